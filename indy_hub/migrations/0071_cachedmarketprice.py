@@ -0,0 +1,39 @@
+# Django
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indy_hub", "0070_rename_cached_assets_tables"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CachedMarketPrice",
+            fields=[
+                ("type_id", models.BigIntegerField(primary_key=True, serialize=False)),
+                (
+                    "buy_price",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=20),
+                ),
+                (
+                    "sell_price",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=20),
+                ),
+                ("data", models.JSONField(blank=True, default=dict)),
+                (
+                    "fetched_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Cached Market Price",
+                "verbose_name_plural": "Cached Market Prices",
+                "default_permissions": (),
+            },
+        ),
+    ]
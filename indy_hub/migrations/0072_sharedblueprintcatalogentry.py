@@ -0,0 +1,62 @@
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indy_hub", "0071_cachedmarketprice"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SharedBlueprintCatalogEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("scope_key", models.CharField(max_length=32)),
+                ("type_id", models.IntegerField()),
+                ("material_efficiency", models.IntegerField()),
+                ("time_efficiency", models.IntegerField()),
+                ("type_name", models.CharField(blank=True, max_length=255)),
+                ("provider_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Shared Blueprint Catalog Entry",
+                "verbose_name_plural": "Shared Blueprint Catalog Entries",
+                "default_permissions": (),
+                "indexes": [
+                    models.Index(
+                        fields=[
+                            "scope_key",
+                            "type_name",
+                            "material_efficiency",
+                            "time_efficiency",
+                        ],
+                        name="bp_catalog_scope_name_idx",
+                    ),
+                    models.Index(fields=["type_id"], name="bp_catalog_type_idx"),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="sharedblueprintcatalogentry",
+            constraint=models.UniqueConstraint(
+                fields=(
+                    "scope_key",
+                    "type_id",
+                    "material_efficiency",
+                    "time_efficiency",
+                ),
+                name="bp_catalog_scope_type_uq",
+            ),
+        ),
+    ]
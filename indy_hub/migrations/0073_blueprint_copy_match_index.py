@@ -0,0 +1,24 @@
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indy_hub", "0072_sharedblueprintcatalogentry"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blueprint",
+            index=models.Index(
+                fields=[
+                    "type_id",
+                    "material_efficiency",
+                    "time_efficiency",
+                    "bp_type",
+                ],
+                name="indy_hub_bl_copy_match_idx",
+            ),
+        ),
+    ]
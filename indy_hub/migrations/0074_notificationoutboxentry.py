@@ -0,0 +1,81 @@
+# Django
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indy_hub", "0073_blueprint_copy_match_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationOutboxEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("message", models.TextField(blank=True)),
+                ("level", models.CharField(default="info", max_length=16)),
+                ("link", models.CharField(blank=True, max_length=500)),
+                ("link_label", models.CharField(blank=True, max_length=255)),
+                ("thumbnail_url", models.CharField(blank=True, max_length=500)),
+                (
+                    "notification_type",
+                    models.CharField(default="industry", max_length=32),
+                ),
+                ("dedup_key", models.CharField(max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("sent", "Sent"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "claim_token",
+                    models.CharField(blank=True, default="", max_length=32),
+                ),
+                ("claimed_at", models.DateTimeField(blank=True, null=True)),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="indy_notification_outbox",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "default_permissions": (),
+                "indexes": [
+                    models.Index(
+                        fields=["status", "claim_token", "id"],
+                        name="notif_outbox_pending_idx",
+                    ),
+                    models.Index(
+                        fields=["dedup_key", "created_at"],
+                        name="notif_outbox_dedup_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
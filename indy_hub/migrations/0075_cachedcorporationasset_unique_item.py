@@ -0,0 +1,34 @@
+# Django
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def drop_duplicate_corp_assets(apps, schema_editor):
+    CachedCorporationAsset = apps.get_model("indy_hub", "CachedCorporationAsset")
+    duplicates = (
+        CachedCorporationAsset.objects.filter(item_id__isnull=False)
+        .values("corporation_id", "item_id")
+        .annotate(row_count=Count("id"), keep_id=Max("id"))
+        .filter(row_count__gt=1)
+    )
+    for row in duplicates.iterator():
+        CachedCorporationAsset.objects.filter(
+            corporation_id=row["corporation_id"], item_id=row["item_id"]
+        ).exclude(id=row["keep_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indy_hub", "0074_notificationoutboxentry"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_corp_assets, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="cachedcorporationasset",
+            constraint=models.UniqueConstraint(
+                fields=("corporation_id", "item_id"), name="cca_corp_item_uq"
+            ),
+        ),
+    ]
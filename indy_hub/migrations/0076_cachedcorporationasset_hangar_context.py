@@ -0,0 +1,29 @@
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indy_hub", "0075_cachedcorporationasset_unique_item"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cachedcorporationasset",
+            name="root_location_id",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="cachedcorporationasset",
+            name="hangar_flag",
+            field=models.CharField(blank=True, default="", max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name="cachedcorporationasset",
+            index=models.Index(
+                fields=["corporation_id", "root_location_id", "hangar_flag"],
+                name="cca_corp_hangar_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Django
+from django.db import migrations, models
+
+PLACEHOLDER_PREFIX = "Structure "
+BATCH_SIZE = 1000
+
+
+def forward_backfill_location_index(apps, schema_editor):
+    CachedStructureName = apps.get_model("indy_hub", "CachedStructureName")
+    Blueprint = apps.get_model("indy_hub", "Blueprint")
+    IndustryJob = apps.get_model("indy_hub", "IndustryJob")
+
+    CachedStructureName.objects.filter(name__startswith=PLACEHOLDER_PREFIX).update(
+        confidence=0
+    )
+
+    # Names that so far were only recorded on blueprint and job rows become
+    # index entries, so lookups no longer have to scan those tables.
+    known = set(CachedStructureName.objects.values_list("structure_id", flat=True))
+    sources = (
+        Blueprint.objects.values_list("location_id", "location_name"),
+        IndustryJob.objects.values_list("station_id", "location_name"),
+    )
+    pending = []
+    for rows in sources:
+        for location_id, name in (
+            rows.exclude(location_name="")
+            .exclude(location_name__startswith=PLACEHOLDER_PREFIX)
+            .distinct()
+            .iterator(chunk_size=BATCH_SIZE)
+        ):
+            if not location_id or location_id in known:
+                continue
+            known.add(location_id)
+            pending.append(
+                CachedStructureName(
+                    structure_id=location_id,
+                    name=name[:255],
+                    source="sync",
+                    confidence=50,
+                )
+            )
+            if len(pending) >= BATCH_SIZE:
+                CachedStructureName.objects.bulk_create(pending, ignore_conflicts=True)
+                pending = []
+    if pending:
+        CachedStructureName.objects.bulk_create(pending, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indy_hub", "0077_esisyncschedule"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cachedstructurename",
+            name="source",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("", "Unknown"),
+                    ("esi", "ESI structure lookup"),
+                    ("station", "ESI station lookup"),
+                    ("corporation", "Corporation structures"),
+                    ("hangar", "Corporation hangar"),
+                    ("sync", "Blueprint and job sync"),
+                ],
+                default="",
+                max_length=16,
+            ),
+        ),
+        migrations.AddField(
+            model_name="cachedstructurename",
+            name="confidence",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (0, "Placeholder"),
+                    (50, "Copied from stored rows"),
+                    (100, "Resolved"),
+                ],
+                default=100,
+            ),
+        ),
+        migrations.RunPython(
+            forward_backfill_location_index, migrations.RunPython.noop
+        ),
+    ]
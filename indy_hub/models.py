@@ -11,7 +11,11 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext
 
-from .utils.eve import get_blueprint_product_type_id, is_reaction_blueprint
+from .utils.eve import (
+    PLACEHOLDER_PREFIX,
+    get_blueprint_product_type_id,
+    is_reaction_blueprint,
+)
 
 
 def generate_order_reference():
@@ -90,6 +94,15 @@ class Blueprint(models.Model):
                 fields=["owner_kind", "corporation_id", "type_id"],
                 name="indy_hub_bl_corp_scope_idx",
             ),
+            models.Index(
+                fields=[
+                    "type_id",
+                    "material_efficiency",
+                    "time_efficiency",
+                    "bp_type",
+                ],
+                name="indy_hub_bl_copy_match_idx",
+            ),
         ]
         permissions = [
             ("can_access_indy_hub", "Can access Indy Hub"),
@@ -1000,6 +1013,61 @@ class JobNotificationDigestEntry(models.Model):
         self.sent_at = timezone.now()
 
 
+class NotificationOutboxEntry(models.Model):
+    """Notification queued for asynchronous delivery by the outbox consumer."""
+
+    STATUS_PENDING = "pending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="indy_notification_outbox",
+    )
+    title = models.CharField(max_length=255)
+    message = models.TextField(blank=True)
+    level = models.CharField(max_length=16, default="info")
+    link = models.CharField(max_length=500, blank=True)
+    link_label = models.CharField(max_length=255, blank=True)
+    thumbnail_url = models.CharField(max_length=500, blank=True)
+    notification_type = models.CharField(max_length=32, default="industry")
+    # sha256 of (user, title, message); identical notifications inside the
+    # dedup window are dropped at enqueue time.
+    dedup_key = models.CharField(max_length=64)
+    status = models.CharField(
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    claim_token = models.CharField(max_length=32, blank=True, default="")
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        default_permissions = ()
+        indexes = [
+            models.Index(
+                fields=["status", "claim_token", "id"],
+                name="notif_outbox_pending_idx",
+            ),
+            models.Index(
+                fields=["dedup_key", "created_at"],
+                name="notif_outbox_dedup_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Outbox {self.title!r} for {self.user_id} ({self.status})"
+
+
 class CorporationSharingSetting(models.Model):
     """Stores per-corporation blueprint sharing preferences for a user."""
 
@@ -1424,6 +1492,10 @@ class CachedCorporationAsset(models.Model):
     quantity = models.BigIntegerField(default=0)
     is_singleton = models.BooleanField(default=False)
     is_blueprint = models.BooleanField(default=False)
+    # Container-resolved placement, filled in after each refresh so stock can
+    # be aggregated per structure/hangar in SQL.
+    root_location_id = models.BigIntegerField(blank=True, null=True)
+    hangar_flag = models.CharField(max_length=50, blank=True, default="")
     synced_at = models.DateTimeField(default=timezone.now, db_index=True)
 
     class Meta:
@@ -1441,6 +1513,16 @@ class CachedCorporationAsset(models.Model):
             models.Index(
                 fields=["corporation_id", "location_flag"], name="cca_corp_flag_idx"
             ),
+            models.Index(
+                fields=["corporation_id", "root_location_id", "hangar_flag"],
+                name="cca_corp_hangar_idx",
+            ),
+        ]
+        constraints = [
+            # Refreshes upsert by item id instead of delete + re-insert.
+            models.UniqueConstraint(
+                fields=["corporation_id", "item_id"], name="cca_corp_item_uq"
+            ),
         ]
 
     def __str__(self):
@@ -1505,11 +1587,36 @@ class CachedCharacterAsset(models.Model):
 
 
 class CachedStructureName(models.Model):
-    """Cached structure names to avoid repeated ESI lookups."""
+    """Location index: structure, station and hangar names by location ID.
+
+    ``indy_hub.utils.eve.resolve_location_name`` consults this table before
+    any ESI lookup. Placeholder names (``Structure <id>``) are stored with
+    ``Confidence.PLACEHOLDER`` so failed lookups are remembered without being
+    served as real names.
+    """
+
+    class Source(models.TextChoices):
+        UNKNOWN = "", _("Unknown")
+        ESI = "esi", _("ESI structure lookup")
+        STATION = "station", _("ESI station lookup")
+        CORPORATION = "corporation", _("Corporation structures")
+        HANGAR = "hangar", _("Corporation hangar")
+        SYNC = "sync", _("Blueprint and job sync")
+
+    class Confidence(models.IntegerChoices):
+        PLACEHOLDER = 0, _("Placeholder")
+        STORED = 50, _("Copied from stored rows")
+        RESOLVED = 100, _("Resolved")
 
     structure_id = models.BigIntegerField(primary_key=True)
     name = models.CharField(max_length=255)
     last_resolved = models.DateTimeField(default=timezone.now)
+    source = models.CharField(
+        max_length=16, choices=Source.choices, default=Source.UNKNOWN, blank=True
+    )
+    confidence = models.PositiveSmallIntegerField(
+        choices=Confidence.choices, default=Confidence.RESOLVED
+    )
 
     class Meta:
         verbose_name = "Cached Structure Name"
@@ -1519,6 +1626,137 @@ class CachedStructureName(models.Model):
     def __str__(self):
         return f"{self.structure_id}: {self.name}"
 
+    def save(self, *args, **kwargs):
+        # Writers only pass a name; keep the confidence in line with it.
+        if str(self.name).startswith(PLACEHOLDER_PREFIX):
+            self.confidence = self.Confidence.PLACEHOLDER
+        elif self.confidence == self.Confidence.PLACEHOLDER:
+            self.confidence = self.Confidence.RESOLVED
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "confidence"}
+        super().save(*args, **kwargs)
+
+
+class ESISyncSchedule(models.Model):
+    """Due time of one owner's blueprint or industry job synchronization.
+
+    ``next_run_at`` follows the ESI cache headers of the last fetch; rows are
+    claimed and dispatched by ``indy_hub.tasks.industry.dispatch_due_syncs``.
+    Character rows are synced through ``user``'s task, corporation rows
+    through the corporation task.
+    """
+
+    class Kind(models.TextChoices):
+        BLUEPRINTS = "blueprints", _("Blueprints")
+        JOBS = "jobs", _("Industry jobs")
+
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    owner_kind = models.CharField(max_length=16, choices=Blueprint.OwnerKind.choices)
+    owner_id = models.BigIntegerField()
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="indy_sync_schedules",
+        blank=True,
+        null=True,
+    )
+    next_run_at = models.DateTimeField(default=timezone.now)
+    dispatched_at = models.DateTimeField(blank=True, null=True)
+    expires_at = models.DateTimeField(blank=True, null=True)
+    last_modified_at = models.DateTimeField(blank=True, null=True)
+    last_synced_at = models.DateTimeField(blank=True, null=True)
+    last_changed_at = models.DateTimeField(blank=True, null=True)
+    failures = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        default_permissions = ()
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "owner_kind", "owner_id"],
+                name="esi_sync_owner_uq",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["kind", "next_run_at"], name="esi_sync_due_idx"),
+            models.Index(
+                fields=["kind", "dispatched_at"], name="esi_sync_in_flight_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.owner_kind}:{self.owner_id} @ {self.next_run_at}"
+
+
+class CachedMarketPrice(models.Model):
+    """Last known Jita 4-4 aggregates for a type, as reported by Fuzzwork."""
+
+    type_id = models.BigIntegerField(primary_key=True)
+    buy_price = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    sell_price = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    data = models.JSONField(default=dict, blank=True)
+    fetched_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = "Cached Market Price"
+        verbose_name_plural = "Cached Market Prices"
+        default_permissions = ()
+
+    def __str__(self):
+        return f"{self.type_id}: buy={self.buy_price} sell={self.sell_price}"
+
+
+class SharedBlueprintCatalogEntry(models.Model):
+    """Denormalized (type, ME, TE) originals offered for copy requests.
+
+    One row per visibility scope key (``everyone``, ``corp:<id>`` or
+    ``alliance:<id>``); ``provider_count`` is the number of distinct sharing
+    owners offering the blueprint within that scope. Maintained by
+    ``indy_hub.services.blueprint_catalog``.
+    """
+
+    scope_key = models.CharField(max_length=32)
+    type_id = models.IntegerField()
+    material_efficiency = models.IntegerField()
+    time_efficiency = models.IntegerField()
+    type_name = models.CharField(max_length=255, blank=True)
+    provider_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Shared Blueprint Catalog Entry"
+        verbose_name_plural = "Shared Blueprint Catalog Entries"
+        default_permissions = ()
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "scope_key",
+                    "type_id",
+                    "material_efficiency",
+                    "time_efficiency",
+                ],
+                name="bp_catalog_scope_type_uq",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=[
+                    "scope_key",
+                    "type_name",
+                    "material_efficiency",
+                    "time_efficiency",
+                ],
+                name="bp_catalog_scope_name_idx",
+            ),
+            models.Index(fields=["type_id"], name="bp_catalog_type_idx"),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.scope_key}: {self.type_id} "
+            f"ME{self.material_efficiency} TE{self.time_efficiency}"
+        )
+
 
 class MaterialExchangeStock(models.Model):
     """
@@ -4,18 +4,28 @@ Notification helpers for Indy Hub.
 Supports Alliance Auth notifications and (future) Discord/webhook fallback.
 """
 # Standard Library
+import hashlib
 import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
 from urllib.parse import urljoin, urlparse
 
 # Django
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 # Alliance Auth
 from allianceauth.notifications.models import Notification
 
+from .models import NotificationOutboxEntry
+
 logger = logging.getLogger(__name__)
 
 LEVELS = {
@@ -40,6 +50,22 @@ EMBED_FOOTER_TEXT = getattr(
 )
 DEFAULT_LINK_LABEL = _("View details")
 
+# Outbox: identical (user, title, message) notifications queued within this
+# window are dropped; the consumer delivers at most SEND_RATE per second.
+OUTBOX_DEDUP_WINDOW_SECONDS = int(
+    getattr(settings, "INDY_HUB_NOTIFICATION_DEDUP_SECONDS", 10 * 60)
+)
+OUTBOX_BATCH_SIZE = int(getattr(settings, "INDY_HUB_NOTIFICATION_BATCH_SIZE", 100))
+OUTBOX_SEND_RATE = float(getattr(settings, "INDY_HUB_NOTIFICATION_SEND_RATE", 5))
+OUTBOX_MAX_ATTEMPTS = 3
+OUTBOX_CLAIM_TIMEOUT_SECONDS = 10 * 60
+OUTBOX_RETENTION_DAYS = 7
+OUTBOX_KICK_CACHE_KEY = "indy_hub:notification_outbox:scheduled"
+OUTBOX_KICK_TTL_SECONDS = 5 * 60
+_OUTBOX_CHUNK_SIZE = 500
+
+_outbox_batch = threading.local()
+
 
 def build_site_url(path: str | None) -> str | None:
     """Return an absolute URL for the given path based on SITE_URL."""
@@ -386,7 +412,9 @@ def notify_user(
 
 def notify_multi(users, title, message, level="info", **kwargs):
     """
-    Send a notification to multiple users (QuerySet, list, or single user).
+    Queue a notification for multiple users (QuerySet, list, or single user).
+
+    Delivery happens asynchronously through the notification outbox.
     
     Args:
         users: Users to notify
@@ -411,6 +439,225 @@ def notify_multi(users, title, message, level="info", **kwargs):
     # Filter users by notification type
     from .utils.discord_roles import filter_users_by_notification_role
     filtered_users = filter_users_by_notification_role(users, notification_type)
-    
-    for user in filtered_users:
-        notify_user(user, title, message, level=level, **kwargs)
+
+    with notification_batch():
+        for user in filtered_users:
+            queue_notification(user, title, message, level=level, **kwargs)
+
+
+def _outbox_dedup_key(user_id: int, title: str, message: str) -> str:
+    raw = "\x1f".join((str(user_id), title, message))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def queue_notification(
+    user,
+    title,
+    message,
+    level="info",
+    *,
+    link: str | None = None,
+    link_label: str | None = None,
+    thumbnail_url: str | None = None,
+    notification_type: str = "industry",
+) -> None:
+    """Queue a notification for asynchronous delivery through ``notify_user``.
+
+    Accepts the same arguments as ``notify_user`` but returns immediately; the
+    outbox consumer performs the role checks and Discord/Auth delivery.
+    """
+
+    if not user:
+        return
+
+    title = str(title or "")[:255]
+    message = str(message or "")
+    entry = NotificationOutboxEntry(
+        user=user,
+        title=title,
+        message=message,
+        level=level or "info",
+        link=link or "",
+        link_label=str(link_label or ""),
+        thumbnail_url=thumbnail_url or "",
+        notification_type=notification_type,
+        dedup_key=_outbox_dedup_key(user.pk, title, message),
+    )
+    pending = getattr(_outbox_batch, "entries", None)
+    if pending is not None:
+        pending.append(entry)
+        return
+    _store_outbox_entries([entry])
+
+
+@contextmanager
+def notification_batch():
+    """Buffer ``queue_notification`` calls and store them in one bulk insert."""
+
+    if getattr(_outbox_batch, "entries", None) is not None:
+        yield
+        return
+
+    _outbox_batch.entries = []
+    try:
+        yield
+        entries = _outbox_batch.entries
+    finally:
+        _outbox_batch.entries = None
+    _store_outbox_entries(entries)
+
+
+def _store_outbox_entries(entries: list[NotificationOutboxEntry]) -> int:
+    if not entries:
+        return 0
+
+    cutoff = timezone.now() - timedelta(seconds=OUTBOX_DEDUP_WINDOW_SECONDS)
+    keys = sorted({entry.dedup_key for entry in entries})
+    seen: set[str] = set()
+    for start in range(0, len(keys), _OUTBOX_CHUNK_SIZE):
+        seen.update(
+            NotificationOutboxEntry.objects.filter(
+                dedup_key__in=keys[start : start + _OUTBOX_CHUNK_SIZE],
+                created_at__gte=cutoff,
+            )
+            .exclude(status=NotificationOutboxEntry.STATUS_FAILED)
+            .values_list("dedup_key", flat=True)
+        )
+
+    fresh = []
+    for entry in entries:
+        if entry.dedup_key in seen:
+            continue
+        seen.add(entry.dedup_key)
+        fresh.append(entry)
+
+    if fresh:
+        NotificationOutboxEntry.objects.bulk_create(
+            fresh, batch_size=_OUTBOX_CHUNK_SIZE
+        )
+        transaction.on_commit(_schedule_outbox_delivery)
+    if len(fresh) != len(entries):
+        logger.debug(
+            "Dropped %s duplicate notification(s) inside the dedup window",
+            len(entries) - len(fresh),
+        )
+    return len(fresh)
+
+
+def _schedule_outbox_delivery() -> None:
+    # One queued consumer run drains the whole backlog; skip redundant kicks.
+    if not cache.add(OUTBOX_KICK_CACHE_KEY, True, OUTBOX_KICK_TTL_SECONDS):
+        return
+
+    from .tasks.notifications import deliver_notification_outbox
+
+    try:
+        deliver_notification_outbox.delay()
+    except Exception as exc:  # pragma: no cover - broker outage
+        cache.delete(OUTBOX_KICK_CACHE_KEY)
+        logger.warning(
+            "Could not schedule notification delivery, periodic run will retry: %s",
+            exc,
+        )
+
+
+def _claim_outbox_entries(limit: int) -> list[NotificationOutboxEntry]:
+    now = timezone.now()
+    pending = NotificationOutboxEntry.objects.filter(
+        status=NotificationOutboxEntry.STATUS_PENDING
+    )
+    # Release claims held by workers that died mid-batch.
+    pending.filter(
+        claimed_at__lt=now - timedelta(seconds=OUTBOX_CLAIM_TIMEOUT_SECONDS)
+    ).exclude(claim_token="").update(claim_token="", claimed_at=None)
+
+    ids = list(
+        pending.filter(claim_token="")
+        .order_by("id")
+        .values_list("id", flat=True)[:limit]
+    )
+    if not ids:
+        return []
+
+    token = uuid.uuid4().hex
+    pending.filter(id__in=ids, claim_token="").update(claim_token=token, claimed_at=now)
+    return list(
+        NotificationOutboxEntry.objects.filter(claim_token=token)
+        .select_related("user")
+        .order_by("id")
+    )
+
+
+def deliver_pending_notifications(limit: int | None = None) -> dict[str, int]:
+    """Deliver one batch of queued notifications, spacing sends by the rate limit."""
+
+    entries = _claim_outbox_entries(limit or OUTBOX_BATCH_SIZE)
+    min_interval = 1.0 / OUTBOX_SEND_RATE if OUTBOX_SEND_RATE > 0 else 0.0
+    last_sent_at: float | None = None
+    sent_ids: list[int] = []
+    retry: list[NotificationOutboxEntry] = []
+    failed: list[NotificationOutboxEntry] = []
+
+    for entry in entries:
+        if min_interval and last_sent_at is not None:
+            wait = min_interval - (time.monotonic() - last_sent_at)
+            if wait > 0:
+                time.sleep(wait)
+        last_sent_at = time.monotonic()
+        try:
+            notify_user(
+                entry.user,
+                entry.title,
+                entry.message,
+                entry.level,
+                link=entry.link or None,
+                link_label=entry.link_label or None,
+                thumbnail_url=entry.thumbnail_url or None,
+                notification_type=entry.notification_type,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Outbox delivery failed for %s: %s", entry.user_id, exc, exc_info=True
+            )
+            entry.attempts += 1
+            entry.claim_token = ""
+            entry.claimed_at = None
+            if entry.attempts >= OUTBOX_MAX_ATTEMPTS:
+                entry.status = NotificationOutboxEntry.STATUS_FAILED
+                failed.append(entry)
+            else:
+                retry.append(entry)
+            continue
+        sent_ids.append(entry.id)
+
+    if sent_ids:
+        NotificationOutboxEntry.objects.filter(id__in=sent_ids).update(
+            status=NotificationOutboxEntry.STATUS_SENT,
+            sent_at=timezone.now(),
+            claim_token="",
+        )
+    if retry or failed:
+        NotificationOutboxEntry.objects.bulk_update(
+            retry + failed, ["attempts", "claim_token", "claimed_at", "status"]
+        )
+
+    return {
+        "sent": len(sent_ids),
+        "retry": len(retry),
+        "failed": len(failed),
+        "remaining": NotificationOutboxEntry.objects.filter(
+            status=NotificationOutboxEntry.STATUS_PENDING, claim_token=""
+        ).count(),
+    }
+
+
+def purge_notification_outbox() -> int:
+    """Delete delivered/failed outbox rows past the retention period."""
+
+    cutoff = timezone.now() - timedelta(days=OUTBOX_RETENTION_DAYS)
+    deleted, _details = (
+        NotificationOutboxEntry.objects.filter(created_at__lt=cutoff)
+        .exclude(status=NotificationOutboxEntry.STATUS_PENDING)
+        .delete()
+    )
+    return deleted
@@ -7,15 +7,12 @@ from celery.schedules import crontab
 
 # Periodic task configuration for indy_hub
 INDY_HUB_BEAT_SCHEDULE = {
-    "indy-hub-update-all-blueprints": {
-        "task": "indy_hub.tasks.industry.update_all_blueprints",
-        "schedule": crontab(hour=3, minute=30),  # Daily at 03:30
-        "options": {"priority": 7},  # Low priority for background updates
-    },
-    "indy-hub-update-all-industry-jobs": {
-        "task": "indy_hub.tasks.industry.update_all_industry_jobs",
-        "schedule": crontab(minute=0, hour="*/2"),  # Every 2 hours
-        "options": {"priority": 7},  # Slightly higher priority for jobs
+    # Blueprint and job syncs are dispatched when their ESI cache expires
+    # (replaces the daily/2-hourly update_all_* fan-out)
+    "indy-hub-dispatch-due-syncs": {
+        "task": "indy_hub.tasks.industry.dispatch_due_syncs",
+        "schedule": crontab(minute="*"),  # Every minute
+        "options": {"priority": 6},
     },
     "indy-hub-dispatch-job-digests": {
         "task": "indy_hub.tasks.notifications.dispatch_job_notification_digests",
@@ -27,6 +24,16 @@ INDY_HUB_BEAT_SCHEDULE = {
         "schedule": crontab(minute="*/5"),  # Every 5 minutes
         "options": {"priority": 5},
     },
+    "indy-hub-deliver-notification-outbox": {
+        "task": "indy_hub.tasks.notifications.deliver_notification_outbox",
+        "schedule": crontab(minute="*"),  # Every minute (safety net)
+        "options": {"priority": 5},
+    },
+    "indy-hub-refresh-discord-role-snapshot": {
+        "task": "indy_hub.tasks.notifications.refresh_discord_role_snapshot",
+        "schedule": crontab(minute="*/10"),  # Every 10 minutes
+        "options": {"priority": 6},
+    },
     "indy-hub-cleanup-old-jobs": {
         "task": "indy_hub.tasks.industry.cleanup_old_jobs",
         "schedule": crontab(hour=2, minute=0),  # Daily at 02:00
@@ -37,6 +44,11 @@ INDY_HUB_BEAT_SCHEDULE = {
         "schedule": crontab(hour=3, minute=0),  # Daily at 03:00
         "options": {"priority": 8},  # Low priority for caching
     },
+    "indy-hub-refresh-shared-blueprint-catalog": {
+        "task": "indy_hub.tasks.industry.refresh_shared_blueprint_catalog",
+        "schedule": crontab(minute=20, hour="*"),  # Every hour at HH:20
+        "options": {"priority": 7},
+    },
     # Material Exchange combined cycle: sync -> validate -> check completed
     "indy-hub-material-exchange-cycle": {
         "task": "indy_hub.tasks.material_exchange_contracts.run_material_exchange_cycle",
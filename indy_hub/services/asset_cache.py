@@ -4,12 +4,14 @@ from __future__ import annotations
 
 # Standard Library
 import logging
+from array import array
 from datetime import timedelta
 from typing import Any
 
 # Django
 from django.conf import settings
-from django.db import transaction
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.utils import timezone
 
 # Alliance Auth
@@ -53,6 +55,28 @@ DIVISION_CACHE_MAX_AGE_MINUTES = getattr(
     settings, "INDY_HUB_DIVISION_CACHE_MAX_AGE_MINUTES", 1440
 )
 
+ASSET_WRITE_BATCH_SIZE = 1000
+CORP_ASSET_REFRESH_LOCK_TTL_SECONDS = 30 * 60
+_CHAR_ASSET_DIFF_FIELDS = (
+    "raw_location_id",
+    "location_id",
+    "location_flag",
+    "type_id",
+    "quantity",
+    "is_singleton",
+    "is_blueprint",
+)
+_CHAR_ASSET_REFRESH_CACHE_PREFIX = "indy_hub:char_assets:last_refresh"
+_CORP_ASSET_UPDATE_FIELDS = [
+    "location_id",
+    "location_flag",
+    "type_id",
+    "quantity",
+    "is_singleton",
+    "is_blueprint",
+    "synced_at",
+]
+
 
 def build_asset_index_by_item_id(assets: list[dict]) -> dict[int, dict]:
     """Build an index mapping item_id -> asset dict.
@@ -86,7 +110,8 @@ def resolve_asset_root_location_id(
     """Resolve the top-level (non-container) location_id for an asset.
 
     If ``asset.location_id`` points to a container's ``item_id``, follow the chain
-    until the location_id no longer matches an item_id in ``index_by_item_id``.
+    until the location_id no longer matches an item_id in ``index_by_item_id``
+    or an office folder is reached (see ``AssetTree.root_location_ids``).
     Returns the final location_id (typically a structure/station id) or None.
     """
 
@@ -100,7 +125,7 @@ def resolve_asset_root_location_id(
             return None
 
         parent = index_by_item_id.get(location_id)
-        if not parent:
+        if not parent or current.get("location_flag") == "OfficeFolder":
             return location_id
 
         if location_id in seen:
@@ -117,40 +142,176 @@ def resolve_asset_root_location_id(
         return None
 
 
-def asset_chain_has_context(
-    asset: dict,
-    index_by_item_id: dict[int, dict],
-    *,
-    location_id: int,
-    location_flag: str,
-    max_depth: int = 25,
-) -> bool:
-    """Return True when asset (or any parent container) matches a location context."""
+def _int_column(assets: list[dict], key: str, default: int = 0) -> array:
+    """Return ``key`` of every asset as an int64 column (bad values become 0)."""
 
-    current = asset
-    seen: set[int] = set()
-    wanted_flag = str(location_flag or "")
+    try:
+        return array("q", [int(asset.get(key, default) or 0) for asset in assets])
+    except (TypeError, ValueError, OverflowError):
+        pass
 
-    for _ in range(int(max_depth)):
+    def coerce(value: Any) -> int:
         try:
-            current_location_id = int(current.get("location_id", 0) or 0)
-        except (TypeError, ValueError):
-            current_location_id = 0
+            return int(value or 0)
+        except (TypeError, ValueError, OverflowError):
+            return 0
 
-        current_flag = str(current.get("location_flag", "") or "")
-        if current_location_id == int(location_id) and current_flag == wanted_flag:
-            return True
+    return array("q", [coerce(asset.get(key, default)) for asset in assets])
 
-        parent = index_by_item_id.get(current_location_id)
-        if not parent:
-            return False
 
-        if current_location_id in seen:
-            return False
-        seen.add(current_location_id)
-        current = parent
+class AssetTree:
+    """Column-oriented index over a flat ESI asset list.
 
-    return False
+    Each asset becomes one row (in input order) of parallel ``array`` columns,
+    with ``parents[row]`` holding the row of the containing asset (or -1).
+    Values are coerced once on build, and container chains are resolved for
+    all rows at once by pointer jumping instead of a per-asset walk through
+    dict lookups.
+    """
+
+    __slots__ = (
+        "item_ids",
+        "location_ids",
+        "type_ids",
+        "quantities",
+        "singletons",
+        "flag_codes",
+        "flags",
+        "parents",
+    )
+
+    def __init__(self) -> None:
+        self.item_ids = array("q")
+        self.location_ids = array("q")
+        self.type_ids = array("q")
+        self.quantities = array("q")
+        self.singletons = array("b")
+        self.flag_codes = array("L")
+        self.flags: list[str] = []
+        self.parents = array("q")
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    @classmethod
+    def from_assets(cls, assets: list[dict]) -> AssetTree:
+        assets = assets or []
+        tree = cls()
+        tree.item_ids = _int_column(assets, "item_id")
+        tree.location_ids = _int_column(assets, "location_id")
+        tree.type_ids = _int_column(assets, "type_id")
+        tree.quantities = _int_column(assets, "quantity", 1)
+        tree.singletons = array(
+            "b", [bool(asset.get("is_singleton")) for asset in assets]
+        )
+
+        flag_code_by_name: dict[str, int] = {}
+        tree.flag_codes = array(
+            "L",
+            [
+                flag_code_by_name.setdefault(
+                    str(asset.get("location_flag", "") or ""), len(flag_code_by_name)
+                )
+                for asset in assets
+            ],
+        )
+        tree.flags = list(flag_code_by_name)
+        tree._link_parents()
+        return tree
+
+    @classmethod
+    def from_hierarchy(
+        cls, item_ids: array, location_ids: array, flag_codes: array, flags: list[str]
+    ) -> AssetTree:
+        """Build a tree holding only the container hierarchy columns."""
+
+        tree = cls()
+        tree.item_ids = item_ids
+        tree.location_ids = location_ids
+        tree.flag_codes = flag_codes
+        tree.flags = flags
+        tree._link_parents()
+        return tree
+
+    def _link_parents(self) -> None:
+        row_by_item_id = {
+            item_id: row for row, item_id in enumerate(self.item_ids) if item_id > 0
+        }
+        self.parents = array(
+            "q",
+            [row_by_item_id.get(location_id, -1) for location_id in self.location_ids],
+        )
+
+    def _resolve_chains(
+        self, values: list, resolved: list[bool], fallback: list
+    ) -> list:
+        """Propagate per-row answers down container chains by pointer jumping.
+
+        ``values[row]`` is final where ``resolved[row]`` is set; every other row
+        takes the answer of its parent. Each pass makes pending rows skip to
+        their pointer's pointer, so chains of depth d settle in log2(d) passes.
+        Rows caught in a parent loop never resolve and take ``fallback``.
+        """
+
+        pointers = list(self.parents)
+        pending = [row for row, done in enumerate(resolved) if not done]
+        for _ in range(len(values).bit_length()):
+            if not pending:
+                break
+            still_pending = []
+            for row in pending:
+                target = pointers[row]
+                if resolved[target]:
+                    values[row] = values[target]
+                    resolved[row] = True
+                else:
+                    pointers[row] = pointers[target]
+                    still_pending.append(row)
+            pending = still_pending
+        for row in pending:
+            values[row] = fallback[row]
+        return values
+
+    def _flag_code(self, flag: str) -> int:
+        try:
+            return self.flags.index(flag)
+        except ValueError:
+            return -1
+
+    def root_location_ids(self) -> list[int]:
+        """Return the top-level (non-container) location_id for every row.
+
+        Resolution stops at office folders: their location is the station or
+        structure, even when the corporation owns that structure and ESI lists
+        it as an asset located in a solar system.
+        """
+
+        office_folder_code = self._flag_code("OfficeFolder")
+        is_root = [
+            parent < 0 or flag_code == office_folder_code
+            for parent, flag_code in zip(self.parents, self.flag_codes)
+        ]
+        # Defensive: rows in pathological parent loops keep their own location.
+        return self._resolve_chains(list(self.location_ids), is_root, self.location_ids)
+
+    def hangar_flags(self) -> list[str]:
+        """Return the hangar flag each row is stored under.
+
+        That is the flag of the outermost container below the office folder
+        (or below the station/structure itself), so items inside cans report
+        the corp hangar division the can sits in.
+        """
+
+        office_folder_code = self._flag_code("OfficeFolder")
+        flag_codes = self.flag_codes
+        in_hangar_root = [
+            parent < 0 or flag_codes[parent] == office_folder_code
+            for parent in self.parents
+        ]
+        context_rows = self._resolve_chains(
+            list(range(len(self))), in_hangar_root, range(len(self))
+        )
+        return [self.flags[flag_codes[row]] for row in context_rows]
 
 
 def make_managed_hangar_location_id(office_folder_item_id: int, division: int) -> int:
@@ -165,44 +326,6 @@ def make_managed_hangar_location_id(office_folder_item_id: int, division: int) -
     return -(office_folder_item_id * 10 + division)
 
 
-def get_office_folder_item_id_from_assets(
-    corp_assets: list[dict], *, structure_id: int
-) -> int | None:
-    """Extract the office folder item_id for a structure from corp assets.
-
-    ESI corp assets represent the OfficeFolder itself as an asset where:
-    - location_id == structure_id
-    - location_flag == "OfficeFolder"
-    - item_id is the office folder item id
-    """
-
-    try:
-        structure_id_int = int(structure_id)
-    except (TypeError, ValueError):
-        return None
-
-    for asset in corp_assets or []:
-        try:
-            if int(asset.get("location_id", 0) or 0) != structure_id_int:
-                continue
-        except (TypeError, ValueError):
-            continue
-
-        if str(asset.get("location_flag") or "") != "OfficeFolder":
-            continue
-
-        item_id = asset.get("item_id")
-        if item_id is None:
-            continue
-
-        try:
-            return int(item_id)
-        except (TypeError, ValueError):
-            return None
-
-    return None
-
-
 def _cache_corp_structure_names(corporation_id: int) -> dict[int, str]:
     """Cache all corp structure names using the corp structures endpoint."""
 
@@ -235,7 +358,11 @@ def _cache_corp_structure_names(corporation_id: int) -> dict[int, str]:
         cached[int(sid)] = name
         CachedStructureName.objects.update_or_create(
             structure_id=int(sid),
-            defaults={"name": name, "last_resolved": now},
+            defaults={
+                "name": name,
+                "source": CachedStructureName.Source.CORPORATION,
+                "last_resolved": now,
+            },
         )
 
     return cached
@@ -276,50 +403,165 @@ def _get_character_for_scope(corporation_id: int, scope: str) -> int:
     )
 
 
-def _refresh_corp_assets(corporation_id: int) -> tuple[list[dict], bool]:
-    """Fetch corporation assets from ESI and refresh the cache."""
+def _corp_asset_row(
+    corporation_id: int, asset: dict, synced_at
+) -> CachedCorporationAsset:
+    return CachedCorporationAsset(
+        corporation_id=corporation_id,
+        item_id=(
+            int(asset.get("item_id")) if asset.get("item_id") is not None else None
+        ),
+        location_id=int(asset.get("location_id", 0) or 0),
+        location_flag=str(asset.get("location_flag", "") or ""),
+        type_id=int(asset.get("type_id", 0) or 0),
+        quantity=int(asset.get("quantity", 0) or 0),
+        is_singleton=bool(asset.get("is_singleton", False)),
+        is_blueprint=bool(asset.get("is_blueprint", False)),
+        synced_at=synced_at,
+    )
+
+
+def _upsert_corp_asset_pages(corporation_id: int, pages, synced_at) -> int:
+    """Upsert streamed asset pages by item id, one bounded batch at a time."""
+
+    written = 0
+    for page in pages:
+        for start in range(0, len(page), ASSET_WRITE_BATCH_SIZE):
+            rows = [
+                _corp_asset_row(corporation_id, asset, synced_at)
+                for asset in page[start : start + ASSET_WRITE_BATCH_SIZE]
+            ]
+            CachedCorporationAsset.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                # MySQL/MariaDB upsert on the unique key implicitly and
+                # reject a target.
+                unique_fields=(
+                    ["corporation_id", "item_id"]
+                    if connection.features.supports_update_conflicts_with_target
+                    else None
+                ),
+                update_fields=_CORP_ASSET_UPDATE_FIELDS,
+            )
+            written += len(rows)
+    return written
+
+
+def _delete_stale_corp_assets(corporation_id: int, synced_before) -> int:
+    """Delete rows a refresh did not touch, in short batches to limit locking."""
+
+    stale = CachedCorporationAsset.objects.filter(
+        corporation_id=corporation_id, synced_at__lt=synced_before
+    )
+    deleted = 0
+    while True:
+        ids = list(stale.values_list("id", flat=True)[:ASSET_WRITE_BATCH_SIZE])
+        if not ids:
+            return deleted
+        deleted += CachedCorporationAsset.objects.filter(id__in=ids).delete()[0]
+
+
+def index_corp_asset_hangars(corporation_id: int) -> int:
+    """Store each cached corp asset's root location and hangar flag.
 
+    Parents can arrive on any ESI page, so this runs over the whole cached
+    corporation once a refresh completes. Only the hierarchy columns are
+    loaded, and only rows whose placement changed are written.
+
+    Returns the number of rows updated.
+    """
+
+    ids = array("q")
+    item_ids = array("q")
+    location_ids = array("q")
+    flag_codes = array("L")
+    current: list[tuple[int | None, str]] = []
+    flag_code_by_name: dict[str, int] = {}
+    rows = (
+        CachedCorporationAsset.objects.filter(corporation_id=int(corporation_id))
+        .values_list(
+            "id",
+            "item_id",
+            "location_id",
+            "location_flag",
+            "root_location_id",
+            "hangar_flag",
+        )
+        .iterator(chunk_size=ASSET_WRITE_BATCH_SIZE)
+    )
+    for row_id, item_id, location_id, flag, root_location_id, hangar_flag in rows:
+        ids.append(row_id)
+        item_ids.append(item_id or 0)
+        location_ids.append(location_id or 0)
+        flag_codes.append(
+            flag_code_by_name.setdefault(flag or "", len(flag_code_by_name))
+        )
+        current.append((root_location_id, hangar_flag))
+
+    tree = AssetTree.from_hierarchy(
+        item_ids, location_ids, flag_codes, list(flag_code_by_name)
+    )
+    changed = [
+        CachedCorporationAsset(
+            id=row_id, root_location_id=root_location_id, hangar_flag=hangar_flag
+        )
+        for row_id, root_location_id, hangar_flag, placement in zip(
+            ids, tree.root_location_ids(), tree.hangar_flags(), current
+        )
+        if placement != (root_location_id, hangar_flag)
+    ]
+    CachedCorporationAsset.objects.bulk_update(
+        changed,
+        ["root_location_id", "hangar_flag"],
+        batch_size=ASSET_WRITE_BATCH_SIZE,
+    )
+    return len(changed)
+
+
+def _refresh_corp_assets(corporation_id: int) -> tuple[int, bool]:
+    """Stream corporation assets from ESI into the cache.
+
+    ESI pages are upserted by ``item_id`` as they arrive and rows the run did
+    not see are deleted afterwards, so memory stays bounded by the page window
+    and readers never find the corporation empty mid-refresh.
+
+    Returns the number of assets written and whether the scope is missing.
+    """
+
+    corporation_id = int(corporation_id)
     assets_scope_missing = False
+    lock_key = f"indy_hub:corp_assets_refresh:{corporation_id}"
+    if not cache.add(lock_key, True, CORP_ASSET_REFRESH_LOCK_TTL_SECONDS):
+        logger.info("Corp %s asset refresh already running, skipping", corporation_id)
+        return 0, assets_scope_missing
+
     try:
         character_id = _get_character_for_scope(
             corporation_id, "esi-assets.read_corporation_assets.v1"
         )
-        assets = shared_client.fetch_corporation_assets(
-            corporation_id=int(corporation_id),
-            character_id=int(character_id),
+        synced_at = timezone.now()
+        written = _upsert_corp_asset_pages(
+            corporation_id,
+            shared_client.iter_corporation_asset_pages(
+                corporation_id, character_id=int(character_id)
+            ),
+            synced_at,
+        )
+        # Only reached when every page arrived; a failed stream keeps old rows.
+        removed = _delete_stale_corp_assets(corporation_id, synced_at)
+        placed = index_corp_asset_hangars(corporation_id)
+        logger.debug(
+            "Corp %s assets refreshed: %s upserted, %s removed, %s re-placed",
+            corporation_id,
+            written,
+            removed,
+            placed,
         )
-        now = timezone.now()
-        rows: list[CachedCorporationAsset] = []
-        for asset in assets:
-            rows.append(
-                CachedCorporationAsset(
-                    corporation_id=int(corporation_id),
-                    item_id=(
-                        int(asset.get("item_id"))
-                        if asset.get("item_id") is not None
-                        else None
-                    ),
-                    location_id=int(asset.get("location_id", 0) or 0),
-                    location_flag=str(asset.get("location_flag", "") or ""),
-                    type_id=int(asset.get("type_id", 0) or 0),
-                    quantity=int(asset.get("quantity", 0) or 0),
-                    is_singleton=bool(asset.get("is_singleton", False)),
-                    is_blueprint=bool(asset.get("is_blueprint", False)),
-                    synced_at=now,
-                )
-            )
-
-        with transaction.atomic():
-            CachedCorporationAsset.objects.filter(
-                corporation_id=corporation_id
-            ).delete()
-            if rows:
-                CachedCorporationAsset.objects.bulk_create(rows, batch_size=1000)
 
         # Cache all corp structure names while we have a valid corp token
-        _cache_corp_structure_names(int(corporation_id))
+        _cache_corp_structure_names(corporation_id)
 
-        return assets, assets_scope_missing
+        return written, assets_scope_missing
 
     except ESITokenError:
         assets_scope_missing = True
@@ -329,8 +571,10 @@ def _refresh_corp_assets(corporation_id: int) -> tuple[list[dict], bool]:
         logger.warning(
             "Unexpected error refreshing corp assets for %s: %s", corporation_id, exc
         )
+    finally:
+        cache.delete(lock_key)
 
-    return [], assets_scope_missing
+    return 0, assets_scope_missing
 
 
 def get_corp_assets_cached(
@@ -378,22 +622,11 @@ def get_corp_assets_cached(
         return assets, assets_scope_missing
 
     if allow_refresh:
-        refreshed_assets, assets_scope_missing = _refresh_corp_assets(corporation_id)
-        # After refresh, return a lazy queryset if requested; otherwise the refreshed list
-        if refreshed_assets:
-            if as_queryset:
-                qs = CachedCorporationAsset.objects.filter(
-                    corporation_id=corporation_id
-                )
-                if location_flags:
-                    qs = qs.filter(location_flag__in=location_flags)
-                return (
-                    qs.values(*values_fields) if values_fields else qs,
-                    assets_scope_missing,
-                )
-            return refreshed_assets, assets_scope_missing
+        # Refreshed rows are streamed into the table; read them back below
+        # (lazily when ``as_queryset``) instead of holding the ESI payload.
+        _refreshed, assets_scope_missing = _refresh_corp_assets(corporation_id)
 
-    # Fallback to whatever is in cache even if stale
+    # Freshly refreshed rows, or whatever is in cache even if stale
     if as_queryset:
         return (
             qs.values(*values_fields) if values_fields else qs,
@@ -794,7 +1027,11 @@ def resolve_structure_names(
             known[int(mid)] = combined
             CachedStructureName.objects.update_or_create(
                 structure_id=int(mid),
-                defaults={"name": combined, "last_resolved": now},
+                defaults={
+                    "name": combined,
+                    "source": CachedStructureName.Source.HANGAR,
+                    "last_resolved": now,
+                },
             )
 
     # Return only requested ids
@@ -881,8 +1118,11 @@ def get_corp_divisions_cached(
     return {obj.division: obj.name for obj in qs}, scope_missing
 
 
-def force_refresh_corp_assets(corporation_id: int) -> tuple[list[dict], bool]:
-    """Force refresh of corp assets cache regardless of staleness."""
+def force_refresh_corp_assets(corporation_id: int) -> tuple[int, bool]:
+    """Force refresh of corp assets cache regardless of staleness.
+
+    Returns the number of assets written and whether the scope is missing.
+    """
 
     return _refresh_corp_assets(corporation_id)
 
@@ -893,8 +1133,138 @@ def force_refresh_corp_divisions(corporation_id: int) -> tuple[dict[int, str], b
     return _refresh_corp_divisions(corporation_id)
 
 
+def apply_character_asset_diff(
+    user, character_id: int, rows: list[CachedCharacterAsset]
+) -> dict[str, int]:
+    """Apply one character's full asset snapshot as inserts/updates/deletes.
+
+    Rows are matched to the cache on ``item_id``; unchanged rows are not
+    written. Returns the number of rows inserted, updated, deleted and left
+    unchanged.
+    """
+
+    existing: dict[int, tuple[int, tuple]] = {}
+    delete_ids: list[int] = []
+    current_rows = CachedCharacterAsset.objects.filter(
+        user=user, character_id=int(character_id)
+    ).values_list("id", "item_id", *_CHAR_ASSET_DIFF_FIELDS)
+    for pk, item_id, *values in current_rows.iterator(chunk_size=2000):
+        if item_id is None or item_id in existing:
+            # Unmatchable or duplicate legacy rows are simply replaced.
+            delete_ids.append(pk)
+            continue
+        existing[item_id] = (pk, tuple(values))
+
+    inserts: list[CachedCharacterAsset] = []
+    updates: list[CachedCharacterAsset] = []
+    unchanged = 0
+    for row in rows:
+        current = existing.pop(row.item_id, None) if row.item_id is not None else None
+        if current is None:
+            inserts.append(row)
+            continue
+        pk, values = current
+        if values == tuple(getattr(row, field) for field in _CHAR_ASSET_DIFF_FIELDS):
+            unchanged += 1
+            continue
+        row.pk = pk
+        updates.append(row)
+    delete_ids.extend(pk for pk, _values in existing.values())
+
+    with transaction.atomic():
+        for start in range(0, len(delete_ids), ASSET_WRITE_BATCH_SIZE):
+            CachedCharacterAsset.objects.filter(
+                id__in=delete_ids[start : start + ASSET_WRITE_BATCH_SIZE]
+            ).delete()
+        if updates:
+            CachedCharacterAsset.objects.bulk_update(
+                updates, [*_CHAR_ASSET_DIFF_FIELDS, "synced_at"], batch_size=500
+            )
+        if inserts:
+            CachedCharacterAsset.objects.bulk_create(inserts, batch_size=1000)
+
+    return {
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "deleted": len(delete_ids),
+        "unchanged": unchanged,
+    }
+
+
+def prune_character_assets(user, keep_character_ids) -> int:
+    """Delete cached rows for characters that can no longer be refreshed."""
+
+    deleted, _details = (
+        CachedCharacterAsset.objects.filter(user=user)
+        .exclude(character_id__in=[int(cid) for cid in keep_character_ids])
+        .delete()
+    )
+    return deleted
+
+
+def record_character_asset_refresh(user_id: int, stats: dict[str, int]) -> None:
+    """Remember when and how a user's assets were last refreshed.
+
+    Unchanged rows keep their ``synced_at``, so freshness checks read this
+    marker as well as the newest row.
+    """
+
+    cache.set(
+        f"{_CHAR_ASSET_REFRESH_CACHE_PREFIX}:{int(user_id)}",
+        {"refreshed_at": timezone.now(), **stats},
+        max(CHAR_ASSET_CACHE_MAX_AGE_MINUTES, 1) * 60 * 4,
+    )
+    logger.info(
+        "Character assets refreshed for user %s: %s inserted, %s updated, "
+        "%s deleted, %s unchanged, %s character(s) failed",
+        user_id,
+        stats.get("inserted", 0),
+        stats.get("updated", 0),
+        stats.get("deleted", 0),
+        stats.get("unchanged", 0),
+        stats.get("failed_characters", 0),
+    )
+
+
+def get_character_asset_refresh_stats(user_id: int) -> dict | None:
+    """Return the rows-touched counters of a user's last asset refresh."""
+
+    return cache.get(f"{_CHAR_ASSET_REFRESH_CACHE_PREFIX}:{int(user_id)}")
+
+
+def get_character_assets_last_refreshed(user_id: int):
+    """Return when a user's character assets were last refreshed, if ever.
+
+    This is the newer of the last refresh marker and the newest row's
+    ``synced_at``; rows created before the marker existed still count.
+    """
+
+    latest = (
+        CachedCharacterAsset.objects.filter(user_id=user_id)
+        .order_by("-synced_at")
+        .values_list("synced_at", flat=True)
+        .first()
+    )
+    last_refresh = get_character_asset_refresh_stats(user_id) or {}
+    refreshed_at = last_refresh.get("refreshed_at")
+    if refreshed_at and (latest is None or refreshed_at > latest):
+        latest = refreshed_at
+    return latest
+
+
+def merge_diff_stats(total: dict[str, int], stats: dict[str, int]) -> None:
+    """Add the per-key row counters of ``stats`` into ``total``."""
+
+    for key, value in stats.items():
+        total[key] = total.get(key, 0) + value
+
+
 def _refresh_character_assets(user) -> tuple[list[dict], bool]:
-    """Fetch character assets for a user from ESI and refresh the cache."""
+    """Fetch character assets for a user from ESI and diff them into the cache.
+
+    Each character is fetched and applied on its own: a failing token leaves
+    that character's cached rows untouched instead of forcing a rewrite.
+    """
 
     asset_scope = "esi-assets.read_assets.v1"
     tokens = (
@@ -904,9 +1274,10 @@ def _refresh_character_assets(user) -> tuple[list[dict], bool]:
         return [], True
 
     assets_scope_missing = False
-    rows: list[CachedCharacterAsset] = []
     all_assets: list[dict] = []
     now = timezone.now()
+    stats: dict[str, int] = {"failed_characters": 0}
+    refreshable_character_ids: set[int] = set()
 
     corp_ids: set[int] = set()
     structure_ids_by_character: dict[int, set[int]] = {}
@@ -921,6 +1292,7 @@ def _refresh_character_assets(user) -> tuple[list[dict], bool]:
             pass
         if not character_id:
             continue
+        refreshable_character_ids.add(int(character_id))
         try:
             assets = shared_client.fetch_character_assets(
                 character_id=int(character_id)
@@ -934,17 +1306,13 @@ def _refresh_character_assets(user) -> tuple[list[dict], bool]:
             logger.warning(
                 "Failed to load assets for character %s: %s", character_id, exc
             )
+            stats["failed_characters"] += 1
             continue
 
-        index_by_item_id = build_asset_index_by_item_id(assets or [])
-
-        for asset in assets:
-            resolved_location_id = resolve_asset_root_location_id(
-                asset, index_by_item_id
-            )
-            if resolved_location_id is None:
-                resolved_location_id = int(asset.get("location_id", 0) or 0)
+        root_location_ids = AssetTree.from_assets(assets or []).root_location_ids()
+        rows: list[CachedCharacterAsset] = []
 
+        for asset, resolved_location_id in zip(assets or [], root_location_ids):
             item_id = asset.get("item_id")
             try:
                 item_id_int = int(item_id) if item_id is not None else None
@@ -993,13 +1361,17 @@ def _refresh_character_assets(user) -> tuple[list[dict], bool]:
                 }
             )
 
+        merge_diff_stats(stats, apply_character_asset_diff(user, character_id, rows))
+
     for corp_id in corp_ids:
         _cache_corp_structure_names(corp_id)
 
-    with transaction.atomic():
-        CachedCharacterAsset.objects.filter(user=user).delete()
-        if rows:
-            CachedCharacterAsset.objects.bulk_create(rows, batch_size=1000)
+    # Characters without a valid assets token can no longer be refreshed.
+    stats["deleted"] = stats.get("deleted", 0) + prune_character_assets(
+        user, refreshable_character_ids
+    )
+    if stats["failed_characters"] < len(refreshable_character_ids):
+        record_character_asset_refresh(user.id, stats)
 
     # Populate CachedStructureName for any newly observed hangar structure ids.
     # This is intentionally best-effort: lack of scope or 403s should not break asset refresh.
@@ -1031,7 +1403,7 @@ def get_user_assets_cached(
 
     max_age = max_age_minutes or CHAR_ASSET_CACHE_MAX_AGE_MINUTES
     qs = CachedCharacterAsset.objects.filter(user=user)
-    latest = qs.order_by("-synced_at").values_list("synced_at", flat=True).first()
+    latest = get_character_assets_last_refreshed(user.id)
     assets_scope_missing = False
 
     if latest and timezone.now() - latest <= timedelta(minutes=max_age):
@@ -1050,9 +1422,8 @@ def get_user_assets_cached(
         return assets, assets_scope_missing
 
     if allow_refresh:
-        refreshed_assets, assets_scope_missing = _refresh_character_assets(user)
-        if refreshed_assets:
-            return refreshed_assets, assets_scope_missing
+        # Read back from the cache: characters whose fetch failed keep their rows.
+        _refreshed, assets_scope_missing = _refresh_character_assets(user)
 
     assets = [
         {
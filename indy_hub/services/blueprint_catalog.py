@@ -0,0 +1,275 @@
+"""Denormalized catalog of originals shared for copy requests.
+
+``SharedBlueprintCatalogEntry`` holds one row per (scope key, type, ME, TE)
+where a scope key is ``everyone``, ``corp:<id>`` or ``alliance:<id>``. A
+viewer sees the union of the keys matching their affiliations, so the copy
+request page is a single indexed query instead of re-evaluating every
+sharing setting against every shared blueprint on each load.
+
+Rows are refreshed per type when blueprint syncs change originals and per
+owner when sharing settings change; a periodic full rebuild picks up
+affiliation changes (characters moving corporation or alliance).
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+
+# Django
+from django.core.cache import cache
+from django.db import transaction
+
+# AA Example App
+from indy_hub.models import (
+    Blueprint,
+    CharacterSettings,
+    CorporationSharingSetting,
+    SharedBlueprintCatalogEntry,
+)
+
+logger = logging.getLogger(__name__)
+
+SCOPE_EVERYONE_KEY = "everyone"
+CATALOG_BUILT_CACHE_KEY = "indy_hub:bp_catalog:built"
+CATALOG_BUILT_TTL_SECONDS = 24 * 60 * 60
+_BATCH_SIZE = 500
+# Keep IN (...) clauses well below the parameter limits of every supported backend.
+_CHUNK_SIZE = 900
+
+
+def corporation_scope_key(corporation_id: int) -> str:
+    return f"corp:{int(corporation_id)}"
+
+
+def alliance_scope_key(alliance_id: int) -> str:
+    return f"alliance:{int(alliance_id)}"
+
+
+def _chunked(values: Iterable[int], size: int = _CHUNK_SIZE):
+    values = sorted(values)
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def viewer_scope_keys(user) -> list[str]:
+    """Return the catalog scope keys visible to ``user``."""
+
+    # Alliance Auth
+    from allianceauth.eveonline.models import EveCharacter
+
+    keys: set[str] = set()
+    if user.has_perm("indy_hub.can_access_indy_hub"):
+        keys.add(SCOPE_EVERYONE_KEY)
+    affiliations = EveCharacter.objects.filter(
+        character_ownership__user=user
+    ).values_list("corporation_id", "alliance_id")
+    for corp_id, alliance_id in affiliations:
+        if corp_id:
+            keys.add(corporation_scope_key(corp_id))
+        if alliance_id:
+            keys.add(alliance_scope_key(alliance_id))
+    return sorted(keys)
+
+
+def _scope_keys_for(scope: str, corp_ids: set[int], alliance_ids: set[int]) -> set[str]:
+    if scope == CharacterSettings.SCOPE_EVERYONE:
+        return {SCOPE_EVERYONE_KEY}
+    keys = {corporation_scope_key(corp_id) for corp_id in corp_ids}
+    if scope == CharacterSettings.SCOPE_ALLIANCE:
+        keys.update(alliance_scope_key(alliance_id) for alliance_id in alliance_ids)
+    elif scope != CharacterSettings.SCOPE_CORPORATION:
+        return set()
+    return keys
+
+
+def _provider_scopes() -> tuple[dict[int, set[str]], dict[tuple[int, int], set[str]]]:
+    """Return scope keys for character-level and corporate sharing owners.
+
+    Mirrors the visibility rules of the copy request page: corporation scope
+    is visible to members of the owner's corporations, alliance scope also to
+    their alliances, and everyone scope to any user with Indy Hub access.
+    """
+
+    # Alliance Auth
+    from allianceauth.eveonline.models import EveCharacter, EveCorporationInfo
+
+    character_settings = list(
+        CharacterSettings.objects.filter(character_id=0, allow_copy_requests=True)
+        .exclude(copy_sharing_scope=CharacterSettings.SCOPE_NONE)
+        .values_list("user_id", "copy_sharing_scope")
+    )
+    corporation_settings = list(
+        CorporationSharingSetting.objects.filter(allow_copy_requests=True)
+        .exclude(share_scope=CharacterSettings.SCOPE_NONE)
+        .values_list("user_id", "corporation_id", "share_scope")
+    )
+
+    owner_user_ids = {user_id for user_id, _scope in character_settings} | {
+        user_id for user_id, _corp_id, _scope in corporation_settings
+    }
+    owner_corp_ids: dict[int, set[int]] = defaultdict(set)
+    owner_alliance_ids: dict[int, set[int]] = defaultdict(set)
+    corp_alliance_map: dict[int, set[int]] = defaultdict(set)
+    if owner_user_ids:
+        owner_characters = EveCharacter.objects.filter(
+            character_ownership__user_id__in=owner_user_ids
+        ).values_list("character_ownership__user_id", "corporation_id", "alliance_id")
+        for user_id, corp_id, alliance_id in owner_characters:
+            if corp_id is not None:
+                owner_corp_ids[user_id].add(corp_id)
+                if alliance_id:
+                    corp_alliance_map[corp_id].add(alliance_id)
+            if alliance_id:
+                owner_alliance_ids[user_id].add(alliance_id)
+
+    missing_corp_ids = {
+        corp_id
+        for _user_id, corp_id, _scope in corporation_settings
+        if corp_id and not corp_alliance_map.get(corp_id)
+    }
+    for batch in _chunked(missing_corp_ids):
+        records = EveCorporationInfo.objects.filter(
+            corporation_id__in=batch
+        ).values_list("corporation_id", "alliance_id")
+        for corp_id, alliance_id in records:
+            if corp_id and alliance_id:
+                corp_alliance_map[corp_id].add(alliance_id)
+
+    character_scopes: dict[int, set[str]] = {}
+    for user_id, scope in character_settings:
+        keys = _scope_keys_for(
+            scope,
+            owner_corp_ids.get(user_id, set()),
+            owner_alliance_ids.get(user_id, set()),
+        )
+        if keys:
+            character_scopes[user_id] = keys
+
+    corporate_scopes: dict[tuple[int, int], set[str]] = {}
+    for user_id, corp_id, scope in corporation_settings:
+        if not corp_id:
+            continue
+        keys = _scope_keys_for(scope, {corp_id}, corp_alliance_map.get(corp_id, set()))
+        if keys:
+            corporate_scopes[(user_id, corp_id)] = keys
+
+    return character_scopes, corporate_scopes
+
+
+def _build_entries(type_ids: set[int] | None) -> list[SharedBlueprintCatalogEntry]:
+    character_scopes, corporate_scopes = _provider_scopes()
+    if not character_scopes and not corporate_scopes:
+        return []
+
+    corporate_user_ids = {user_id for user_id, _corp_id in corporate_scopes}
+    originals = Blueprint.objects.filter(bp_type=Blueprint.BPType.ORIGINAL).filter(
+        owner_user_id__in=set(character_scopes) | corporate_user_ids
+    )
+    columns = (
+        "owner_user_id",
+        "owner_kind",
+        "corporation_id",
+        "type_id",
+        "type_name",
+        "material_efficiency",
+        "time_efficiency",
+    )
+    if type_ids is None:
+        batches = [originals.values_list(*columns).iterator(chunk_size=2000)]
+    else:
+        batches = [
+            originals.filter(type_id__in=batch).values_list(*columns)
+            for batch in _chunked(type_ids)
+        ]
+
+    names: dict[int, str] = {}
+    providers: dict[tuple[str, int, int, int], set] = defaultdict(set)
+    for rows in batches:
+        for user_id, kind, corp_id, type_id, type_name, me, te in rows:
+            if kind == Blueprint.OwnerKind.CORPORATION:
+                provider = (user_id, corp_id)
+                keys = corporate_scopes.get(provider)
+            else:
+                provider = user_id
+                keys = character_scopes.get(user_id)
+            if not keys:
+                continue
+            if type_name and not names.get(type_id):
+                names[type_id] = type_name
+            for key in keys:
+                providers[(key, type_id, me, te)].add(provider)
+
+    return [
+        SharedBlueprintCatalogEntry(
+            scope_key=key,
+            type_id=type_id,
+            material_efficiency=me,
+            time_efficiency=te,
+            type_name=names.get(type_id) or str(type_id),
+            provider_count=len(owners),
+        )
+        for (key, type_id, me, te), owners in providers.items()
+    ]
+
+
+def refresh_blueprint_catalog(type_ids: Iterable[int] | None = None) -> int:
+    """Rebuild catalog rows for ``type_ids`` (or everything) from the source tables.
+
+    Returns the number of catalog rows written.
+    """
+
+    ids = None if type_ids is None else {int(pk) for pk in type_ids if pk}
+    if ids is not None and not ids:
+        return 0
+
+    entries = _build_entries(ids)
+    with transaction.atomic():
+        if ids is None:
+            SharedBlueprintCatalogEntry.objects.all().delete()
+        else:
+            for batch in _chunked(ids):
+                SharedBlueprintCatalogEntry.objects.filter(type_id__in=batch).delete()
+        # The rows were just deleted, so a plain insert suffices. A concurrent
+        # refresh of the same types built the same rows; keep whichever
+        # committed first rather than fail (an upsert with a conflict target
+        # is not available on MySQL/MariaDB).
+        SharedBlueprintCatalogEntry.objects.bulk_create(
+            entries, batch_size=_BATCH_SIZE, ignore_conflicts=True
+        )
+
+    if ids is None:
+        cache.set(CATALOG_BUILT_CACHE_KEY, True, CATALOG_BUILT_TTL_SECONDS)
+    logger.debug(
+        "Shared blueprint catalog refreshed (%s types, %s rows)",
+        "all" if ids is None else len(ids),
+        len(entries),
+    )
+    return len(entries)
+
+
+def refresh_catalog_for_owner(user_id: int, corporation_id: int | None = None) -> int:
+    """Refresh the catalog rows for every original one sharing owner holds."""
+
+    originals = Blueprint.objects.filter(
+        owner_user_id=user_id, bp_type=Blueprint.BPType.ORIGINAL
+    )
+    if corporation_id is None:
+        originals = originals.filter(owner_kind=Blueprint.OwnerKind.CHARACTER)
+    else:
+        originals = originals.filter(
+            owner_kind=Blueprint.OwnerKind.CORPORATION, corporation_id=corporation_id
+        )
+    return refresh_blueprint_catalog(
+        set(originals.values_list("type_id", flat=True).distinct())
+    )
+
+
+def ensure_blueprint_catalog() -> None:
+    """Build the catalog once when it has never been built (e.g. after install)."""
+
+    if cache.get(CATALOG_BUILT_CACHE_KEY):
+        return
+    refresh_blueprint_catalog()
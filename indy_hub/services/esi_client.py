@@ -3,8 +3,16 @@
 from __future__ import annotations
 
 # Standard Library
+import hashlib
 import logging
+import re
+import threading
 import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 # Third Party
 import requests
@@ -15,16 +23,29 @@ from urllib3.util.retry import Retry
 try:
     # Django
     from django.conf import settings
+    from django.core.cache import cache
 except Exception:  # pragma: no cover - settings might be unavailable in tests
     settings = None
+    cache = None
 
 # Alliance Auth
 from esi.models import Token
 
+from .esi_governor import ErrorBudgetGovernor
+
 logger = logging.getLogger(__name__)
 
 ESI_BASE_URL = "https://esi.evetech.net/latest"
 DEFAULT_COMPATIBILITY_DATE = "2025-09-30"
+DEFAULT_PAGE_CONCURRENCY = 4
+# Stop fanning out page requests once fewer errors than this remain in the
+# current ESI error-limit window.
+DEFAULT_ERROR_LIMIT_THRESHOLD = 10
+# Longer error-budget waits raise ESIRateLimitError instead of sleeping.
+DEFAULT_MAX_INLINE_WAIT = 5.0
+DEFAULT_CONDITIONAL_CACHE_TTL = 24 * 60 * 60
+_CONDITIONAL_CACHE_PREFIX = "indy_hub:esi_etag:"
+_ENDPOINT_ID_PATTERN = re.compile(r"/\d+(?=/|$)")
 
 
 class ESIClientError(Exception):
@@ -69,6 +90,44 @@ class ESIRateLimitError(ESIClientError):
         self.remaining = remaining
 
 
+class PaginatedPayload(list):
+    """Rows of a paginated ESI endpoint.
+
+    ``not_modified`` is set when every page was answered with HTTP 304, i.e.
+    the rows are the cached copy of what the caller last synchronized.
+    ``expires`` and ``last_modified`` are the cache headers of page 1.
+    """
+
+    def __init__(
+        self,
+        rows=(),
+        *,
+        not_modified: bool = False,
+        cache_keys=(),
+        expires: datetime | None = None,
+        last_modified: datetime | None = None,
+    ):
+        super().__init__(rows)
+        self.not_modified = not_modified
+        self.cache_keys = list(cache_keys)
+        self.expires = expires
+        self.last_modified = last_modified
+
+
+def parse_http_date(value: str | None) -> datetime | None:
+    """Return an aware datetime for an HTTP date header, or None."""
+
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
 def rate_limit_wait_seconds(
     response: Response, fallback: float
 ) -> tuple[float, int | None]:
@@ -113,12 +172,25 @@ class ESIClient:
         max_attempts: int = 3,
         backoff_factor: float = 0.75,
         compatibility_date: str | None = None,
+        page_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        error_limit_threshold: int = DEFAULT_ERROR_LIMIT_THRESHOLD,
+        conditional_cache_ttl: int = DEFAULT_CONDITIONAL_CACHE_TTL,
+        max_inline_wait: float = DEFAULT_MAX_INLINE_WAIT,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_attempts = max_attempts
         self.backoff_factor = backoff_factor
         self.compatibility_date = (compatibility_date or "").strip() or None
+        self.page_concurrency = max(1, int(page_concurrency))
+        self.error_limit_threshold = max(0, int(error_limit_threshold))
+        # Error-limit state shared by every worker through the Django cache.
+        self.governor = ErrorBudgetGovernor(threshold=self.error_limit_threshold)
+        self.max_inline_wait = max(0.0, float(max_inline_wait))
+        # ETag + body cache for paginated endpoints; 0 disables it.
+        self.conditional_cache_ttl = max(0, int(conditional_cache_ttl))
+        self._conditional_stats_lock = threading.Lock()
+        self._conditional_stats: dict[str, dict[str, int]] = {}
         self.session = requests.Session()
         retry = Retry(
             total=max_attempts,
@@ -129,7 +201,10 @@ class ESIClient:
             status_forcelist=(429, 500, 502, 503, 504),
             allowed_methods=("GET",),
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_maxsize=max(10, self.page_concurrency),
+        )
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         self._default_headers: dict[str, str] = {"Accept": "application/json"}
@@ -148,6 +223,7 @@ class ESIClient:
             character_id=character_id,
             scope="esi-characters.read_blueprints.v1",
             endpoint=f"/characters/{character_id}/blueprints/",
+            conditional=True,
         )
 
     def fetch_character_industry_jobs(self, character_id: int) -> list[dict]:
@@ -167,6 +243,7 @@ class ESIClient:
             character_id=character_id,
             scope="esi-corporations.read_blueprints.v1",
             endpoint=f"/corporations/{corporation_id}/blueprints/",
+            conditional=True,
         )
 
     def fetch_corporation_industry_jobs(
@@ -311,7 +388,62 @@ class ESIClient:
         character_id: int,
         scope: str,
         endpoint: str,
+        conditional: bool = False,
     ) -> list[dict]:
+        """Fetch every page of ``endpoint`` into one list (see ``_iter_pages``)."""
+
+        aggregated: list[dict] = []
+        not_modified = True
+        total_pages = 1
+        cache_headers: dict[str, datetime | None] = {}
+        for rows, total_pages, page_not_modified in self._iter_pages(
+            character_id=character_id,
+            scope=scope,
+            endpoint=endpoint,
+            cache_headers=cache_headers,
+            conditional=conditional,
+        ):
+            aggregated.extend(rows)
+            not_modified = not_modified and page_not_modified
+        return PaginatedPayload(
+            aggregated,
+            not_modified=not_modified,
+            cache_keys=(
+                [
+                    self._conditional_cache_key(endpoint, character_id, page)
+                    for page in range(1, total_pages + 1)
+                ]
+                if conditional
+                else []
+            ),
+            expires=cache_headers.get("expires"),
+            last_modified=cache_headers.get("last_modified"),
+        )
+
+    def _iter_pages(
+        self,
+        *,
+        character_id: int,
+        scope: str,
+        endpoint: str,
+        cache_headers: dict | None = None,
+        conditional: bool = False,
+    ) -> Iterator[tuple[list[dict], int, bool]]:
+        """Yield ``(rows, total_pages, not_modified)`` per page, in ESI page order.
+
+        Page 1 is fetched first to learn ``X-Pages``; the remaining pages are
+        requested over at most ``page_concurrency`` threads sharing the pooled
+        session, never running more than that many pages ahead of the
+        consumer. The fan-out falls back to sequential requests while the ESI
+        error budget is low. When given, ``cache_headers`` receives the parsed
+        ``Expires`` / ``Last-Modified`` headers of page 1.
+
+        With ``conditional``, page bodies are kept in the shared cache with
+        their ETag and unchanged pages are served from it on HTTP 304. Only
+        endpoints whose callers act on ``not_modified`` opt in, so large
+        payloads such as corporation assets never land in the cache.
+        """
+
         token_obj = self._get_token(character_id, scope)
         try:
             access_token = token_obj.valid_access_token()
@@ -321,36 +453,192 @@ class ESIClient:
             ) from exc
         url = f"{self.base_url}{endpoint}"
         headers = {"Authorization": f"Bearer {access_token}"}
-        params = {"datasource": "tranquility", "page": 1}
 
-        aggregated: list[dict] = []
-        while True:
-            try:
-                response = self._request("GET", url, headers=headers, params=params)
-            except ESITokenError as exc:
-                if exc.status_code == 403:
-                    self._handle_forbidden_token(
-                        token_obj,
-                        scope=scope,
-                        endpoint=endpoint,
-                    )
-                    raise ESIForbiddenError(
-                        f"Access denied for {endpoint}",
-                        character_id=int(character_id),
-                    ) from exc
-                raise
+        def fetch_page(page: int) -> tuple[list[dict], int, bool]:
+            cache_key = self._conditional_cache_key(endpoint, character_id, page)
+            cached = self._read_conditional(cache_key) if conditional else None
+            page_headers = dict(headers)
+            if cached:
+                page_headers["If-None-Match"] = cached["etag"]
+            response = self._request(
+                "GET",
+                url,
+                headers=page_headers,
+                params={"datasource": "tranquility", "page": page},
+            )
+            if page == 1 and cache_headers is not None:
+                cache_headers["expires"] = parse_http_date(
+                    response.headers.get("Expires")
+                )
+                cache_headers["last_modified"] = parse_http_date(
+                    response.headers.get("Last-Modified")
+                )
+            if response.status_code == 304 and cached:
+                self._count_conditional(endpoint, not_modified=True)
+                total = response.headers.get("X-Pages") or cached.get("pages", 1)
+                return cached["body"], int(total), True
+
             payload = response.json()
             if not isinstance(payload, list):
                 raise ESIClientError(
                     f"ESI {endpoint} returned an unexpected payload type: {type(payload)}"
                 )
-            aggregated.extend(payload)
+            total = int(response.headers.get("X-Pages", 1))
+            if conditional:
+                self._count_conditional(endpoint, not_modified=False)
+                self._write_conditional(
+                    cache_key, response.headers.get("ETag"), payload, total
+                )
+            return payload, total, False
 
-            total_pages = int(response.headers.get("X-Pages", 1))
-            if params["page"] >= total_pages:
-                break
-            params["page"] += 1
-        return aggregated
+        try:
+            first_page = fetch_page(1)
+            yield first_page
+            remaining_pages = range(2, first_page[1] + 1)
+            workers = min(self.page_concurrency, len(remaining_pages))
+            if workers <= 1 or self._error_budget_low():
+                for page in remaining_pages:
+                    yield fetch_page(page)
+            else:
+                yield from self._map_pages(fetch_page, remaining_pages, workers)
+        except ESITokenError as exc:
+            if exc.status_code == 403:
+                self._handle_forbidden_token(
+                    token_obj,
+                    scope=scope,
+                    endpoint=endpoint,
+                )
+                raise ESIForbiddenError(
+                    f"Access denied for {endpoint}",
+                    character_id=int(character_id),
+                ) from exc
+            raise
+
+    @staticmethod
+    def _map_pages(fetch_page, pages, workers: int) -> Iterator:
+        """Yield ``fetch_page`` results for ``pages`` in order from a thread pool.
+
+        A sliding window keeps at most ``workers`` pages in flight or buffered,
+        so memory stays bounded however slowly the consumer drains them.
+        """
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="indy-hub-esi"
+        )
+        page_iter = iter(pages)
+        window = deque(
+            executor.submit(fetch_page, page)
+            for _slot, page in zip(range(workers), page_iter)
+        )
+        try:
+            while window:
+                result = window.popleft().result()
+                next_page = next(page_iter, None)
+                if next_page is not None:
+                    window.append(executor.submit(fetch_page, next_page))
+                yield result
+        finally:
+            # On failure or early exit, drop the pages that have not started yet.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _conditional_cache_key(
+        self, endpoint: str, character_id: int, page: int
+    ) -> str:
+        digest = hashlib.md5(
+            f"{self.base_url}{endpoint}|{character_id}|{page}".encode()
+        ).hexdigest()
+        return f"{_CONDITIONAL_CACHE_PREFIX}{digest}"
+
+    def _read_conditional(self, cache_key: str) -> dict | None:
+        if cache is None or not self.conditional_cache_ttl:
+            return None
+        try:
+            entry = cache.get(cache_key)
+        except Exception:  # pragma: no cover - cache backend unavailable
+            return None
+        if isinstance(entry, dict) and entry.get("etag"):
+            return entry
+        return None
+
+    def _write_conditional(
+        self, cache_key: str, etag: str | None, body: list, pages: int
+    ) -> None:
+        if cache is None or not self.conditional_cache_ttl:
+            return
+        try:
+            if etag:
+                cache.set(
+                    cache_key,
+                    {"etag": etag, "body": body, "pages": pages},
+                    self.conditional_cache_ttl,
+                )
+            else:
+                cache.delete(cache_key)
+        except Exception:  # pragma: no cover - cache backend unavailable
+            logger.debug("Unable to store ESI ETag for %s", cache_key, exc_info=True)
+
+    def discard_conditional_cache(self, payload: PaginatedPayload) -> None:
+        """Forget the ETags behind ``payload`` so the next fetch returns 200.
+
+        Callers that skip their writes on ``not_modified`` use this when a
+        write phase fails, so the database is not left behind the cache.
+        """
+
+        keys = list(getattr(payload, "cache_keys", ()) or ())
+        if cache is None or not keys:
+            return
+        try:
+            cache.delete_many(keys)
+        except Exception:  # pragma: no cover - cache backend unavailable
+            logger.debug("Unable to discard %s ESI ETags", len(keys), exc_info=True)
+
+    def _count_conditional(self, endpoint: str, *, not_modified: bool) -> None:
+        label = _ENDPOINT_ID_PATTERN.sub("/{id}", endpoint)
+        with self._conditional_stats_lock:
+            counters = self._conditional_stats.setdefault(
+                label, {"not_modified": 0, "modified": 0}
+            )
+            counters["not_modified" if not_modified else "modified"] += 1
+
+    def conditional_request_stats(self) -> dict[str, dict[str, int]]:
+        """Return per-endpoint counts of 304 (``not_modified``) vs 200 pages."""
+
+        with self._conditional_stats_lock:
+            return {
+                label: dict(counters)
+                for label, counters in self._conditional_stats.items()
+            }
+
+    def _record_error_limit(self, response: Response) -> None:
+        self.governor.record_headers(response.headers)
+
+    def _error_budget_low(self) -> bool:
+        wait, _remain = self.governor.wait_seconds()
+        return wait > 0
+
+    def _wait_for_error_budget(self) -> None:
+        """Hold new requests while the shared ESI error budget is spent.
+
+        Waits up to ``max_inline_wait`` are slept through; longer ones raise
+        ``ESIRateLimitError`` so the calling task can defer itself instead of
+        blocking a worker until the window resets.
+        """
+
+        wait, remain = self.governor.wait_seconds()
+        if wait <= 0:
+            return
+        if wait > self.max_inline_wait:
+            raise ESIRateLimitError(
+                f"ESI error budget spent (remaining={remain}); retry in {wait:.0f}s",
+                retry_after=wait,
+                remaining=remain,
+            )
+        logger.warning(
+            "ESI error budget low (remaining=%s); pausing %.1fs before next request",
+            remain,
+            wait,
+        )
+        time.sleep(wait)
 
     def _get_token(self, character_id: int, scope: str) -> Token:
         try:
@@ -375,6 +663,7 @@ class ESIClient:
             attempt += 1
             headers = kwargs.pop("headers", None)
             kwargs["headers"] = self._merge_headers(headers)
+            self._wait_for_error_budget()
             try:
                 response = self.session.request(
                     method, url, timeout=self.timeout, **kwargs
@@ -396,6 +685,7 @@ class ESIClient:
                 time.sleep(sleep_for)
                 continue
 
+            self._record_error_limit(response)
             if response.status_code in (401, 403):
                 raise ESITokenError(
                     f"Invalid token for {url} (status {response.status_code})",
@@ -413,12 +703,13 @@ class ESIClient:
                     remaining,
                     sleep_for,
                 )
-                if attempt >= self.max_attempts:
+                # Every worker holds off, not just this one.
+                self.governor.pause(sleep_for)
+                if attempt >= self.max_attempts or sleep_for > self.max_inline_wait:
                     raise ESIRateLimitError(
                         retry_after=sleep_for,
                         remaining=remaining,
                     )
-                time.sleep(sleep_for)
                 continue
             if response.status_code >= 400:
                 if attempt >= self.max_attempts:
@@ -449,6 +740,7 @@ class ESIClient:
             character_id=character_id,
             scope="esi-contracts.read_corporation_contracts.v1",
             endpoint=f"/corporations/{corporation_id}/contracts/",
+            conditional=True,
         )
 
     def fetch_corporation_contract_items(
@@ -478,6 +770,21 @@ class ESIClient:
             endpoint=f"/corporations/{corporation_id}/assets/",
         )
 
+    def iter_corporation_asset_pages(
+        self,
+        corporation_id: int,
+        *,
+        character_id: int,
+    ) -> Iterator[list[dict]]:
+        """Yield corporation asset pages one at a time for streaming consumers."""
+
+        for rows, _total, _not_modified in self._iter_pages(
+            character_id=character_id,
+            scope="esi-assets.read_corporation_assets.v1",
+            endpoint=f"/corporations/{corporation_id}/assets/",
+        ):
+            yield rows
+
     def fetch_character_assets(self, *, character_id: int) -> list[dict]:
         """Fetch all assets for a character using their token."""
 
@@ -616,7 +923,31 @@ if settings is not None:
         "INDY_HUB_ESI_COMPATIBILITY_DATE",
         DEFAULT_COMPATIBILITY_DATE,
     )
+    _page_concurrency = getattr(
+        settings, "INDY_HUB_ESI_PAGE_CONCURRENCY", DEFAULT_PAGE_CONCURRENCY
+    )
+    _error_limit_threshold = getattr(
+        settings,
+        "INDY_HUB_ESI_ERROR_LIMIT_THRESHOLD",
+        DEFAULT_ERROR_LIMIT_THRESHOLD,
+    )
+    _conditional_cache_ttl = getattr(
+        settings, "INDY_HUB_ESI_ETAG_CACHE_TTL", DEFAULT_CONDITIONAL_CACHE_TTL
+    )
+    _max_inline_wait = getattr(
+        settings, "INDY_HUB_ESI_MAX_INLINE_WAIT_SECONDS", DEFAULT_MAX_INLINE_WAIT
+    )
 else:  # pragma: no cover - running without Django settings
     _compat_date = DEFAULT_COMPATIBILITY_DATE
-
-shared_client = ESIClient(compatibility_date=_compat_date)
+    _page_concurrency = DEFAULT_PAGE_CONCURRENCY
+    _error_limit_threshold = DEFAULT_ERROR_LIMIT_THRESHOLD
+    _conditional_cache_ttl = DEFAULT_CONDITIONAL_CACHE_TTL
+    _max_inline_wait = DEFAULT_MAX_INLINE_WAIT
+
+shared_client = ESIClient(
+    compatibility_date=_compat_date,
+    page_concurrency=_page_concurrency,
+    error_limit_threshold=_error_limit_threshold,
+    conditional_cache_ttl=_conditional_cache_ttl,
+    max_inline_wait=_max_inline_wait,
+)
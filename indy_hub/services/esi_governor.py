@@ -0,0 +1,106 @@
+"""Cluster-wide ESI error-budget governor.
+
+ESI counts its error limit (``X-Esi-Error-Limit-Remain`` / ``-Reset``) per
+source IP, so every Celery worker process spends the same budget. The
+governor keeps the latest reported budget and any 420 pause in the shared
+Django cache, so a worker sees the budget another worker just spent before it
+sends its own request. Callers decide what to do with the wait: short ones
+are slept through, long ones are turned into ``ESIRateLimitError`` so tasks
+can reschedule themselves instead of holding a worker slot.
+
+Without a cache backend the state is kept per process.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import logging
+import math
+import threading
+import time
+from collections.abc import Mapping
+
+try:
+    # Django
+    from django.core.cache import cache
+except Exception:  # pragma: no cover - settings might be unavailable in tests
+    cache = None
+
+logger = logging.getLogger(__name__)
+
+_BUDGET_CACHE_KEY = "indy_hub:esi_governor:budget"
+_PAUSE_CACHE_KEY = "indy_hub:esi_governor:pause_until"
+
+
+class ErrorBudgetGovernor:
+    """Shared view of the ESI error budget.
+
+    The budget is spent once ``remain`` drops to ``threshold`` and is refilled
+    when ESI's reset window ends; a 420 response pauses everyone for the
+    advertised wait.
+    """
+
+    def __init__(self, *, threshold: int) -> None:
+        self.threshold = max(0, int(threshold))
+        self._cache = cache
+        self._local_lock = threading.Lock()
+        self._local: dict[str, object] = {}
+
+    def _get(self, key: str):
+        if self._cache is not None:
+            try:
+                return self._cache.get(key)
+            except Exception:  # pragma: no cover - cache backend unavailable
+                logger.debug("ESI governor cache read failed", exc_info=True)
+        with self._local_lock:
+            return self._local.get(key)
+
+    def _set(self, key: str, value, ttl: float) -> None:
+        with self._local_lock:
+            self._local[key] = value
+        if self._cache is not None:
+            try:
+                self._cache.set(key, value, max(int(math.ceil(ttl)), 1))
+            except Exception:  # pragma: no cover - cache backend unavailable
+                logger.debug("ESI governor cache write failed", exc_info=True)
+
+    def record_headers(self, headers: Mapping[str, str]) -> None:
+        """Store the error budget reported by an ESI response."""
+
+        remain_header = headers.get("X-Esi-Error-Limit-Remain")
+        if remain_header is None:
+            return
+        reset_header = headers.get("X-Esi-Error-Limit-Reset")
+        try:
+            remain = int(remain_header)
+            reset_in = max(float(reset_header), 0.0) if reset_header else 0.0
+        except (TypeError, ValueError):
+            return
+        self._set(
+            _BUDGET_CACHE_KEY,
+            {"remain": remain, "reset_at": time.time() + reset_in},
+            reset_in + 1,
+        )
+
+    def pause(self, seconds: float | None) -> None:
+        """Hold every worker's requests for ``seconds`` (e.g. after a 420)."""
+
+        if not seconds or seconds <= 0:
+            return
+        resume_at = time.time() + float(seconds)
+        current = self._get(_PAUSE_CACHE_KEY) or 0.0
+        if resume_at > current:
+            self._set(_PAUSE_CACHE_KEY, resume_at, seconds + 1)
+
+    def wait_seconds(self) -> tuple[float, int | None]:
+        """Return ``(seconds until requests may resume, remaining budget)``."""
+
+        now = time.time()
+        wait = max((self._get(_PAUSE_CACHE_KEY) or 0.0) - now, 0.0)
+        remain = None
+        budget = self._get(_BUDGET_CACHE_KEY)
+        if isinstance(budget, dict) and budget.get("reset_at", 0.0) > now:
+            remain = budget.get("remain")
+            if remain is not None and remain <= self.threshold:
+                wait = max(wait, budget["reset_at"] - now)
+        return wait, remain
@@ -0,0 +1,360 @@
+"""Process-wide in-memory view of the SDE manufacturing/reaction graph.
+
+The craft views used to walk ``eveuniverse_eveindustryactivity*`` one node at a
+time. The graph below is loaded once per process with two bulk queries and
+then answers every tree expansion without touching the database.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import logging
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from math import ceil
+from typing import Any
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# Manufacturing (1) and reactions (11) are the only activities the craft planner uses.
+CRAFT_ACTIVITY_IDS = (1, 11)
+DEFAULT_MAX_DEPTH = 10
+
+GRAPH_VERSION_CACHE_KEY = "indy_hub:industry_graph:version"
+# Safety net in case an SDE reload bypassed the invalidation signals.
+GRAPH_MAX_AGE_SECONDS = int(
+    getattr(settings, "INDY_HUB_INDUSTRY_GRAPH_MAX_AGE_SECONDS", 6 * 3600)
+)
+
+
+@dataclass(frozen=True)
+class IndustryGraph:
+    """Immutable blueprint/material/product lookup tables."""
+
+    # blueprint type_id -> ((material type_id, base quantity per run), ...)
+    materials: Mapping[int, tuple[tuple[int, int], ...]] = field(default_factory=dict)
+    # product type_id -> blueprint type_id producing it
+    producers: Mapping[int, int] = field(default_factory=dict)
+    # blueprint type_id -> (product type_id, quantity per run)
+    products: Mapping[int, tuple[int, int]] = field(default_factory=dict)
+    type_names: Mapping[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_rows(
+        cls,
+        *,
+        product_rows: Iterable[tuple[int, int, int]],
+        material_rows: Iterable[tuple[int, int, int]],
+        type_names: Mapping[int, str] | None = None,
+    ) -> IndustryGraph:
+        """Build a graph from ``(blueprint, product, qty)`` and ``(blueprint, material, qty)`` rows.
+
+        Rows are expected in a stable order; the first producer of a product
+        wins, matching the ``LIMIT 1`` lookups the views used before.
+        """
+
+        producers: dict[int, int] = {}
+        products: dict[int, tuple[int, int]] = {}
+        for blueprint_id, product_id, quantity in product_rows:
+            blueprint_id = int(blueprint_id)
+            if product_id:
+                producers.setdefault(int(product_id), blueprint_id)
+            products.setdefault(
+                blueprint_id, (int(product_id or 0), int(quantity or 1))
+            )
+
+        grouped: dict[int, list[tuple[int, int]]] = {}
+        for blueprint_id, material_id, quantity in material_rows:
+            grouped.setdefault(int(blueprint_id), []).append(
+                (int(material_id), int(quantity or 0))
+            )
+
+        return cls(
+            materials={bp_id: tuple(rows) for bp_id, rows in grouped.items()},
+            producers=producers,
+            products=products,
+            type_names=dict(type_names or {}),
+        )
+
+    def producer_of(self, type_id: int) -> int | None:
+        """Return the blueprint type_id that manufactures ``type_id``."""
+
+        return self.producers.get(int(type_id))
+
+    def output_per_run(self, blueprint_id: int) -> int:
+        product = self.products.get(int(blueprint_id))
+        return (product[1] or 1) if product else 1
+
+    def product_of(self, blueprint_id: int) -> int | None:
+        product = self.products.get(int(blueprint_id))
+        return product[0] if product and product[0] else None
+
+    def materials_of(self, blueprint_id: int) -> tuple[tuple[int, int], ...]:
+        return self.materials.get(int(blueprint_id), ())
+
+    def type_name(self, type_id: int) -> str:
+        return self.type_names.get(int(type_id)) or str(type_id)
+
+    def recipe(self, blueprint_id: int, blueprint_me: int = 0) -> dict[str, Any]:
+        """Return the ME-adjusted per-cycle inputs for ``blueprint_id``."""
+
+        inputs = []
+        for material_id, base_qty in self.materials_of(blueprint_id):
+            qty_per_cycle = ceil(base_qty * (100 - blueprint_me) / 100)
+            if qty_per_cycle <= 0:
+                continue
+            inputs.append({"type_id": material_id, "quantity": int(qty_per_cycle)})
+        return {
+            "produced_per_cycle": int(self.output_per_run(blueprint_id)),
+            "inputs_per_cycle": inputs,
+        }
+
+    def build_materials_tree(
+        self,
+        bp_id: int,
+        runs: int,
+        blueprint_me: int = 0,
+        *,
+        me_te_map: Mapping[int, Mapping[str, int]] | None = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        recipe_map: dict[int, dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Expand the material tree for ``runs`` of ``bp_id``.
+
+        ME rounding is applied per run before multiplying, as the game does.
+        When ``recipe_map`` is given it is filled with per-cycle recipes keyed by
+        the produced item type_id.
+        """
+
+        return self.build_materials_trees(
+            bp_id,
+            [runs],
+            blueprint_me,
+            me_te_map=me_te_map,
+            max_depth=max_depth,
+            recipe_map=recipe_map,
+        )[0]
+
+    def build_materials_trees(
+        self,
+        bp_id: int,
+        runs_values: Sequence[int],
+        blueprint_me: int = 0,
+        *,
+        me_te_map: Mapping[int, Mapping[str, int]] | None = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        recipe_map: dict[int, dict[str, Any]] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Expand one material tree per entry of ``runs_values`` in a single walk.
+
+        The tree shape only depends on the graph and ME configuration, so each
+        node is visited once and its quantities, cycles and surplus are computed
+        for the whole run dimension at the same time.
+        """
+
+        me_te_map = me_te_map or {}
+        recipe_cache: dict[tuple[int, int], dict[str, Any]] = {}
+        width = len(runs_values)
+
+        def expand(current_bp, runs_vec, current_me, depth, seen):
+            if depth > max_depth or current_bp in seen:
+                return [[] for _ in range(width)]
+            seen = seen | {current_bp}
+
+            mats_by_run: list[list[dict[str, Any]]] = [[] for _ in range(width)]
+            for material_id, base_qty in self.materials_of(current_bp):
+                per_run_qty = int(ceil(base_qty * (100 - current_me) / 100))
+                qty_vec = [per_run_qty * runs for runs in runs_vec]
+                type_name = self.type_name(material_id)
+
+                sub_bp_id = self.producer_of(material_id)
+                if sub_bp_id is None:
+                    for index, qty in enumerate(qty_vec):
+                        mats_by_run[index].append(
+                            {
+                                "type_id": material_id,
+                                "type_name": type_name,
+                                "quantity": qty,
+                                "cycles": None,
+                                "produced_per_cycle": None,
+                                "total_produced": None,
+                                "surplus": None,
+                                "sub_materials": [],
+                            }
+                        )
+                    continue
+
+                output_qty = self.output_per_run(sub_bp_id)
+                cycles_vec = [-(-qty // output_qty) for qty in qty_vec]
+
+                sub_bp_me = int(me_te_map.get(sub_bp_id, {}).get("me", 0))
+                if recipe_map is not None and material_id not in recipe_map:
+                    cache_key = (sub_bp_id, sub_bp_me)
+                    if cache_key not in recipe_cache:
+                        recipe_cache[cache_key] = self.recipe(sub_bp_id, sub_bp_me)
+                    recipe_map[material_id] = recipe_cache[cache_key]
+
+                children = expand(sub_bp_id, cycles_vec, sub_bp_me, depth + 1, seen)
+                for index, qty in enumerate(qty_vec):
+                    total_produced = cycles_vec[index] * output_qty
+                    mats_by_run[index].append(
+                        {
+                            "type_id": material_id,
+                            "type_name": type_name,
+                            "quantity": qty,
+                            "cycles": cycles_vec[index],
+                            "produced_per_cycle": output_qty,
+                            "total_produced": total_produced,
+                            "surplus": total_produced - qty,
+                            "sub_materials": children[index],
+                        }
+                    )
+            return mats_by_run
+
+        runs_vec = [int(runs) for runs in runs_values]
+        return expand(int(bp_id), runs_vec, blueprint_me, 0, frozenset())
+
+    def blueprint_closure(
+        self, bp_id: int, *, max_depth: int = DEFAULT_MAX_DEPTH
+    ) -> set[int]:
+        """Return ``bp_id`` and every blueprint reachable through its materials."""
+
+        acc: set[int] = set()
+
+        def visit(current_bp, depth):
+            if depth > max_depth or current_bp in acc:
+                return
+            acc.add(current_bp)
+            for material_id, _qty in self.materials_of(current_bp):
+                sub_bp_id = self.producer_of(material_id)
+                if sub_bp_id is not None:
+                    visit(sub_bp_id, depth + 1)
+
+        visit(int(bp_id), 0)
+        return acc
+
+    def descendant_blueprints(
+        self, tree: Iterable[Mapping[str, Any]], excluded: set[int] | None = None
+    ) -> set[int]:
+        """Collect the producing blueprint of every node in an expanded tree."""
+
+        if excluded is None:
+            excluded = set()
+        for mat in tree:
+            sub_bp_id = self.producer_of(mat["type_id"])
+            if sub_bp_id is not None:
+                excluded.add(sub_bp_id)
+            if mat.get("sub_materials"):
+                self.descendant_blueprints(mat["sub_materials"], excluded)
+        return excluded
+
+    def buy_exclusions(
+        self,
+        tree: Iterable[Mapping[str, Any]],
+        buy_set: set[int],
+        excluded: set[int] | None = None,
+    ) -> set[int]:
+        """Blueprints made irrelevant because their output is bought instead."""
+
+        if excluded is None:
+            excluded = set()
+        for mat in tree:
+            if mat["type_id"] in buy_set:
+                sub_bp_id = self.producer_of(mat["type_id"])
+                if sub_bp_id is not None:
+                    excluded.add(sub_bp_id)
+                if mat.get("sub_materials"):
+                    self.descendant_blueprints(mat["sub_materials"], excluded)
+            elif mat.get("sub_materials"):
+                self.buy_exclusions(mat["sub_materials"], buy_set, excluded)
+        return excluded
+
+
+def load_industry_graph() -> IndustryGraph:
+    """Read the craft-relevant SDE tables in bulk."""
+
+    activity_ids = ",".join(str(activity_id) for activity_id in CRAFT_ACTIVITY_IDS)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT eve_type_id, product_eve_type_id, quantity
+            FROM eveuniverse_eveindustryactivityproduct
+            WHERE activity_id IN ({activity_ids})
+            ORDER BY id
+            """
+        )
+        product_rows = cursor.fetchall()
+
+        # The inner join mirrors the per-node query the views used to run.
+        cursor.execute(
+            f"""
+            SELECT m.eve_type_id, m.material_eve_type_id, m.quantity, t.name
+            FROM eveuniverse_eveindustryactivitymaterial m
+            JOIN eveuniverse_evetype t ON m.material_eve_type_id = t.id
+            WHERE m.activity_id IN ({activity_ids})
+            ORDER BY m.id
+            """
+        )
+        material_rows = cursor.fetchall()
+
+    type_names = {int(row[1]): row[3] for row in material_rows}
+    graph = IndustryGraph.from_rows(
+        product_rows=product_rows,
+        material_rows=((row[0], row[1], row[2]) for row in material_rows),
+        type_names=type_names,
+    )
+    logger.info(
+        "Loaded industry graph: %s blueprints, %s producible types",
+        len(graph.products),
+        len(graph.producers),
+    )
+    return graph
+
+
+_graph_lock = threading.Lock()
+_graph: IndustryGraph | None = None
+_graph_version: Any = None
+_graph_loaded_at = 0.0
+
+
+def get_industry_graph() -> IndustryGraph:
+    """Return the cached graph, reloading it after an invalidation or expiry."""
+
+    global _graph, _graph_version, _graph_loaded_at
+
+    current_version = cache.get(GRAPH_VERSION_CACHE_KEY)
+    graph = _graph
+    if (
+        graph is not None
+        and current_version == _graph_version
+        and time.monotonic() - _graph_loaded_at < GRAPH_MAX_AGE_SECONDS
+    ):
+        return graph
+
+    with _graph_lock:
+        if (
+            _graph is not None
+            and current_version == _graph_version
+            and time.monotonic() - _graph_loaded_at < GRAPH_MAX_AGE_SECONDS
+        ):
+            return _graph
+        _graph = load_industry_graph()
+        _graph_version = current_version
+        _graph_loaded_at = time.monotonic()
+        return _graph
+
+
+def invalidate_industry_graph() -> None:
+    """Drop the graph in this process and signal other workers to reload."""
+
+    global _graph
+
+    _graph = None
+    cache.set(GRAPH_VERSION_CACHE_KEY, time.time_ns(), None)
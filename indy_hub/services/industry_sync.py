@@ -0,0 +1,320 @@
+"""Bulk diff-and-apply helpers for blueprint and industry job synchronization."""
+
+from __future__ import annotations
+
+# Standard Library
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+# Django
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+# AA Example App
+from indy_hub.models import Blueprint, IndustryJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+# Keep IN (...) clauses well below the parameter limits of every supported backend.
+LOOKUP_CHUNK_SIZE = 900
+
+# Fields written from an ESI blueprint payload. ``bp_type`` is derived from
+# quantity/type and compared as well so reclassifications are persisted.
+BLUEPRINT_SYNC_FIELDS = (
+    "owner_user_id",
+    "owner_kind",
+    "corporation_id",
+    "corporation_name",
+    "character_id",
+    "character_name",
+    "blueprint_id",
+    "type_id",
+    "type_name",
+    "location_id",
+    "location_name",
+    "location_flag",
+    "quantity",
+    "time_efficiency",
+    "material_efficiency",
+    "runs",
+    "bp_type",
+)
+
+# Fields written from an ESI industry job payload.
+INDUSTRY_JOB_SYNC_FIELDS = (
+    "owner_user_id",
+    "owner_kind",
+    "corporation_id",
+    "corporation_name",
+    "character_id",
+    "character_name",
+    "installer_id",
+    "station_id",
+    "location_name",
+    "activity_id",
+    "blueprint_id",
+    "blueprint_type_id",
+    "blueprint_type_name",
+    "runs",
+    "cost",
+    "licensed_runs",
+    "probability",
+    "product_type_id",
+    "product_type_name",
+    "status",
+    "duration",
+    "start_date",
+    "end_date",
+    "pause_date",
+    "completed_date",
+    "completed_character_id",
+    "successful_runs",
+)
+
+_COST_QUANTUM = Decimal("0.01")
+
+
+@dataclass
+class SyncCounts:
+    """Per-run write statistics for a bulk synchronization."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+    def merge(self, other: SyncCounts) -> None:
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.deleted += other.deleted
+
+    @property
+    def written(self) -> int:
+        return self.inserted + self.updated + self.deleted
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def chunked(values: Iterable[Any], size: int = LOOKUP_CHUNK_SIZE):
+    """Yield successive lists of at most ``size`` items."""
+
+    batch: list[Any] = []
+    for value in values:
+        batch.append(value)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def classify_blueprint_values(values: dict[str, Any]) -> str:
+    """Return the ``bp_type`` that ``Blueprint.save`` would assign to ``values``."""
+
+    bp_type = Blueprint.classify_bp_type(
+        quantity=values.get("quantity"),
+        type_name=values.get("type_name"),
+        type_id=values.get("type_id"),
+    )
+    if bp_type == "STACK":
+        bp_type = Blueprint.BPType.COPY
+    return bp_type
+
+
+def _load_rows_by_key(
+    model,
+    key_field: str,
+    keys: Iterable[int],
+) -> dict[int, Any]:
+    loaded: dict[int, Any] = {}
+    for batch in chunked(keys):
+        for obj in model.objects.filter(**{f"{key_field}__in": batch}):
+            loaded[int(getattr(obj, key_field))] = obj
+    return loaded
+
+
+def apply_bulk_diff(
+    model,
+    *,
+    key_field: str,
+    desired: Mapping[int, dict[str, Any]],
+    owned_queryset: QuerySet,
+    compare_fields: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[SyncCounts, list[Any], list[Any], list[Any]]:
+    """Diff ``desired`` rows against the database and apply only the changes.
+
+    ``desired`` maps the natural key (``item_id``/``job_id``) to the field values
+    ESI reported. ``owned_queryset`` scopes the rows currently owned by the sync
+    target; owned rows absent from ``desired`` are deleted. Rows with the same key
+    owned by someone else are taken over, mirroring ``update_or_create``.
+
+    Unchanged rows are not written at all; the owner's
+    ``ESISyncSchedule.last_synced_at`` records when they were last seen.
+
+    Returns the counts along with the created, updated and deleted instances so
+    callers can run batch side effects.
+    """
+
+    compare_fields = tuple(compare_fields)
+    counts = SyncCounts()
+
+    # ``.all()`` so a queryset reused across syncs is not served from its
+    # result cache.
+    existing: dict[int, Any] = {
+        int(getattr(obj, key_field)): obj for obj in owned_queryset.all()
+    }
+    foreign_keys = [key for key in desired if key not in existing]
+    if foreign_keys:
+        existing.update(_load_rows_by_key(model, key_field, foreign_keys))
+
+    now = timezone.now()
+    to_create: list[Any] = []
+    to_update: list[Any] = []
+    unchanged_pks: list[int] = []
+    changed_fields: set[str] = set()
+
+    for key, values in desired.items():
+        obj = existing.get(key)
+        if obj is None:
+            to_create.append(model(**{key_field: key}, **values))
+            continue
+
+        dirty = False
+        for field in compare_fields:
+            if field not in values:
+                continue
+            if getattr(obj, field) != values[field]:
+                setattr(obj, field, values[field])
+                changed_fields.add(field)
+                dirty = True
+
+        if dirty:
+            obj.last_updated = now
+            to_update.append(obj)
+        else:
+            unchanged_pks.append(obj.pk)
+
+    stale = [
+        obj
+        for key, obj in existing.items()
+        if key not in desired and obj.pk is not None
+    ]
+    stale_pks = [obj.pk for obj in stale]
+
+    with transaction.atomic():
+        if to_create:
+            model.objects.bulk_create(to_create, batch_size=batch_size)
+        if to_update:
+            model.objects.bulk_update(
+                to_update,
+                fields=sorted(changed_fields) + ["last_updated"],
+                batch_size=batch_size,
+            )
+        for batch in chunked(stale_pks):
+            deleted, _ = model.objects.filter(pk__in=batch).delete()
+            counts.deleted += deleted
+
+    counts.inserted = len(to_create)
+    counts.updated = len(to_update)
+    counts.unchanged = len(unchanged_pks)
+    return counts, to_create, to_update, stale
+
+
+def sync_blueprint_rows(
+    desired: Mapping[int, dict[str, Any]],
+    *,
+    owned_queryset: QuerySet,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    touched_type_ids: set[int] | None = None,
+) -> SyncCounts:
+    """Bulk upsert blueprints keyed by ``item_id`` and prune stale owned rows.
+
+    When ``touched_type_ids`` is given, the type IDs of every inserted,
+    updated or deleted row are added to it (used to refresh the shared
+    blueprint catalog once per sync).
+    """
+
+    for values in desired.values():
+        values["bp_type"] = classify_blueprint_values(values)
+
+    counts, created, updated, deleted = apply_bulk_diff(
+        Blueprint,
+        key_field="item_id",
+        desired=desired,
+        owned_queryset=owned_queryset,
+        compare_fields=BLUEPRINT_SYNC_FIELDS,
+        batch_size=batch_size,
+    )
+    if touched_type_ids is not None:
+        touched_type_ids.update(bp.type_id for bp in created + updated + deleted)
+    return counts
+
+
+def normalize_job_cost(value) -> Decimal | None:
+    """Return ESI job cost in the precision stored by ``IndustryJob.cost``."""
+
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value)).quantize(_COST_QUANTUM)
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def sync_industry_job_rows(
+    desired: Mapping[int, dict[str, Any]],
+    *,
+    owned_queryset: QuerySet,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> SyncCounts:
+    """Bulk upsert industry jobs keyed by ``job_id`` and prune stale owned rows.
+
+    Bulk writes bypass the ``IndustryJob`` save signals, so completion
+    notifications are dispatched here once for every inserted or changed job.
+    """
+
+    for values in desired.values():
+        if "cost" in values:
+            values["cost"] = normalize_job_cost(values["cost"])
+
+    counts, created, updated, _deleted = apply_bulk_diff(
+        IndustryJob,
+        key_field="job_id",
+        desired=desired,
+        owned_queryset=owned_queryset,
+        compare_fields=INDUSTRY_JOB_SYNC_FIELDS,
+        batch_size=batch_size,
+    )
+
+    touched = created + updated
+    if touched:
+        # AA Example App
+        from indy_hub.utils.job_notifications import (
+            process_job_completion_notifications,
+        )
+
+        if created:
+            # bulk_create does not return primary keys on every backend.
+            touched = updated + list(
+                _load_rows_by_key(
+                    IndustryJob, "job_id", (job.job_id for job in created)
+                ).values()
+            )
+        try:
+            process_job_completion_notifications(touched)
+        except Exception:  # pragma: no cover - defensive fallback
+            logger.error(
+                "Failed to process completion notifications for %s jobs",
+                len(touched),
+                exc_info=True,
+            )
+
+    return counts
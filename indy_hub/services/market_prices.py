@@ -0,0 +1,342 @@
+"""Shared Jita price cache backed by Fuzzwork market aggregates.
+
+Prices are kept per type in the Django cache and in ``CachedMarketPrice``.
+Callers get whatever is younger than ``max_age`` without touching Fuzzwork;
+prices past the freshness window are refreshed in the background, and only
+types with no usable price at all are fetched inline. Concurrent requests for
+the same type set share one upstream call.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import hashlib
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+# Third Party
+import requests
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+# AA Example App
+from indy_hub.models import CachedMarketPrice
+
+logger = logging.getLogger(__name__)
+
+JITA_STATION_ID = 60003760  # Jita IV - Moon 4 - Caldari Navy Assembly Plant
+FUZZWORK_AGGREGATES_URL = "https://market.fuzzwork.co.uk/aggregates/"
+
+# Prices younger than this are served as-is.
+PRICE_FRESH_SECONDS = int(getattr(settings, "INDY_HUB_PRICE_FRESH_SECONDS", 15 * 60))
+# Prices younger than this are served immediately and refreshed in the background.
+PRICE_MAX_STALE_SECONDS = int(
+    getattr(settings, "INDY_HUB_PRICE_MAX_STALE_SECONDS", 24 * 60 * 60)
+)
+FUZZWORK_TIMEOUT_SECONDS = int(getattr(settings, "INDY_HUB_FUZZWORK_TIMEOUT", 15))
+FUZZWORK_MAX_URL_LENGTH = int(
+    getattr(settings, "INDY_HUB_FUZZWORK_MAX_URL_LENGTH", 2000)
+)
+
+# How long a worker waits for another worker's in-flight fetch of the same types.
+COALESCE_WAIT_SECONDS = 10
+_COALESCE_POLL_SECONDS = 0.2
+_FETCH_LOCK_TTL_SECONDS = FUZZWORK_TIMEOUT_SECONDS + 15
+_REFRESH_LOCK_TTL_SECONDS = 120
+_CACHE_KEY_PREFIX = "indy_hub:market_price:"
+_PRICE_QUANTUM = Decimal("0.01")
+
+
+class PriceUnavailableError(Exception):
+    """Fuzzwork could not be reached and no usable cached price exists."""
+
+
+@dataclass(frozen=True)
+class JitaPrice:
+    """Jita 4-4 aggregate for one type."""
+
+    type_id: int
+    buy: Decimal
+    sell: Decimal
+    fetched_at: float
+    data: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+
+def _cache_key(type_id: int) -> str:
+    return f"{_CACHE_KEY_PREFIX}{int(type_id)}"
+
+
+def _digest(type_ids: list[int]) -> str:
+    return hashlib.md5(",".join(map(str, type_ids)).encode()).hexdigest()
+
+
+def _to_price(value) -> Decimal:
+    try:
+        return Decimal(str(value or 0)).quantize(_PRICE_QUANTUM)
+    except (InvalidOperation, ValueError):
+        return Decimal("0.00")
+
+
+def _normalize_type_ids(type_ids: Iterable) -> list[int]:
+    normalized: set[int] = set()
+    for type_id in type_ids or ():
+        try:
+            value = int(type_id)
+        except (TypeError, ValueError):
+            continue
+        if value > 0:
+            normalized.add(value)
+    return sorted(normalized)
+
+
+def _price_from_aggregate(type_id: int, data: dict, fetched_at: float) -> JitaPrice:
+    data = data if isinstance(data, dict) else {}
+    return JitaPrice(
+        type_id=int(type_id),
+        buy=_to_price((data.get("buy") or {}).get("max")),
+        sell=_to_price((data.get("sell") or {}).get("min")),
+        fetched_at=fetched_at,
+        data=data,
+    )
+
+
+def _cache_ttl() -> int:
+    # Keep cache entries a bit longer than they are usable so stale reads
+    # still avoid the database.
+    return PRICE_MAX_STALE_SECONDS + PRICE_FRESH_SECONDS
+
+
+def _read_cached(type_ids: list[int]) -> dict[int, JitaPrice]:
+    if not type_ids:
+        return {}
+    raw = cache.get_many([_cache_key(type_id) for type_id in type_ids])
+    found: dict[int, JitaPrice] = {}
+    for type_id in type_ids:
+        entry = raw.get(_cache_key(type_id))
+        if entry:
+            found[type_id] = _price_from_aggregate(
+                type_id, entry.get("data") or {}, float(entry.get("fetched_at") or 0)
+            )
+    return found
+
+
+def _write_cached(prices: Iterable[JitaPrice]) -> None:
+    payload = {
+        _cache_key(price.type_id): {"data": price.data, "fetched_at": price.fetched_at}
+        for price in prices
+    }
+    if payload:
+        cache.set_many(payload, _cache_ttl())
+
+
+def _read_db(type_ids: list[int]) -> dict[int, JitaPrice]:
+    if not type_ids:
+        return {}
+    found: dict[int, JitaPrice] = {}
+    for row in CachedMarketPrice.objects.filter(type_id__in=type_ids):
+        found[int(row.type_id)] = _price_from_aggregate(
+            row.type_id, row.data or {}, row.fetched_at.timestamp()
+        )
+    if found:
+        _write_cached(found.values())
+    return found
+
+
+def _store(prices: list[JitaPrice]) -> None:
+    if not prices:
+        return
+    _write_cached(prices)
+    rows = [
+        CachedMarketPrice(
+            type_id=price.type_id,
+            buy_price=price.buy,
+            sell_price=price.sell,
+            data=price.data,
+            fetched_at=datetime.fromtimestamp(price.fetched_at, tz=dt_timezone.utc),
+        )
+        for price in prices
+    ]
+    CachedMarketPrice.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        # MySQL/MariaDB upsert on the unique key implicitly and reject a target.
+        unique_fields=(
+            ["type_id"]
+            if connection.features.supports_update_conflicts_with_target
+            else None
+        ),
+        update_fields=["buy_price", "sell_price", "data", "fetched_at"],
+    )
+
+
+def chunk_type_ids_for_url(
+    type_ids: list[int], max_url_length: int = FUZZWORK_MAX_URL_LENGTH
+) -> list[list[int]]:
+    """Split ``type_ids`` so each aggregates URL stays under ``max_url_length``."""
+
+    base_length = len(f"{FUZZWORK_AGGREGATES_URL}?station={JITA_STATION_ID}&types=")
+    budget = max(max_url_length - base_length, 16)
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    used = 0
+    for type_id in type_ids:
+        cost = len(str(type_id)) + (1 if current else 0)
+        if current and used + cost > budget:
+            chunks.append(current)
+            current, used = [], 0
+            cost = len(str(type_id))
+        current.append(type_id)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _request_aggregates(type_ids: list[int]) -> dict[str, Any]:
+    response = requests.get(
+        FUZZWORK_AGGREGATES_URL,
+        params={
+            "station": JITA_STATION_ID,
+            "types": ",".join(str(type_id) for type_id in type_ids),
+        },
+        timeout=FUZZWORK_TIMEOUT_SECONDS,
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data if isinstance(data, dict) else {}
+
+
+def _fetch_chunk(chunk: list[int]) -> dict[int, JitaPrice]:
+    """Fetch one chunk from Fuzzwork, or wait for the worker already doing so."""
+
+    lock_key = f"{_CACHE_KEY_PREFIX}fetch:{_digest(chunk)}"
+    requested_at = time.time()
+
+    if cache.add(lock_key, requested_at, _FETCH_LOCK_TTL_SECONDS):
+        try:
+            data = _request_aggregates(chunk)
+            fetched_at = time.time()
+            prices = [
+                _price_from_aggregate(type_id, data.get(str(type_id)) or {}, fetched_at)
+                for type_id in chunk
+            ]
+            _store(prices)
+            return {price.type_id: price for price in prices}
+        finally:
+            cache.delete(lock_key)
+
+    # Someone else is fetching this exact set: wait for their results.
+    deadline = time.monotonic() + COALESCE_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(_COALESCE_POLL_SECONDS)
+        found = {
+            type_id: price
+            for type_id, price in _read_cached(chunk).items()
+            if price.fetched_at >= requested_at - _FETCH_LOCK_TTL_SECONDS
+        }
+        if len(found) == len(chunk) or cache.get(lock_key) is None:
+            return found
+    return {}
+
+
+def fetch_jita_prices(type_ids: Iterable) -> dict[int, JitaPrice]:
+    """Fetch ``type_ids`` from Fuzzwork now and store the results.
+
+    Raises ``requests.RequestException``/``ValueError`` when an upstream chunk
+    fails; chunks fetched before the failure are still stored.
+    """
+
+    fetched: dict[int, JitaPrice] = {}
+    for chunk in chunk_type_ids_for_url(_normalize_type_ids(type_ids)):
+        fetched.update(_fetch_chunk(chunk))
+    return fetched
+
+
+def schedule_price_refresh(type_ids: Iterable) -> bool:
+    """Queue a background refresh of ``type_ids`` unless one is already pending."""
+
+    ids = _normalize_type_ids(type_ids)
+    if not ids:
+        return False
+    if not cache.add(
+        f"{_CACHE_KEY_PREFIX}refresh:{_digest(ids)}", 1, _REFRESH_LOCK_TTL_SECONDS
+    ):
+        return False
+    try:
+        # AA Example App
+        from indy_hub.tasks.market import refresh_jita_prices
+
+        refresh_jita_prices.delay(ids)
+        return True
+    except Exception as exc:  # pragma: no cover - broker unavailable
+        logger.warning("Unable to queue Jita price refresh: %s", exc)
+        return False
+
+
+def get_jita_prices(
+    type_ids: Iterable,
+    *,
+    max_age: int | None = None,
+    refresh_stale: bool = True,
+    raise_errors: bool = False,
+) -> dict[int, JitaPrice]:
+    """Return Jita prices for ``type_ids``, hitting Fuzzwork only when needed.
+
+    Prices younger than ``max_age`` (default ``PRICE_MAX_STALE_SECONDS``) are
+    returned without any upstream call; those past ``PRICE_FRESH_SECONDS`` are
+    refreshed in the background when ``refresh_stale`` is set. Types with no
+    price young enough are fetched inline. Upstream failures are logged and the
+    affected types are omitted, unless ``raise_errors`` is set in which case
+    ``PriceUnavailableError`` is raised.
+    """
+
+    ids = _normalize_type_ids(type_ids)
+    if not ids:
+        return {}
+    if max_age is None:
+        max_age = PRICE_MAX_STALE_SECONDS
+
+    prices = _read_cached(ids)
+    missing = [type_id for type_id in ids if type_id not in prices]
+    if missing:
+        prices.update(_read_db(missing))
+
+    blocking = [
+        type_id
+        for type_id in ids
+        if type_id not in prices or prices[type_id].age_seconds > max_age
+    ]
+    stale = [
+        type_id
+        for type_id in ids
+        if type_id not in blocking and prices[type_id].age_seconds > PRICE_FRESH_SECONDS
+    ]
+
+    if blocking:
+        try:
+            prices.update(fetch_jita_prices(blocking))
+        except (requests.RequestException, ValueError) as exc:
+            logger.warning(
+                "Failed to fetch Jita prices for %s types: %s", len(blocking), exc
+            )
+            if raise_errors:
+                raise PriceUnavailableError(str(exc)) from exc
+
+    if stale and refresh_stale:
+        schedule_price_refresh(stale)
+
+    return prices
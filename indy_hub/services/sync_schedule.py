@@ -0,0 +1,222 @@
+"""Expires-driven scheduling of blueprint and industry job synchronization.
+
+Every (owner, endpoint) pair has an ``ESISyncSchedule`` row whose
+``next_run_at`` follows the cache headers of its last ESI fetch:
+
+* data changed: refresh right after ESI's ``Expires``, so active
+  industrialists see new jobs and blueprints as soon as ESI has them;
+* data unchanged: wait half as long as the data has been idle, capped at the
+  bulk window, so dormant accounts fade to one fetch per window;
+* errors or missing tokens: exponential backoff, capped the same way.
+
+A beat task claims due rows in small batches, within a budget of owners in
+flight, instead of fanning out one countdown task per user.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import logging
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+# Django
+from django.utils import timezone
+
+# AA Example App
+from indy_hub.models import ESISyncSchedule
+
+logger = logging.getLogger(__name__)
+
+# Margin after ``Expires`` so the refresh lands on the new ESI cache entry.
+EXPIRY_GRACE = timedelta(seconds=15)
+# Used when ESI sent no usable ``Expires`` header.
+DEFAULT_CACHE_INTERVAL = timedelta(minutes=5)
+FAILURE_BACKOFF = timedelta(minutes=5)
+_MAX_BACKOFF_EXPONENT = 10
+_BATCH_SIZE = 500
+
+
+def next_run_after_sync(
+    *,
+    now: datetime,
+    expires: datetime | None,
+    last_changed_at: datetime | None,
+    max_interval: timedelta,
+) -> datetime:
+    """Return when an owner synced at ``now`` is due again."""
+
+    ready = (expires + EXPIRY_GRACE) if expires else now + DEFAULT_CACHE_INTERVAL
+    ready = max(ready, now + EXPIRY_GRACE)
+    if last_changed_at is None or last_changed_at >= now:
+        return ready
+    idle_delay = min((now - last_changed_at) / 2, max_interval)
+    return max(ready, now + idle_delay)
+
+
+def next_run_after_failure(
+    *, now: datetime, failures: int, max_interval: timedelta
+) -> datetime:
+    exponent = min(max(failures - 1, 0), _MAX_BACKOFF_EXPONENT)
+    return now + min(FAILURE_BACKOFF * (2**exponent), max_interval)
+
+
+def _schedule_for(
+    kind: str, owner_kind: str, owner_id: int, user_id: int | None
+) -> ESISyncSchedule:
+    schedule, _created = ESISyncSchedule.objects.get_or_create(
+        kind=kind,
+        owner_kind=owner_kind,
+        owner_id=int(owner_id),
+        defaults={"user_id": user_id},
+    )
+    return schedule
+
+
+def record_sync(
+    kind: str,
+    owner_kind: str,
+    owner_id: int,
+    *,
+    user_id: int | None = None,
+    expires: datetime | None = None,
+    last_modified: datetime | None = None,
+    changed: bool,
+    max_interval: timedelta,
+) -> ESISyncSchedule:
+    """Store the outcome of a successful fetch and schedule the next one."""
+
+    now = timezone.now()
+    schedule = _schedule_for(kind, owner_kind, owner_id, user_id)
+    if changed or schedule.last_changed_at is None:
+        schedule.last_changed_at = now
+    schedule.expires_at = expires
+    schedule.last_modified_at = last_modified
+    schedule.last_synced_at = now
+    schedule.dispatched_at = None
+    schedule.failures = 0
+    schedule.next_run_at = next_run_after_sync(
+        now=now,
+        expires=expires,
+        last_changed_at=schedule.last_changed_at,
+        max_interval=max_interval,
+    )
+    if user_id is not None:
+        schedule.user_id = user_id
+    schedule.save(
+        update_fields=[
+            "user",
+            "next_run_at",
+            "dispatched_at",
+            "expires_at",
+            "last_modified_at",
+            "last_synced_at",
+            "last_changed_at",
+            "failures",
+        ]
+    )
+    return schedule
+
+
+def record_failure(
+    kind: str,
+    owner_kind: str,
+    owner_id: int,
+    *,
+    user_id: int | None = None,
+    max_interval: timedelta,
+) -> ESISyncSchedule:
+    """Back off an owner whose fetch failed or could not be attempted."""
+
+    now = timezone.now()
+    schedule = _schedule_for(kind, owner_kind, owner_id, user_id)
+    schedule.failures = min(schedule.failures + 1, 2**15 - 1)
+    schedule.dispatched_at = None
+    schedule.next_run_at = next_run_after_failure(
+        now=now, failures=schedule.failures, max_interval=max_interval
+    )
+    schedule.save(update_fields=["next_run_at", "dispatched_at", "failures"])
+    return schedule
+
+
+def sync_schedule_owners(
+    kind: str, owners: Iterable[tuple[str, int, int | None]]
+) -> tuple[int, int]:
+    """Match the schedule rows of ``kind`` to ``owners``.
+
+    ``owners`` yields ``(owner_kind, owner_id, user_id)``. New owners are due
+    immediately; rows of owners no longer listed are deleted. Returns
+    ``(created, deleted)``.
+    """
+
+    wanted = {
+        (owner_kind, int(owner_id)): user_id for owner_kind, owner_id, user_id in owners
+    }
+    existing = {
+        (owner_kind, owner_id): pk
+        for pk, owner_kind, owner_id in ESISyncSchedule.objects.filter(
+            kind=kind
+        ).values_list("pk", "owner_kind", "owner_id")
+    }
+    stale = [pk for key, pk in existing.items() if key not in wanted]
+    for start in range(0, len(stale), _BATCH_SIZE):
+        ESISyncSchedule.objects.filter(
+            pk__in=stale[start : start + _BATCH_SIZE]
+        ).delete()
+
+    missing = [
+        ESISyncSchedule(
+            kind=kind, owner_kind=owner_kind, owner_id=owner_id, user_id=user_id
+        )
+        for (owner_kind, owner_id), user_id in wanted.items()
+        if (owner_kind, owner_id) not in existing
+    ]
+    ESISyncSchedule.objects.bulk_create(
+        missing, batch_size=_BATCH_SIZE, ignore_conflicts=True
+    )
+    if missing or stale:
+        logger.debug(
+            "%s sync schedule: %s owners added, %s removed",
+            kind,
+            len(missing),
+            len(stale),
+        )
+    return len(missing), len(stale)
+
+
+def mark_all_due(kind: str) -> int:
+    """Make every owner of ``kind`` due now (full refresh)."""
+
+    return ESISyncSchedule.objects.filter(kind=kind).update(next_run_at=timezone.now())
+
+
+def in_flight_count(kind: str, *, window: timedelta) -> int:
+    """Owners dispatched within ``window`` whose sync has not reported back."""
+
+    return ESISyncSchedule.objects.filter(
+        kind=kind, dispatched_at__gte=timezone.now() - window
+    ).count()
+
+
+def claim_due(kind: str, *, limit: int, lease: timedelta) -> list[ESISyncSchedule]:
+    """Return up to ``limit`` due rows, most overdue first, and lease them.
+
+    A leased row is not due again until ``lease`` has passed, so a sync that
+    never reports back (lost task, vanished token) falls back to the lease
+    cadence instead of being dispatched on every tick. Callers must not claim
+    concurrently.
+    """
+
+    if limit <= 0:
+        return []
+    now = timezone.now()
+    rows = list(
+        ESISyncSchedule.objects.filter(kind=kind, next_run_at__lte=now).order_by(
+            "next_run_at"
+        )[:limit]
+    )
+    if rows:
+        ESISyncSchedule.objects.filter(pk__in=[row.pk for row in rows]).update(
+            next_run_at=now + lease, dispatched_at=now
+        )
+    return rows
@@ -2,11 +2,14 @@
 import logging
 
 # Django
-from django.db.models.signals import post_migrate, post_save, pre_save
+from django.conf import settings
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
 from django.dispatch import receiver
 
 from .models import (
     Blueprint,
+    CharacterSettings,
+    CorporationSharingSetting,
     IndustryJob,
     MaterialExchangeBuyOrder,
     MaterialExchangeConfig,
@@ -25,6 +28,20 @@ try:
 except ImportError:
     Token = None
 
+if "eveuniverse" in getattr(settings, "INSTALLED_APPS", ()):  # pragma: no branch
+    try:  # pragma: no cover - EveUniverse is optional
+        # Alliance Auth (External Libs)
+        from eveuniverse.models import (
+            EveIndustryActivityMaterial,
+            EveIndustryActivityProduct,
+        )
+    except ImportError:  # pragma: no cover
+        EveIndustryActivityMaterial = None
+        EveIndustryActivityProduct = None
+else:  # pragma: no cover - EveUniverse app not installed
+    EveIndustryActivityMaterial = None
+    EveIndustryActivityProduct = None
+
 # AA Example App
 # Task imports
 from indy_hub.tasks.industry import (
@@ -32,11 +49,17 @@ from indy_hub.tasks.industry import (
     CORP_JOBS_SCOPE,
     REQUIRED_CORPORATION_ROLES,
     get_character_corporation_roles,
+    invalidate_character_corporation_roles,
     update_blueprints_for_user,
     update_industry_jobs_for_user,
 )
 
+from .services.blueprint_catalog import (
+    refresh_blueprint_catalog,
+    refresh_catalog_for_owner,
+)
 from .services.esi_client import ESITokenError
+from .services.industry_graph import invalidate_industry_graph
 
 logger = logging.getLogger(__name__)
 
@@ -127,10 +150,17 @@ def sync_industry_job_location_name(sender, instance, **kwargs):
 
 @receiver(post_save, sender=Blueprint)
 def cache_blueprint_data(sender, instance, created, **kwargs):
+    """Keep the shared blueprint catalog in step with single blueprint saves.
+
+    Bulk synchronization bypasses this signal and refreshes the catalog itself.
     """
-    No longer needed: ESI name caching is removed. All lookups are local DB only.
-    """
-    pass
+    try:
+        refresh_blueprint_catalog([instance.type_id])
+    except Exception:  # pragma: no cover - catalog is rebuilt periodically
+        logger.exception(
+            "Failed to refresh the shared blueprint catalog for type %s",
+            instance.type_id,
+        )
 
 
 @receiver(post_save, sender=IndustryJob)
@@ -245,13 +275,13 @@ def auto_sync_stock_on_config_change(sender, instance, created, **kwargs):
     logger.info("SYNCING MATERIAL EXCHANGE STOCK/PRICES for config pk=%s", instance.pk)
 
     try:
-        sync_material_exchange_stock()
+        sync_material_exchange_stock(instance.pk)
         logger.info("Stock sync completed for config pk=%s", instance.pk)
     except Exception:
         logger.exception("Stock sync failed for config pk=%s", instance.pk)
 
     try:
-        sync_material_exchange_prices()
+        sync_material_exchange_prices(config_id=instance.pk)
         logger.info("Price sync completed for config pk=%s", instance.pk)
     except Exception:
         logger.exception("Price sync failed for config pk=%s", instance.pk)
@@ -276,9 +306,79 @@ def setup_indyhub_periodic_tasks(sender, **kwargs):
         )
 
 
+def _invalidate_industry_graph_on_sde_change(sender, **kwargs):
+    invalidate_industry_graph()
+
+
+# Reloading SDE industry data must refresh the in-memory craft graph everywhere.
+for _sde_model in (EveIndustryActivityMaterial, EveIndustryActivityProduct):
+    if _sde_model is None:
+        continue
+    post_save.connect(
+        _invalidate_industry_graph_on_sde_change,
+        sender=_sde_model,
+        dispatch_uid=f"indy_hub_industry_graph_{_sde_model.__name__}_save",
+    )
+    post_delete.connect(
+        _invalidate_industry_graph_on_sde_change,
+        sender=_sde_model,
+        dispatch_uid=f"indy_hub_industry_graph_{_sde_model.__name__}_delete",
+    )
+
+
+# --- Shared blueprint catalog maintenance ---
+
+_CATALOG_SHARING_FIELDS = {
+    CharacterSettings: {"allow_copy_requests", "copy_sharing_scope"},
+    CorporationSharingSetting: {"allow_copy_requests", "share_scope"},
+}
+
+
+def _refresh_catalog_for_setting(sender, instance, update_fields=None) -> None:
+    if sender is CharacterSettings:
+        if instance.character_id != 0:
+            return
+        corporation_id = None
+    else:
+        corporation_id = instance.corporation_id
+    if update_fields and not _CATALOG_SHARING_FIELDS[sender] & set(update_fields):
+        return
+    try:
+        refresh_catalog_for_owner(instance.user_id, corporation_id)
+    except Exception:  # pragma: no cover - catalog is rebuilt periodically
+        logger.exception(
+            "Failed to refresh the shared blueprint catalog for user %s",
+            instance.user_id,
+        )
+
+
+@receiver(post_save, sender=CharacterSettings)
+@receiver(post_save, sender=CorporationSharingSetting)
+def refresh_catalog_on_sharing_change(sender, instance, **kwargs):
+    _refresh_catalog_for_setting(
+        sender, instance, update_fields=kwargs.get("update_fields")
+    )
+
+
+@receiver(post_delete, sender=CharacterSettings)
+@receiver(post_delete, sender=CorporationSharingSetting)
+def refresh_catalog_on_sharing_delete(sender, instance, **kwargs):
+    _refresh_catalog_for_setting(sender, instance)
+
+
 # --- NEW: Combined token sync trigger ---
 if Token:
 
+    @receiver(post_save, sender=Token)
+    @receiver(post_delete, sender=Token)
+    def invalidate_corporation_roles_on_token_change(sender, instance, **kwargs):
+        # A new or removed token usually follows a role change in game;
+        # connected first so the role check below reads fresh roles. Plain
+        # saves (access token refreshes) keep the cached roles.
+        if not kwargs.get("created", True) or not instance.character_id:
+            return
+        invalidate_character_corporation_roles(instance.character_id)
+
     @receiver(post_save, sender=Token)
     def enforce_corporation_role_tokens(sender, instance, created, **kwargs):
         if not created:
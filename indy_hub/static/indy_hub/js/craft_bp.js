@@ -1371,6 +1371,62 @@ async function fetchBlueprintPayloadForRuns(testRuns) {
     return json;
 }
 
+async function prefetchBlueprintPayloadsForRuns(runsList) {
+    // Fetch every requested run count in one batch call and seed the per-runs cache,
+    // so the sequential loops below resolve from memory instead of one request each.
+    window.__indyHubRunOptimizedCache = window.__indyHubRunOptimizedCache || {};
+    const cache = window.__indyHubRunOptimizedCache;
+    const missing = Array.from(new Set((runsList || []).map((v) => Math.max(1, Math.floor(Number(v) || 1)))))
+        .filter((runs) => {
+            const url = buildCraftPayloadUrlForRuns(runs);
+            return url && !cache[String(url)];
+        });
+    if (!missing.length) {
+        return;
+    }
+
+    const baseUrl = buildCraftPayloadUrlForRuns(missing[0]);
+    if (!baseUrl) {
+        return;
+    }
+    const batchUrl = new URL(baseUrl);
+    batchUrl.searchParams.delete('runs');
+
+    try {
+        const chunkSize = 500;
+        for (let start = 0; start < missing.length; start += chunkSize) {
+            const chunk = missing.slice(start, start + chunkSize);
+            batchUrl.searchParams.set('runs_list', chunk.join(','));
+            const response = await fetch(batchUrl.toString(), {
+                headers: { 'Accept': 'application/json' },
+                credentials: 'same-origin',
+            });
+            if (!response.ok) {
+                throw new Error(`craft_bp_payload batch failed: ${response.status}`);
+            }
+            const json = await response.json();
+            (json?.results || []).forEach((result) => {
+                const url = buildCraftPayloadUrlForRuns(result.num_runs);
+                if (!url) return;
+                cache[String(url)] = {
+                    type_id: json.type_id,
+                    bp_type_id: json.bp_type_id,
+                    product_type_id: json.product_type_id,
+                    output_qty_per_run: json.output_qty_per_run,
+                    ...result,
+                };
+            });
+            craftBPDebugLog('[RunOptimized] craft_bp_payload batch response', {
+                requested: chunk.length,
+                received: Array.isArray(json?.results) ? json.results.length : 0,
+            });
+        }
+    } catch (e) {
+        // Fall back to the per-runs requests made by the callers.
+        craftBPDebugLog('[RunOptimized] batch prefetch failed', e);
+    }
+}
+
 function computeOptimizedProfitabilityForPayload(payload, pricesSnapshot, options = {}) {
     const tree = Array.isArray(payload?.materials_tree) ? payload.materials_tree : [];
     const productTypeId = Number(payload?.product_type_id) || 0;
@@ -2224,6 +2280,7 @@ async function findOptimalRuns({
         return computeOptimizedProfitabilityForPayload(payload, pricesSnapshot);
     };
 
+    await prefetchBlueprintPayloadsForRuns(candidates);
     for (let i = 0; i < candidates.length; i += 1) {
         const runs = candidates[i];
         if (statusEl) {
@@ -2242,6 +2299,7 @@ async function findOptimalRuns({
         const end = Math.min(maxValue, center + 50);
         const refineRuns = [];
         for (let r = start; r <= end; r += 1) refineRuns.push(r);
+        await prefetchBlueprintPayloadsForRuns(refineRuns);
 
         for (let i = 0; i < refineRuns.length; i += 1) {
             const runs = refineRuns[i];
@@ -2407,6 +2465,8 @@ function initializeRunOptimizedTab() {
                 const decisions = getCurrentDecisionsFromSimulationOrDom();
                 state.decisions = decisions;
 
+                await prefetchBlueprintPayloadsForRuns(scenarios);
+
                 const results = [];
                 for (let i = 0; i < scenarios.length; i += 1) {
                     const runs = scenarios[i];
@@ -21,6 +21,7 @@ from .tasks import setup_periodic_tasks  # noqa: F401
 # Import all tasks from specialized modules
 from .tasks.industry import (  # noqa: F401
     cleanup_old_jobs,
+    dispatch_due_syncs,
     update_all_blueprints,
     update_all_industry_jobs,
     update_blueprints_for_user,
@@ -29,6 +29,7 @@ def _import_task_submodules() -> None:
     # Import task submodules so their @shared_task are registered
     from . import industry  # noqa: F401
     from . import location  # noqa: F401
+    from . import market  # noqa: F401
     from . import material_exchange  # noqa: F401
     from . import material_exchange_contracts  # noqa: F401
     from . import notifications  # noqa: F401
@@ -103,13 +104,16 @@ def setup_periodic_tasks():
     logging.getLogger(__name__).info("IndyHub cron tasks registered.")
 
     # Clean up any legacy task entries that are no longer defined
-    removed, _ = PeriodicTask.objects.filter(
-        name="indy-hub-notify-completed-jobs"
-    ).delete()
-    if removed:
-        logging.getLogger(__name__).info(
-            "Removed legacy periodic task indy-hub-notify-completed-jobs"
-        )
+    for legacy_name in (
+        "indy-hub-notify-completed-jobs",
+        "indy-hub-update-all-blueprints",
+        "indy-hub-update-all-industry-jobs",
+    ):
+        removed, _ = PeriodicTask.objects.filter(name=legacy_name).delete()
+        if removed:
+            logging.getLogger(__name__).info(
+                "Removed legacy periodic task %s", legacy_name
+            )
 
 
 # ...import additional tasks here if needed...
@@ -4,7 +4,7 @@
 
 # Standard Library
 import logging
-import random
+import math
 from datetime import datetime, timedelta
 
 # Third Party
@@ -14,12 +14,12 @@ from celery import shared_task
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.cache import cache
-from django.db import transaction
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
 # Alliance Auth
 from allianceauth.authentication.models import CharacterOwnership
+from allianceauth.eveonline.models import EveCharacter
 
 from ..models import (
     Blueprint,
@@ -27,6 +27,7 @@ from ..models import (
     CorporationSharingSetting,
     IndustryJob,
 )
+from ..services.blueprint_catalog import refresh_blueprint_catalog
 from ..services.esi_client import (
     ESIClientError,
     ESIForbiddenError,
@@ -34,7 +35,20 @@ from ..services.esi_client import (
     ESITokenError,
     shared_client,
 )
+from ..services.industry_sync import (
+    SyncCounts,
+    sync_blueprint_rows,
+    sync_industry_job_rows,
+)
 from ..services.location_population import populate_location_names
+from ..services.sync_schedule import (
+    claim_due,
+    in_flight_count,
+    mark_all_due,
+    record_failure,
+    record_sync,
+    sync_schedule_owners,
+)
 from ..utils.eve import (
     PLACEHOLDER_PREFIX,
     batch_cache_type_names,
@@ -42,6 +56,8 @@ from ..utils.eve import (
     get_corporation_name,
     get_type_name,
     resolve_location_name,
+    resolve_location_names,
+    resolve_names_bulk,
 )
 
 logger = logging.getLogger(__name__)
@@ -87,16 +103,24 @@ _DEFAULT_BULK_WINDOWS = {
     MANUAL_REFRESH_KIND_BLUEPRINTS: 720,
     MANUAL_REFRESH_KIND_JOBS: 120,
 }
-
-_MANUAL_REFRESH_CACHE_PREFIX = "indy_hub:manual_refresh"
-_DEFAULT_BULK_WINDOWS = {
-    MANUAL_REFRESH_KIND_BLUEPRINTS: 720,
-    MANUAL_REFRESH_KIND_JOBS: 120,
+# Settings suffix of each kind: INDY_HUB_<suffix>_BULK_WINDOW_MINUTES.
+_BULK_WINDOW_SETTING_NAMES = {
+    MANUAL_REFRESH_KIND_BLUEPRINTS: "BLUEPRINTS",
+    MANUAL_REFRESH_KIND_JOBS: "INDUSTRY_JOBS",
 }
 
+_SYNC_DISPATCH_LOCK_KEY = "indy_hub:sync_schedule:dispatching"
+_SYNC_OWNERS_REFRESHED_KEY = "indy_hub:sync_schedule:owners_refreshed:{kind}"
+_SYNC_OWNERS_REFRESH_SECONDS = 10 * 60
+# Dispatched owners count against the in-flight budget for at most this long.
+_SYNC_IN_FLIGHT_WINDOW = timedelta(minutes=15)
+
+_CORP_SYNC_CACHE_PREFIX = "indy_hub:corp_sync"
+_CORP_SYNC_LOCK_TTL_SECONDS = 30 * 60
+
 _OPTIONAL_CORPORATION_SCOPES = {STRUCTURE_SCOPE}
 REQUIRED_CORPORATION_ROLES = {"DIRECTOR", "FACTORY_MANAGER"}
-_CORPORATION_ROLE_CACHE: dict[int, set[str]] = {}
+_CORPORATION_ROLES_CACHE_PREFIX = "indy_hub:corporation_roles"
 
 
 def _normalized_roles(roles: list[str] | tuple[str, ...] | None) -> set[str]:
@@ -105,9 +129,45 @@ def _normalized_roles(roles: list[str] | tuple[str, ...] | None) -> set[str]:
     return {str(role).upper() for role in roles if role}
 
 
+def _corporation_roles_cache_key(character_id: int) -> str:
+    return f"{_CORPORATION_ROLES_CACHE_PREFIX}:{int(character_id)}"
+
+
+def _get_corporation_roles_ttl() -> int:
+    # Short enough that a demoted director loses corporation access quickly.
+    value = getattr(settings, "INDY_HUB_CORPORATION_ROLES_CACHE_TTL", 15 * 60)
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        value = 15 * 60
+    return max(value, 0)
+
+
+def invalidate_character_corporation_roles(character_id: int) -> None:
+    cache.delete(_corporation_roles_cache_key(character_id))
+
+
+def prefetch_character_corporation_roles(character_ids) -> dict[int, set[str]]:
+    """Return the cached roles of ``character_ids`` in one cache round trip.
+
+    Characters missing from the result are fetched from ESI on demand by
+    ``get_character_corporation_roles``.
+    """
+
+    keys = {
+        _corporation_roles_cache_key(character_id): int(character_id)
+        for character_id in character_ids
+    }
+    if not keys:
+        return {}
+    return {keys[key]: set(roles) for key, roles in cache.get_many(list(keys)).items()}
+
+
 def get_character_corporation_roles(character_id: int) -> set[str]:
-    if character_id in _CORPORATION_ROLE_CACHE:
-        return _CORPORATION_ROLE_CACHE[character_id]
+    cache_key = _corporation_roles_cache_key(character_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return set(cached)
 
     try:
         payload = shared_client.fetch_character_corporation_roles(int(character_id))
@@ -123,10 +183,26 @@ def get_character_corporation_roles(character_id: int) -> set[str]:
     for key in ("roles", "roles_at_hq", "roles_at_base", "roles_at_other"):
         collected.update(_normalized_roles(payload.get(key)))
 
-    _CORPORATION_ROLE_CACHE[character_id] = collected
+    ttl = _get_corporation_roles_ttl()
+    if ttl:
+        cache.set(cache_key, sorted(collected), ttl)
     return collected
 
 
+def _prewarm_owner_names(ownerships) -> None:
+    """Resolve every owner character/corporation name before the sync loop."""
+
+    character_ids: set[int] = set()
+    corporation_ids: set[int] = set()
+    for ownership in ownerships:
+        character = ownership.character
+        character_ids.add(character.character_id)
+        if getattr(character, "corporation_id", None):
+            corporation_ids.add(character.corporation_id)
+    if character_ids or corporation_ids:
+        resolve_names_bulk(character_ids=character_ids, corporation_ids=corporation_ids)
+
+
 def _collect_corporation_contexts(
     user: User, required_scopes: list[str]
 ) -> dict[int, dict[str, int | str]]:
@@ -149,6 +225,7 @@ def _collect_corporation_contexts(
         getattr(ownership.character, "corporation_id", None) for ownership in ownerships
     }
     corp_ids_in_ownerships.discard(None)
+    _prewarm_owner_names(ownerships)
     missing_corp_ids = corp_ids_in_ownerships - set(corp_settings.keys())
 
     # Bulk create missing settings
@@ -186,103 +263,132 @@ def _collect_corporation_contexts(
         logger.debug("ESI Token model unavailable; skipping corp context collection")
         return contexts
 
+    known_roles = prefetch_character_corporation_roles(
+        ownership.character.character_id for ownership in ownerships
+    )
     for ownership in ownerships:
         corp_id = getattr(ownership.character, "corporation_id", None)
-        if not corp_id:
+        if not corp_id or corp_id in contexts:
             continue
 
-        setting = corp_settings.get(corp_id)
-
-        char_id = ownership.character.character_id
-        base_qs = Token.objects.filter(character_id=char_id, user=user).order_by(
-            "-created"
+        result = _corporation_character_context(
+            user,
+            ownership.character.character_id,
+            corp_id,
+            required_scopes,
+            corp_settings.get(corp_id),
+            token_model=Token,
+            known_roles=known_roles,
         )
+        if result is not None:
+            contexts[corp_id] = result[0]
 
-        scope_groups: list[list[str]]
-        if required_scopes:
-            base_scopes = list(required_scopes)
-            scope_groups = [base_scopes]
-            for optional_scope in _OPTIONAL_CORPORATION_SCOPES:
-                if optional_scope in base_scopes:
-                    reduced = [
-                        scope for scope in base_scopes if scope != optional_scope
-                    ]
-                    if reduced not in scope_groups:
-                        scope_groups.append(reduced)
-        else:
-            scope_groups = [[]]
-
-        token_qs = None
-        scopes_used: list[str] | None = None
-        for scopes in scope_groups:
-            candidate_qs = base_qs
-            if scopes:
-                candidate_qs = candidate_qs.require_scopes(scopes)
-            if candidate_qs.exists():
-                token_qs = candidate_qs
-                scopes_used = scopes
-                break
+    return contexts
 
-        if token_qs is None:
-            continue
 
-        if (
-            setting
-            and setting.restricts_characters
-            and not setting.is_character_authorized(char_id)
-        ):
-            logger.debug(
-                "Character %s skipped for corporation %s: not whitelisted in Indy Hub",
-                char_id,
-                corp_id,
-            )
-            continue
+def _corporation_character_context(
+    user: User,
+    char_id: int,
+    corp_id: int,
+    required_scopes: list[str],
+    setting: CorporationSharingSetting | None,
+    *,
+    token_model,
+    known_roles: dict[int, set[str]] | None = None,
+) -> tuple[dict[str, int | str], bool] | None:
+    """Return the token context of one character for its corporation.
+
+    The flag is True when the token carries every required scope (rather than
+    a fallback set without the optional ones). None means the character cannot
+    act for the corporation. ``known_roles`` holds prefetched roles by
+    character id.
+    """
 
-        if scopes_used is not None and scopes_used != required_scopes:
-            logger.debug(
-                "Character %s uses fallback scopes %s for corporation %s",
-                char_id,
-                scopes_used,
-                corp_id,
-            )
+    base_qs = token_model.objects.filter(character_id=char_id, user=user).order_by(
+        "-created"
+    )
 
-        try:
-            roles = get_character_corporation_roles(char_id)
-        except ESITokenError:
-            logger.info(
-                "Character %s lacks the required corporation roles scope for corporation %s",
-                char_id,
-                corp_id,
-            )
-            continue
-        except ESIClientError as exc:
-            logger.warning(
-                "Unable to load corporation roles for %s (%s); skipping corp %s",
-                char_id,
-                exc,
-                corp_id,
-            )
-            continue
+    scope_groups: list[list[str]]
+    if required_scopes:
+        base_scopes = list(required_scopes)
+        scope_groups = [base_scopes]
+        for optional_scope in _OPTIONAL_CORPORATION_SCOPES:
+            if optional_scope in base_scopes:
+                reduced = [scope for scope in base_scopes if scope != optional_scope]
+                if reduced not in scope_groups:
+                    scope_groups.append(reduced)
+    else:
+        scope_groups = [[]]
+
+    token_qs = None
+    scopes_used: list[str] | None = None
+    for scopes in scope_groups:
+        candidate_qs = base_qs
+        if scopes:
+            candidate_qs = candidate_qs.require_scopes(scopes)
+        if candidate_qs.exists():
+            token_qs = candidate_qs
+            scopes_used = scopes
+            break
+
+    if token_qs is None:
+        return None
 
-        if not roles.intersection(REQUIRED_CORPORATION_ROLES):
-            logger.info(
-                "Character %s does not have roles %s for corporation %s",
-                char_id,
-                ", ".join(sorted(REQUIRED_CORPORATION_ROLES)),
-                corp_id,
-            )
-            continue
+    if (
+        setting
+        and setting.restricts_characters
+        and not setting.is_character_authorized(char_id)
+    ):
+        logger.debug(
+            "Character %s skipped for corporation %s: not whitelisted in Indy Hub",
+            char_id,
+            corp_id,
+        )
+        return None
 
-        contexts.setdefault(
+    if scopes_used is not None and scopes_used != required_scopes:
+        logger.debug(
+            "Character %s uses fallback scopes %s for corporation %s",
+            char_id,
+            scopes_used,
             corp_id,
-            {
-                "character_id": char_id,
-                "character_name": get_character_name(char_id),
-                "corporation_name": get_corporation_name(corp_id),
-            },
         )
 
-    return contexts
+    try:
+        roles = (known_roles or {}).get(char_id)
+        if roles is None:
+            roles = get_character_corporation_roles(char_id)
+    except ESITokenError:
+        logger.info(
+            "Character %s lacks the required corporation roles scope for corporation %s",
+            char_id,
+            corp_id,
+        )
+        return None
+    except ESIClientError as exc:
+        logger.warning(
+            "Unable to load corporation roles for %s (%s); skipping corp %s",
+            char_id,
+            exc,
+            corp_id,
+        )
+        return None
+
+    if not roles.intersection(REQUIRED_CORPORATION_ROLES):
+        logger.info(
+            "Character %s does not have roles %s for corporation %s",
+            char_id,
+            ", ".join(sorted(REQUIRED_CORPORATION_ROLES)),
+            corp_id,
+        )
+        return None
+
+    context = {
+        "character_id": char_id,
+        "character_name": get_character_name(char_id),
+        "corporation_name": get_corporation_name(corp_id),
+    }
+    return context, scopes_used == list(required_scopes)
 
 
 def _get_manual_refresh_cooldown_seconds() -> int:
@@ -297,14 +403,10 @@ def _get_manual_refresh_cooldown_seconds() -> int:
 def _get_bulk_window_minutes(kind: str) -> int:
     fallback = _DEFAULT_BULK_WINDOWS.get(kind, 720)
     fallback = getattr(settings, "INDY_HUB_BULK_UPDATE_WINDOW_MINUTES", fallback)
-    try:
-        specific = getattr(
-            settings,
-            f"INDY_HUB_{kind.upper()}_BULK_WINDOW_MINUTES",
-            fallback,
-        )
-    except AttributeError:
-        specific = fallback
+    setting_name = _BULK_WINDOW_SETTING_NAMES.get(kind, kind.upper())
+    specific = getattr(
+        settings, f"INDY_HUB_{setting_name}_BULK_WINDOW_MINUTES", fallback
+    )
     try:
         minutes = int(specific)
     except (TypeError, ValueError):
@@ -316,25 +418,42 @@ def _manual_refresh_cache_key(kind: str, user_id: int) -> str:
     return f"{_MANUAL_REFRESH_CACHE_PREFIX}:{kind}:{user_id}"
 
 
-def _queue_staggered_user_tasks(
-    task, user_ids: list[int], *, window_minutes: int, priority: int | None = None
-) -> int:
-    if not user_ids:
-        return 0
+def _sync_max_interval(kind: str) -> timedelta:
+    # Idle owners and failing tokens never wait longer than the bulk window.
+    return timedelta(minutes=max(_get_bulk_window_minutes(kind), 1))
 
-    total = len(user_ids)
-    window_seconds = max(window_minutes * 60, 0)
 
-    if total == 1 or window_seconds == 0:
-        for user_id in user_ids:
-            task.apply_async(args=(user_id,), priority=priority)
-        return total
+def _record_owner_sync(
+    kind: str,
+    owner_kind: str,
+    owner_id: int,
+    *,
+    payload,
+    changed: bool,
+    user_id: int | None = None,
+) -> None:
+    record_sync(
+        kind,
+        owner_kind,
+        owner_id,
+        user_id=user_id,
+        expires=getattr(payload, "expires", None),
+        last_modified=getattr(payload, "last_modified", None),
+        changed=changed,
+        max_interval=_sync_max_interval(kind),
+    )
 
-    spacing = window_seconds / total
-    for index, user_id in enumerate(user_ids):
-        countdown = int(round(index * spacing))
-        task.apply_async(args=(user_id,), countdown=countdown, priority=priority)
-    return total
+
+def _record_owner_failure(
+    kind: str, owner_kind: str, owner_id: int, *, user_id: int | None = None
+) -> None:
+    record_failure(
+        kind,
+        owner_kind,
+        owner_id,
+        user_id=user_id,
+        max_interval=_sync_max_interval(kind),
+    )
 
 
 def _record_manual_refresh(kind: str, user_id: int) -> None:
@@ -458,8 +577,94 @@ def _coerce_job_datetime(value):
     return dt
 
 
+def _build_blueprint_rows(
+    blueprints: list[dict],
+    *,
+    base_values: dict,
+    lookup_character_id: int | None,
+    owner_user_id: int,
+    owner_label: str,
+) -> dict[int, dict]:
+    """Map ESI blueprint payloads to ``item_id`` -> model field values."""
+
+    resolve_names_bulk(type_ids=(bp.get("type_id") for bp in blueprints))
+    location_names: dict[int, str] = resolve_location_names(
+        bp.get("location_id") for bp in blueprints
+    )
+    rows: dict[int, dict] = {}
+
+    for bp in blueprints:
+        item_id = bp.get("item_id")
+        if item_id is None:
+            logger.debug(
+                "Blueprint without item_id ignored for %s (%s)",
+                owner_label,
+                bp,
+            )
+            continue
+
+        location_id = bp.get("location_id")
+        location_name = location_names.get(location_id)
+        if location_name is None:
+            location_name = resolve_location_name(
+                location_id,
+                character_id=lookup_character_id,
+                owner_user_id=owner_user_id,
+            )
+            location_names[location_id] = location_name
+
+        rows[int(item_id)] = {
+            **base_values,
+            "blueprint_id": bp.get("blueprint_id"),
+            "type_id": bp.get("type_id"),
+            "location_id": location_id,
+            "location_name": location_name,
+            "location_flag": bp.get("location_flag", ""),
+            "quantity": bp.get("quantity"),
+            "time_efficiency": bp.get("time_efficiency", 0),
+            "material_efficiency": bp.get("material_efficiency", 0),
+            "runs": bp.get("runs", 0),
+            "type_name": get_type_name(bp.get("type_id")),
+        }
+
+    return rows
+
+
+def _blueprints_not_modified(blueprints, owned_queryset) -> bool:
+    """Return True when ESI answered 304 and the stored rows still match it.
+
+    The row count guards against rows removed or reassigned since the
+    cached payload was last written.
+    """
+
+    if not getattr(blueprints, "not_modified", False):
+        return False
+    return owned_queryset.count() == len(blueprints)
+
+
+def _defer_character_sync(
+    task, user, character_ids: list[int], *, retry_after: float | None
+) -> None:
+    countdown = max(int(math.ceil(retry_after or 0)), 1)
+    task.apply_async(
+        args=(user.id,),
+        kwargs={"scope": "character", "character_ids": character_ids},
+        countdown=countdown,
+        priority=7,
+    )
+    logger.warning(
+        "ESI error budget spent; deferred %s of %s's characters by %ss (%s)",
+        len(character_ids),
+        user.username,
+        countdown,
+        task.name,
+    )
+
+
 @shared_task(bind=True, max_retries=3)
-def update_blueprints_for_user(self, user_id, scope: str | None = None):
+def update_blueprints_for_user(
+    self, user_id, scope: str | None = None, character_ids: list[int] | None = None
+):
     base_scopes = [BLUEPRINT_SCOPE]
     scope_preferences = [
         base_scopes + [STRUCTURE_SCOPE],
@@ -483,6 +688,8 @@ def update_blueprints_for_user(self, user_id, scope: str | None = None):
     )
     updated_count = 0
     deleted_total = 0
+    sync_counts = SyncCounts()
+    touched_type_ids: set[int] = set()
     error_messages: list[str] = []
     corp_contexts: dict[int, dict[str, int | str]] = {}
 
@@ -511,9 +718,16 @@ def update_blueprints_for_user(self, user_id, scope: str | None = None):
         error_messages.append(message)
 
     ownerships = (
-        CharacterOwnership.objects.filter(user=user) if process_characters else []
+        CharacterOwnership.objects.filter(user=user).select_related("character")
+        if process_characters
+        else []
     )
-    for ownership in ownerships:
+    if character_ids and process_characters:
+        ownerships = ownerships.filter(character__character_id__in=character_ids)
+    _prewarm_owner_names(ownerships)
+    deferred_character_ids: list[int] = []
+    retry_after: float | None = None
+    for index, ownership in enumerate(ownerships):
         char_id = ownership.character.character_id
         character_name = get_character_name(char_id)
         try:
@@ -540,6 +754,12 @@ def update_blueprints_for_user(self, user_id, scope: str | None = None):
                 )
                 logger.debug(message)
                 error_messages.append(message)
+                _record_owner_failure(
+                    MANUAL_REFRESH_KIND_BLUEPRINTS,
+                    Blueprint.OwnerKind.CHARACTER,
+                    char_id,
+                    user_id=user.id,
+                )
                 continue
 
             if STRUCTURE_SCOPE not in chosen_scopes:
@@ -553,171 +773,142 @@ def update_blueprints_for_user(self, user_id, scope: str | None = None):
             message = f"Invalid token for {character_name} ({char_id}): {exc}"
             logger.warning(message)
             error_messages.append(message)
+            _record_owner_failure(
+                MANUAL_REFRESH_KIND_BLUEPRINTS,
+                Blueprint.OwnerKind.CHARACTER,
+                char_id,
+                user_id=user.id,
+            )
             continue
-        except (ESIForbiddenError, ESIRateLimitError, ESIClientError) as exc:
+        except ESIRateLimitError as exc:
+            # The shared ESI error budget is spent: hand the remaining
+            # characters to a later run instead of failing each of them.
+            deferred_character_ids = [
+                pending.character.character_id for pending in ownerships[index:]
+            ]
+            retry_after = exc.retry_after
+            break
+        except (ESIForbiddenError, ESIClientError) as exc:
             message = f"ESI error for {character_name} ({char_id}): {exc}"
             logger.error(message)
             error_messages.append(message)
+            _record_owner_failure(
+                MANUAL_REFRESH_KIND_BLUEPRINTS,
+                Blueprint.OwnerKind.CHARACTER,
+                char_id,
+                user_id=user.id,
+            )
             continue
         except Exception as exc:  # pragma: no cover - unexpected
             message = f"Unexpected error for {character_name} ({char_id}): {exc}"
             logger.exception(message)
             error_messages.append(message)
+            _record_owner_failure(
+                MANUAL_REFRESH_KIND_BLUEPRINTS,
+                Blueprint.OwnerKind.CHARACTER,
+                char_id,
+                user_id=user.id,
+            )
             continue
 
-        esi_ids = set()
-        with transaction.atomic():
-            for bp in blueprints:
-                item_id = bp.get("item_id")
-                if item_id is None:
-                    logger.debug(
-                        "Blueprint without item_id ignored for %s (%s)",
-                        character_name,
-                        bp,
-                    )
-                    continue
-                esi_ids.add(item_id)
-                location_id = bp.get("location_id")
-                location_name = resolve_location_name(
-                    location_id,
-                    character_id=char_id,
-                    owner_user_id=user.id,
-                )
-                Blueprint.objects.update_or_create(
-                    item_id=item_id,
-                    defaults={
-                        "owner_user": user,
-                        "owner_kind": Blueprint.OwnerKind.CHARACTER,
-                        "corporation_id": None,
-                        "corporation_name": "",
-                        "character_id": char_id,
-                        "blueprint_id": bp.get("blueprint_id"),
-                        "type_id": bp.get("type_id"),
-                        "location_id": location_id,
-                        "location_name": location_name,
-                        "location_flag": bp.get("location_flag", ""),
-                        "quantity": bp.get("quantity"),
-                        "time_efficiency": bp.get("time_efficiency", 0),
-                        "material_efficiency": bp.get("material_efficiency", 0),
-                        "runs": bp.get("runs", 0),
-                        "character_name": character_name,
-                        "type_name": get_type_name(bp.get("type_id")),
-                    },
-                )
+        owned_queryset = Blueprint.objects.filter(
+            owner_user=user,
+            owner_kind=Blueprint.OwnerKind.CHARACTER,
+            character_id=char_id,
+        )
+        if _blueprints_not_modified(blueprints, owned_queryset):
+            sync_counts.unchanged += len(blueprints)
+            updated_count += len(blueprints)
+            _record_owner_sync(
+                MANUAL_REFRESH_KIND_BLUEPRINTS,
+                Blueprint.OwnerKind.CHARACTER,
+                char_id,
+                payload=blueprints,
+                changed=False,
+                user_id=user.id,
+            )
+            logger.debug(
+                "Blueprints unchanged for %s (ESI 304); skipping writes",
+                character_name,
+            )
+            continue
 
-            deleted, _ = (
-                Blueprint.objects.filter(
-                    owner_user=user,
-                    owner_kind=Blueprint.OwnerKind.CHARACTER,
-                    character_id=char_id,
-                )
-                .exclude(item_id__in=esi_ids)
-                .delete()
+        desired = _build_blueprint_rows(
+            blueprints,
+            base_values={
+                "owner_user_id": user.id,
+                "owner_kind": Blueprint.OwnerKind.CHARACTER,
+                "corporation_id": None,
+                "corporation_name": "",
+                "character_id": char_id,
+                "character_name": character_name,
+            },
+            lookup_character_id=char_id,
+            owner_user_id=user.id,
+            owner_label=character_name,
+        )
+        try:
+            counts = sync_blueprint_rows(
+                desired,
+                owned_queryset=owned_queryset,
+                touched_type_ids=touched_type_ids,
             )
-        deleted_total += deleted
+        except Exception:
+            shared_client.discard_conditional_cache(blueprints)
+            raise
+        sync_counts.merge(counts)
+        _record_owner_sync(
+            MANUAL_REFRESH_KIND_BLUEPRINTS,
+            Blueprint.OwnerKind.CHARACTER,
+            char_id,
+            payload=blueprints,
+            changed=bool(counts.written),
+            user_id=user.id,
+        )
+        deleted_total += counts.deleted
         updated_count += len(blueprints)
         logger.debug(
-            "Blueprint synchronization finished for %s (%s updated, %s deleted)",
+            "Blueprint synchronization finished for %s (%s inserted, %s updated, %s unchanged, %s deleted)",
             character_name,
-            len(blueprints),
-            deleted,
+            counts.inserted,
+            counts.updated,
+            counts.unchanged,
+            counts.deleted,
         )
 
-    if process_corporations and corp_contexts:
-        for corp_id, context in corp_contexts.items():
-            corp_char_id = context.get("character_id")
-            corp_name = context.get("corporation_name") or str(corp_id)
-            acting_character_name = context.get("character_name") or ""
-
-            if not corp_char_id:
-                logger.debug(
-                    "Incomplete context for corporation %s (missing character_id)",
-                    corp_id,
-                )
-                continue
-
-            try:
-                corp_blueprints = shared_client.fetch_corporation_blueprints(
-                    int(corp_id), character_id=int(corp_char_id)
-                )
-            except ESITokenError as exc:
-                message = f"Invalid token for corporation {corp_name} ({corp_id}) via {acting_character_name}: {exc}"
-                logger.warning(message)
-                error_messages.append(message)
-                continue
-            except (ESIForbiddenError, ESIRateLimitError, ESIClientError) as exc:
-                message = f"ESI error for corporation {corp_name} ({corp_id}) via {acting_character_name}: {exc}"
-                logger.error(message)
-                error_messages.append(message)
-                continue
-            except Exception as exc:  # pragma: no cover - unexpected
-                message = f"Unexpected error for corporation {corp_name} ({corp_id}) via {acting_character_name}: {exc}"
-                logger.exception(message)
-                error_messages.append(message)
-                continue
-
-            corp_esi_ids: set[int] = set()
-            with transaction.atomic():
-                for bp in corp_blueprints:
-                    item_id = bp.get("item_id")
-                    if item_id is None:
-                        logger.debug(
-                            "Corporate blueprint without item_id ignored for %s (%s)",
-                            corp_name,
-                            bp,
-                        )
-                        continue
-                    corp_esi_ids.add(item_id)
-                    location_id = bp.get("location_id")
-                    location_name = resolve_location_name(
-                        location_id,
-                        character_id=int(corp_char_id),
-                        owner_user_id=user.id,
-                    )
-                    Blueprint.objects.update_or_create(
-                        item_id=item_id,
-                        defaults={
-                            "owner_user": user,
-                            "owner_kind": Blueprint.OwnerKind.CORPORATION,
-                            "corporation_id": corp_id,
-                            "corporation_name": corp_name,
-                            "character_id": None,
-                            "character_name": acting_character_name,
-                            "blueprint_id": bp.get("blueprint_id"),
-                            "type_id": bp.get("type_id"),
-                            "location_id": location_id,
-                            "location_name": location_name,
-                            "location_flag": bp.get("location_flag", ""),
-                            "quantity": bp.get("quantity"),
-                            "time_efficiency": bp.get("time_efficiency", 0),
-                            "material_efficiency": bp.get("material_efficiency", 0),
-                            "runs": bp.get("runs", 0),
-                            "type_name": get_type_name(bp.get("type_id")),
-                        },
-                    )
+    if deferred_character_ids:
+        _defer_character_sync(
+            update_blueprints_for_user,
+            user,
+            deferred_character_ids,
+            retry_after=retry_after,
+        )
 
-                deleted, _ = (
-                    Blueprint.objects.filter(
-                        owner_kind=Blueprint.OwnerKind.CORPORATION,
-                        corporation_id=corp_id,
-                    )
-                    .exclude(item_id__in=corp_esi_ids)
-                    .delete()
-                )
+    if process_corporations and corp_contexts:
+        # Corporation blueprints are shared by every director of the corp and
+        # synced once per window by the corporation task.
+        for corp_id in corp_contexts:
+            queue_corporation_sync(
+                MANUAL_REFRESH_KIND_BLUEPRINTS,
+                corp_id,
+                force=normalized_scope == "corporation",
+            )
 
-            updated_count += len(corp_blueprints)
-            deleted_total += deleted
-            logger.debug(
-                "Corporate blueprint synchronization finished for %s (%s updated, %s deleted)",
-                corp_name,
-                len(corp_blueprints),
-                deleted,
+    if touched_type_ids:
+        try:
+            refresh_blueprint_catalog(touched_type_ids)
+        except Exception:  # pragma: no cover - catalog is rebuilt periodically
+            logger.exception(
+                "Failed to refresh the shared blueprint catalog for %s", user.username
             )
 
     logger.info(
-        "Blueprints synchronized for %s: %s updated, %s deleted",
+        "Blueprints synchronized for %s: %s processed (%s inserted, %s updated, %s unchanged, %s deleted)",
         user.username,
         updated_count,
+        sync_counts.inserted,
+        sync_counts.updated,
+        sync_counts.unchanged,
         deleted_total,
     )
     if error_messages:
@@ -731,22 +922,170 @@ def update_blueprints_for_user(self, user_id, scope: str | None = None):
         "success": True,
         "blueprints_updated": updated_count,
         "deleted": deleted_total,
+        "counts": sync_counts.as_dict(),
         "errors": error_messages,
     }
 
 
+class _JobLocationNames:
+    """Per-run location name cache honouring the structure lookup budget."""
+
+    def __init__(self, *, budget: int, owner_user_id: int, username: str) -> None:
+        self.budget = budget
+        self.owner_user_id = owner_user_id
+        self.username = username
+        self.names: dict[int, str] = {}
+        self.budget_warned = False
+
+    def prefetch(self, station_ids) -> None:
+        """Load indexed names in bulk; they do not count against the budget."""
+
+        self.names.update(resolve_location_names(station_ids))
+
+    def resolve(self, station_id, *, character_id: int, owner_label: str) -> str:
+        if station_id is None:
+            return ""
+        try:
+            location_key = int(station_id)
+        except (TypeError, ValueError):
+            return ""
+
+        cached_name = self.names.get(location_key)
+        if cached_name is not None:
+            return cached_name
+
+        placeholder = f"{PLACEHOLDER_PREFIX}{location_key}"
+        if self.budget <= 0:
+            if not self.budget_warned:
+                logger.warning(
+                    "Location lookup budget exhausted while syncing industry jobs for %s; remaining locations will use placeholders.",
+                    self.username,
+                )
+                self.budget_warned = True
+            return self.names.setdefault(location_key, placeholder)
+
+        try:
+            resolved_name = resolve_location_name(
+                location_key,
+                character_id=character_id,
+                owner_user_id=self.owner_user_id,
+            )
+        except Exception:  # pragma: no cover - defensive fallback
+            logger.debug(
+                "Location resolution failed for %s via %s",
+                location_key,
+                owner_label,
+                exc_info=True,
+            )
+            resolved_name = None
+
+        self.budget -= 1
+        self.names[location_key] = resolved_name or placeholder
+        return self.names[location_key]
+
+
+def _build_job_rows(
+    jobs: list[dict],
+    *,
+    base_values: dict,
+    lookup_character_id: int,
+    owner_label: str,
+    location_names: _JobLocationNames,
+) -> dict[int, dict]:
+    """Map ESI industry job payloads to ``job_id`` -> model field values."""
+
+    resolve_names_bulk(
+        type_ids=(
+            type_id
+            for job in jobs
+            for type_id in (job.get("blueprint_type_id"), job.get("product_type_id"))
+        )
+    )
+    location_names.prefetch(job.get("station_id") for job in jobs)
+    rows: dict[int, dict] = {}
+
+    for job in jobs:
+        job_id = job.get("job_id")
+        if job_id is None:
+            logger.debug(
+                "Skipping job without identifier for %s: %s",
+                owner_label,
+                job,
+            )
+            continue
+
+        start_date = _coerce_job_datetime(job.get("start_date"))
+        end_date = _coerce_job_datetime(job.get("end_date"))
+        if start_date is None:
+            logger.warning(
+                "Skipping job %s for %s due to invalid start date %r",
+                job_id,
+                owner_label,
+                job.get("start_date"),
+            )
+            continue
+        if end_date is None:
+            logger.warning(
+                "Job %s for %s missing end date; defaulting to start date.",
+                job_id,
+                owner_label,
+            )
+            end_date = start_date
+
+        station_id = job.get("station_id") or job.get("facility_id")
+        rows[int(job_id)] = {
+            **base_values,
+            "installer_id": job.get("installer_id"),
+            "station_id": station_id,
+            "location_name": location_names.resolve(
+                station_id,
+                character_id=lookup_character_id,
+                owner_label=owner_label,
+            ),
+            "activity_id": job.get("activity_id"),
+            "blueprint_id": job.get("blueprint_id"),
+            "blueprint_type_id": job.get("blueprint_type_id"),
+            "runs": job.get("runs"),
+            "cost": job.get("cost"),
+            "licensed_runs": job.get("licensed_runs"),
+            "probability": job.get("probability"),
+            "product_type_id": job.get("product_type_id"),
+            "status": job.get("status"),
+            "duration": job.get("duration"),
+            "start_date": start_date,
+            "end_date": end_date,
+            "pause_date": _coerce_job_datetime(job.get("pause_date")),
+            "completed_date": _coerce_job_datetime(job.get("completed_date")),
+            "completed_character_id": job.get("completed_character_id"),
+            "successful_runs": job.get("successful_runs"),
+            "blueprint_type_name": get_type_name(job.get("blueprint_type_id")),
+            "product_type_name": get_type_name(job.get("product_type_id")),
+        }
+
+    return rows
+
+
 @shared_task(bind=True, max_retries=3)
-def update_industry_jobs_for_user(self, user_id, scope: str | None = None):
+def update_industry_jobs_for_user(
+    self, user_id, scope: str | None = None, character_ids: list[int] | None = None
+):
     try:
         user = User.objects.get(id=user_id)
         logger.info("Starting industry jobs update for user %s", user.username)
         updated_count = 0
         deleted_total = 0
+        sync_counts = SyncCounts()
         error_messages: list[str] = []
-        location_cache: dict[int, str] = {}
-        lookup_budget = _get_location_lookup_budget()
-        lookup_budget_warned = False
-        ownerships = CharacterOwnership.objects.filter(user=user)
+        location_names = _JobLocationNames(
+            budget=_get_location_lookup_budget(),
+            owner_user_id=user.id,
+            username=user.username,
+        )
+        ownerships = CharacterOwnership.objects.filter(user=user).select_related(
+            "character"
+        )
+        if character_ids:
+            ownerships = ownerships.filter(character__character_id__in=character_ids)
         base_scopes = [JOBS_SCOPE]
         scope_preferences = [
             base_scopes + [STRUCTURE_SCOPE],
@@ -793,7 +1132,10 @@ def update_industry_jobs_for_user(self, user_id, scope: str | None = None):
             logger.info(message)
             error_messages.append(message)
 
-        for ownership in ownerships:
+        _prewarm_owner_names(ownerships)
+        deferred_character_ids: list[int] = []
+        retry_after: float | None = None
+        for index, ownership in enumerate(ownerships):
             char_id = ownership.character.character_id
             character_name = get_character_name(char_id)
             try:
@@ -818,6 +1160,12 @@ def update_industry_jobs_for_user(self, user_id, scope: str | None = None):
                     message = f"{character_name} ({char_id}) missing token for scopes {scope_list}"
                     logger.debug(message)
                     error_messages.append(message)
+                    _record_owner_failure(
+                        MANUAL_REFRESH_KIND_JOBS,
+                        Blueprint.OwnerKind.CHARACTER,
+                        char_id,
+                        user_id=user.id,
+                    )
                     continue
 
                 if STRUCTURE_SCOPE not in chosen_scopes:
@@ -831,332 +1179,109 @@ def update_industry_jobs_for_user(self, user_id, scope: str | None = None):
                 message = f"Invalid token for {character_name} ({char_id}): {exc}"
                 logger.warning(message)
                 error_messages.append(message)
+                _record_owner_failure(
+                    MANUAL_REFRESH_KIND_JOBS,
+                    Blueprint.OwnerKind.CHARACTER,
+                    char_id,
+                    user_id=user.id,
+                )
                 continue
-            except (ESIForbiddenError, ESIRateLimitError, ESIClientError) as exc:
+            except ESIRateLimitError as exc:
+                deferred_character_ids = [
+                    pending.character.character_id for pending in ownerships[index:]
+                ]
+                retry_after = exc.retry_after
+                break
+            except (ESIForbiddenError, ESIClientError) as exc:
                 message = f"ESI error for {character_name} ({char_id}): {exc}"
                 logger.error(message)
                 error_messages.append(message)
+                _record_owner_failure(
+                    MANUAL_REFRESH_KIND_JOBS,
+                    Blueprint.OwnerKind.CHARACTER,
+                    char_id,
+                    user_id=user.id,
+                )
                 continue
             except Exception as exc:  # pragma: no cover - unexpected
                 message = f"Unexpected error for {character_name} ({char_id}): {exc}"
                 logger.exception(message)
                 error_messages.append(message)
-                continue
-
-            esi_job_ids = set()
-            with transaction.atomic():
-                for job in jobs:
-                    job_id = job.get("job_id")
-                    if job_id is None:
-                        logger.debug(
-                            "Skipping job without identifier for %s: %s",
-                            character_name,
-                            job,
-                        )
-                        continue
-                    esi_job_ids.add(job_id)
-                    station_id = job.get("station_id") or job.get("facility_id")
-                    location_name = ""
-                    if station_id is not None:
-                        try:
-                            location_key = int(station_id)
-                        except (TypeError, ValueError):
-                            location_key = None
-
-                        if location_key is not None:
-                            cached_name = location_cache.get(location_key)
-                            if cached_name is not None:
-                                location_name = cached_name
-                            elif lookup_budget > 0:
-                                try:
-                                    resolved_name = resolve_location_name(
-                                        location_key,
-                                        character_id=char_id,
-                                        owner_user_id=user.id,
-                                    )
-                                except (
-                                    Exception
-                                ):  # pragma: no cover - defensive fallback
-                                    logger.debug(
-                                        "Location resolution failed for %s via %s",
-                                        location_key,
-                                        character_name,
-                                        exc_info=True,
-                                    )
-                                    resolved_name = None
-
-                                lookup_budget -= 1
-                                location_name = (
-                                    resolved_name
-                                    if resolved_name
-                                    else f"{PLACEHOLDER_PREFIX}{location_key}"
-                                )
-                                location_cache[location_key] = location_name
-                            else:
-                                if not lookup_budget_warned:
-                                    logger.warning(
-                                        "Location lookup budget exhausted while syncing industry jobs for %s; remaining locations will use placeholders.",
-                                        user.username,
-                                    )
-                                    lookup_budget_warned = True
-                                location_name = location_cache.setdefault(
-                                    location_key,
-                                    f"{PLACEHOLDER_PREFIX}{location_key}",
-                                )
-                    start_date = _coerce_job_datetime(job.get("start_date"))
-                    end_date = _coerce_job_datetime(job.get("end_date"))
-                    pause_date = _coerce_job_datetime(job.get("pause_date"))
-                    completed_date = _coerce_job_datetime(job.get("completed_date"))
-
-                    if start_date is None:
-                        logger.warning(
-                            "Skipping job %s for %s due to invalid start date %r",
-                            job_id,
-                            character_name,
-                            job.get("start_date"),
-                        )
-                        continue
-
-                    if end_date is None:
-                        logger.warning(
-                            "Job %s for %s missing end date; defaulting to start date.",
-                            job_id,
-                            character_name,
-                        )
-                        end_date = start_date
-
-                    IndustryJob.objects.update_or_create(
-                        job_id=job_id,
-                        defaults={
-                            "owner_user": user,
-                            "owner_kind": Blueprint.OwnerKind.CHARACTER,
-                            "corporation_id": None,
-                            "corporation_name": "",
-                            "character_id": char_id,
-                            "installer_id": job.get("installer_id"),
-                            "station_id": station_id,
-                            "location_name": location_name,
-                            "activity_id": job.get("activity_id"),
-                            "blueprint_id": job.get("blueprint_id"),
-                            "blueprint_type_id": job.get("blueprint_type_id"),
-                            "runs": job.get("runs"),
-                            "cost": job.get("cost"),
-                            "licensed_runs": job.get("licensed_runs"),
-                            "probability": job.get("probability"),
-                            "product_type_id": job.get("product_type_id"),
-                            "status": job.get("status"),
-                            "duration": job.get("duration"),
-                            "start_date": start_date,
-                            "end_date": end_date,
-                            "pause_date": pause_date,
-                            "completed_date": completed_date,
-                            "completed_character_id": job.get("completed_character_id"),
-                            "successful_runs": job.get("successful_runs"),
-                            "blueprint_type_name": get_type_name(
-                                job.get("blueprint_type_id")
-                            ),
-                            "product_type_name": get_type_name(
-                                job.get("product_type_id")
-                            ),
-                            "character_name": character_name,
-                        },
-                    )
-
-                deleted, _ = (
-                    IndustryJob.objects.filter(
-                        owner_user=user,
-                        owner_kind=Blueprint.OwnerKind.CHARACTER,
-                        character_id=char_id,
-                    )
-                    .exclude(job_id__in=esi_job_ids)
-                    .delete()
+                _record_owner_failure(
+                    MANUAL_REFRESH_KIND_JOBS,
+                    Blueprint.OwnerKind.CHARACTER,
+                    char_id,
+                    user_id=user.id,
                 )
+                continue
 
-            deleted_total += deleted
+            desired = _build_job_rows(
+                jobs,
+                base_values={
+                    "owner_user_id": user.id,
+                    "owner_kind": Blueprint.OwnerKind.CHARACTER,
+                    "corporation_id": None,
+                    "corporation_name": "",
+                    "character_id": char_id,
+                    "character_name": character_name,
+                },
+                lookup_character_id=char_id,
+                owner_label=character_name,
+                location_names=location_names,
+            )
+            counts = sync_industry_job_rows(
+                desired,
+                owned_queryset=IndustryJob.objects.filter(
+                    owner_user=user,
+                    owner_kind=Blueprint.OwnerKind.CHARACTER,
+                    character_id=char_id,
+                ),
+            )
+            sync_counts.merge(counts)
+            deleted_total += counts.deleted
             updated_count += len(jobs)
+            _record_owner_sync(
+                MANUAL_REFRESH_KIND_JOBS,
+                Blueprint.OwnerKind.CHARACTER,
+                char_id,
+                payload=jobs,
+                changed=bool(counts.written),
+                user_id=user.id,
+            )
             logger.debug(
-                "Finished syncing jobs for %s (%s updated, %s removed)",
+                "Finished syncing jobs for %s (%s inserted, %s updated, %s unchanged, %s removed)",
                 character_name,
-                len(jobs),
-                deleted,
+                counts.inserted,
+                counts.updated,
+                counts.unchanged,
+                counts.deleted,
             )
 
-        if process_corporations and corp_contexts:
-            for corp_id, context in corp_contexts.items():
-                corp_char_id = context.get("character_id")
-                corp_name = context.get("corporation_name") or str(corp_id)
-                acting_character_name = context.get("character_name") or ""
-
-                if not corp_char_id:
-                    logger.debug(
-                        "Incomplete corporate job context for %s (missing character_id)",
-                        corp_id,
-                    )
-                    continue
-
-                try:
-                    corp_jobs = shared_client.fetch_corporation_industry_jobs(
-                        int(corp_id), character_id=int(corp_char_id)
-                    )
-                except ESITokenError as exc:
-                    message = f"Invalid token for corporation {corp_name} ({corp_id}) via {acting_character_name}: {exc}"
-                    logger.warning(message)
-                    error_messages.append(message)
-                    continue
-                except (ESIForbiddenError, ESIRateLimitError, ESIClientError) as exc:
-                    message = f"ESI error for corporation {corp_name} ({corp_id}) via {acting_character_name}: {exc}"
-                    logger.error(message)
-                    error_messages.append(message)
-                    continue
-                except Exception as exc:  # pragma: no cover - unexpected
-                    message = f"Unexpected error for corporation {corp_name} ({corp_id}) via {acting_character_name}: {exc}"
-                    logger.exception(message)
-                    error_messages.append(message)
-                    continue
-
-                corp_job_ids: set[int] = set()
-                with transaction.atomic():
-                    for job in corp_jobs:
-                        job_id = job.get("job_id")
-                        if job_id is None:
-                            logger.debug(
-                                "Skipping corporate job without identifier for %s: %s",
-                                corp_name,
-                                job,
-                            )
-                            continue
-
-                        corp_job_ids.add(job_id)
-                        station_id = job.get("station_id") or job.get("facility_id")
-                        location_name = ""
-                        if station_id is not None:
-                            try:
-                                location_key = int(station_id)
-                            except (TypeError, ValueError):
-                                location_key = None
-
-                            if location_key is not None:
-                                cached_name = location_cache.get(location_key)
-                                if cached_name is not None:
-                                    location_name = cached_name
-                                elif lookup_budget > 0:
-                                    try:
-                                        resolved_name = resolve_location_name(
-                                            location_key,
-                                            character_id=int(corp_char_id),
-                                            owner_user_id=user.id,
-                                        )
-                                    except Exception:  # pragma: no cover
-                                        logger.debug(
-                                            "Location resolution failed for %s via %s",
-                                            location_key,
-                                            acting_character_name,
-                                            exc_info=True,
-                                        )
-                                        resolved_name = None
-
-                                    lookup_budget -= 1
-                                    location_name = (
-                                        resolved_name
-                                        if resolved_name
-                                        else f"{PLACEHOLDER_PREFIX}{location_key}"
-                                    )
-                                    location_cache[location_key] = location_name
-                                else:
-                                    if not lookup_budget_warned:
-                                        logger.warning(
-                                            "Location lookup budget exhausted while syncing corporate jobs for %s; remaining locations will use placeholders.",
-                                            corp_name,
-                                        )
-                                        lookup_budget_warned = True
-                                    location_name = location_cache.setdefault(
-                                        location_key,
-                                        f"{PLACEHOLDER_PREFIX}{location_key}",
-                                    )
-
-                        start_date = _coerce_job_datetime(job.get("start_date"))
-                        end_date = _coerce_job_datetime(job.get("end_date"))
-                        pause_date = _coerce_job_datetime(job.get("pause_date"))
-                        completed_date = _coerce_job_datetime(job.get("completed_date"))
-
-                        if start_date is None:
-                            logger.warning(
-                                "Ignoring corporate job %s for %s due to invalid start date %r",
-                                job_id,
-                                corp_name,
-                                job.get("start_date"),
-                            )
-                            continue
-
-                        if end_date is None:
-                            logger.warning(
-                                "Corporate job %s for %s missing end date; defaulting to start date.",
-                                job_id,
-                                corp_name,
-                            )
-                            end_date = start_date
-
-                        IndustryJob.objects.update_or_create(
-                            job_id=job_id,
-                            defaults={
-                                "owner_user": user,
-                                "owner_kind": Blueprint.OwnerKind.CORPORATION,
-                                "corporation_id": corp_id,
-                                "corporation_name": corp_name,
-                                "character_id": None,
-                                "character_name": acting_character_name,
-                                "installer_id": job.get("installer_id"),
-                                "station_id": station_id,
-                                "location_name": location_name,
-                                "activity_id": job.get("activity_id"),
-                                "blueprint_id": job.get("blueprint_id"),
-                                "blueprint_type_id": job.get("blueprint_type_id"),
-                                "runs": job.get("runs"),
-                                "cost": job.get("cost"),
-                                "licensed_runs": job.get("licensed_runs"),
-                                "probability": job.get("probability"),
-                                "product_type_id": job.get("product_type_id"),
-                                "status": job.get("status"),
-                                "duration": job.get("duration"),
-                                "start_date": start_date,
-                                "end_date": end_date,
-                                "pause_date": pause_date,
-                                "completed_date": completed_date,
-                                "completed_character_id": job.get(
-                                    "completed_character_id"
-                                ),
-                                "successful_runs": job.get("successful_runs"),
-                                "blueprint_type_name": get_type_name(
-                                    job.get("blueprint_type_id")
-                                ),
-                                "product_type_name": get_type_name(
-                                    job.get("product_type_id")
-                                ),
-                            },
-                        )
-
-                deleted, _ = (
-                    IndustryJob.objects.filter(
-                        owner_kind=Blueprint.OwnerKind.CORPORATION,
-                        corporation_id=corp_id,
-                    )
-                    .exclude(job_id__in=corp_job_ids)
-                    .delete()
-                )
+        if deferred_character_ids:
+            _defer_character_sync(
+                update_industry_jobs_for_user,
+                user,
+                deferred_character_ids,
+                retry_after=retry_after,
+            )
 
-                updated_count += len(corp_jobs)
-                deleted_total += deleted
-                logger.debug(
-                    "Finished syncing corporate jobs for %s (%s updated, %s removed)",
-                    corp_name,
-                    len(corp_jobs),
-                    deleted,
+        if process_corporations and corp_contexts:
+            # Corporation jobs are synced once per window by the corporation
+            # task instead of once per director.
+            for corp_id in corp_contexts:
+                queue_corporation_sync(
+                    MANUAL_REFRESH_KIND_JOBS,
+                    corp_id,
+                    force=normalized_scope == "corporation",
                 )
 
         logger.info(
-            "Jobs synced for %s: %s updated, %s removed",
+            "Jobs synced for %s: %s processed (%s inserted, %s updated, %s unchanged, %s removed)",
             user.username,
             updated_count,
+            sync_counts.inserted,
+            sync_counts.updated,
+            sync_counts.unchanged,
             deleted_total,
         )
         if error_messages:
@@ -1169,6 +1294,7 @@ def update_industry_jobs_for_user(self, user_id, scope: str | None = None):
             "success": True,
             "jobs_updated": updated_count,
             "deleted": deleted_total,
+            "counts": sync_counts.as_dict(),
             "errors": error_messages,
         }
     except Exception as e:
@@ -1177,6 +1303,335 @@ def update_industry_jobs_for_user(self, user_id, scope: str | None = None):
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
 
+def _get_corporation_sync_window_minutes(kind: str) -> int:
+    # Half the bulk window by default, so each bulk cycle syncs a corp once
+    # even when its first director is queued early in the next cycle.
+    fallback = _get_bulk_window_minutes(kind) // 2
+    try:
+        minutes = int(getattr(settings, "INDY_HUB_CORP_SYNC_WINDOW_MINUTES", fallback))
+    except (TypeError, ValueError):
+        minutes = fallback
+    return max(minutes, 0)
+
+
+def _corporation_sync_cache_key(kind: str, corporation_id: int, state: str) -> str:
+    return f"{_CORP_SYNC_CACHE_PREFIX}:{kind}:{int(corporation_id)}:{state}"
+
+
+def _select_corporation_context(
+    corporation_id: int, required_scopes: list[str]
+) -> dict[str, int | str] | None:
+    """Pick the director token a corporation sync should use.
+
+    Any member character whose user may manage corporation blueprints, holds a
+    token for ``required_scopes`` and has a director/factory manager role
+    qualifies; tokens with the full scope set win over fallback scopes.
+    """
+
+    # Alliance Auth
+    from esi.models import Token
+
+    corp_settings = {
+        setting.user_id: setting
+        for setting in CorporationSharingSetting.objects.filter(
+            corporation_id=corporation_id
+        )
+    }
+    members = CharacterOwnership.objects.filter(
+        character__corporation_id=corporation_id
+    )
+    # Only members holding a token with at least the non-optional scopes can
+    # qualify, so permission checks are limited to their users.
+    tokens = Token.objects.filter(
+        character_id__in=members.values("character__character_id")
+    )
+    minimal_scopes = [
+        scope for scope in required_scopes if scope not in _OPTIONAL_CORPORATION_SCOPES
+    ]
+    if minimal_scopes:
+        tokens = tokens.require_scopes(minimal_scopes)
+    token_holders = set(tokens.values_list("character_id", "user_id"))
+
+    ownerships = members.select_related("character", "user").order_by("pk")
+    allowed_users: dict[int, bool] = {}
+    candidates = []
+    for ownership in ownerships:
+        user = ownership.user
+        if (ownership.character.character_id, user.id) not in token_holders:
+            continue
+        if user.id not in allowed_users:
+            allowed_users[user.id] = user.has_perm(
+                "indy_hub.can_manage_corp_bp_requests"
+            )
+        if allowed_users[user.id]:
+            candidates.append(ownership)
+
+    known_roles = prefetch_character_corporation_roles(
+        ownership.character.character_id for ownership in candidates
+    )
+    fallback: dict[str, int | str] | None = None
+    for ownership in candidates:
+        user = ownership.user
+        result = _corporation_character_context(
+            user,
+            ownership.character.character_id,
+            corporation_id,
+            required_scopes,
+            corp_settings.get(user.id),
+            token_model=Token,
+            known_roles=known_roles,
+        )
+        if result is None:
+            continue
+        context, full_scopes = result
+        context["user_id"] = user.id
+        if full_scopes:
+            return context
+        fallback = fallback or context
+    return fallback
+
+
+def _sync_corporation_blueprints(
+    corporation_id: int, context: dict[str, int | str]
+) -> dict:
+    corp_char_id = int(context["character_id"])
+    corp_name = context.get("corporation_name") or str(corporation_id)
+    owner_user_id = int(context["user_id"])
+
+    corp_blueprints = shared_client.fetch_corporation_blueprints(
+        corporation_id, character_id=corp_char_id
+    )
+    owned_queryset = Blueprint.objects.filter(
+        owner_kind=Blueprint.OwnerKind.CORPORATION,
+        corporation_id=corporation_id,
+    )
+    if _blueprints_not_modified(corp_blueprints, owned_queryset):
+        logger.debug(
+            "Corporate blueprints unchanged for %s (ESI 304); skipping writes",
+            corp_name,
+        )
+        _record_owner_sync(
+            MANUAL_REFRESH_KIND_BLUEPRINTS,
+            Blueprint.OwnerKind.CORPORATION,
+            corporation_id,
+            payload=corp_blueprints,
+            changed=False,
+        )
+        counts = SyncCounts(unchanged=len(corp_blueprints))
+        return {"blueprints_updated": len(corp_blueprints), **counts.as_dict()}
+
+    desired = _build_blueprint_rows(
+        corp_blueprints,
+        base_values={
+            "owner_user_id": owner_user_id,
+            "owner_kind": Blueprint.OwnerKind.CORPORATION,
+            "corporation_id": corporation_id,
+            "corporation_name": corp_name,
+            "character_id": None,
+            "character_name": context.get("character_name") or "",
+        },
+        lookup_character_id=corp_char_id,
+        owner_user_id=owner_user_id,
+        owner_label=corp_name,
+    )
+    touched_type_ids: set[int] = set()
+    try:
+        counts = sync_blueprint_rows(
+            desired,
+            owned_queryset=owned_queryset,
+            touched_type_ids=touched_type_ids,
+        )
+    except Exception:
+        shared_client.discard_conditional_cache(corp_blueprints)
+        raise
+    _record_owner_sync(
+        MANUAL_REFRESH_KIND_BLUEPRINTS,
+        Blueprint.OwnerKind.CORPORATION,
+        corporation_id,
+        payload=corp_blueprints,
+        changed=bool(counts.written),
+    )
+
+    if touched_type_ids:
+        try:
+            refresh_blueprint_catalog(touched_type_ids)
+        except Exception:  # pragma: no cover - catalog is rebuilt periodically
+            logger.exception(
+                "Failed to refresh the shared blueprint catalog for corp %s",
+                corporation_id,
+            )
+    logger.info(
+        "Corporate blueprints synchronized for %s: %s processed (%s inserted, %s updated, %s unchanged, %s deleted)",
+        corp_name,
+        len(corp_blueprints),
+        counts.inserted,
+        counts.updated,
+        counts.unchanged,
+        counts.deleted,
+    )
+    return {"blueprints_updated": len(corp_blueprints), **counts.as_dict()}
+
+
+def _sync_corporation_industry_jobs(
+    corporation_id: int, context: dict[str, int | str]
+) -> dict:
+    corp_char_id = int(context["character_id"])
+    corp_name = context.get("corporation_name") or str(corporation_id)
+    owner_user_id = int(context["user_id"])
+
+    corp_jobs = shared_client.fetch_corporation_industry_jobs(
+        corporation_id, character_id=corp_char_id
+    )
+    desired = _build_job_rows(
+        corp_jobs,
+        base_values={
+            "owner_user_id": owner_user_id,
+            "owner_kind": Blueprint.OwnerKind.CORPORATION,
+            "corporation_id": corporation_id,
+            "corporation_name": corp_name,
+            "character_id": None,
+            "character_name": context.get("character_name") or "",
+        },
+        lookup_character_id=corp_char_id,
+        owner_label=corp_name,
+        location_names=_JobLocationNames(
+            budget=_get_location_lookup_budget(),
+            owner_user_id=owner_user_id,
+            username=corp_name,
+        ),
+    )
+    counts = sync_industry_job_rows(
+        desired,
+        owned_queryset=IndustryJob.objects.filter(
+            owner_kind=Blueprint.OwnerKind.CORPORATION,
+            corporation_id=corporation_id,
+        ),
+    )
+    _record_owner_sync(
+        MANUAL_REFRESH_KIND_JOBS,
+        Blueprint.OwnerKind.CORPORATION,
+        corporation_id,
+        payload=corp_jobs,
+        changed=bool(counts.written),
+    )
+    logger.info(
+        "Corporate jobs synchronized for %s: %s processed (%s inserted, %s updated, %s unchanged, %s removed)",
+        corp_name,
+        len(corp_jobs),
+        counts.inserted,
+        counts.updated,
+        counts.unchanged,
+        counts.deleted,
+    )
+    return {"jobs_updated": len(corp_jobs), **counts.as_dict()}
+
+
+_CORPORATION_SYNCS = {
+    MANUAL_REFRESH_KIND_BLUEPRINTS: (
+        CORP_BLUEPRINT_SCOPE_SET,
+        _sync_corporation_blueprints,
+    ),
+    MANUAL_REFRESH_KIND_JOBS: (CORP_JOBS_SCOPE_SET, _sync_corporation_industry_jobs),
+}
+
+
+def _run_corporation_sync(kind: str, corporation_id: int, *, force: bool) -> dict:
+    """Sync one corporation's shared data at most once per window.
+
+    ``force`` (a manual corporation refresh) skips the window but never runs
+    alongside another worker syncing the same corporation.
+    """
+
+    corporation_id = int(corporation_id)
+    required_scopes, sync = _CORPORATION_SYNCS[kind]
+    done_key = _corporation_sync_cache_key(kind, corporation_id, "done")
+    if not force and cache.get(done_key):
+        logger.debug(
+            "Corporation %s %s synced recently; skipping", corporation_id, kind
+        )
+        return {"success": True, "skipped": "recent"}
+
+    lock_key = _corporation_sync_cache_key(kind, corporation_id, "running")
+    if not cache.add(lock_key, True, _CORP_SYNC_LOCK_TTL_SECONDS):
+        logger.debug(
+            "Corporation %s %s sync already running; skipping", corporation_id, kind
+        )
+        return {"success": True, "skipped": "running"}
+
+    try:
+        context = _select_corporation_context(corporation_id, required_scopes)
+        if context is None:
+            logger.info(
+                "No director token available for corporation %s %s sync",
+                corporation_id,
+                kind,
+            )
+            _record_owner_failure(kind, Blueprint.OwnerKind.CORPORATION, corporation_id)
+            result = {"success": False, "error": "no_director_token"}
+        else:
+            result = {"success": True, **sync(corporation_id, context)}
+        cache.set(
+            done_key,
+            timezone.now().timestamp(),
+            _get_corporation_sync_window_minutes(kind) * 60,
+        )
+        return result
+    except ESIRateLimitError as exc:
+        countdown = max(int(math.ceil(exc.retry_after or 0)), 1)
+        queue_corporation_sync(kind, corporation_id, force=force, countdown=countdown)
+        logger.warning(
+            "ESI error budget spent; deferred corporation %s %s sync by %ss",
+            corporation_id,
+            kind,
+            countdown,
+        )
+        return {"success": False, "deferred": countdown}
+    except (
+        ESITokenError,
+        ESIForbiddenError,
+        ESIClientError,
+    ) as exc:
+        # No window marker: the next director's run retries the corporation.
+        logger.warning(
+            "ESI error during corporation %s %s sync: %s", corporation_id, kind, exc
+        )
+        _record_owner_failure(kind, Blueprint.OwnerKind.CORPORATION, corporation_id)
+        return {"success": False, "error": str(exc)}
+    finally:
+        cache.delete(lock_key)
+
+
+@shared_task
+def sync_corporation_blueprints(corporation_id: int, force: bool = False):
+    return _run_corporation_sync(
+        MANUAL_REFRESH_KIND_BLUEPRINTS, corporation_id, force=force
+    )
+
+
+@shared_task
+def sync_corporation_industry_jobs(corporation_id: int, force: bool = False):
+    return _run_corporation_sync(MANUAL_REFRESH_KIND_JOBS, corporation_id, force=force)
+
+
+def queue_corporation_sync(
+    kind: str,
+    corporation_id: int,
+    *,
+    force: bool = False,
+    countdown: int | None = None,
+):
+    task = {
+        MANUAL_REFRESH_KIND_BLUEPRINTS: sync_corporation_blueprints,
+        MANUAL_REFRESH_KIND_JOBS: sync_corporation_industry_jobs,
+    }[kind]
+    task.apply_async(
+        args=(int(corporation_id),),
+        kwargs={"force": force},
+        countdown=countdown,
+        priority=7,
+    )
+
+
 @shared_task
 def cleanup_old_jobs():
     """
@@ -1238,6 +1693,15 @@ def cleanup_old_jobs():
     }
 
 
+@shared_task
+def refresh_shared_blueprint_catalog():
+    """Rebuild the shared blueprint catalog to pick up affiliation changes."""
+
+    rows = refresh_blueprint_catalog()
+    logger.info("Shared blueprint catalog rebuilt (%s rows)", rows)
+    return rows
+
+
 @shared_task
 def update_type_names():
     blueprints_without_names = Blueprint.objects.filter(type_name="")
@@ -1295,57 +1759,151 @@ def populate_location_names_async(
     return summary
 
 
-@shared_task
-def update_all_blueprints():
-    """
-    Update blueprints for all users - scheduled via Celery beat
-    """
-    logger.info("Starting bulk blueprint update for all users")
+def _get_sync_dispatch_limits() -> tuple[int, int]:
+    limits = []
+    for setting_name, default in (
+        ("INDY_HUB_SYNC_DISPATCH_BATCH_SIZE", 25),
+        ("INDY_HUB_SYNC_MAX_IN_FLIGHT", 50),
+    ):
+        try:
+            value = int(getattr(settings, setting_name, default))
+        except (TypeError, ValueError):
+            value = default
+        limits.append(max(value, 0))
+    return limits[0], limits[1]
+
+
+def _schedule_owners(kind: str):
+    """Yield ``(owner_kind, owner_id, user_id)`` for every syncable owner."""
+
+    # Alliance Auth
+    from esi.models import Token
 
-    user_ids = list(
-        User.objects.filter(token__isnull=False).distinct().values_list("id", flat=True)
+    if kind == MANUAL_REFRESH_KIND_BLUEPRINTS:
+        scope, corp_scope = BLUEPRINT_SCOPE, CORP_BLUEPRINT_SCOPE
+    else:
+        scope, corp_scope = JOBS_SCOPE, CORP_JOBS_SCOPE
+    characters = dict(
+        Token.objects.filter(user__isnull=False)
+        .require_scopes([scope])
+        .values_list("character_id", "user_id")
+    )
+    for character_id, user_id in characters.items():
+        yield Blueprint.OwnerKind.CHARACTER, character_id, user_id
+
+    # Corporations are syncable through any member's corporation-scope token,
+    # whether or not a corporation-scope user sync has run for them yet.
+    corp_character_ids = set(
+        Token.objects.filter(user__isnull=False)
+        .require_scopes([corp_scope])
+        .values_list("character_id", flat=True)
+    )
+    corporation_ids = set(
+        CorporationSharingSetting.objects.values_list("corporation_id", flat=True)
+    )
+    corporation_ids.update(
+        EveCharacter.objects.filter(character_id__in=corp_character_ids).values_list(
+            "corporation_id", flat=True
+        )
     )
-    random.shuffle(user_ids)
+    for corporation_id in corporation_ids:
+        yield Blueprint.OwnerKind.CORPORATION, corporation_id, None
 
-    window_minutes = _get_bulk_window_minutes("blueprints")
-    queued = _queue_staggered_user_tasks(
-        update_blueprints_for_user,
-        user_ids,
-        window_minutes=window_minutes,
-        priority=7,
+
+def _refresh_schedule_owners(kind: str, *, force: bool = False) -> None:
+    cache_key = _SYNC_OWNERS_REFRESHED_KEY.format(kind=kind)
+    if force:
+        cache.set(cache_key, True, _SYNC_OWNERS_REFRESH_SECONDS)
+    elif not cache.add(cache_key, True, _SYNC_OWNERS_REFRESH_SECONDS):
+        return
+    sync_schedule_owners(kind, _schedule_owners(kind))
+
+
+def _dispatch_due_owners(kind: str) -> int:
+    _refresh_schedule_owners(kind)
+    batch_size, max_in_flight = _get_sync_dispatch_limits()
+    available = max_in_flight - in_flight_count(kind, window=_SYNC_IN_FLIGHT_WINDOW)
+    schedules = claim_due(
+        kind, limit=min(batch_size, available), lease=_sync_max_interval(kind)
     )
 
-    logger.info(
-        "Queued blueprint updates for %s users across a %s minute window",
-        queued,
-        window_minutes,
+    user_task = (
+        update_blueprints_for_user
+        if kind == MANUAL_REFRESH_KIND_BLUEPRINTS
+        else update_industry_jobs_for_user
     )
-    return {"users_queued": queued, "window_minutes": window_minutes}
+    characters_by_user: dict[int, list[int]] = {}
+    for schedule in schedules:
+        if schedule.owner_kind == Blueprint.OwnerKind.CORPORATION:
+            queue_corporation_sync(kind, schedule.owner_id, force=True)
+        elif schedule.user_id:
+            characters_by_user.setdefault(schedule.user_id, []).append(
+                schedule.owner_id
+            )
+    for user_id, character_ids in characters_by_user.items():
+        user_task.apply_async(
+            args=(user_id,),
+            kwargs={"scope": "character", "character_ids": character_ids},
+            priority=7,
+        )
+    return len(schedules)
 
 
 @shared_task
-def update_all_industry_jobs():
+def dispatch_due_syncs():
     """
-    Update industry jobs for all users - scheduled via Celery beat
+    Dispatch the blueprint and job syncs whose ESI cache has expired - scheduled
+    via Celery beat every minute
     """
-    logger.info("Starting bulk industry jobs update for all users")
+    wait, remaining = shared_client.governor.wait_seconds()
+    if wait > 0:
+        logger.info(
+            "ESI error budget spent (remaining=%s); no syncs dispatched for %.0fs",
+            remaining,
+            wait,
+        )
+        return {"deferred": round(wait)}
+    if not cache.add(_SYNC_DISPATCH_LOCK_KEY, True, 5 * 60):
+        logger.debug("Sync dispatch already running; skipping this tick")
+        return {"skipped": True}
+    try:
+        dispatched = {
+            kind: _dispatch_due_owners(kind)
+            for kind in (MANUAL_REFRESH_KIND_BLUEPRINTS, MANUAL_REFRESH_KIND_JOBS)
+        }
+    finally:
+        cache.delete(_SYNC_DISPATCH_LOCK_KEY)
+    if any(dispatched.values()):
+        logger.info(
+            "Dispatched due syncs: %s blueprint owners, %s job owners",
+            dispatched[MANUAL_REFRESH_KIND_BLUEPRINTS],
+            dispatched[MANUAL_REFRESH_KIND_JOBS],
+        )
+    return dispatched
 
-    user_ids = list(
-        User.objects.filter(token__isnull=False).distinct().values_list("id", flat=True)
-    )
-    random.shuffle(user_ids)
 
-    window_minutes = _get_bulk_window_minutes("industry_jobs")
-    queued = _queue_staggered_user_tasks(
-        update_industry_jobs_for_user,
-        user_ids,
-        window_minutes=window_minutes,
-        priority=7,
-    )
+def _mark_all_owners_due(kind: str) -> int:
+    _refresh_schedule_owners(kind, force=True)
+    return mark_all_due(kind)
 
-    logger.info(
-        "Queued industry job updates for %s users across a %s minute window",
-        queued,
-        window_minutes,
-    )
-    return {"users_queued": queued, "window_minutes": window_minutes}
+
+@shared_task
+def update_all_blueprints():
+    """
+    Make every blueprint owner due now; dispatch_due_syncs drains them within
+    its in-flight budget
+    """
+    owners = _mark_all_owners_due(MANUAL_REFRESH_KIND_BLUEPRINTS)
+    logger.info("Marked blueprint synchronization due for %s owners", owners)
+    return {"owners_due": owners}
+
+
+@shared_task
+def update_all_industry_jobs():
+    """
+    Make every industry job owner due now; dispatch_due_syncs drains them
+    within its in-flight budget
+    """
+    owners = _mark_all_owners_due(MANUAL_REFRESH_KIND_JOBS)
+    logger.info("Marked industry job synchronization due for %s owners", owners)
+    return {"owners_due": owners}
@@ -174,10 +174,22 @@ def cache_structure_name(
     if not name:
         name = f"{PLACEHOLDER_PREFIX}{structure_id}"
 
-    CachedStructureName.objects.update_or_create(
-        structure_id=structure_id,
-        defaults={"name": str(name), "last_resolved": now},
-    )
+    if str(name).startswith(PLACEHOLDER_PREFIX):
+        # Remember the failed lookup without replacing a name resolved earlier.
+        updated = CachedStructureName.objects.filter(
+            structure_id=structure_id,
+            confidence=CachedStructureName.Confidence.PLACEHOLDER,
+        ).update(name=str(name), last_resolved=now)
+        if not updated:
+            CachedStructureName.objects.get_or_create(
+                structure_id=structure_id,
+                defaults={"name": str(name), "last_resolved": now},
+            )
+    else:
+        CachedStructureName.objects.update_or_create(
+            structure_id=structure_id,
+            defaults={"name": str(name), "last_resolved": now},
+        )
 
     return {
         "structure_id": structure_id,
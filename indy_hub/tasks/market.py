@@ -0,0 +1,28 @@
+"""Celery tasks keeping the shared Jita price cache warm."""
+
+from __future__ import annotations
+
+# Standard Library
+import logging
+
+# Third Party
+from celery import shared_task
+
+# AA Example App
+from indy_hub.services.market_prices import fetch_jita_prices
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_kwargs={"max_retries": 2, "countdown": 30},
+    time_limit=120,
+    soft_time_limit=100,
+)
+def refresh_jita_prices(type_ids):
+    """Refresh cached Jita prices for ``type_ids`` from Fuzzwork."""
+
+    fetched = fetch_jita_prices(type_ids)
+    logger.debug("Refreshed Jita prices for %s types", len(fetched))
+    return len(fetched)
@@ -10,9 +10,11 @@ from decimal import Decimal
 from celery import shared_task
 
 # Django
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.db import transaction
+from django.db.models import BigIntegerField, Case, F, Sum, Value, When
 from django.utils import timezone
 
 # Alliance Auth
@@ -25,12 +27,14 @@ from indy_hub.models import (
     MaterialExchangeStock,
 )
 from indy_hub.services.asset_cache import (
-    asset_chain_has_context,
-    build_asset_index_by_item_id,
+    AssetTree,
+    apply_character_asset_diff,
     force_refresh_corp_assets,
     get_corp_assets_cached,
-    get_office_folder_item_id_from_assets,
-    resolve_asset_root_location_id,
+    index_corp_asset_hangars,
+    merge_diff_stats,
+    prune_character_assets,
+    record_character_asset_refresh,
     resolve_structure_names,
 )
 from indy_hub.services.esi_client import (
@@ -40,7 +44,12 @@ from indy_hub.services.esi_client import (
     ESITokenError,
     shared_client,
 )
-from indy_hub.utils.eve import get_type_name
+from indy_hub.services.market_prices import (
+    PRICE_FRESH_SECONDS,
+    PriceUnavailableError,
+    get_jita_prices,
+)
+from indy_hub.utils.eve import get_type_name, resolve_names_bulk
 
 logger = logging.getLogger(__name__)
 
@@ -276,7 +285,9 @@ def refresh_material_exchange_sell_user_assets(user_id: int) -> None:
 
     done = 0
     failed = 0
-    all_rows: list[CachedCharacterAsset] = []
+    # Rows-touched counters; each character is diffed into the cache as soon
+    # as it is fetched, so a failing token leaves that character's rows alone.
+    diff_stats: dict[str, int] = {}
     structure_ids_by_character: dict[int, set[int]] = {}
 
     for character_id in character_ids:
@@ -330,7 +341,7 @@ def refresh_material_exchange_sell_user_assets(user_id: int) -> None:
             )
             continue
 
-        index_by_item_id = build_asset_index_by_item_id(assets or [])
+        root_location_ids = AssetTree.from_assets(assets or []).root_location_ids()
 
         character_structure_ids = structure_ids_by_character.setdefault(
             int(character_id),
@@ -338,7 +349,7 @@ def refresh_material_exchange_sell_user_assets(user_id: int) -> None:
         )
 
         rows: list[CachedCharacterAsset] = []
-        for asset in assets or []:
+        for asset, resolved_location_id in zip(assets or [], root_location_ids):
             item_id = asset.get("item_id")
             try:
                 item_id_int = int(item_id) if item_id is not None else None
@@ -350,12 +361,6 @@ def refresh_material_exchange_sell_user_assets(user_id: int) -> None:
             except (TypeError, ValueError):
                 raw_location_id = None
 
-            resolved_location_id = resolve_asset_root_location_id(
-                asset, index_by_item_id
-            )
-            if resolved_location_id is None:
-                resolved_location_id = int(asset.get("location_id", 0) or 0)
-
             rows.append(
                 CachedCharacterAsset(
                     user=user,
@@ -382,8 +387,9 @@ def refresh_material_exchange_sell_user_assets(user_id: int) -> None:
                 if raw_location_id:
                     character_structure_ids.add(int(raw_location_id))
 
-        if rows:
-            all_rows.extend(rows)
+        merge_diff_stats(
+            diff_stats, apply_character_asset_diff(user, int(character_id), rows)
+        )
 
         done += 1
         cache.set(
@@ -412,10 +418,10 @@ def refresh_material_exchange_sell_user_assets(user_id: int) -> None:
         ttl_seconds,
     )
 
-    # Only replace cached rows if we managed to fetch at least some assets.
+    # When no character could be fetched, the previously cached rows are kept.
     # This prevents the sell page from losing previously cached data when ESI is down
     # or when all characters are missing the required scope.
-    if not all_rows:
+    if failed >= total:
         cache.set(
             progress_key,
             {
@@ -430,9 +436,12 @@ def refresh_material_exchange_sell_user_assets(user_id: int) -> None:
         )
         return
 
-    with transaction.atomic():
-        CachedCharacterAsset.objects.filter(user=user).delete()
-        CachedCharacterAsset.objects.bulk_create(all_rows, batch_size=1000)
+    # Characters no longer owned by the user are dropped from the cache.
+    diff_stats["deleted"] = diff_stats.get("deleted", 0) + prune_character_assets(
+        user, character_ids
+    )
+    diff_stats["failed_characters"] = failed
+    record_character_asset_refresh(int(user.id), diff_stats)
 
     # Warm structure/station names after updating the cache.
     # Do not fail the refresh if name resolution is forbidden or errors.
@@ -461,9 +470,10 @@ def refresh_material_exchange_sell_user_assets(user_id: int) -> None:
     )
 
     logger.info(
-        "Successfully refreshed %s character assets for user %s",
-        len(all_rows),
+        "Successfully refreshed character assets for user %s (%s/%s characters)",
         user.id,
+        total - failed,
+        total,
     )
 
 
@@ -495,7 +505,7 @@ def refresh_material_exchange_buy_stock(corporation_id: int) -> None:
 
         # Now sync the material exchange stock based on fresh corp assets
         logger.info("Syncing Material Exchange stock from refreshed corp assets")
-        _sync_stock_impl()
+        _sync_stock_impl(corporation_id=int(corporation_id))
 
         cache.set(
             progress_key,
@@ -535,25 +545,61 @@ def refresh_material_exchange_buy_stock(corporation_id: int) -> None:
     time_limit=300,
     soft_time_limit=280,
 )
-def sync_material_exchange_stock():
+def sync_material_exchange_stock(config_id: int | None = None):
     """
     Celery task to sync material stock from ESI corp assets.
     Delegates to the implementation function.
     """
-    _sync_stock_impl()
+    _sync_stock_impl(config_id)
 
 
-def _sync_stock_impl():
+def material_exchange_configs(
+    config_id: int | None = None, *, corporation_id: int | None = None
+):
+    """Return the configs a sync should process: one by id, or every active hub."""
+
+    if config_id is not None:
+        return MaterialExchangeConfig.objects.filter(pk=int(config_id))
+    configs = MaterialExchangeConfig.objects.filter(is_active=True)
+    if corporation_id is not None:
+        configs = configs.filter(corporation_id=int(corporation_id))
+    return configs.order_by("pk")
+
+
+def _sync_stock_impl(
+    config_id: int | None = None,
+    *,
+    corporation_id: int | None = None,
+    sync_prices: bool = True,
+):
     """
     Implementation of material stock synchronization.
     Can be called from Celery tasks or directly from other async tasks.
+
+    Syncs one config, or every active hub (optionally of one corporation).
+    Hubs of the same corporation read the same cached corp assets, which are
+    refreshed at most once per run.
     """
-    try:
-        config = MaterialExchangeConfig.objects.first()
-        if not config:
-            logger.warning("Material Exchange not configured - skipping stock sync")
-            return
+    configs = list(material_exchange_configs(config_id, corporation_id=corporation_id))
+    if not configs:
+        logger.warning("Material Exchange not configured - skipping stock sync")
+        return
+
+    for config in configs:
+        _sync_stock_for_config(config)
+
+    if sync_prices:
+        # Auto-sync prices after stock updates so buy page has prices
+        for config in configs:
+            try:
+                sync_material_exchange_prices(config_id=config.pk)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Auto price sync failed after stock sync: %s", exc)
+
 
+def _sync_stock_for_config(config: MaterialExchangeConfig) -> None:
+    """Sync MaterialExchangeStock for one hub from the cached corp assets."""
+    try:
         # Filter assets for specific structure and hangar division
         # hangar_division maps to flag: CorpSAG1 = division 1, etc.
         hangar_flag_map = {
@@ -576,51 +622,40 @@ def _sync_stock_impl():
 
         stock_updates: dict[int, int] = {}
 
-        corp_assets, assets_scope_missing = get_corp_assets_cached(
-            int(config.corporation_id)
+        corp_assets_qs, assets_scope_missing = get_corp_assets_cached(
+            int(config.corporation_id), as_queryset=True
         )
         if assets_scope_missing:
             logger.warning("Missing corp assets scope for %s", config.corporation_id)
-
-        # Upwell structures store corp hangar contents under the OfficeFolder item_id.
-        # Stations (and some locations) use the structure/station id directly.
-        office_folder_item_id = get_office_folder_item_id_from_assets(
-            corp_assets, structure_id=int(config.structure_id)
-        )
-        effective_location_id = (
-            int(office_folder_item_id)
-            if office_folder_item_id is not None
-            else int(config.structure_id)
+        if corp_assets_qs.filter(root_location_id__isnull=True).exists():
+            # Rows cached before placement was tracked, or a refresh that
+            # stopped between writing and indexing.
+            index_corp_asset_hangars(int(config.corporation_id))
+
+        # Assets inside containers (cans/boxes) carry the root structure and the
+        # hangar flag of their outermost container, resolved at refresh time,
+        # so office folders and nesting are already accounted for here.
+        stock_rows = (
+            corp_assets_qs.filter(
+                root_location_id=int(config.structure_id),
+                hangar_flag=str(target_flag),
+                type_id__gt=0,
+            )
+            .values("type_id")
+            .annotate(
+                total=Sum(
+                    Case(
+                        When(quantity__gt=0, then=F("quantity")),
+                        When(is_singleton=True, then=Value(1)),
+                        default=Value(0),
+                        output_field=BigIntegerField(),
+                    )
+                )
+            )
+            .order_by()
         )
-
-        index_by_item_id = build_asset_index_by_item_id(corp_assets or [])
-
-        for asset in corp_assets:
-            # Assets can be inside containers (cans/boxes) which have their own item_id.
-            # In those cases the child asset location_id points to the container item_id,
-            # and the container carries the actual hangar context.
-            if not asset_chain_has_context(
-                asset,
-                index_by_item_id,
-                location_id=int(effective_location_id),
-                location_flag=str(target_flag),
-            ):
-                continue
-
-            try:
-                type_id = int(asset.get("type_id"))
-            except (TypeError, ValueError):
-                continue
-
-            qty_raw = asset.get("quantity", 1)
-            try:
-                quantity = int(qty_raw or 0)
-            except (TypeError, ValueError):
-                quantity = 1
-            if quantity <= 0:
-                quantity = 1 if asset.get("is_singleton") else 0
-
-            stock_updates[type_id] = stock_updates.get(type_id, 0) + quantity
+        for row in stock_rows:
+            stock_updates[int(row["type_id"])] = int(row["total"] or 0)
 
         logger.info(
             "Loaded %d asset types from cache for structure %s, division %s",
@@ -676,11 +711,12 @@ def _sync_stock_impl():
 
             # Track which items had quantity changes
             items_with_qty_change = set()
+            type_names = resolve_names_bulk(type_ids=stock_updates.keys())["types"]
 
             for type_id, quantity in stock_updates.items():
                 type_id = int(type_id)
                 quantity = int(quantity or 0)
-                type_name = get_type_name(type_id)
+                type_name = type_names.get(type_id) or get_type_name(type_id)
 
                 if type_id not in current_ids:
                     # New item
@@ -745,7 +781,8 @@ def _sync_stock_impl():
             config.save(update_fields=["last_stock_sync"])
 
         logger.info(
-            "Material Exchange stock sync completed: %s types updated",
+            "Material Exchange stock sync completed for config %s: %s types updated",
+            config.pk,
             len(stock_updates),
         )
 
@@ -755,14 +792,41 @@ def _sync_stock_impl():
             _ME_CACHE_VERSION_TTL_SECONDS,
         )
 
-        # Auto-sync prices after stock updates so buy page has prices
-        try:
-            sync_material_exchange_prices()
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("Auto price sync failed after stock sync: %s", exc)
-
     except Exception as e:
-        logger.exception(f"Error syncing material exchange stock: {e}")
+        logger.exception(
+            f"Error syncing material exchange stock for config {config.pk}: {e}"
+        )
+
+
+_PRICE_SYNC_CHUNK_SIZE = 1000
+_PRICE_SYNC_BATCH_SIZE = 500
+
+
+def _chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _price_moved(stock_item, jita_buy, jita_sell, threshold: Decimal) -> bool:
+    """Return True when either Jita price moved by more than ``threshold``."""
+
+    for old, new in (
+        (stock_item.jita_buy_price or Decimal(0), jita_buy),
+        (stock_item.jita_sell_price or Decimal(0), jita_sell),
+    ):
+        if old == new:
+            continue
+        if not threshold or not old:
+            return True
+        if abs(new - old) / abs(old) > threshold:
+            return True
+    return False
 
 
 @shared_task(
@@ -772,67 +836,84 @@ def _sync_stock_impl():
     time_limit=60,
     soft_time_limit=50,
 )
-def sync_material_exchange_prices():
+def sync_material_exchange_prices(min_change_percent=None, config_id=None):
     """
-    Sync Jita buy/sell prices from Fuzzwork API for all stock items.
+    Sync Jita buy/sell prices from the shared Fuzzwork price cache for all stock items.
     Updates MaterialExchangeStock jita_buy_price and jita_sell_price.
-    """
-    try:
-        # Third Party
-        import requests
-
-        stock_items = MaterialExchangeStock.objects.filter(quantity__gt=0)
-        if not stock_items.exists():
-            logger.info("No stock items to sync prices for")
-            return
 
-        # Collect all type_ids
-        type_ids = list(stock_items.values_list("type_id", flat=True))
+    ``config_id`` limits the sync to one hub's stock; by default every hub's
+    stock is synced.
 
-        # Fuzzwork API supports batch requests
-        # https://market.fuzzwork.co.uk/aggregates/?station=60003760&types=34,35,36
-        # Jita 4-4 = station_id 60003760
-        jita_station_id = 60003760
-        type_ids_str = ",".join(map(str, type_ids))
+    Stock rows are processed in chunks and only rows whose price changed are
+    written, with ``bulk_update``. ``min_change_percent`` (default
+    ``INDY_HUB_PRICE_SYNC_MIN_CHANGE_PERCENT``) skips rows whose buy and sell
+    prices both moved less than that percentage.
+    """
+    if min_change_percent is None:
+        min_change_percent = getattr(
+            settings, "INDY_HUB_PRICE_SYNC_MIN_CHANGE_PERCENT", 0
+        )
+    threshold = Decimal(str(min_change_percent or 0)) / Decimal(100)
 
-        url = f"https://market.fuzzwork.co.uk/aggregates/?station={jita_station_id}&types={type_ids_str}"
+    try:
+        stock_items = MaterialExchangeStock.objects.filter(quantity__gt=0)
+        if config_id is not None:
+            stock_items = stock_items.filter(config_id=int(config_id))
+        stock_items = stock_items.only(
+            "id", "type_id", "jita_buy_price", "jita_sell_price"
+        ).order_by("id")
+
+        now = timezone.now()
+        seen = updated = 0
+        for chunk in _chunked(
+            stock_items.iterator(chunk_size=_PRICE_SYNC_CHUNK_SIZE),
+            _PRICE_SYNC_CHUNK_SIZE,
+        ):
+            seen += len(chunk)
+            # Background job: refresh anything past the freshness window inline
+            # instead of serving stale prices.
+            try:
+                prices = get_jita_prices(
+                    {stock_item.type_id for stock_item in chunk},
+                    max_age=PRICE_FRESH_SECONDS,
+                    refresh_stale=False,
+                    raise_errors=True,
+                )
+            except PriceUnavailableError as e:
+                logger.error(f"Failed to fetch prices from Fuzzwork: {e}")
+                return
+
+            changed = []
+            for stock_item in chunk:
+                price = prices.get(int(stock_item.type_id))
+                if price is None or not _price_moved(
+                    stock_item, price.buy, price.sell, threshold
+                ):
+                    continue
+                stock_item.jita_buy_price = price.buy
+                stock_item.jita_sell_price = price.sell
+                stock_item.last_price_update = now
+                changed.append(stock_item)
+
+            if changed:
+                MaterialExchangeStock.objects.bulk_update(
+                    changed,
+                    ["jita_buy_price", "jita_sell_price", "last_price_update"],
+                    batch_size=_PRICE_SYNC_BATCH_SIZE,
+                )
+                updated += len(changed)
 
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            prices_data = response.json()
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch prices from Fuzzwork: {e}")
+        if not seen:
+            logger.info("No stock items to sync prices for")
             return
 
-        # Update stock prices
-        with transaction.atomic():
-            for stock_item in stock_items:
-                type_id_str = str(stock_item.type_id)
-                if type_id_str in prices_data:
-                    price_info = prices_data[type_id_str]
-
-                    # Fuzzwork returns buy/sell prices
-                    jita_buy = Decimal(str(price_info.get("buy", {}).get("max", 0)))
-                    jita_sell = Decimal(str(price_info.get("sell", {}).get("min", 0)))
-
-                    stock_item.jita_buy_price = jita_buy
-                    stock_item.jita_sell_price = jita_sell
-                    stock_item.save(update_fields=["jita_buy_price", "jita_sell_price"])
-
-                    logger.debug(
-                        f"Price sync: {get_type_name(stock_item.type_id)} "
-                        f"buy={jita_buy:,.2f} sell={jita_sell:,.2f}"
-                    )
-
-            # Update config timestamp
-            config = MaterialExchangeConfig.objects.first()
-            if config:
-                config.last_price_sync = timezone.now()
-                config.save(update_fields=["last_price_sync"])
+        # Update config timestamp
+        material_exchange_configs(config_id).update(last_price_sync=now)
 
         logger.info(
-            f"Material Exchange prices sync completed: {len(type_ids)} types updated"
+            "Material Exchange prices sync completed: %s/%s stock rows updated",
+            updated,
+            seen,
         )
 
     except Exception as e:
@@ -6,6 +6,7 @@ Handles ESI contract checking, validation, and PM notifications for sell/buy ord
 # Standard Library
 import logging
 import re
+from collections import Counter, defaultdict
 from decimal import Decimal, InvalidOperation
 
 # Third Party
@@ -40,9 +41,19 @@ from indy_hub.services.esi_client import (
     ESITokenError,
     shared_client,
 )
+from indy_hub.tasks.material_exchange import (
+    _sync_stock_impl,
+    material_exchange_configs,
+)
 
 logger = logging.getLogger(__name__)
 
+MATERIAL_EXCHANGE_CYCLE_LOCK_TTL_SECONDS = 15 * 60
+
+# Order references as written in contract titles (INDY-<digits>).
+_ORDER_REFERENCE_PREFIX = "INDY-"
+_ORDER_REFERENCE_RE = re.compile(r"INDY-\d+")
+
 # Cache for structure names to avoid repeated ESI lookups
 _structure_name_cache: dict[int, str] = {}
 
@@ -182,6 +193,7 @@ def _get_structure_name(
                         structure_id=int(location_id),
                         defaults={
                             "name": str(structure_name),
+                            "source": CachedStructureName.Source.ESI,
                             "last_resolved": timezone.now(),
                         },
                     )
@@ -217,15 +229,20 @@ def sync_esi_contracts():
 
     Should be run periodically (e.g., every 5-15 minutes).
     """
-    configs = MaterialExchangeConfig.objects.filter(is_active=True)
+    corporation_ids = (
+        material_exchange_configs()
+        .order_by()
+        .values_list("corporation_id", flat=True)
+        .distinct()
+    )
 
-    for config in configs:
+    for corporation_id in corporation_ids:
         try:
-            _sync_contracts_for_corporation(config.corporation_id)
+            _sync_contracts_for_corporation(corporation_id)
         except Exception as exc:
             logger.error(
                 "Failed to sync contracts for corporation %s: %s",
-                config.corporation_id,
+                corporation_id,
                 exc,
                 exc_info=True,
             )
@@ -243,18 +260,75 @@ def run_material_exchange_cycle():
     End-to-end cycle: sync contracts, validate pending sell orders,
     validate pending buy orders, then check completion of approved orders.
     Intended to be scheduled in Celery Beat to simplify orchestration.
+
+    Fans out one cycle task per corporation with an active hub, so hubs of
+    different corporations no longer queue behind each other.
     """
-    # Step 1: sync cached contracts
-    sync_esi_contracts()
+    corporation_ids = (
+        material_exchange_configs()
+        .order_by()
+        .values_list("corporation_id", flat=True)
+        .distinct()
+    )
+    for corporation_id in corporation_ids:
+        run_material_exchange_corporation_cycle.delay(int(corporation_id))
+
+
+def _material_exchange_cycle_lock_key(corporation_id: int) -> str:
+    return f"indy_hub:material_exchange:cycle:{int(corporation_id)}"
+
+
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_kwargs={"max_retries": 2, "countdown": 5},
+    rate_limit="300/m",
+    time_limit=900,
+    soft_time_limit=880,
+)
+def run_material_exchange_corporation_cycle(corporation_id: int):
+    """
+    Material Exchange cycle for every active hub of one corporation.
+
+    Contracts and corp assets are shared by the corporation's hubs, so they
+    are synced once and each hub then updates its stock and prices and
+    validates its orders. A per-corporation lock skips a cycle while the
+    previous one for that corporation is still running.
+    """
+    corporation_id = int(corporation_id)
+    lock_key = _material_exchange_cycle_lock_key(corporation_id)
+    if not cache.add(lock_key, True, MATERIAL_EXCHANGE_CYCLE_LOCK_TTL_SECONDS):
+        logger.info(
+            "Material Exchange cycle for corporation %s already running, skipping",
+            corporation_id,
+        )
+        return
+
+    try:
+        # Step 1: sync cached contracts
+        try:
+            _sync_contracts_for_corporation(corporation_id)
+        except Exception as exc:
+            logger.error(
+                "Failed to sync contracts for corporation %s: %s",
+                corporation_id,
+                exc,
+                exc_info=True,
+            )
+
+        # Step 2: stock and prices from the (shared) cached corp assets
+        _sync_stock_impl(corporation_id=corporation_id)
 
-    # Step 2: validate pending sell orders using cached contracts
-    validate_material_exchange_sell_orders()
+        for config in material_exchange_configs(corporation_id=corporation_id):
+            # Step 3: validate pending sell orders using cached contracts
+            validate_material_exchange_sell_orders(config.pk)
 
-    # Step 3: validate pending buy orders using cached contracts
-    validate_material_exchange_buy_orders()
+            # Step 4: validate pending buy orders using cached contracts
+            validate_material_exchange_buy_orders(config.pk)
 
-    # Step 4: check completion/payment for approved orders
-    check_completed_material_exchange_contracts()
+            # Step 5: check completion/payment for approved orders
+            check_completed_material_exchange_contracts(config.pk)
+    finally:
+        cache.delete(lock_key)
 
 
 def _sync_contracts_for_corporation(corporation_id: int):
@@ -296,123 +370,137 @@ def _sync_contracts_for_corporation(corporation_id: int):
         )
         return
 
+    if getattr(contracts, "not_modified", False):
+        logger.info(
+            "Contracts unchanged for corporation %s (ESI 304); skipping sync",
+            corporation_id,
+        )
+        return
+
     # Track synced contract IDs
     synced_contract_ids = []
     indy_contracts_count = 0
 
-    with transaction.atomic():
-        for contract_data in contracts:
-            contract_id = contract_data.get("contract_id")
-            if not contract_id:
-                continue
-
-            # Filter: only process contracts with "INDY" in title
-            contract_title = contract_data.get("title", "")
-            if "INDY" not in contract_title.upper():
-                continue
-
-            indy_contracts_count += 1
-            synced_contract_ids.append(contract_id)
-
-            # Create or update contract
-            contract, created = ESIContract.objects.update_or_create(
-                contract_id=contract_id,
-                defaults={
-                    "issuer_id": contract_data.get("issuer_id", 0),
-                    "issuer_corporation_id": contract_data.get(
-                        "issuer_corporation_id", 0
-                    ),
-                    "assignee_id": contract_data.get("assignee_id", 0),
-                    "acceptor_id": contract_data.get("acceptor_id", 0),
-                    "contract_type": contract_data.get("type", "unknown"),
-                    "status": contract_data.get("status", "unknown"),
-                    "title": contract_data.get("title", ""),
-                    "start_location_id": contract_data.get("start_location_id"),
-                    "end_location_id": contract_data.get("end_location_id"),
-                    "price": Decimal(str(contract_data.get("price") or 0)),
-                    "reward": Decimal(str(contract_data.get("reward") or 0)),
-                    "collateral": Decimal(str(contract_data.get("collateral") or 0)),
-                    "date_issued": contract_data.get("date_issued"),
-                    "date_expired": contract_data.get("date_expired"),
-                    "date_accepted": contract_data.get("date_accepted"),
-                    "date_completed": contract_data.get("date_completed"),
-                    "corporation_id": corporation_id,
-                },
-            )
-
-            # Fetch and store contract items for item_exchange contracts
-            # Only fetch items for contracts where items are accessible (outstanding/in_progress)
-            # Completed/expired contracts return 404 for items endpoint
-            contract_status = contract_data.get("status", "")
-            if contract_data.get("type") == "item_exchange" and contract_status in [
-                "outstanding",
-                "in_progress",
-            ]:
-                try:
-                    contract_items = shared_client.fetch_corporation_contract_items(
-                        corporation_id=corporation_id,
-                        contract_id=contract_id,
-                        character_id=character_id,
-                    )
-
-                    # Clear existing items and create new ones
-                    ESIContractItem.objects.filter(contract=contract).delete()
-
-                    for item_data in contract_items:
-                        ESIContractItem.objects.create(
-                            contract=contract,
-                            record_id=item_data.get("record_id", 0),
-                            type_id=item_data.get("type_id", 0),
-                            quantity=item_data.get("quantity", 0),
-                            is_included=item_data.get("is_included", False),
-                            is_singleton=item_data.get("is_singleton", False),
+    try:
+        with transaction.atomic():
+            for contract_data in contracts:
+                contract_id = contract_data.get("contract_id")
+                if not contract_id:
+                    continue
+
+                # Filter: only process contracts with "INDY" in title
+                contract_title = contract_data.get("title", "")
+                if "INDY" not in contract_title.upper():
+                    continue
+
+                indy_contracts_count += 1
+                synced_contract_ids.append(contract_id)
+
+                # Create or update contract
+                contract, created = ESIContract.objects.update_or_create(
+                    contract_id=contract_id,
+                    defaults={
+                        "issuer_id": contract_data.get("issuer_id", 0),
+                        "issuer_corporation_id": contract_data.get(
+                            "issuer_corporation_id", 0
+                        ),
+                        "assignee_id": contract_data.get("assignee_id", 0),
+                        "acceptor_id": contract_data.get("acceptor_id", 0),
+                        "contract_type": contract_data.get("type", "unknown"),
+                        "status": contract_data.get("status", "unknown"),
+                        "title": contract_data.get("title", ""),
+                        "start_location_id": contract_data.get("start_location_id"),
+                        "end_location_id": contract_data.get("end_location_id"),
+                        "price": Decimal(str(contract_data.get("price") or 0)),
+                        "reward": Decimal(str(contract_data.get("reward") or 0)),
+                        "collateral": Decimal(
+                            str(contract_data.get("collateral") or 0)
+                        ),
+                        "date_issued": contract_data.get("date_issued"),
+                        "date_expired": contract_data.get("date_expired"),
+                        "date_accepted": contract_data.get("date_accepted"),
+                        "date_completed": contract_data.get("date_completed"),
+                        "corporation_id": corporation_id,
+                    },
+                )
+
+                # Fetch and store contract items for item_exchange contracts
+                # Only fetch items for contracts where items are accessible (outstanding/in_progress)
+                # Completed/expired contracts return 404 for items endpoint
+                contract_status = contract_data.get("status", "")
+                if contract_data.get("type") == "item_exchange" and contract_status in [
+                    "outstanding",
+                    "in_progress",
+                ]:
+                    try:
+                        contract_items = shared_client.fetch_corporation_contract_items(
+                            corporation_id=corporation_id,
+                            contract_id=contract_id,
+                            character_id=character_id,
                         )
 
-                    logger.info(
-                        "Contract %s: synced %s items",
-                        contract_id,
-                        len(contract_items),
-                    )
-
-                except ESIClientError as exc:
-                    # 404 is normal for contracts without items or expired contracts
-                    if "404" in str(exc):
-                        logger.debug(
-                            "Contract %s has no items (404) - skipping items sync",
+                        # Clear existing items and create new ones
+                        ESIContractItem.objects.filter(contract=contract).delete()
+
+                        for item_data in contract_items:
+                            ESIContractItem.objects.create(
+                                contract=contract,
+                                record_id=item_data.get("record_id", 0),
+                                type_id=item_data.get("type_id", 0),
+                                quantity=item_data.get("quantity", 0),
+                                is_included=item_data.get("is_included", False),
+                                is_singleton=item_data.get("is_singleton", False),
+                            )
+
+                        logger.info(
+                            "Contract %s: synced %s items",
                             contract_id,
+                            len(contract_items),
                         )
-                    else:
+
+                    except ESIClientError as exc:
+                        # 404 is normal for contracts without items or expired contracts
+                        if "404" in str(exc):
+                            logger.debug(
+                                "Contract %s has no items (404) - skipping items sync",
+                                contract_id,
+                            )
+                        else:
+                            logger.warning(
+                                "Failed to fetch items for contract %s: %s",
+                                contract_id,
+                                exc,
+                            )
+                    except Exception as exc:
                         logger.warning(
                             "Failed to fetch items for contract %s: %s",
                             contract_id,
                             exc,
                         )
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to fetch items for contract %s: %s",
-                        contract_id,
-                        exc,
-                    )
 
-        # Remove contracts that are no longer in ESI response
-        # Keep contracts from the last 30 days to maintain history
-        cutoff_date = timezone.now() - timezone.timedelta(days=30)
-        deleted_count, _ = (
-            ESIContract.objects.filter(
-                corporation_id=corporation_id,
-                last_synced__lt=timezone.now() - timezone.timedelta(minutes=20),
-                date_issued__gte=cutoff_date,
+            # Remove contracts that are no longer in ESI response
+            # Keep contracts from the last 30 days to maintain history
+            cutoff_date = timezone.now() - timezone.timedelta(days=30)
+            deleted_count, _ = (
+                ESIContract.objects.filter(
+                    corporation_id=corporation_id,
+                    last_synced__lt=timezone.now() - timezone.timedelta(minutes=20),
+                    date_issued__gte=cutoff_date,
+                )
+                .exclude(contract_id__in=synced_contract_ids)
+                .delete()
             )
-            .exclude(contract_id__in=synced_contract_ids)
-            .delete()
-        )
 
-        if deleted_count > 0:
-            logger.info(
-                "Removed %s stale contracts for corporation %s",
-                deleted_count,
-                corporation_id,
-            )
+            if deleted_count > 0:
+                logger.info(
+                    "Removed %s stale contracts for corporation %s",
+                    deleted_count,
+                    corporation_id,
+                )
+    except Exception:
+        # Make the next run re-download instead of trusting the ETag.
+        shared_client.discard_conditional_cache(contracts)
+        raise
 
     logger.info(
         "Successfully synced %s INDY contracts (filtered from %s total) for corporation %s",
@@ -429,7 +517,7 @@ def _sync_contracts_for_corporation(corporation_id: int):
     time_limit=600,
     soft_time_limit=580,
 )
-def validate_material_exchange_sell_orders():
+def validate_material_exchange_sell_orders(config_id=None):
     """
     Validate pending sell orders against cached ESI contracts in the database.
 
@@ -444,19 +532,27 @@ def validate_material_exchange_sell_orders():
     4. Update order status & notify users
 
     Note: Contracts are synced separately by sync_esi_contracts task.
+
+    ``config_id`` limits validation to one hub; by default every active hub
+    is validated.
     """
-    config = MaterialExchangeConfig.objects.filter(is_active=True).first()
-    if not config:
+    configs = list(material_exchange_configs(config_id).filter(is_active=True))
+    if not configs:
         logger.warning("No active Material Exchange config found")
         return
 
+    for config in configs:
+        _validate_sell_orders_for_config(config)
+
+
+def _validate_sell_orders_for_config(config: MaterialExchangeConfig) -> None:
     pending_orders = MaterialExchangeSellOrder.objects.filter(
         config=config,
         status__in=[
             MaterialExchangeSellOrder.Status.DRAFT,
             MaterialExchangeSellOrder.Status.AWAITING_VALIDATION,
         ],
-    )
+    ).prefetch_related("items")
 
     if not pending_orders.exists():
         logger.debug("No pending sell orders to validate")
@@ -467,7 +563,7 @@ def validate_material_exchange_sell_orders():
     contracts = ESIContract.objects.filter(
         corporation_id=config.corporation_id,
         contract_type="item_exchange",
-    ).prefetch_related("items")
+    )
 
     if not contracts.exists():
         logger.warning(
@@ -490,10 +586,12 @@ def validate_material_exchange_sell_orders():
         esi_client = None
         logger.warning("ESI client not available for structure name lookups")
 
+    contract_index = _ContractIndex(contracts)
+
     # Process each pending order
     for order in pending_orders:
         try:
-            _validate_sell_order_from_db(config, order, contracts, esi_client)
+            _validate_sell_order_from_db(config, order, contract_index, esi_client)
         except Exception as exc:
             logger.error(
                 "Error validating sell order %s: %s",
@@ -510,7 +608,7 @@ def validate_material_exchange_sell_orders():
     time_limit=600,
     soft_time_limit=580,
 )
-def validate_material_exchange_buy_orders():
+def validate_material_exchange_buy_orders(config_id=None):
     """
     Validate pending buy orders against cached ESI contracts in the database.
 
@@ -525,19 +623,27 @@ def validate_material_exchange_buy_orders():
     4. Update order status & notify users
 
     Note: Contracts are synced separately by sync_esi_contracts task.
+
+    ``config_id`` limits validation to one hub; by default every active hub
+    is validated.
     """
-    config = MaterialExchangeConfig.objects.filter(is_active=True).first()
-    if not config:
+    configs = list(material_exchange_configs(config_id).filter(is_active=True))
+    if not configs:
         logger.warning("No active Material Exchange config found")
         return
 
+    for config in configs:
+        _validate_buy_orders_for_config(config)
+
+
+def _validate_buy_orders_for_config(config: MaterialExchangeConfig) -> None:
     pending_orders = MaterialExchangeBuyOrder.objects.filter(
         config=config,
         status__in=[
             MaterialExchangeBuyOrder.Status.DRAFT,
             MaterialExchangeBuyOrder.Status.AWAITING_VALIDATION,
         ],
-    )
+    ).prefetch_related("items")
 
     if not pending_orders.exists():
         logger.debug("No pending buy orders to validate")
@@ -569,7 +675,7 @@ def validate_material_exchange_buy_orders():
     contracts = ESIContract.objects.filter(
         corporation_id=config.corporation_id,
         contract_type="item_exchange",
-    ).prefetch_related("items")
+    )
 
     if not contracts.exists():
         logger.warning(
@@ -591,9 +697,11 @@ def validate_material_exchange_buy_orders():
         esi_client = None
         logger.warning("ESI client not available for structure name lookups")
 
+    contract_index = _ContractIndex(contracts)
+
     for order in pending_orders:
         try:
-            _validate_buy_order_from_db(config, order, contracts, esi_client)
+            _validate_buy_order_from_db(config, order, contract_index, esi_client)
         except Exception as exc:
             logger.error(
                 "Error validating buy order %s: %s",
@@ -603,10 +711,13 @@ def validate_material_exchange_buy_orders():
             )
 
 
-def _validate_sell_order_from_db(config, order, contracts, esi_client=None):
+def _validate_sell_order_from_db(config, order, contract_index, esi_client=None):
     """
     Validate a single sell order against cached database contracts.
 
+    Only the contracts ``contract_index`` lists for the order reference are
+    checked; their items and location names come from the index.
+
     Contract matching criteria:
     - type = item_exchange
     - issuer_id = seller's main character
@@ -645,22 +756,20 @@ def _validate_sell_order_from_db(config, order, contracts, esi_client=None):
     contract_with_correct_ref_wrong_structure: dict | None = None
     contract_with_correct_ref_wrong_price: dict | None = None
 
-    for contract in contracts:
-        # Track contracts with correct order reference in title (for better diagnostics)
-        title = contract.title or ""
-        has_correct_ref = order_ref in title
-
-        # Require title reference before further checks
-        if not has_correct_ref:
-            continue
-
+    # Only contracts with the order reference in their title are candidates.
+    for contract in contract_index.for_reference(order_ref):
         # Basic criteria
         criteria_match = _matches_sell_order_criteria_db(
-            contract, order, config, seller_character_ids, esi_client
+            contract,
+            order,
+            config,
+            seller_character_ids,
+            esi_client,
+            location_names=contract_index.location_names,
         )
         if not criteria_match:
             # Store contract info if it has correct ref but wrong structure
-            if has_correct_ref and not contract_with_correct_ref_wrong_structure:
+            if not contract_with_correct_ref_wrong_structure:
                 contract_with_correct_ref_wrong_structure = {
                     "contract_id": contract.contract_id,
                     "issue": "structure location mismatch",
@@ -670,7 +779,9 @@ def _validate_sell_order_from_db(config, order, contracts, esi_client=None):
             continue
 
         # Items check
-        if not _contract_items_match_order_db(contract, order):
+        if not _contract_items_match_order_db(
+            contract, order, contract_items=contract_index.included_items(contract)
+        ):
             last_reason = "items mismatch"
             continue
 
@@ -679,7 +790,7 @@ def _validate_sell_order_from_db(config, order, contracts, esi_client=None):
         if not price_ok:
             last_price_issue = price_msg
             last_reason = price_msg
-            if has_correct_ref and not contract_with_correct_ref_wrong_price:
+            if not contract_with_correct_ref_wrong_price:
                 contract_with_correct_ref_wrong_price = {
                     "contract_id": contract.contract_id,
                     "price_msg": price_msg,
@@ -854,7 +965,7 @@ def _validate_sell_order_from_db(config, order, contracts, esi_client=None):
         logger.info("Sell order %s pending: no matching contract yet", order.id)
 
 
-def _validate_buy_order_from_db(config, order, contracts, esi_client=None):
+def _validate_buy_order_from_db(config, order, contract_index, esi_client=None):
     """Validate a single buy order against cached database contracts."""
 
     order_ref = order.order_reference or f"INDY-{order.id}"
@@ -882,21 +993,22 @@ def _validate_buy_order_from_db(config, order, contracts, esi_client=None):
     last_price_issue: str | None = None
     last_reason: str | None = None
 
-    for contract in contracts:
-        title = contract.title or ""
-        has_correct_ref = order_ref in title
-
-        # Require title reference before further checks.
-        if not has_correct_ref:
-            continue
-
+    # Only contracts with the order reference in their title are candidates.
+    for contract in contract_index.for_reference(order_ref):
         criteria_match = _matches_buy_order_criteria_db(
-            contract, order, config, buyer_character_ids, esi_client
+            contract,
+            order,
+            config,
+            buyer_character_ids,
+            esi_client,
+            location_names=contract_index.location_names,
         )
         if not criteria_match:
             continue
 
-        if not _contract_items_match_order_db(contract, order):
+        if not _contract_items_match_order_db(
+            contract, order, contract_items=contract_index.included_items(contract)
+        ):
             last_reason = "items mismatch"
             continue
 
@@ -983,16 +1095,55 @@ def _validate_buy_order_from_db(config, order, contracts, esi_client=None):
     logger.info("Buy order %s pending: no matching contract yet", order.id)
 
 
-def _matches_sell_order_criteria_db(
-    contract, order, config, seller_character_ids, esi_client=None
-):
+def _contract_at_config_location(
+    contract, config, esi_client=None, location_names=None
+) -> bool:
     """
-    Check if a database contract matches sell order basic criteria.
+    Check whether a contract starts or ends at the hub structure.
 
     Location matching:
-    - Prefer matching by structure name (handles signed/unsigned ID variants)
-    - Fall back to ID matching only if name lookup fails
+    - Match by ID first (no lookup needed)
+    - Then by structure name (handles signed/unsigned ID variants and
+      service-module IDs)
+
+    ``location_names`` memoises name lookups across calls.
     """
+    if config.structure_id in (contract.start_location_id, contract.end_location_id):
+        return True
+
+    config_location_name = config.structure_name
+    if not config_location_name:
+        return False
+
+    for location_id in (contract.start_location_id, contract.end_location_id):
+        if location_id is None:
+            continue
+        if location_names is not None and location_id in location_names:
+            name = location_names[location_id]
+        else:
+            name = _get_location_name(
+                location_id,
+                esi_client,
+                corporation_id=int(config.corporation_id),
+            )
+            if location_names is not None:
+                location_names[location_id] = name
+        if name and name == config_location_name:
+            return True
+
+    return False
+
+
+def _matches_sell_order_criteria_db(
+    contract,
+    order,
+    config,
+    seller_character_ids,
+    esi_client=None,
+    *,
+    location_names=None,
+):
+    """Check if a database contract matches sell order basic criteria."""
     # Issuer must be the seller
     if contract.issuer_id not in seller_character_ids:
         return False
@@ -1001,36 +1152,17 @@ def _matches_sell_order_criteria_db(
     if contract.assignee_id != config.corporation_id:
         return False
 
-    # Check location by name to handle signed/unsigned variants and service-module IDs
-    contract_start_name = _get_location_name(
-        contract.start_location_id,
-        esi_client,
-        corporation_id=int(config.corporation_id),
-    )
-    contract_end_name = _get_location_name(
-        contract.end_location_id,
-        esi_client,
-        corporation_id=int(config.corporation_id),
-    )
-    config_location_name = config.structure_name
-
-    # Try name matching first
-    if contract_start_name and contract_start_name == config_location_name:
-        return True
-    if contract_end_name and contract_end_name == config_location_name:
-        return True
-
-    # Fall back to ID matching if name lookup failed
-    if contract.start_location_id == config.structure_id:
-        return True
-    if contract.end_location_id == config.structure_id:
-        return True
-
-    return False
+    return _contract_at_config_location(contract, config, esi_client, location_names)
 
 
 def _matches_buy_order_criteria_db(
-    contract, order, config, buyer_character_ids, esi_client=None
+    contract,
+    order,
+    config,
+    buyer_character_ids,
+    esi_client=None,
+    *,
+    location_names=None,
 ):
     """Check if a database contract matches buy order basic criteria."""
 
@@ -1042,50 +1174,55 @@ def _matches_buy_order_criteria_db(
     if contract.assignee_id not in buyer_character_ids:
         return False
 
-    contract_start_name = _get_location_name(
-        contract.start_location_id,
-        esi_client,
-        corporation_id=int(config.corporation_id),
-    )
-    contract_end_name = _get_location_name(
-        contract.end_location_id,
-        esi_client,
-        corporation_id=int(config.corporation_id),
-    )
-    config_location_name = config.structure_name
+    return _contract_at_config_location(contract, config, esi_client, location_names)
 
-    if contract_start_name and contract_start_name == config_location_name:
-        return True
-    if contract_end_name and contract_end_name == config_location_name:
-        return True
 
-    if contract.start_location_id == config.structure_id:
-        return True
-    if contract.end_location_id == config.structure_id:
-        return True
+def _included_item_counts(contract) -> Counter:
+    """Return the (type_id, quantity) multiset of a contract's included items."""
+    # Only validate included items (not requested); uses prefetched items.
+    return Counter(
+        (int(item.type_id), int(item.quantity))
+        for item in contract.items.all()
+        if item.is_included
+    )
 
-    return False
 
+def _contract_items_match_order_db(contract, order, *, contract_items=None):
+    """Check if database contract items exactly match the order items."""
+    if contract_items is None:
+        contract_items = _included_item_counts(contract)
+    order_items = Counter(
+        (int(item.type_id), int(item.quantity)) for item in order.items.all()
+    )
+    return contract_items == order_items
 
-def _contract_items_match_order_db(contract, order):
-    """Check if database contract items exactly match the sell order items."""
-    # Only validate included items (not requested)
-    included_items = contract.items.filter(is_included=True)
 
-    order_items = list(order.items.all())
+class _ContractIndex:
+    """
+    In-memory lookups over one validation run's cached contracts.
 
-    if included_items.count() != len(order_items):
-        return False
+    Contracts are keyed by the order references in their titles, so each
+    order only looks at its own candidates. Included items are loaded once
+    for those candidates, and location names are memoised per location id.
+    """
 
-    # Check each order item has a matching contract item
-    for order_item in order_items:
-        found = included_items.filter(
-            type_id=order_item.type_id, quantity=order_item.quantity
-        ).exists()
-        if not found:
-            return False
+    def __init__(self, contracts):
+        self.by_reference: dict[str, list] = defaultdict(list)
+        candidates = contracts.filter(title__contains=_ORDER_REFERENCE_PREFIX)
+        for contract in candidates.prefetch_related("items"):
+            for reference in set(_ORDER_REFERENCE_RE.findall(contract.title or "")):
+                self.by_reference[reference].append(contract)
+        self.location_names: dict[int, str | None] = {}
+        self._included_items: dict[int, Counter] = {}
 
-    return True
+    def for_reference(self, order_ref: str) -> list:
+        return self.by_reference.get(order_ref, [])
+
+    def included_items(self, contract) -> Counter:
+        counts = self._included_items.get(contract.pk)
+        if counts is None:
+            counts = self._included_items[contract.pk] = _included_item_counts(contract)
+        return counts
 
 
 def _contract_price_matches_db(contract, order) -> tuple[bool, str]:
@@ -1167,15 +1304,19 @@ def handle_material_exchange_buy_order_created(order_id):
     time_limit=600,
     soft_time_limit=580,
 )
-def check_completed_material_exchange_contracts():
+def check_completed_material_exchange_contracts(config_id=None):
     """
     Check if corp contracts for approved sell orders have been completed.
     Update order status and notify users when payment is verified.
+
+    ``config_id`` limits the check to one hub; by default every active hub
+    is checked.
     """
-    config = MaterialExchangeConfig.objects.filter(is_active=True).first()
-    if not config:
-        return
+    for config in material_exchange_configs(config_id).filter(is_active=True):
+        _check_completed_contracts_for_config(config)
+
 
+def _check_completed_contracts_for_config(config: MaterialExchangeConfig) -> None:
     approved_orders = MaterialExchangeSellOrder.objects.filter(
         config=config,
         status=MaterialExchangeSellOrder.Status.VALIDATED,
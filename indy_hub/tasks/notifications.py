@@ -7,6 +7,7 @@ import logging
 from celery import shared_task
 
 # Django
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -18,7 +19,14 @@ from ..models import (
     IndustryJob,
     JobNotificationDigestEntry,
 )
-from ..notifications import build_site_url, notify_user
+from ..notifications import (
+    OUTBOX_KICK_CACHE_KEY,
+    build_site_url,
+    deliver_pending_notifications,
+    notify_user,
+    purge_notification_outbox,
+)
+from ..utils.discord_roles import refresh_guild_role_snapshot
 from ..utils.job_notifications import (
     build_digest_notification_body,
     compute_next_digest_at,
@@ -266,3 +274,27 @@ def notify_recently_completed_jobs(max_jobs: int = 500) -> dict[str, int]:
             skipped += 1
 
     return {"processed": processed, "skipped": skipped, "scanned": len(pending_jobs)}
+
+
+@shared_task
+def deliver_notification_outbox() -> dict[str, int]:
+    """Deliver queued outbox notifications, re-queueing while a backlog remains."""
+
+    # Clear the scheduling marker first so entries queued during this run
+    # schedule a follow-up instead of waiting for the periodic sweep.
+    cache.delete(OUTBOX_KICK_CACHE_KEY)
+    result = deliver_pending_notifications()
+    result["purged"] = purge_notification_outbox()
+    if result["remaining"] and result["sent"] + result["failed"]:
+        deliver_notification_outbox.delay()
+    return result
+
+
+@shared_task
+def refresh_discord_role_snapshot() -> dict[str, int]:
+    """Rebuild the cached guild role snapshot used by notification filtering."""
+
+    snapshot = refresh_guild_role_snapshot()
+    if snapshot is None:
+        return {"members": 0, "skipped": 1}
+    return {"members": len(snapshot), "skipped": 0}
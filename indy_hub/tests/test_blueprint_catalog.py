@@ -0,0 +1,126 @@
+"""Tests for the shared blueprint catalog."""
+
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+
+# Alliance Auth
+from allianceauth.authentication.models import CharacterOwnership
+from allianceauth.eveonline.models import EveCharacter
+
+# AA Example App
+from indy_hub.models import (
+    Blueprint,
+    CharacterSettings,
+    SharedBlueprintCatalogEntry,
+)
+from indy_hub.services.blueprint_catalog import (
+    refresh_blueprint_catalog,
+    viewer_scope_keys,
+)
+
+
+def _add_character(user: User, character_id: int, corp_id: int, alliance_id=None):
+    character = EveCharacter.objects.create(
+        character_id=character_id,
+        character_name=f"Pilot {character_id}",
+        corporation_id=corp_id,
+        corporation_name=f"Corp {corp_id}",
+        corporation_ticker="CORP",
+        alliance_id=alliance_id,
+        alliance_name="",
+        alliance_ticker="",
+    )
+    CharacterOwnership.objects.create(
+        user=user, character=character, owner_hash=f"hash-{character_id}"
+    )
+
+
+def _add_original(user: User, item_id: int, *, me: int = 10, te: int = 20):
+    Blueprint.objects.create(
+        owner_user=user,
+        character_id=item_id,
+        item_id=item_id,
+        type_id=691,
+        type_name="Rifter Blueprint",
+        location_id=60003760,
+        location_flag="Hangar",
+        quantity=-1,
+        material_efficiency=me,
+        time_efficiency=te,
+    )
+
+
+class SharedBlueprintCatalogTests(TestCase):
+    def setUp(self) -> None:
+        self.first = User.objects.create_user("catalog_one", password="secret123")
+        self.second = User.objects.create_user("catalog_two", password="secret123")
+        _add_character(self.first, 9101, corp_id=2001, alliance_id=3001)
+        _add_character(self.second, 9102, corp_id=2002, alliance_id=3001)
+        for user in (self.first, self.second):
+            CharacterSettings.objects.create(
+                user=user,
+                character_id=0,
+                allow_copy_requests=True,
+                copy_sharing_scope=CharacterSettings.SCOPE_ALLIANCE,
+            )
+        _add_original(self.first, 5001)
+        _add_original(self.second, 5002)
+        _add_original(self.second, 5003, me=8)
+
+    def test_rows_are_deduplicated_per_scope_with_provider_count(self) -> None:
+        refresh_blueprint_catalog()
+
+        alliance_rows = SharedBlueprintCatalogEntry.objects.filter(
+            scope_key="alliance:3001"
+        ).order_by("material_efficiency")
+        self.assertEqual(
+            [(row.material_efficiency, row.provider_count) for row in alliance_rows],
+            [(8, 1), (10, 2)],
+        )
+        self.assertEqual(
+            set(
+                SharedBlueprintCatalogEntry.objects.filter(
+                    scope_key="corp:2001"
+                ).values_list("material_efficiency", flat=True)
+            ),
+            {10},
+        )
+
+    def test_viewer_keys_match_affiliations(self) -> None:
+        viewer = User.objects.create_user("catalog_viewer", password="secret123")
+        _add_character(viewer, 9103, corp_id=2003, alliance_id=3001)
+
+        self.assertEqual(viewer_scope_keys(viewer), ["alliance:3001", "corp:2003"])
+
+    def test_disabling_sharing_removes_owner_rows(self) -> None:
+        settings = CharacterSettings.objects.get(user=self.second, character_id=0)
+        settings.set_copy_sharing_scope(CharacterSettings.SCOPE_NONE)
+        settings.save()
+
+        rows = SharedBlueprintCatalogEntry.objects.filter(type_id=691)
+        self.assertEqual(
+            set(rows.values_list("material_efficiency", "provider_count")),
+            {(10, 1)},
+        )
+
+    def test_refresh_on_backend_without_upsert_target(self) -> None:
+        # MySQL/MariaDB reject ``unique_fields`` on conflict updates.
+        with patch.object(
+            connection.features, "supports_update_conflicts_with_target", False
+        ):
+            refresh_blueprint_catalog()
+            written = refresh_blueprint_catalog([691])
+
+        self.assertEqual(
+            written, SharedBlueprintCatalogEntry.objects.filter(type_id=691).count()
+        )
+        self.assertTrue(
+            SharedBlueprintCatalogEntry.objects.filter(
+                scope_key="alliance:3001", material_efficiency=8
+            ).exists()
+        )
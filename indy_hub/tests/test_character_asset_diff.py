@@ -0,0 +1,188 @@
+"""Tests for the incremental character asset refresh."""
+
+# Standard Library
+from datetime import timedelta
+from unittest.mock import patch
+
+# Django
+from django.contrib.auth.models import Permission, User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+# Alliance Auth
+from allianceauth.authentication.models import UserProfile
+from allianceauth.eveonline.models import EveCharacter
+
+# AA Example App
+from indy_hub.models import CachedCharacterAsset, MaterialExchangeConfig
+from indy_hub.services import asset_cache
+from indy_hub.tasks.material_exchange import (
+    ME_USER_ASSETS_CACHE_VERSION,
+    me_user_assets_cache_version_key,
+)
+from indy_hub.views import material_exchange as material_exchange_views
+
+MAIN_ID = 9001
+ALT_ID = 9002
+STATION_ID = 60003760
+
+
+class _FakeToken:
+    def __init__(self, character_id: int):
+        self.character_id = character_id
+        self.character = type("Char", (), {"corporation_id": None})()
+
+
+class _FakeTokenQuerySet(list):
+    def require_scopes(self, scopes):
+        return self
+
+    def require_valid(self):
+        return self
+
+    def exists(self):
+        return True
+
+
+def _asset(item_id: int, quantity: int) -> dict:
+    return {
+        "item_id": item_id,
+        "location_id": STATION_ID,
+        "location_flag": "Cargo",
+        "type_id": 34,
+        "quantity": quantity,
+        "is_singleton": False,
+        "is_blueprint": False,
+    }
+
+
+class CharacterAssetDiffTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user("alts", password="secret123")
+        self.synced_at = timezone.now() - timedelta(hours=3)
+        for character_id, item_id in ((MAIN_ID, 1), (MAIN_ID, 2), (MAIN_ID, 3)):
+            self._cache_row(character_id, item_id, quantity=10)
+        self._cache_row(ALT_ID, 10, quantity=5)
+        self._cache_row(7777, 20, quantity=5)  # character without a token
+
+    def _cache_row(self, character_id: int, item_id: int, *, quantity: int) -> None:
+        CachedCharacterAsset.objects.create(
+            user=self.user,
+            character_id=character_id,
+            item_id=item_id,
+            raw_location_id=STATION_ID,
+            location_id=STATION_ID,
+            location_flag="Cargo",
+            type_id=34,
+            quantity=quantity,
+            synced_at=self.synced_at,
+        )
+
+    def _refresh(self):
+        def fetch(*, character_id):
+            if character_id == ALT_ID:
+                raise asset_cache.ESIClientError("token revoked")
+            return [_asset(1, 10), _asset(2, 25), _asset(4, 1)]
+
+        tokens = _FakeTokenQuerySet([_FakeToken(MAIN_ID), _FakeToken(ALT_ID)])
+        with (
+            patch.object(asset_cache.Token.objects, "filter", return_value=tokens),
+            patch.object(asset_cache.shared_client, "fetch_character_assets", fetch),
+            patch.object(asset_cache, "resolve_structure_names"),
+        ):
+            return asset_cache._refresh_character_assets(self.user)
+
+    def test_only_changed_rows_are_written(self) -> None:
+        unchanged_pk = CachedCharacterAsset.objects.get(item_id=1).pk
+
+        refreshed, scope_missing = self._refresh()
+
+        self.assertFalse(scope_missing)
+        self.assertEqual(len(refreshed), 3)
+        stats = asset_cache.get_character_asset_refresh_stats(self.user.id)
+        self.assertEqual(
+            {key: value for key, value in stats.items() if key != "refreshed_at"},
+            {
+                "inserted": 1,
+                "updated": 1,
+                "deleted": 2,
+                "unchanged": 1,
+                "failed_characters": 1,
+            },
+        )
+        unchanged = CachedCharacterAsset.objects.get(item_id=1)
+        self.assertEqual(unchanged.pk, unchanged_pk)
+        self.assertEqual(unchanged.synced_at, self.synced_at)
+        self.assertEqual(CachedCharacterAsset.objects.get(item_id=2).quantity, 25)
+
+    def test_failing_character_keeps_its_rows(self) -> None:
+        self._refresh()
+
+        self.assertEqual(
+            dict(
+                CachedCharacterAsset.objects.filter(user=self.user).values_list(
+                    "item_id", "character_id"
+                )
+            ),
+            {1: MAIN_ID, 2: MAIN_ID, 4: MAIN_ID, 10: ALT_ID},
+        )
+
+    def test_refresh_marker_keeps_unchanged_cache_fresh(self) -> None:
+        self._refresh()
+
+        with patch.object(asset_cache, "_refresh_character_assets") as refresh:
+            assets, _scope_missing = asset_cache.get_user_assets_cached(self.user)
+
+        refresh.assert_not_called()
+        self.assertEqual(len(assets), 4)
+
+    def test_unchanged_refresh_keeps_sell_page_fresh(self) -> None:
+        CachedCharacterAsset.objects.exclude(character_id=MAIN_ID).delete()
+        tokens = _FakeTokenQuerySet([_FakeToken(MAIN_ID)])
+        with (
+            patch.object(asset_cache.Token.objects, "filter", return_value=tokens),
+            patch.object(
+                asset_cache.shared_client,
+                "fetch_character_assets",
+                return_value=[_asset(1, 10), _asset(2, 10), _asset(3, 10)],
+            ),
+            patch.object(asset_cache, "resolve_structure_names"),
+        ):
+            asset_cache._refresh_character_assets(self.user)
+        MaterialExchangeConfig.objects.create(
+            corporation_id=123456,
+            structure_id=STATION_ID,
+            structure_name="Test Structure",
+            hangar_division=1,
+        )
+        profile, _ = UserProfile.objects.get_or_create(user=self.user)
+        profile.main_character = EveCharacter.objects.create(
+            character_id=MAIN_ID,
+            character_name="Main",
+            corporation_id=2000000,
+            corporation_name="Test Corp",
+            corporation_ticker="TEST",
+        )
+        profile.save(update_fields=["main_character"])
+        self.user.user_permissions.add(
+            Permission.objects.get(
+                content_type__app_label="indy_hub", codename="can_access_indy_hub"
+            )
+        )
+        cache.set(
+            me_user_assets_cache_version_key(self.user.id),
+            ME_USER_ASSETS_CACHE_VERSION,
+        )
+        self.client.force_login(self.user)
+
+        with patch.object(
+            material_exchange_views, "_ensure_sell_assets_refresh_started"
+        ) as start_refresh:
+            response = self.client.get(reverse("indy_hub:material_exchange_sell"))
+
+        self.assertEqual(response.status_code, 200)
+        start_refresh.assert_not_called()
+        self.assertGreater(response.context["sell_last_update"], self.synced_at)
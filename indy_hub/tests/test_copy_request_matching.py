@@ -0,0 +1,89 @@
+"""Tests for matching copy requests against fulfillable originals."""
+
+# Django
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+# AA Example App
+from indy_hub.models import Blueprint, BlueprintCopyRequest
+from indy_hub.views.industry import (
+    _copy_request_match,
+    _fulfillable_blueprints_queryset,
+)
+
+BLUEPRINT_COUNT = 5000
+ACCESSIBLE_COUNT = 4000
+BASE_TYPE_ID = 10000
+
+
+class CopyRequestMatchingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.provider = User.objects.create_user("provider", password="secret123")
+        requester = User.objects.create_user("requester", password="secret123")
+
+        blueprints = []
+        for index in range(BLUEPRINT_COUNT):
+            if index < 2500:
+                owner = {"owner_kind": Blueprint.OwnerKind.CHARACTER}
+            elif index < ACCESSIBLE_COUNT:
+                owner = {
+                    "owner_kind": Blueprint.OwnerKind.CORPORATION,
+                    "corporation_id": 3001,
+                }
+            else:
+                owner = {
+                    "owner_kind": Blueprint.OwnerKind.CORPORATION,
+                    "corporation_id": 3002,
+                }
+            blueprints.append(
+                Blueprint(
+                    owner_user=cls.provider,
+                    character_id=9001,
+                    item_id=1_000_000 + index,
+                    type_id=BASE_TYPE_ID + index,
+                    location_id=60003760,
+                    location_flag="Hangar",
+                    quantity=-1,
+                    material_efficiency=10,
+                    time_efficiency=20,
+                    **owner,
+                )
+            )
+        Blueprint.objects.bulk_create(blueprints, batch_size=1000)
+
+        def _request(index: int, me: int = 10) -> BlueprintCopyRequest:
+            return BlueprintCopyRequest(
+                type_id=BASE_TYPE_ID + index,
+                material_efficiency=me,
+                time_efficiency=20,
+                requested_by=requester,
+                runs_requested=1,
+                copies_requested=1,
+            )
+
+        requests = [_request(index) for index in range(0, ACCESSIBLE_COUNT, 4)]
+        requests += [_request(index, me=9) for index in range(0, ACCESSIBLE_COUNT, 8)]
+        requests += [_request(index) for index in range(ACCESSIBLE_COUNT, 4500)]
+        BlueprintCopyRequest.objects.bulk_create(requests, batch_size=1000)
+        cls.expected_matches = ACCESSIBLE_COUNT // 4
+
+    def test_open_requests_are_matched_in_one_query(self) -> None:
+        self.assertEqual(BlueprintCopyRequest.objects.count(), 2000)
+        blueprints = _fulfillable_blueprints_queryset(self.provider, [3001])
+
+        with self.assertNumQueries(1):
+            matched = BlueprintCopyRequest.objects.filter(
+                _copy_request_match(blueprints), fulfilled=False
+            ).count()
+
+        self.assertEqual(matched, self.expected_matches)
+
+    def test_corporate_originals_require_accessible_corporation(self) -> None:
+        blueprints = _fulfillable_blueprints_queryset(self.provider, [])
+
+        matched = BlueprintCopyRequest.objects.filter(
+            _copy_request_match(blueprints)
+        ).count()
+
+        self.assertEqual(matched, 2500 // 4)
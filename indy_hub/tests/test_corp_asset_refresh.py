@@ -0,0 +1,109 @@
+"""Tests for the streaming corporation asset refresh."""
+
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+
+# AA Example App
+from indy_hub.models import CachedCorporationAsset
+from indy_hub.services import asset_cache
+
+CORP_ID = 98000001
+
+
+def _asset(item_id: int, quantity: int = 1) -> dict:
+    return {
+        "item_id": item_id,
+        "location_id": 60003760,
+        "location_flag": "CorpSAG1",
+        "type_id": 34,
+        "quantity": quantity,
+        "is_singleton": False,
+    }
+
+
+@patch("indy_hub.services.asset_cache._cache_corp_structure_names")
+@patch("indy_hub.services.asset_cache._get_character_for_scope", return_value=9001)
+class StreamingCorpAssetRefreshTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        for item_id in (1, 2):
+            CachedCorporationAsset.objects.create(
+                corporation_id=CORP_ID,
+                item_id=item_id,
+                location_id=60003760,
+                location_flag="CorpSAG1",
+                type_id=34,
+                quantity=5,
+            )
+
+    def test_pages_are_upserted_and_stale_rows_removed(self, *_mocks) -> None:
+        seen_counts = []
+
+        def pages(corporation_id, *, character_id):
+            for page in ([_asset(2, 50), _asset(3)], [_asset(4)]):
+                yield page
+                seen_counts.append(
+                    CachedCorporationAsset.objects.filter(
+                        corporation_id=CORP_ID
+                    ).count()
+                )
+
+        with patch.object(
+            asset_cache.shared_client, "iter_corporation_asset_pages", pages
+        ):
+            written, scope_missing = asset_cache.force_refresh_corp_assets(CORP_ID)
+
+        self.assertEqual((written, scope_missing), (3, False))
+        # Readers never saw the corporation emptied mid-refresh.
+        self.assertEqual(seen_counts, [3, 4])
+        rows = CachedCorporationAsset.objects.filter(corporation_id=CORP_ID)
+        self.assertEqual(
+            dict(rows.values_list("item_id", "quantity")), {2: 50, 3: 1, 4: 1}
+        )
+
+    def test_refresh_on_backend_without_upsert_target(self, *_mocks) -> None:
+        # MySQL/MariaDB reject ``unique_fields`` on conflict updates.
+        other_corp = CORP_ID + 1
+
+        def pages(corporation_id, *, character_id):
+            yield [_asset(3), _asset(4)]
+
+        with (
+            patch.object(
+                asset_cache.shared_client, "iter_corporation_asset_pages", pages
+            ),
+            patch.object(
+                connection.features, "supports_update_conflicts_with_target", False
+            ),
+        ):
+            written, _scope_missing = asset_cache.force_refresh_corp_assets(other_corp)
+
+        self.assertEqual(written, 2)
+        self.assertEqual(
+            CachedCorporationAsset.objects.filter(corporation_id=other_corp).count(), 2
+        )
+
+    def test_failed_stream_keeps_previous_rows(self, *_mocks) -> None:
+        def pages(corporation_id, *, character_id):
+            yield [_asset(3)]
+            raise asset_cache.ESIClientError("page 2 failed")
+
+        with patch.object(
+            asset_cache.shared_client, "iter_corporation_asset_pages", pages
+        ):
+            written, _scope_missing = asset_cache.force_refresh_corp_assets(CORP_ID)
+
+        self.assertEqual(written, 0)
+        self.assertEqual(
+            set(
+                CachedCorporationAsset.objects.filter(
+                    corporation_id=CORP_ID
+                ).values_list("item_id", flat=True)
+            ),
+            {1, 2, 3},
+        )
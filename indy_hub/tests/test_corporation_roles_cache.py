@@ -0,0 +1,60 @@
+"""Tests for the shared corporation roles cache."""
+
+# Standard Library
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+# AA Example App
+from indy_hub import signals
+from indy_hub.tasks import industry
+
+DIRECTOR_ID = 9001
+
+
+@patch.object(
+    industry.shared_client,
+    "fetch_character_corporation_roles",
+    return_value={"roles": ["Director"], "roles_at_hq": ["Factory_Manager"]},
+)
+class CorporationRolesCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_roles_are_fetched_once_and_shared(self, fetch) -> None:
+        first = industry.get_character_corporation_roles(DIRECTOR_ID)
+        second = industry.get_character_corporation_roles(DIRECTOR_ID)
+
+        self.assertEqual(first, {"DIRECTOR", "FACTORY_MANAGER"})
+        self.assertEqual(second, first)
+        fetch.assert_called_once_with(DIRECTOR_ID)
+        self.assertEqual(
+            industry.prefetch_character_corporation_roles([DIRECTOR_ID, 9002]),
+            {DIRECTOR_ID: first},
+        )
+
+    def test_new_token_invalidates_cached_roles(self, fetch) -> None:
+        industry.get_character_corporation_roles(DIRECTOR_ID)
+        token = SimpleNamespace(character_id=DIRECTOR_ID)
+
+        signals.invalidate_corporation_roles_on_token_change(
+            sender=None, instance=token, created=False
+        )
+        industry.get_character_corporation_roles(DIRECTOR_ID)
+        self.assertEqual(fetch.call_count, 1)
+
+        signals.invalidate_corporation_roles_on_token_change(
+            sender=None, instance=token, created=True
+        )
+        industry.get_character_corporation_roles(DIRECTOR_ID)
+        self.assertEqual(fetch.call_count, 2)
+
+    @override_settings(INDY_HUB_CORPORATION_ROLES_CACHE_TTL=0)
+    def test_zero_ttl_disables_caching(self, fetch) -> None:
+        industry.get_character_corporation_roles(DIRECTOR_ID)
+        industry.get_character_corporation_roles(DIRECTOR_ID)
+
+        self.assertEqual(fetch.call_count, 2)
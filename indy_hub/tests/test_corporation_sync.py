@@ -0,0 +1,138 @@
+"""Tests for the corporation-keyed blueprint/job synchronization."""
+
+# Standard Library
+from unittest.mock import MagicMock, patch
+
+# Django
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+# Alliance Auth
+from allianceauth.authentication.models import CharacterOwnership
+from allianceauth.eveonline.models import EveCharacter
+from esi.models import Scope, Token
+
+# AA Example App
+from indy_hub.tasks import industry
+from indy_hub.tasks.industry import CORP_BLUEPRINT_SCOPE_SET
+
+CORP_ID = 98000001
+CONTEXT = {
+    "character_id": 9001,
+    "character_name": "Director",
+    "corporation_name": "Corp",
+    "user_id": 1,
+}
+
+
+class CorporationSyncWindowTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.sync = MagicMock(return_value={"blueprints_updated": 3})
+        patcher = patch.dict(
+            industry._CORPORATION_SYNCS,
+            {
+                industry.MANUAL_REFRESH_KIND_BLUEPRINTS: (
+                    CORP_BLUEPRINT_SCOPE_SET,
+                    self.sync,
+                )
+            },
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(industry, "_select_corporation_context", return_value=CONTEXT)
+    def test_corporation_is_synced_once_per_window(self, select) -> None:
+        first = industry.sync_corporation_blueprints(CORP_ID)
+        second = industry.sync_corporation_blueprints(CORP_ID)
+
+        self.assertTrue(first["success"])
+        self.assertEqual(second["skipped"], "recent")
+        self.sync.assert_called_once_with(CORP_ID, CONTEXT)
+        select.assert_called_once_with(CORP_ID, CORP_BLUEPRINT_SCOPE_SET)
+
+    @patch.object(industry, "_select_corporation_context", return_value=CONTEXT)
+    def test_forced_sync_skips_the_window_but_not_a_running_sync(self, _select) -> None:
+        industry.sync_corporation_blueprints(CORP_ID)
+        industry.sync_corporation_blueprints(CORP_ID, force=True)
+        self.assertEqual(self.sync.call_count, 2)
+
+        cache.add(
+            industry._corporation_sync_cache_key(
+                industry.MANUAL_REFRESH_KIND_BLUEPRINTS, CORP_ID, "running"
+            ),
+            True,
+            60,
+        )
+        result = industry.sync_corporation_blueprints(CORP_ID, force=True)
+
+        self.assertEqual(result["skipped"], "running")
+        self.assertEqual(self.sync.call_count, 2)
+
+    @patch.object(industry, "_select_corporation_context", return_value=CONTEXT)
+    def test_esi_failure_leaves_the_window_open(self, _select) -> None:
+        self.sync.side_effect = industry.ESIClientError("corp endpoint down")
+
+        failed = industry.sync_corporation_blueprints(CORP_ID)
+        self.sync.side_effect = None
+        retried = industry.sync_corporation_blueprints(CORP_ID)
+
+        self.assertFalse(failed["success"])
+        self.assertTrue(retried["success"])
+        self.assertEqual(self.sync.call_count, 2)
+
+
+class SelectCorporationContextTests(TestCase):
+    def _member(self, username: str, character_id: int, scopes=()) -> User:
+        user = User.objects.create_user(username, password="secret123")
+        character = EveCharacter.objects.create(
+            character_id=character_id,
+            character_name=username,
+            corporation_id=CORP_ID,
+            corporation_name="Corp",
+            corporation_ticker="CORP",
+        )
+        CharacterOwnership.objects.create(
+            user=user, character=character, owner_hash=f"hash-{character_id}"
+        )
+        if scopes:
+            token = Token.objects.create(
+                user=user,
+                character_id=character_id,
+                character_name=username,
+                access_token="access",
+                refresh_token="refresh",
+                token_type="character",
+                character_owner_hash=f"hash-{character_id}",
+            )
+            token.scopes.add(
+                *(Scope.objects.get_or_create(name=name)[0] for name in scopes)
+            )
+        return user
+
+    def test_permissions_are_checked_only_for_token_holders(self) -> None:
+        director = self._member("director", 9001, CORP_BLUEPRINT_SCOPE_SET)
+        self._member("member", 9002)
+        checked = []
+
+        def has_perm(user, perm, obj=None):
+            checked.append(user.pk)
+            return True
+
+        def character_context(user, char_id, *args, **kwargs):
+            return {"character_id": char_id}, True
+
+        with (
+            patch.object(User, "has_perm", has_perm),
+            patch.object(industry, "_corporation_character_context", character_context),
+            patch.object(
+                industry, "prefetch_character_corporation_roles", return_value={}
+            ),
+        ):
+            context = industry._select_corporation_context(
+                CORP_ID, CORP_BLUEPRINT_SCOPE_SET
+            )
+
+        self.assertEqual(context, {"character_id": 9001, "user_id": director.pk})
+        self.assertEqual(checked, [director.pk])
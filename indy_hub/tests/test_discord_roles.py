@@ -0,0 +1,106 @@
+"""Tests for the cached Discord guild role snapshot."""
+
+# Standard Library
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Django
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+# AA Example App
+from indy_hub.utils import discord_roles
+
+INDUSTRY_ROLE = "111"
+EXCHANGE_ROLE = "222"
+
+
+class _FakeBot:
+    """Offline stand-in exposing the discord.py ``get_guild`` surface."""
+
+    def __init__(self, members: dict[int, list[int]]) -> None:
+        self.guild = SimpleNamespace(
+            members=[
+                SimpleNamespace(
+                    id=uid, roles=[SimpleNamespace(id=role) for role in roles]
+                )
+                for uid, roles in members.items()
+            ]
+        )
+        self.calls = 0
+
+    def get_guild(self, guild_id: int):
+        self.calls += 1
+        return self.guild
+
+
+@override_settings(
+    DISCORD_GUILD_ID=999,
+    INDY_HUB_DISCORD_NOTIFICATION_ROLES={INDUSTRY_ROLE: {"name": "Industry"}},
+    INDY_HUB_MATERIAL_EXCHANGE_NOTIFICATION_ROLES={EXCHANGE_ROLE: {"name": "Exchange"}},
+)
+@patch("indy_hub.utils.discord_roles._discord_bot_installed", return_value=True)
+class GuildRoleSnapshotTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.users = [
+            User.objects.create_user(f"member{index}", password="secret123")
+            for index in range(4)
+        ]
+        # user 0: industry, user 1: exchange, user 2: no tracked role,
+        # user 3: no linked Discord account.
+        self.uids = {self.users[index].pk: str(5000 + index) for index in range(3)}
+        self.bot = _FakeBot(
+            {5000: [int(INDUSTRY_ROLE), 7], 5001: [int(EXCHANGE_ROLE)], 5002: [7]}
+        )
+        uid_patch = patch(
+            "indy_hub.utils.discord_roles._discord_uids",
+            side_effect=lambda user_ids: {
+                user_id: self.uids[user_id]
+                for user_id in user_ids
+                if user_id in self.uids
+            },
+        )
+        uid_patch.start()
+        self.addCleanup(uid_patch.stop)
+
+    def test_bulk_filter_uses_one_snapshot_build(self, _installed) -> None:
+        with patch(
+            "indy_hub.utils.discord_roles._get_discord_bot", return_value=self.bot
+        ):
+            industry = discord_roles.filter_users_by_notification_role(self.users)
+            exchange = discord_roles.filter_users_by_notification_role(
+                self.users, discord_roles.NOTIFICATION_TYPE_MATERIAL_EXCHANGE
+            )
+            self.assertTrue(discord_roles.user_has_notification_role(self.users[0]))
+
+        self.assertEqual(industry, [self.users[0]])
+        self.assertEqual(exchange, [self.users[1]])
+        self.assertEqual(self.bot.calls, 1)
+        self.assertEqual(
+            discord_roles.get_guild_role_snapshot(build=False),
+            {"5000": [INDUSTRY_ROLE], "5001": [EXCHANGE_ROLE]},
+        )
+
+    def test_invalidation_forces_rebuild(self, _installed) -> None:
+        discord_roles.refresh_guild_role_snapshot(bot=self.bot)
+        discord_roles.invalidate_guild_role_snapshot()
+
+        self.assertIsNone(discord_roles.get_guild_role_snapshot(build=False))
+
+    def test_missing_snapshot_fails_open(self, _installed) -> None:
+        with patch("indy_hub.utils.discord_roles._get_discord_bot", return_value=None):
+            allowed = discord_roles.filter_users_by_notification_role(self.users)
+
+        self.assertEqual(allowed, self.users)
+
+    def test_user_notifications_are_never_filtered(self, _installed) -> None:
+        discord_roles.refresh_guild_role_snapshot(bot=self.bot)
+
+        self.assertEqual(
+            discord_roles.filter_users_by_notification_role(
+                self.users, discord_roles.NOTIFICATION_TYPE_USER
+            ),
+            self.users,
+        )
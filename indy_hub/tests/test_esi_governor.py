@@ -0,0 +1,57 @@
+"""Tests for the cluster-wide ESI error-budget governor."""
+
+# Standard Library
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+# AA Example App
+from indy_hub.services.esi_client import ESIClient, ESIRateLimitError
+
+
+def _response(remain: int, reset: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        headers={
+            "X-Esi-Error-Limit-Remain": str(remain),
+            "X-Esi-Error-Limit-Reset": str(reset),
+        }
+    )
+
+
+class ErrorBudgetGovernorTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        # Two clients stand in for two worker processes sharing the cache.
+        self.worker_a = ESIClient(error_limit_threshold=10, max_inline_wait=5)
+        self.worker_b = ESIClient(error_limit_threshold=10, max_inline_wait=5)
+
+    def test_budget_spent_by_one_worker_defers_the_other(self) -> None:
+        self.worker_a._record_error_limit(_response(remain=4, reset=45))
+
+        with (
+            patch("indy_hub.services.esi_client.time.sleep") as sleep,
+            self.assertRaises(ESIRateLimitError) as raised,
+        ):
+            self.worker_b._wait_for_error_budget()
+
+        sleep.assert_not_called()
+        self.assertGreater(raised.exception.retry_after, 40)
+        self.assertEqual(raised.exception.remaining, 4)
+
+    def test_short_waits_are_slept_through(self) -> None:
+        self.worker_a.governor.pause(2)
+
+        with patch("indy_hub.services.esi_client.time.sleep") as sleep:
+            self.worker_b._wait_for_error_budget()
+
+        sleep.assert_called_once()
+        self.assertLessEqual(sleep.call_args.args[0], 2)
+
+    def test_healthy_budget_does_not_wait(self) -> None:
+        self.worker_a._record_error_limit(_response(remain=95, reset=45))
+
+        self.assertEqual(self.worker_b.governor.wait_seconds(), (0.0, 95))
+        self.assertFalse(self.worker_b._error_budget_low())
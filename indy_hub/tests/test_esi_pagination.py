@@ -0,0 +1,185 @@
+"""Tests for page fetching in ``ESIClient._fetch_paginated``."""
+
+from __future__ import annotations
+
+# Standard Library
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+# Django
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+# AA Example App
+from indy_hub.services.esi_client import ESIClient
+
+PAGE_DELAY_SECONDS = 0.2
+TOTAL_PAGES = 8
+
+
+class _FakeESIHandler(BaseHTTPRequestHandler):
+    """Serve ``TOTAL_PAGES`` pages of ``[{"page": n, "row": i}]`` slowly."""
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(PAGE_DELAY_SECONDS)
+            page = int(parse_qs(urlparse(self.path).query).get("page", ["1"])[0])
+            etag = f'"{server.version}-{page}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("X-Pages", str(TOTAL_PAGES))
+                self.end_headers()
+                return
+            body = json.dumps([{"page": page, "row": row} for row in range(3)])
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", etag)
+            self.send_header("X-Pages", str(TOTAL_PAGES))
+            self.send_header("X-Esi-Error-Limit-Remain", str(server.error_remain))
+            self.send_header("X-Esi-Error-Limit-Reset", server.error_reset)
+            self.end_headers()
+            self.wfile.write(body.encode())
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):  # noqa: A002 - keep test output quiet
+        return
+
+
+class FetchPaginatedTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeESIHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = 0
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.error_remain = 100
+        self.server.error_reset = "60"
+        self.server.version = 1
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        host, port = self.server.server_address
+        self.base_url = f"http://{host}:{port}"
+
+    def _fetch(
+        self,
+        page_concurrency: int,
+        client: ESIClient | None = None,
+        *,
+        conditional: bool = False,
+    ) -> tuple[list[dict], float]:
+        client = client or ESIClient(
+            base_url=self.base_url,
+            page_concurrency=page_concurrency,
+            conditional_cache_ttl=0,
+        )
+        token = SimpleNamespace(valid_access_token=lambda: "access-token")
+        started = time.monotonic()
+        with patch.object(client, "_get_token", return_value=token):
+            rows = client._fetch_paginated(
+                character_id=1,
+                scope="esi-assets.read_corporation_assets.v1",
+                endpoint="/corporations/2/assets/",
+                conditional=conditional,
+            )
+        return rows, time.monotonic() - started
+
+    def test_pages_are_fetched_concurrently_in_order(self) -> None:
+        sequential_rows, sequential_elapsed = self._fetch(page_concurrency=1)
+        self.assertEqual(self.server.max_in_flight, 1)
+
+        self.server.max_in_flight = 0
+        concurrent_rows, concurrent_elapsed = self._fetch(page_concurrency=4)
+
+        self.assertEqual(concurrent_rows, sequential_rows)
+        self.assertEqual(
+            [row["page"] for row in concurrent_rows[::3]],
+            list(range(1, TOTAL_PAGES + 1)),
+        )
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(self.server.max_in_flight, 4)
+        self.assertLess(concurrent_elapsed, sequential_elapsed / 2)
+
+    def test_low_error_budget_falls_back_to_sequential(self) -> None:
+        self.server.error_remain = 5
+        self.server.error_reset = "0.1"
+
+        rows, _elapsed = self._fetch(page_concurrency=4)
+
+        self.assertEqual(len(rows), TOTAL_PAGES * 3)
+        self.assertEqual(self.server.max_in_flight, 1)
+
+    def test_unchanged_pages_are_served_from_etag_cache(self) -> None:
+        client = ESIClient(base_url=self.base_url, page_concurrency=4)
+
+        first, _elapsed = self._fetch(4, client, conditional=True)
+        second, _elapsed = self._fetch(4, client, conditional=True)
+
+        self.assertFalse(first.not_modified)
+        self.assertTrue(second.not_modified)
+        self.assertEqual(second, first)
+        self.assertEqual(
+            client.conditional_request_stats(),
+            {
+                "/corporations/{id}/assets/": {
+                    "not_modified": TOTAL_PAGES,
+                    "modified": TOTAL_PAGES,
+                }
+            },
+        )
+
+        self.server.version = 2
+        third, _elapsed = self._fetch(4, client, conditional=True)
+        self.assertFalse(third.not_modified)
+
+    def test_pages_are_not_cached_unless_requested(self) -> None:
+        client = ESIClient(base_url=self.base_url, page_concurrency=4)
+        token = SimpleNamespace(valid_access_token=lambda: "access-token")
+
+        rows, _elapsed = self._fetch(4, client)
+        with patch.object(client, "_get_token", return_value=token):
+            streamed = list(client.iter_corporation_asset_pages(2, character_id=1))
+
+        self.assertEqual(len(rows), TOTAL_PAGES * 3)
+        self.assertEqual(len(streamed), TOTAL_PAGES)
+        self.assertEqual(rows.cache_keys, [])
+        self.assertEqual(client.conditional_request_stats(), {})
+        self.assertIsNone(
+            cache.get(client._conditional_cache_key("/corporations/2/assets/", 1, 1))
+        )
+
+    def test_streamed_pages_stay_within_the_concurrency_window(self) -> None:
+        client = ESIClient(
+            base_url=self.base_url, page_concurrency=2, conditional_cache_ttl=0
+        )
+        token = SimpleNamespace(valid_access_token=lambda: "access-token")
+
+        with patch.object(client, "_get_token", return_value=token):
+            pages = client.iter_corporation_asset_pages(2, character_id=1)
+            first = next(pages)
+            second = next(pages)
+            time.sleep(PAGE_DELAY_SECONDS * 2)
+            # Pages 1-2 consumed, 3-4 in the window; nothing further requested.
+            self.assertEqual(self.server.requests, 4)
+            rest = list(pages)
+
+        self.assertEqual([first[0]["page"], second[0]["page"]], [1, 2])
+        self.assertEqual(
+            [rows[0]["page"] for rows in rest], list(range(3, TOTAL_PAGES + 1))
+        )
@@ -0,0 +1,105 @@
+"""Tests for the in-memory SDE industry graph."""
+
+from __future__ import annotations
+
+# Django
+from django.test import SimpleTestCase
+
+# AA Example App
+from indy_hub.services.industry_graph import IndustryGraph
+from indy_hub.views.api import MAX_BATCH_RUNS, _parse_config_sets, _parse_runs_list
+
+SHIP_BP = 100
+COMPONENT_BP = 200
+SHIP = 101
+COMPONENT = 201
+MINERAL = 34
+MOON_GOO = 16633
+
+
+def _graph() -> IndustryGraph:
+    return IndustryGraph.from_rows(
+        product_rows=[
+            (SHIP_BP, SHIP, 1),
+            (COMPONENT_BP, COMPONENT, 10),
+        ],
+        material_rows=[
+            (SHIP_BP, COMPONENT, 25),
+            (SHIP_BP, MINERAL, 1000),
+            (COMPONENT_BP, MINERAL, 3),
+            (COMPONENT_BP, MOON_GOO, 1),
+        ],
+        type_names={COMPONENT: "Component", MINERAL: "Tritanium"},
+    )
+
+
+class IndustryGraphTests(SimpleTestCase):
+    def test_tree_applies_per_run_me_and_cycles(self) -> None:
+        recipe_map: dict = {}
+        tree = _graph().build_materials_tree(
+            SHIP_BP,
+            2,
+            10,
+            me_te_map={COMPONENT_BP: {"me": 10}},
+            recipe_map=recipe_map,
+        )
+
+        component, mineral = tree
+        self.assertEqual(component["quantity"], 46)  # ceil(25 * 0.9) * 2
+        self.assertEqual(component["cycles"], 5)
+        self.assertEqual(component["surplus"], 4)
+        self.assertEqual(mineral["quantity"], 1800)
+        self.assertEqual(mineral["sub_materials"], [])
+        self.assertEqual([m["quantity"] for m in component["sub_materials"]], [15, 5])
+        self.assertEqual(component["sub_materials"][1]["type_name"], str(MOON_GOO))
+        self.assertEqual(
+            recipe_map[COMPONENT]["inputs_per_cycle"],
+            [
+                {"type_id": MINERAL, "quantity": 3},
+                {"type_id": MOON_GOO, "quantity": 1},
+            ],
+        )
+
+    def test_closure_and_buy_exclusions(self) -> None:
+        graph = _graph()
+        tree = graph.build_materials_tree(SHIP_BP, 1)
+
+        self.assertEqual(graph.blueprint_closure(SHIP_BP), {SHIP_BP, COMPONENT_BP})
+        self.assertEqual(graph.buy_exclusions(tree, {COMPONENT}), {COMPONENT_BP})
+        self.assertEqual(graph.buy_exclusions(tree, {MINERAL}), set())
+        self.assertEqual(graph.product_of(SHIP_BP), SHIP)
+        self.assertEqual(graph.output_per_run(COMPONENT_BP), 10)
+
+    def test_batch_trees_round_each_run_count_independently(self) -> None:
+        trees = _graph().build_materials_trees(SHIP_BP, [1, 3], 10)
+
+        single, triple = (tree[0] for tree in trees)
+        self.assertEqual(
+            (single["quantity"], single["cycles"], single["surplus"]), (23, 3, 7)
+        )
+        self.assertEqual(
+            (triple["quantity"], triple["cycles"], triple["surplus"]), (69, 7, 1)
+        )
+        self.assertEqual(single["sub_materials"][0]["quantity"], 9)
+        self.assertEqual(triple["sub_materials"][0]["quantity"], 21)
+
+
+class RunsListParsingTests(SimpleTestCase):
+    def test_ranges_steps_and_duplicates(self) -> None:
+        self.assertEqual(
+            _parse_runs_list("5, 1-3, 10-20:5, 3"), [1, 2, 3, 5, 10, 15, 20]
+        )
+
+    def test_rejects_oversized_batches(self) -> None:
+        with self.assertRaises(ValueError):
+            _parse_runs_list("1-100000")
+
+    def test_rejects_config_sets_beyond_the_run_budget(self) -> None:
+        runs = _parse_runs_list("1-100")
+        raw = '[{"me": 10}, {"me": 8}, {"me": 6}, {"me": 4}, {"me": 2}, {"me": 0}]'
+
+        with self.assertRaises(ValueError):
+            _parse_config_sets(raw, 0, 0, {}, max_sets=MAX_BATCH_RUNS // len(runs))
+        self.assertEqual(
+            len(_parse_config_sets(raw, 0, 0, {}, max_sets=MAX_BATCH_RUNS)), 6
+        )
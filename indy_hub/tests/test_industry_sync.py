@@ -0,0 +1,217 @@
+"""Tests for the bulk blueprint/job synchronization helpers."""
+
+# Standard Library
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+# Django
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+# AA Example App
+from indy_hub.models import Blueprint, CharacterSettings, IndustryJob
+from indy_hub.services.industry_sync import (
+    sync_blueprint_rows,
+    sync_industry_job_rows,
+)
+from indy_hub.utils.job_notifications import process_job_completion_notifications
+
+
+def _blueprint_values(user: User, **overrides) -> dict:
+    values = {
+        "owner_user_id": user.id,
+        "owner_kind": Blueprint.OwnerKind.CHARACTER,
+        "corporation_id": None,
+        "corporation_name": "",
+        "character_id": 9001,
+        "character_name": "Sync Pilot",
+        "blueprint_id": None,
+        "type_id": 691,
+        "type_name": "Rifter Blueprint",
+        "location_id": 60003760,
+        "location_name": "Jita IV - Moon 4",
+        "location_flag": "Hangar",
+        "quantity": -1,
+        "time_efficiency": 20,
+        "material_efficiency": 10,
+        "runs": -1,
+    }
+    values.update(overrides)
+    return values
+
+
+class BlueprintBulkSyncTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user("bulk_sync", password="secret123")
+        self.owned = Blueprint.objects.filter(
+            owner_user=self.user,
+            owner_kind=Blueprint.OwnerKind.CHARACTER,
+            character_id=9001,
+        )
+
+    def test_first_sync_inserts_and_classifies(self) -> None:
+        counts = sync_blueprint_rows(
+            {
+                1001: _blueprint_values(self.user),
+                1002: _blueprint_values(self.user, quantity=-2, runs=5),
+            },
+            owned_queryset=self.owned,
+        )
+
+        self.assertEqual(counts.inserted, 2)
+        self.assertEqual(counts.updated, 0)
+        self.assertEqual(
+            Blueprint.objects.get(item_id=1001).bp_type, Blueprint.BPType.ORIGINAL
+        )
+        self.assertEqual(
+            Blueprint.objects.get(item_id=1002).bp_type, Blueprint.BPType.COPY
+        )
+
+    def test_identical_payload_is_not_rewritten(self) -> None:
+        sync_blueprint_rows(
+            {1001: _blueprint_values(self.user)}, owned_queryset=self.owned
+        )
+
+        counts = sync_blueprint_rows(
+            {1001: _blueprint_values(self.user)}, owned_queryset=self.owned
+        )
+
+        self.assertEqual(
+            counts.as_dict(),
+            {"inserted": 0, "updated": 0, "unchanged": 1, "deleted": 0},
+        )
+
+    def test_changed_and_removed_rows(self) -> None:
+        sync_blueprint_rows(
+            {
+                1001: _blueprint_values(self.user),
+                1002: _blueprint_values(self.user),
+            },
+            owned_queryset=self.owned,
+        )
+
+        counts = sync_blueprint_rows(
+            {1001: _blueprint_values(self.user, material_efficiency=9)},
+            owned_queryset=self.owned,
+        )
+
+        self.assertEqual(counts.updated, 1)
+        self.assertEqual(counts.deleted, 1)
+        self.assertEqual(Blueprint.objects.get(item_id=1001).material_efficiency, 9)
+        self.assertFalse(Blueprint.objects.filter(item_id=1002).exists())
+
+    def test_row_owned_elsewhere_is_taken_over(self) -> None:
+        other = User.objects.create_user("previous_owner", password="secret123")
+        Blueprint.objects.create(
+            owner_user=other,
+            character_id=42,
+            item_id=1001,
+            type_id=691,
+            location_id=60003760,
+            location_flag="Hangar",
+            quantity=-1,
+        )
+
+        counts = sync_blueprint_rows(
+            {1001: _blueprint_values(self.user)}, owned_queryset=self.owned
+        )
+
+        self.assertEqual(counts.updated, 1)
+        self.assertEqual(Blueprint.objects.get(item_id=1001).owner_user, self.user)
+
+
+def _job_values(user: User, **overrides) -> dict:
+    now = timezone.now()
+    values = {
+        "owner_user_id": user.id,
+        "owner_kind": Blueprint.OwnerKind.CHARACTER,
+        "corporation_id": None,
+        "corporation_name": "",
+        "character_id": 9001,
+        "character_name": "Sync Pilot",
+        "installer_id": 9001,
+        "station_id": 60003760,
+        "location_name": "Jita IV - Moon 4",
+        "activity_id": 1,
+        "blueprint_id": 1001,
+        "blueprint_type_id": 691,
+        "blueprint_type_name": "Rifter Blueprint",
+        "runs": 10,
+        "cost": 1234.5,
+        "licensed_runs": 10,
+        "probability": None,
+        "product_type_id": 587,
+        "product_type_name": "Rifter",
+        "status": "active",
+        "duration": 3600,
+        "start_date": now - timedelta(hours=2),
+        "end_date": now + timedelta(hours=1),
+        "pause_date": None,
+        "completed_date": None,
+        "completed_character_id": None,
+        "successful_runs": None,
+    }
+    values.update(overrides)
+    return values
+
+
+class IndustryJobBulkSyncTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user("bulk_jobs", password="secret123")
+        self.owned = IndustryJob.objects.filter(
+            owner_user=self.user,
+            owner_kind=Blueprint.OwnerKind.CHARACTER,
+            character_id=9001,
+        )
+
+    def test_float_cost_does_not_mark_job_dirty(self) -> None:
+        values = _job_values(self.user)
+        sync_industry_job_rows({501: dict(values)}, owned_queryset=self.owned)
+
+        counts = sync_industry_job_rows({501: dict(values)}, owned_queryset=self.owned)
+
+        self.assertEqual(counts.unchanged, 1)
+        self.assertEqual(counts.updated, 0)
+        self.assertEqual(IndustryJob.objects.get(job_id=501).cost, Decimal("1234.50"))
+
+    @patch("indy_hub.utils.job_notifications.notify_user")
+    def test_status_change_runs_completion_side_effects_once(self, mock_notify):
+        values = _job_values(self.user)
+        sync_industry_job_rows({501: dict(values)}, owned_queryset=self.owned)
+        self.assertFalse(IndustryJob.objects.get(job_id=501).job_completed_notified)
+
+        finished = _job_values(
+            self.user,
+            status="delivered",
+            end_date=timezone.now() - timedelta(minutes=5),
+            successful_runs=10,
+        )
+        counts = sync_industry_job_rows({501: finished}, owned_queryset=self.owned)
+
+        self.assertEqual(counts.updated, 1)
+        self.assertTrue(IndustryJob.objects.get(job_id=501).job_completed_notified)
+
+    def test_completion_batch_queries_do_not_grow_with_jobs(self) -> None:
+        CharacterSettings.objects.create(
+            user=self.user,
+            character_id=0,
+            jobs_notify_frequency=CharacterSettings.NOTIFY_DISABLED,
+        )
+        finished = _job_values(
+            self.user, status="delivered", end_date=timezone.now() - timedelta(hours=1)
+        )
+        IndustryJob.objects.bulk_create(
+            IndustryJob(job_id=job_id, **finished) for job_id in range(601, 606)
+        )
+        jobs = list(IndustryJob.objects.filter(owner_user=self.user))
+
+        # Owner users, user settings and the final UPDATE.
+        with self.assertNumQueries(3):
+            processed = process_job_completion_notifications(jobs)
+
+        self.assertEqual(processed, 5)
+        self.assertFalse(
+            IndustryJob.objects.filter(job_completed_notified=False).exists()
+        )
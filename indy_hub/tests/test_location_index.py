@@ -0,0 +1,59 @@
+"""Tests for the CachedStructureName location index."""
+
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.test import TestCase
+
+# AA Example App
+from indy_hub.models import CachedStructureName
+from indy_hub.utils import eve as eve_utils
+
+STRUCTURE_ID = 1035466617946
+STATION_ID = 60003760
+
+
+class LocationIndexTests(TestCase):
+    def setUp(self) -> None:
+        eve_utils._LOCATION_NAME_CACHE.clear()
+        CachedStructureName.objects.create(
+            structure_id=STRUCTURE_ID, name="Perimeter - Tranquility Trading Tower"
+        )
+        CachedStructureName.objects.create(
+            structure_id=STATION_ID + 1, name=f"Structure {STATION_ID + 1}"
+        )
+
+    def tearDown(self) -> None:
+        eve_utils._LOCATION_NAME_CACHE.clear()
+
+    def test_bulk_lookup_reads_the_index_once(self) -> None:
+        with self.assertNumQueries(1):
+            names = eve_utils.resolve_location_names(
+                [STRUCTURE_ID, STATION_ID + 1, None, "bogus"]
+            )
+
+        self.assertEqual(names, {STRUCTURE_ID: "Perimeter - Tranquility Trading Tower"})
+        self.assertEqual(
+            CachedStructureName.objects.get(structure_id=STATION_ID + 1).confidence,
+            CachedStructureName.Confidence.PLACEHOLDER,
+        )
+        with self.assertNumQueries(0):
+            eve_utils.resolve_location_name(STRUCTURE_ID)
+
+    def test_resolved_station_is_added_to_the_index(self) -> None:
+        response = type(
+            "Response",
+            (),
+            {"status_code": 200, "json": lambda self: {"name": "Jita IV - Moon 4"}},
+        )()
+        with patch.object(
+            eve_utils, "_rate_limited_public_get", return_value=response
+        ) as public_get:
+            name = eve_utils.resolve_location_name(STATION_ID)
+
+        self.assertEqual(name, "Jita IV - Moon 4")
+        public_get.assert_called_once()
+        cached = CachedStructureName.objects.get(structure_id=STATION_ID)
+        self.assertEqual(cached.source, CachedStructureName.Source.STATION)
+        self.assertEqual(cached.confidence, CachedStructureName.Confidence.RESOLVED)
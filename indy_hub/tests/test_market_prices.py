@@ -0,0 +1,84 @@
+"""Tests for the shared Jita price cache."""
+
+# Standard Library
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+# AA Example App
+from indy_hub.models import CachedMarketPrice
+from indy_hub.services.market_prices import (
+    FUZZWORK_AGGREGATES_URL,
+    JITA_STATION_ID,
+    chunk_type_ids_for_url,
+    get_jita_prices,
+)
+
+
+def _aggregate(buy: str, sell: str) -> dict:
+    return {"buy": {"max": buy}, "sell": {"min": sell}}
+
+
+class JitaPriceCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    @patch("indy_hub.services.market_prices._request_aggregates")
+    def test_fetches_once_then_serves_from_cache(self, mock_request) -> None:
+        mock_request.return_value = {"34": _aggregate("4.50", "5.10")}
+
+        first = get_jita_prices([34, "34"])
+        second = get_jita_prices([34])
+
+        mock_request.assert_called_once_with([34])
+        self.assertEqual(first[34].sell, Decimal("5.10"))
+        self.assertEqual(second[34].buy, Decimal("4.50"))
+        self.assertTrue(CachedMarketPrice.objects.filter(type_id=34).exists())
+
+    @patch("indy_hub.services.market_prices._request_aggregates")
+    def test_backend_without_upsert_target_stores_prices(self, mock_request) -> None:
+        # MySQL/MariaDB reject ``unique_fields`` on conflict updates.
+        mock_request.return_value = {"36": _aggregate("1.00", "1.20")}
+
+        with patch.object(
+            connection.features, "supports_update_conflicts_with_target", False
+        ):
+            prices = get_jita_prices([36])
+
+        self.assertEqual(prices[36].sell, Decimal("1.20"))
+        self.assertTrue(CachedMarketPrice.objects.filter(type_id=36).exists())
+
+    @patch("indy_hub.services.market_prices.schedule_price_refresh")
+    @patch("indy_hub.services.market_prices._request_aggregates")
+    def test_stale_price_is_served_and_refreshed_in_background(
+        self, mock_request, mock_schedule
+    ) -> None:
+        CachedMarketPrice.objects.create(
+            type_id=35,
+            buy_price=Decimal("9.00"),
+            sell_price=Decimal("10.00"),
+            data=_aggregate("9.00", "10.00"),
+            fetched_at=timezone.now() - timedelta(hours=2),
+        )
+
+        prices = get_jita_prices([35])
+
+        mock_request.assert_not_called()
+        mock_schedule.assert_called_once_with([35])
+        self.assertEqual(prices[35].sell, Decimal("10.00"))
+
+    def test_chunks_respect_url_length(self) -> None:
+        type_ids = list(range(10000, 10500))
+
+        chunks = chunk_type_ids_for_url(type_ids, max_url_length=300)
+
+        self.assertEqual([tid for chunk in chunks for tid in chunk], type_ids)
+        base = f"{FUZZWORK_AGGREGATES_URL}?station={JITA_STATION_ID}&types="
+        for chunk in chunks:
+            self.assertLessEqual(len(base + ",".join(map(str, chunk))), 300)
@@ -19,6 +19,8 @@ from indy_hub.models import (
     MaterialExchangeSellOrderItem,
 )
 from indy_hub.tasks.material_exchange_contracts import (
+    _contract_items_match_order_db,
+    _ContractIndex,
     _extract_contract_id,
     validate_material_exchange_buy_orders,
     validate_material_exchange_sell_orders,
@@ -83,11 +85,61 @@ class ContractValidationTestCase(TestCase):
         )
 
     def test_contract_items_matching(self):
-        """Test contract items matching"""
-        # TODO: Update to use ESIContractItem models instead of dicts
-        self.skipTest(
-            "Legacy dict-based contract item matching - needs update for DB models"
-        )
+        """Test contract items matching via the contract index"""
+        # Standard Library
+        from datetime import timedelta
+
+        # Django
+        from django.utils import timezone
+
+        # AA Example App
+        from indy_hub.models import ESIContract, ESIContractItem
+
+        order_ref = f"INDY-{self.sell_order.id}"
+        now = timezone.now()
+        # Candidates keep the newest-first ordering of ESIContract.
+        for contract_id, title, quantity in (
+            (1, f"{order_ref} minerals", 1000),
+            (2, f"{order_ref}", 999),
+            (3, f"{order_ref}7", 1000),  # a different order's reference
+        ):
+            contract = ESIContract.objects.create(
+                contract_id=contract_id,
+                issuer_id=1,
+                issuer_corporation_id=1,
+                assignee_id=self.config.corporation_id,
+                corporation_id=self.config.corporation_id,
+                contract_type="item_exchange",
+                status="outstanding",
+                title=title,
+                date_issued=now - timedelta(minutes=contract_id),
+                date_expired=now + timedelta(days=7),
+            )
+            ESIContractItem.objects.create(
+                contract=contract,
+                record_id=contract_id,
+                type_id=34,
+                quantity=quantity,
+                is_included=True,
+            )
+
+        with self.assertNumQueries(2):
+            index = _ContractIndex(ESIContract.objects.all())
+        candidates = index.for_reference(order_ref)
+        self.assertEqual([c.contract_id for c in candidates], [1, 2])
+
+        order = MaterialExchangeSellOrder.objects.prefetch_related("items").get(
+            pk=self.sell_order.pk
+        )
+        list(order.items.all())
+        with self.assertNumQueries(0):
+            matches = [
+                _contract_items_match_order_db(
+                    contract, order, contract_items=index.included_items(contract)
+                )
+                for contract in candidates
+            ]
+        self.assertEqual(matches, [True, False])
 
     def test_extract_contract_id(self):
         """Test contract ID extraction from notes"""
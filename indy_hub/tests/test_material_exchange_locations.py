@@ -8,9 +8,8 @@ from indy_hub.models import (
     CachedStructureName,
 )
 from indy_hub.services.asset_cache import (
-    asset_chain_has_context,
+    AssetTree,
     build_asset_index_by_item_id,
-    get_office_folder_item_id_from_assets,
     make_managed_hangar_location_id,
     resolve_asset_root_location_id,
     resolve_structure_names,
@@ -69,43 +68,38 @@ class TestMaterialExchangeLocations(TestCase):
             "is_blueprint": False,
         }
 
-        assets = [item_a, container_c]
-        index_by_item_id = build_asset_index_by_item_id(assets)
+        tree = AssetTree.from_assets([item_a, container_c])
 
-        assert asset_chain_has_context(
-            item_a,
-            index_by_item_id,
-            location_id=effective_location_id,
-            location_flag=target_flag,
-        )
+        assert tree.root_location_ids() == [effective_location_id] * 2
+        assert tree.hangar_flags() == [target_flag] * 2
 
-    def test_office_folder_item_id_extraction(self):
-        corp_assets = [
+    def test_asset_tree_resolves_roots_and_hangar_context(self):
+        office_folder_id = 1045722708748
+        assets = [
+            # Item inside a container inside a container in CorpSAG7.
+            {"item_id": 3, "location_id": 2, "location_flag": "Unlocked"},
+            {"item_id": 2, "location_id": 1, "location_flag": "Unlocked"},
             {
-                "item_id": 1045722708748,
-                "location_id": 1045667241057,
-                "location_flag": "OfficeFolder",
-                "type_id": 27,
-                "quantity": 1,
-                "is_singleton": True,
-                "is_blueprint": False,
+                "item_id": 1,
+                "location_id": office_folder_id,
+                "location_flag": "CorpSAG7",
             },
+            # Loose item in another division.
             {
-                "item_id": 999,
-                "location_id": 1045722708748,
-                "location_flag": "CorpSAG7",
-                "type_id": 34,
-                "quantity": 10,
-                "is_singleton": False,
-                "is_blueprint": False,
+                "item_id": 4,
+                "location_id": office_folder_id,
+                "location_flag": "CorpSAG1",
             },
+            # Pathological parent loop.
+            {"item_id": 5, "location_id": 6, "location_flag": "CorpSAG7"},
+            {"item_id": 6, "location_id": 5, "location_flag": "Unlocked"},
         ]
 
-        assert (
-            get_office_folder_item_id_from_assets(
-                corp_assets, structure_id=1045667241057
-            )
-            == 1045722708748
+        tree = AssetTree.from_assets(assets)
+
+        self.assertEqual(tree.root_location_ids()[:4], [office_folder_id] * 4)
+        self.assertEqual(
+            tree.hangar_flags()[:4], ["CorpSAG7", "CorpSAG7", "CorpSAG7", "CorpSAG1"]
         )
 
     def test_managed_hangar_location_id(self):
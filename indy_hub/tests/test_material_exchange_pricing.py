@@ -3,13 +3,17 @@ Tests for Material Exchange pricing with configurable base prices.
 """
 
 # Standard Library
+import time
 from decimal import Decimal
+from unittest.mock import patch
 
 # Django
 from django.test import TestCase
 
 # AA Example App
 from indy_hub.models import MaterialExchangeConfig, MaterialExchangeStock
+from indy_hub.services.market_prices import JitaPrice
+from indy_hub.tasks.material_exchange import sync_material_exchange_prices
 
 
 class MaterialExchangePricingTests(TestCase):
@@ -142,3 +146,64 @@ class MaterialExchangePricingTests(TestCase):
         expected = Decimal("6.00")
         actual = self.stock.buy_price_from_member
         self.assertAlmostEqual(float(actual), float(expected), places=2)
+
+
+def _jita(type_id: int, buy: str, sell: str) -> JitaPrice:
+    return JitaPrice(
+        type_id=type_id, buy=Decimal(buy), sell=Decimal(sell), fetched_at=time.time()
+    )
+
+
+class MaterialExchangePriceSyncTests(TestCase):
+    """Test the bulk price writeback of sync_material_exchange_prices."""
+
+    def setUp(self):
+        self.config = MaterialExchangeConfig.objects.create(
+            corporation_id=123456,
+            structure_id=789012,
+            structure_name="Test Structure",
+            hangar_division=1,
+        )
+        self.tritanium = MaterialExchangeStock.objects.create(
+            config=self.config,
+            type_id=34,
+            quantity=1000,
+            jita_buy_price=Decimal("5.00"),
+            jita_sell_price=Decimal("6.00"),
+        )
+        self.pyerite = MaterialExchangeStock.objects.create(
+            config=self.config,
+            type_id=35,
+            quantity=1000,
+            jita_buy_price=Decimal("10.00"),
+            jita_sell_price=Decimal("12.00"),
+        )
+
+    @patch("indy_hub.tasks.material_exchange.get_jita_prices")
+    def test_only_changed_rows_are_written(self, mock_prices):
+        mock_prices.return_value = {
+            34: _jita(34, "5.00", "6.00"),
+            35: _jita(35, "11.00", "12.00"),
+        }
+
+        sync_material_exchange_prices()
+
+        self.tritanium.refresh_from_db()
+        self.pyerite.refresh_from_db()
+        self.assertIsNone(self.tritanium.last_price_update)
+        self.assertEqual(self.pyerite.jita_buy_price, Decimal("11.00"))
+        self.assertIsNotNone(self.pyerite.last_price_update)
+
+    @patch("indy_hub.tasks.material_exchange.get_jita_prices")
+    def test_min_change_percent_skips_small_moves(self, mock_prices):
+        mock_prices.return_value = {
+            34: _jita(34, "5.05", "6.00"),  # +1%
+            35: _jita(35, "10.00", "13.00"),  # sell +8.3%
+        }
+
+        sync_material_exchange_prices(min_change_percent=5)
+
+        self.tritanium.refresh_from_db()
+        self.pyerite.refresh_from_db()
+        self.assertEqual(self.tritanium.jita_buy_price, Decimal("5.00"))
+        self.assertEqual(self.pyerite.jita_sell_price, Decimal("13.00"))
@@ -0,0 +1,161 @@
+"""Tests for the multi-hub, SQL-aggregated Material Exchange stock sync."""
+
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+from django.test import TestCase
+
+# AA Example App
+from indy_hub.models import (
+    CachedCorporationAsset,
+    MaterialExchangeConfig,
+    MaterialExchangeStock,
+)
+from indy_hub.tasks.material_exchange import _sync_stock_impl
+from indy_hub.tasks.material_exchange_contracts import (
+    _material_exchange_cycle_lock_key,
+    run_material_exchange_corporation_cycle,
+    run_material_exchange_cycle,
+)
+
+CORP_ID = 98000001
+STRUCTURE_ID = 1045667241057
+OFFICE_FOLDER_ID = 1045722708748
+
+
+@patch("indy_hub.tasks.material_exchange.sync_material_exchange_prices")
+@patch("indy_hub.tasks.material_exchange.get_type_name", return_value="")
+@patch(
+    "indy_hub.tasks.material_exchange.resolve_names_bulk",
+    return_value={"types": {}},
+)
+class StockSyncAggregationTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.config = MaterialExchangeConfig.objects.create(
+            corporation_id=CORP_ID,
+            structure_id=STRUCTURE_ID,
+            structure_name="Hub",
+            hangar_division=7,
+        )
+        for item_id, location_id, flag, type_id, quantity, singleton in (
+            (OFFICE_FOLDER_ID, STRUCTURE_ID, "OfficeFolder", 27, 1, True),
+            (1, OFFICE_FOLDER_ID, "CorpSAG7", 34, 100, False),
+            (2, OFFICE_FOLDER_ID, "CorpSAG7", 3297, 0, True),  # container
+            (3, 2, "Unlocked", 34, 50, False),
+            (4, 2, "Unlocked", 35, 10, False),
+            (5, OFFICE_FOLDER_ID, "CorpSAG1", 34, 999, False),
+            (6, 60003760, "CorpSAG7", 34, 999, False),
+        ):
+            CachedCorporationAsset.objects.create(
+                corporation_id=CORP_ID,
+                item_id=item_id,
+                location_id=location_id,
+                location_flag=flag,
+                type_id=type_id,
+                quantity=quantity,
+                is_singleton=singleton,
+            )
+
+    def test_stock_is_summed_per_type_for_the_configured_hangar(self, *_mocks):
+        _sync_stock_impl()
+
+        self.assertEqual(
+            dict(
+                MaterialExchangeStock.objects.filter(config=self.config).values_list(
+                    "type_id", "quantity"
+                )
+            ),
+            {34: 150, 35: 10, 3297: 1},
+        )
+
+    def test_container_contents_inherit_the_container_hangar(self, *_mocks):
+        _sync_stock_impl()
+
+        self.assertEqual(
+            CachedCorporationAsset.objects.values_list(
+                "root_location_id", "hangar_flag"
+            ).get(item_id=3),
+            (STRUCTURE_ID, "CorpSAG7"),
+        )
+        self.assertFalse(
+            CachedCorporationAsset.objects.filter(
+                root_location_id__isnull=True
+            ).exists()
+        )
+
+    def test_hub_in_a_corporation_owned_structure(self, *_mocks):
+        # ESI lists a structure the corporation owns as an asset in space.
+        CachedCorporationAsset.objects.create(
+            corporation_id=CORP_ID,
+            item_id=STRUCTURE_ID,
+            location_id=30000142,
+            location_flag="AutoFit",
+            type_id=35832,
+            quantity=1,
+            is_singleton=True,
+        )
+
+        _sync_stock_impl()
+
+        self.assertEqual(
+            dict(
+                MaterialExchangeStock.objects.filter(config=self.config).values_list(
+                    "type_id", "quantity"
+                )
+            ),
+            {34: 150, 35: 10, 3297: 1},
+        )
+
+    def test_every_active_hub_is_synced(self, *_mocks):
+        second_hub = MaterialExchangeConfig.objects.create(
+            corporation_id=CORP_ID,
+            structure_id=STRUCTURE_ID,
+            structure_name="Hub",
+            hangar_division=1,
+        )
+
+        _sync_stock_impl()
+
+        self.assertEqual(
+            dict(
+                MaterialExchangeStock.objects.filter(config=second_hub).values_list(
+                    "type_id", "quantity"
+                )
+            ),
+            {34: 999},
+        )
+        self.assertEqual(
+            MaterialExchangeStock.objects.filter(config=self.config).count(), 3
+        )
+
+
+class MaterialExchangeCycleFanOutTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        for corporation_id, division in ((CORP_ID, 1), (CORP_ID, 7), (98000002, 1)):
+            MaterialExchangeConfig.objects.create(
+                corporation_id=corporation_id,
+                structure_id=STRUCTURE_ID,
+                hangar_division=division,
+            )
+
+    def test_one_cycle_task_per_corporation(self):
+        with patch.object(run_material_exchange_corporation_cycle, "delay") as delay:
+            run_material_exchange_cycle()
+
+        self.assertCountEqual(
+            [call.args for call in delay.call_args_list], [(CORP_ID,), (98000002,)]
+        )
+
+    @patch("indy_hub.tasks.material_exchange_contracts._sync_stock_impl")
+    @patch("indy_hub.tasks.material_exchange_contracts._sync_contracts_for_corporation")
+    def test_running_corporation_cycle_is_skipped(self, sync_contracts, sync_stock):
+        cache.add(_material_exchange_cycle_lock_key(CORP_ID), True, 60)
+
+        run_material_exchange_corporation_cycle(CORP_ID)
+
+        sync_contracts.assert_not_called()
+        sync_stock.assert_not_called()
@@ -0,0 +1,86 @@
+"""Tests for the two-tier EVE name cache."""
+
+from __future__ import annotations
+
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+# Alliance Auth
+from allianceauth.eveonline.models import EveCharacter
+
+# AA Example App
+from indy_hub.utils import eve as eve_utils
+from indy_hub.utils.name_cache import TwoTierCache
+
+
+class TwoTierCacheTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_local_tier_is_bounded(self) -> None:
+        names = TwoTierCache("test_bounded", maxsize=2)
+        names.set_many({1: "one", 2: "two"})
+        names.get(1)
+        names.set(3, "three")
+
+        self.assertEqual(len(names), 2)
+        # Key 2 was least recently used; it is still served from the shared tier.
+        self.assertEqual(names.get(2), "two")
+        self.assertEqual(names.stats()["shared_hits"], 1)
+
+    def test_other_process_reads_shared_tier(self) -> None:
+        TwoTierCache("test_shared").set_many({34: "Tritanium", 35: None})
+        other = TwoTierCache("test_shared")
+
+        self.assertEqual(other.get_many([34, 35, 36]), {34: "Tritanium", 35: None})
+        self.assertEqual(other.stats()["shared_hits"], 2)
+        self.assertEqual(other.stats()["misses"], 1)
+
+    def test_local_entries_expire(self) -> None:
+        names = TwoTierCache("test_ttl", local_ttl=10)
+        with patch("indy_hub.utils.name_cache.time.monotonic", return_value=100.0):
+            names.set(1, "one")
+        cache.clear()
+
+        with patch("indy_hub.utils.name_cache.time.monotonic", return_value=105.0):
+            self.assertEqual(names.get(1), "one")
+        with patch("indy_hub.utils.name_cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(names.get(1))
+
+
+class ResolveNamesBulkTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        eve_utils._CHAR_NAME_CACHE.clear()
+        eve_utils._CORP_NAME_CACHE.clear()
+        EveCharacter.objects.create(
+            character_id=9001,
+            character_name="Bulk Pilot",
+            corporation_id=2001,
+            corporation_name="Bulk Corp",
+            corporation_ticker="BULK",
+        )
+
+    @patch.object(eve_utils.shared_client, "resolve_ids_to_names")
+    def test_misses_are_loaded_once_and_cached(self, mock_resolve) -> None:
+        mock_resolve.return_value = {9002: "Remote Pilot"}
+
+        with self.assertNumQueries(3):
+            names = eve_utils.resolve_names_bulk(
+                character_ids=[9001, 9002, 9003], corporation_ids=[2001]
+            )
+
+        self.assertEqual(
+            names["characters"],
+            {9001: "Bulk Pilot", 9002: "Remote Pilot", 9003: "9003"},
+        )
+        self.assertEqual(names["corporations"], {2001: "Bulk Corp"})
+        mock_resolve.assert_called_once_with([9002, 9003])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(eve_utils.get_character_name(9002), "Remote Pilot")
+            self.assertEqual(eve_utils.get_corporation_name(2001), "Bulk Corp")
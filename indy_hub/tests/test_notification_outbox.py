@@ -0,0 +1,81 @@
+"""Tests for the asynchronous notification outbox."""
+
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+# AA Example App
+from indy_hub.models import NotificationOutboxEntry
+from indy_hub.notifications import (
+    deliver_pending_notifications,
+    notification_batch,
+    queue_notification,
+)
+
+
+@patch("indy_hub.notifications.OUTBOX_SEND_RATE", 0)
+class NotificationOutboxTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.users = [
+            User.objects.create_user(f"provider{index}", password="secret123")
+            for index in range(3)
+        ]
+
+    def test_batch_is_stored_with_one_insert_and_deduplicated(self) -> None:
+        with self.captureOnCommitCallbacks() as callbacks:
+            # One dedup lookup plus one bulk insert for the whole batch.
+            with self.assertNumQueries(2):
+                with notification_batch():
+                    for user in self.users:
+                        queue_notification(user, "New request", "Rifter BPC")
+                    queue_notification(self.users[0], "New request", "Rifter BPC")
+
+        self.assertEqual(NotificationOutboxEntry.objects.count(), 3)
+        self.assertEqual(len(callbacks), 1)
+
+        queue_notification(self.users[0], "New request", "Rifter BPC")
+        queue_notification(self.users[0], "New request", "Merlin BPC")
+        self.assertEqual(NotificationOutboxEntry.objects.count(), 4)
+
+    @patch("indy_hub.notifications.notify_user")
+    def test_delivery_marks_entries_sent(self, mock_notify) -> None:
+        with notification_batch():
+            for user in self.users:
+                queue_notification(
+                    user,
+                    "New request",
+                    "Rifter BPC",
+                    link="/indy_hub/fulfill/",
+                    link_label="Review",
+                )
+
+        result = deliver_pending_notifications()
+
+        self.assertEqual(result["sent"], 3)
+        self.assertEqual(result["remaining"], 0)
+        self.assertEqual(
+            {call.args[0] for call in mock_notify.call_args_list}, set(self.users)
+        )
+        self.assertEqual(mock_notify.call_args.kwargs["link"], "/indy_hub/fulfill/")
+        self.assertFalse(
+            NotificationOutboxEntry.objects.exclude(
+                status=NotificationOutboxEntry.STATUS_SENT
+            ).exists()
+        )
+
+    @patch("indy_hub.notifications.notify_user", side_effect=RuntimeError("down"))
+    def test_failed_delivery_is_retried_then_abandoned(self, _mock_notify) -> None:
+        queue_notification(self.users[0], "New request", "Rifter BPC")
+
+        for _attempt in range(3):
+            deliver_pending_notifications()
+
+        entry = NotificationOutboxEntry.objects.get()
+        self.assertEqual(entry.attempts, 3)
+        self.assertEqual(entry.status, NotificationOutboxEntry.STATUS_FAILED)
+        self.assertEqual(deliver_pending_notifications()["sent"], 0)
@@ -1657,7 +1657,7 @@ class BlueprintCopyRequestPageTests(TestCase):
             "copies_requested": 1,
         }
 
-        with patch("indy_hub.views.industry.notify_user") as mock_notify:
+        with patch("indy_hub.views.industry.queue_notification") as mock_notify:
             response = self.client.post(url, post_data)
             self.assertRedirects(response, url)
 
@@ -1837,7 +1837,7 @@ class BlueprintCopyRequestPageTests(TestCase):
             "copies_requested": 1,
         }
 
-        with patch("indy_hub.views.industry.notify_user") as mock_notify:
+        with patch("indy_hub.views.industry.queue_notification") as mock_notify:
             response = self.client.post(
                 reverse("indy_hub:bp_copy_request_page"), post_data
             )
@@ -1985,7 +1985,7 @@ class BlueprintCopyMyRequestsTests(TestCase):
             copies_requested=1,
         )
 
-        with patch("indy_hub.views.industry.notify_user") as mock_notify:
+        with patch("indy_hub.views.industry.queue_notification") as mock_notify:
             response = self.client.post(
                 reverse("indy_hub:bp_update_copy_request", args=[request_obj.id]),
                 {"runs_requested": 5, "copies_requested": 4},
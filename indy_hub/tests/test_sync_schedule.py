@@ -0,0 +1,195 @@
+"""Tests for the Expires-driven blueprint/job sync scheduler."""
+
+# Standard Library
+from datetime import timedelta
+from unittest.mock import patch
+
+# Django
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+# Alliance Auth
+from allianceauth.eveonline.models import EveCharacter
+from esi.models import Token
+
+# AA Example App
+from indy_hub.models import Blueprint, ESISyncSchedule
+from indy_hub.services import sync_schedule
+from indy_hub.tasks import industry
+
+CHARACTER = Blueprint.OwnerKind.CHARACTER
+CORPORATION = Blueprint.OwnerKind.CORPORATION
+
+
+class _FakeTokens:
+    """Token queryset stand-in keyed by the single scope a caller requires."""
+
+    def __init__(self, tokens_by_scope: dict[str, list[tuple[int, int]]]):
+        self.tokens_by_scope = tokens_by_scope
+        self.rows: list[tuple[int, int]] = []
+
+    def filter(self, **kwargs):
+        return self
+
+    def require_scopes(self, scopes):
+        (scope,) = scopes
+        scoped = _FakeTokens(self.tokens_by_scope)
+        scoped.rows = self.tokens_by_scope.get(scope, [])
+        return scoped
+
+    def values_list(self, *fields, flat=False):
+        if flat:
+            return [row[0] for row in self.rows]
+        return list(self.rows)
+
+
+class NextRunTests(TestCase):
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        self.expires = self.now + timedelta(minutes=3)
+
+    def test_changed_owner_refreshes_right_after_expiry(self) -> None:
+        self.assertEqual(
+            sync_schedule.next_run_after_sync(
+                now=self.now,
+                expires=self.expires,
+                last_changed_at=self.now,
+                max_interval=timedelta(hours=12),
+            ),
+            self.expires + sync_schedule.EXPIRY_GRACE,
+        )
+
+    def test_idle_owner_backs_off_up_to_the_window(self) -> None:
+        idle_six_hours = sync_schedule.next_run_after_sync(
+            now=self.now,
+            expires=self.expires,
+            last_changed_at=self.now - timedelta(hours=6),
+            max_interval=timedelta(hours=12),
+        )
+        idle_two_days = sync_schedule.next_run_after_sync(
+            now=self.now,
+            expires=self.expires,
+            last_changed_at=self.now - timedelta(days=2),
+            max_interval=timedelta(hours=12),
+        )
+
+        self.assertEqual(idle_six_hours, self.now + timedelta(hours=3))
+        self.assertEqual(idle_two_days, self.now + timedelta(hours=12))
+
+
+@patch.object(industry, "_refresh_schedule_owners")
+class DispatchDueSyncsTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user("industrialist", password="secret123")
+        past = timezone.now() - timedelta(minutes=1)
+        for owner_kind, owner_id, user in (
+            (CHARACTER, 9001, self.user),
+            (CHARACTER, 9002, self.user),
+            (CORPORATION, 98000001, None),
+        ):
+            ESISyncSchedule.objects.create(
+                kind=industry.MANUAL_REFRESH_KIND_BLUEPRINTS,
+                owner_kind=owner_kind,
+                owner_id=owner_id,
+                user=user,
+                next_run_at=past,
+            )
+        ESISyncSchedule.objects.create(
+            kind=industry.MANUAL_REFRESH_KIND_BLUEPRINTS,
+            owner_kind=CHARACTER,
+            owner_id=9003,
+            user=self.user,
+            next_run_at=timezone.now() + timedelta(hours=1),
+        )
+
+    def test_due_characters_are_batched_per_user(self, _owners) -> None:
+        with (
+            patch.object(industry.update_blueprints_for_user, "apply_async") as task,
+            patch.object(industry, "queue_corporation_sync") as corp_sync,
+            patch.object(industry.update_industry_jobs_for_user, "apply_async"),
+        ):
+            result = industry.dispatch_due_syncs()
+
+        self.assertEqual(result[industry.MANUAL_REFRESH_KIND_BLUEPRINTS], 3)
+        task.assert_called_once()
+        self.assertEqual(task.call_args.kwargs["args"], (self.user.id,))
+        self.assertCountEqual(
+            task.call_args.kwargs["kwargs"]["character_ids"], [9001, 9002]
+        )
+        corp_sync.assert_called_once_with(
+            industry.MANUAL_REFRESH_KIND_BLUEPRINTS, 98000001, force=True
+        )
+        leased = ESISyncSchedule.objects.get(owner_id=9001)
+        self.assertGreater(leased.next_run_at, timezone.now())
+        self.assertIsNotNone(leased.dispatched_at)
+
+    @override_settings(INDY_HUB_SYNC_MAX_IN_FLIGHT=2)
+    def test_in_flight_budget_limits_dispatch(self, _owners) -> None:
+        with (
+            patch.object(industry.update_blueprints_for_user, "apply_async"),
+            patch.object(industry, "queue_corporation_sync"),
+        ):
+            first = industry.dispatch_due_syncs()
+            second = industry.dispatch_due_syncs()
+
+        self.assertEqual(first[industry.MANUAL_REFRESH_KIND_BLUEPRINTS], 2)
+        self.assertEqual(second[industry.MANUAL_REFRESH_KIND_BLUEPRINTS], 0)
+
+    def test_recorded_sync_releases_the_budget(self, _owners) -> None:
+        expires = timezone.now() + timedelta(minutes=50)
+        with (
+            patch.object(industry.update_blueprints_for_user, "apply_async"),
+            patch.object(industry, "queue_corporation_sync"),
+        ):
+            industry.dispatch_due_syncs()
+
+        sync_schedule.record_sync(
+            industry.MANUAL_REFRESH_KIND_BLUEPRINTS,
+            CHARACTER,
+            9001,
+            expires=expires,
+            changed=True,
+            max_interval=timedelta(hours=12),
+        )
+
+        schedule = ESISyncSchedule.objects.get(owner_id=9001)
+        self.assertIsNone(schedule.dispatched_at)
+        self.assertEqual(schedule.next_run_at, expires + sync_schedule.EXPIRY_GRACE)
+        self.assertEqual(
+            sync_schedule.in_flight_count(
+                industry.MANUAL_REFRESH_KIND_BLUEPRINTS,
+                window=timedelta(minutes=15),
+            ),
+            2,
+        )
+
+
+class ScheduleOwnersTests(TestCase):
+    def test_corporations_are_seeded_from_corporation_tokens(self) -> None:
+        user = User.objects.create_user("director", password="secret123")
+        EveCharacter.objects.create(
+            character_id=9101,
+            character_name="Director",
+            corporation_id=98000002,
+            corporation_name="Builders",
+            corporation_ticker="BLD",
+        )
+        tokens = _FakeTokens(
+            {
+                industry.BLUEPRINT_SCOPE: [(9001, user.id)],
+                industry.CORP_BLUEPRINT_SCOPE: [(9101, user.id)],
+            }
+        )
+
+        with patch.object(Token, "objects", tokens):
+            owners = list(
+                industry._schedule_owners(industry.MANUAL_REFRESH_KIND_BLUEPRINTS)
+            )
+
+        self.assertCountEqual(
+            owners,
+            [(CHARACTER, 9001, user.id), (CORPORATION, 98000002, None)],
+        )
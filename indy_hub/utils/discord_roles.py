@@ -6,13 +6,21 @@ Supports separate role configurations for:
 - Industry notifications (blueprints, jobs, copy requests)
 - Material Exchange admin notifications (new orders to review)
 - User-specific notifications (always sent, no filtering)
+
+Member roles are read from a guild role snapshot (Discord uid -> configured
+role ids) kept in the shared cache and refreshed periodically, so filtering N
+users costs one cache read, one uid query and N dictionary lookups instead of
+a guild/member round-trip per user.
 """
 
 # Standard Library
+import hashlib
 import logging
 
 # Django
+from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,20 +30,51 @@ NOTIFICATION_TYPE_INDUSTRY = "industry"
 NOTIFICATION_TYPE_MATERIAL_EXCHANGE = "material_exchange"
 NOTIFICATION_TYPE_USER = "user"
 
-notification_type=NOTIFICATION_TYPE_INDUSTRY):
+ROLE_SETTINGS = {
+    NOTIFICATION_TYPE_INDUSTRY: "INDY_HUB_DISCORD_NOTIFICATION_ROLES",
+    NOTIFICATION_TYPE_MATERIAL_EXCHANGE: "INDY_HUB_MATERIAL_EXCHANGE_NOTIFICATION_ROLES",
+}
+
+SNAPSHOT_CACHE_PREFIX = "indy_hub:discord_roles:snapshot"
+SNAPSHOT_TTL_SECONDS = int(
+    getattr(settings, "INDY_HUB_DISCORD_ROLE_SNAPSHOT_TTL", 30 * 60)
+)
+
+
+def get_notification_roles(notification_type=NOTIFICATION_TYPE_INDUSTRY):
+    """
+    Get the configured Discord roles for a notification type.
+
+    Args:
+        notification_type: Type of notification
+
+    Returns:
+        dict: Role ID (as string) -> role config (``name``, ``enabled``)
+    """
+    setting_name = ROLE_SETTINGS.get(notification_type)
+    if not setting_name:
+        return {}
+    roles = getattr(settings, setting_name, None) or {}
+    if not isinstance(roles, dict):
+        logger.warning("%s must be a dict of role id -> config", setting_name)
+        return {}
+    return {str(role_id): (config or {}) for role_id, config in roles.items()}
+
+
+def is_notification_enabled(notification_type=NOTIFICATION_TYPE_INDUSTRY):
     """
     Check if role-based notification filtering is enabled for a type.
-    
+
     Args:
         notification_type: Type of notification to check
-        
+
     Returns:
         bool: True if role filtering is configured and enabled
     """
     roles = get_notification_roles(notification_type)
     if not roles:
         return False
-    
+
     # At least one role must be enabled
     return any(role.get("enabled", True) for role in roles.values())
 
@@ -43,143 +82,180 @@ notification_type=NOTIFICATION_TYPE_INDUSTRY):
 def get_enabled_role_ids(notification_type=NOTIFICATION_TYPE_INDUSTRY):
     """
     Get list of enabled Discord role IDs for a notification type.
-    
+
     Args:
         notification_type: Type of notification
-        
+
     Returns:
         list: List of Discord role IDs as strings
     """
-    roles = get_notification_roles(notification_typen filtering is enabled.
-    
-    Returns:
-        bool: True if role filtering is configured and enabled
-    """
-    roles = get_notification_roles()
-    if not roles:
-        return False
-    
-    # At least one role must be enabled
-    return any(role.get("enabled", True) for role in roles.values())
+    roles = get_notification_roles(notification_type)
+    return [role_id for role_id, config in roles.items() if config.get("enabled", True)]
+
+
+def _tracked_role_ids() -> set[str]:
+    role_ids: set[str] = set()
+    for notification_type in ROLE_SETTINGS:
+        role_ids.update(get_enabled_role_ids(notification_type))
+    return role_ids
+
 
+def _snapshot_cache_key(tracked: set[str]) -> str:
+    # Keyed by the configured roles so a settings change never reads a
+    # snapshot that was trimmed to a different role set.
+    digest = hashlib.md5(",".join(sorted(tracked)).encode()).hexdigest()
+    return f"{SNAPSHOT_CACHE_PREFIX}:{digest}"
 
-def get_enabled_role_ids():
+
+def _discord_bot_installed() -> bool:
+    return apps.is_installed("aadiscordbot")
+
+
+def _get_discord_bot():
+    try:
+        # Third Party
+        from aadiscordbot.app_settings import get_bot
+    except ImportError:
+        logger.debug("aadiscordbot get_bot unavailable", exc_info=True)
+        return None
+    try:
+        return get_bot()
+    except Exception:  # pragma: no cover - bot not running in this process
+        logger.debug("Discord bot not available", exc_info=True)
+        return None
+
+
+def refresh_guild_role_snapshot(bot=None):
     """
-    Get list of enabled Discord role IDs for notifications.
-    
+    Rebuild the guild role snapshot from the bot's member cache.
+
+    Only roles configured for a notification type are kept, so the snapshot
+    holds just the members that can pass a role filter.
+
     Returns:
-        list: List of Discord role IDs as strings
+        dict | None: Discord uid -> sorted role ids, or None if unavailable
     """
-    roles = get_notification_roles()
-    return [
-        role_id , notification_type=NOTIFICATION_TYPE_INDUSTRY):
+    tracked = _tracked_role_ids()
+    if not tracked:
+        return None
+
+    guild_id = getattr(settings, "DISCORD_GUILD_ID", None)
+    if not guild_id:
+        logger.debug("DISCORD_GUILD_ID not configured, no role snapshot built")
+        return None
+
+    bot = bot or _get_discord_bot()
+    if not bot:
+        return None
+
+    guild = bot.get_guild(int(guild_id))
+    if guild is None:
+        logger.warning("Discord guild %s not visible to the bot", guild_id)
+        return None
+
+    snapshot = {}
+    for member in getattr(guild, "members", None) or ():
+        role_ids = {str(role.id) for role in getattr(member, "roles", ())} & tracked
+        if role_ids:
+            snapshot[str(member.id)] = sorted(role_ids)
+
+    cache.set(_snapshot_cache_key(tracked), snapshot, SNAPSHOT_TTL_SECONDS)
+    logger.debug(
+        "Discord role snapshot refreshed: %s members with tracked roles",
+        len(snapshot),
+    )
+    return snapshot
+
+
+def get_guild_role_snapshot(*, build=True):
+    """Return the cached guild role snapshot, building it on a miss if possible."""
+    tracked = _tracked_role_ids()
+    if not tracked:
+        return None
+    snapshot = cache.get(_snapshot_cache_key(tracked))
+    if snapshot is None and build:
+        snapshot = refresh_guild_role_snapshot()
+    return snapshot
+
+
+def invalidate_guild_role_snapshot():
+    """Drop the cached snapshot; the next lookup or periodic refresh rebuilds it."""
+    cache.delete(_snapshot_cache_key(_tracked_role_ids()))
+
+
+def _discord_uids(user_ids) -> dict[int, str]:
+    """Return linked Discord uids keyed by user id (one query)."""
+    try:
+        discord_user_model = apps.get_model("discord", "DiscordUser")
+    except LookupError:
+        return {}
+    return {
+        user_id: str(uid)
+        for user_id, uid in discord_user_model.objects.filter(
+            user_id__in=user_ids
+        ).values_list("user_id", "uid")
+        if uid
+    }
+
+
+def _allowed_user_ids(users, notification_type):
+    """Return the ids of ``users`` that pass the role filter, or None for all."""
+    if notification_type == NOTIFICATION_TYPE_USER:
+        return None
+    if not is_notification_enabled(notification_type):
+        return None
+    if not _discord_bot_installed():
+        logger.debug("aadiscordbot not installed, allowing all notifications")
+        return None
+
+    snapshot = get_guild_role_snapshot()
+    if snapshot is None:
+        # Fail open, as before: never block notifications on Discord outages.
+        logger.debug("Discord role snapshot unavailable, allowing all notifications")
+        return None
+
+    enabled_roles = set(get_enabled_role_ids(notification_type))
+    uids = _discord_uids([user.pk for user in users])
+    return {
+        user_id
+        for user_id, uid in uids.items()
+        if not enabled_roles.isdisjoint(snapshot.get(uid, ()))
+    }
+
+
+def user_has_notification_role(user, notification_type=NOTIFICATION_TYPE_INDUSTRY):
     """
     Check if a user has a Discord role for a specific notification type.
-    
+
     Args:
         user: Django User object
         notification_type: Type of notification (industry, material_exchange, user)
-        
-    Returns:
-        bool: True if user should receive notifications based on roles,
-              or if role filtering is disabled (all users get notifications)
-    """
-    # User-specific notifications always go through (no filtering)
-    if notification_type == NOTIFICATION_TYPE_USER:
-        return True
-    
-    # If no role filtering configured for this type, allow all notifications
-    if not is_notification_enabled(notification_type
+
     Returns:
         bool: True if user should receive notifications based on roles,
               or if role filtering is disabled (all users get notifications)
     """
-    # If no role filtering configured, allow all notifications
-    if not is_notification_enabled():
+    allowed = _allowed_user_ids([user], notification_type)
+    if allowed is None:
         return True
-    
-    try:
-        # Check if aadiscordbot is available
-        from django.apps import apps
-        if not apps.is_installed("aadiscordbot"):
-            logger.debug("aadiscordbot not installed, allowing all notifications")
-            return True
-        
-        # Try to get user's Discord account
-        discord_user = getattr(user, "discord", None)
-        if not discord_user:
-            logger.debug(f"User {user.username} has no Discord account linked")
-            return False
-        
-        # Get the user's Discord member object
-        try:
-            from aadiscordbot.models import DiscordUser
-            discord_account = DiscordUser.objects.filter(user=user).first()
-            
-            if not discord_account:
-                logger.debug(f"User {user.username} has no Discord account in database")
-                return False
-            
-            # Check if we can get member roles via Discord API
-            # This requires aadiscordbot to be properly configured
-            from discord.utils import get as discord_get
-            from aadiscordbot.app_settings import get_bot
-            
-            bot = get_bot()
-            if not bot:
-                logger.debug("Discord bot not available, allowing all notifications")
-                return True
-            
-            guild_id = getattr(settings, "DISCORD_GUILD_ID", None)
-            if not guild_id:
-                logger.debug("DISCORD_GUILD_ID not configured, allowing all notifications")
-                return True
-             for this notification type
-            enabled_roles = get_enabled_role_ids(notification_type)
-            user_role_ids = [str(role.id) for role in member.roles]
-            
-            has_role = any(role_id in user_role_ids for role_id in enabled_roles)
-            
-            if has_role:
-                logger.debug(f"User {user.username} has {notification_type} notification role")
-            else:
-                logger.debug(f"User {user.username} does not have {notification_type}
-            
-            # Check if user has any of the configured roles
-            enabled_roles = get_enabled_role_ids()
-            user_role_ids = [str(role.id) for role in member.roles]
-            
-            has_role = any(role_id in user_role_ids for role_id in enabled_roles)
-            
-            if has_role:
-                logger.debug(f"User {user.username} has notification role")
-            else:
-                logger.debug(f"User {user.username} does not have notification role")
-            
-            return has_role
-            
-        except ImportError:
-            logger.debug("aadiscordbot not properly configured, allowing all notifications")
-            return True
-        except Exception as e:
-            logger.warning(
-                f"Error checking Discord roles for {user.username}: {e}",
-                exc_info=True
-            )
-            # On error, allow notifications to avoid blocking users
-            return True
-            
-    except Exception as e:
-        logger.error(
-            f"Unexpected error checking notification roles: {e}",
-            exc_info=True, notification_type=NOTIFICATION_TYPE_INDUSTRY):
+    has_role = user.pk in allowed
+    if not has_role:
+        logger.debug(
+            "User %s does not have %s notification role", user, notification_type
+        )
+    return has_role
+
+
+def filter_users_by_notification_role(
+    users, notification_type=NOTIFICATION_TYPE_INDUSTRY
+):
     """
     Filter a list of users to only those with notification roles for a type.
-    
+
     Args:
         users: QuerySet, list, or single User object
         notification_type: Type of notification (industry, material_exchange, user)
-        
+
     Returns:
         list: Filtered list of users who should receive notifications
     """
@@ -188,28 +264,16 @@ def get_enabled_role_ids():
         users = list(users)
     elif not isinstance(users, (list, tuple)):
         users = [users]
-    
-    # User-specific notifications go to all users (no filtering)
-    if notification_type == NOTIFICATION_TYPE_USER:
-        return users
-    
-    # If role filtering is disabled for this type, return all users
-    if not is_notification_enabled(notification_type):
-        return users
-    
-    # Filter users by role
-    filtered_users = []
-    for user in users:
-        if user_has_notification_role(user, notification_type):
-            filtered_users.append(user)
-        else:
-            logger.debug(
-                f"Skipping {notification_type}
-        if user_has_notification_role(user):
-            filtered_users.append(user)
-        else:
-            logger.debug(
-                f"Skipping notification for {user.username} - no notification role"
-            )
-    
+
+    allowed = _allowed_user_ids(users, notification_type)
+    if allowed is None:
+        return list(users)
+
+    filtered_users = [user for user in users if user.pk in allowed]
+    if len(filtered_users) != len(users):
+        logger.debug(
+            "Skipping %s notification for %s user(s) without a notification role",
+            notification_type,
+            len(users) - len(filtered_users),
+        )
     return filtered_users
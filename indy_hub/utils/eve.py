@@ -15,6 +15,7 @@ import requests
 from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import AppRegistryNotReady
+from django.utils import timezone
 
 # Alliance Auth
 from allianceauth.eveonline.models import EveCharacter, EveCorporationInfo
@@ -29,6 +30,7 @@ from ..services.esi_client import (
     rate_limit_wait_seconds,
     shared_client,
 )
+from .name_cache import TwoTierCache
 
 if getattr(settings, "configured", False) and "eveuniverse" in getattr(
     settings, "INSTALLED_APPS", ()
@@ -45,13 +47,14 @@ else:  # pragma: no cover - EveUniverse app not installed
 
 logger = logging.getLogger(__name__)
 
-_TYPE_NAME_CACHE: dict[int, str] = {}
-_CHAR_NAME_CACHE: dict[int, str] = {}
-_CORP_NAME_CACHE: dict[int, str] = {}
-_CORP_TICKER_CACHE: dict[int, str] = {}
-_BP_PRODUCT_CACHE: dict[int, int | None] = {}
-_REACTION_CACHE: dict[int, bool] = {}
-_LOCATION_NAME_CACHE: dict[int, str] = {}
+_TYPE_NAME_CACHE = TwoTierCache("type_name")
+_CHAR_NAME_CACHE = TwoTierCache("character_name")
+_CORP_NAME_CACHE = TwoTierCache("corporation_name")
+_CORP_TICKER_CACHE = TwoTierCache("corporation_ticker")
+_BP_PRODUCT_CACHE = TwoTierCache("blueprint_product")
+_REACTION_CACHE = TwoTierCache("reaction_blueprint")
+# Structure names can be renamed in game; keep them for a shorter time.
+_LOCATION_NAME_CACHE = TwoTierCache("location_name", shared_ttl=6 * 60 * 60)
 PLACEHOLDER_PREFIX = "Structure "
 _STRUCTURE_SCOPE = "esi-universe.read_structures.v1"
 _FALLBACK_STRUCTURE_TOKEN_IDS: list[int] | None = None
@@ -59,30 +62,32 @@ _OWNER_STRUCTURE_TOKEN_CACHE: dict[int, list[int]] = {}
 _STATION_ID_MAX = 100_000_000
 _MAX_STRUCTURE_LOOKUPS = 3
 _FORBIDDEN_STRUCTURE_CHARACTERS: set[int] = set()
-_STRUCTURE_LOOKUP_PAUSE_UNTIL: float = 0.0
+# Keep IN (...) clauses well below the parameter limits of every supported backend.
+_NAME_LOOKUP_CHUNK_SIZE = 900
 
 
 def _schedule_structure_rate_limit_pause(duration: float | None) -> None:
-    """Record a future time when structure lookups may resume."""
+    """Pause ESI lookups on every worker for ``duration`` seconds."""
 
-    if not duration or duration <= 0:
-        return
+    shared_client.governor.pause(duration)
 
-    global _STRUCTURE_LOOKUP_PAUSE_UNTIL
-    resume_at = time.monotonic() + float(duration)
-    _STRUCTURE_LOOKUP_PAUSE_UNTIL = max(_STRUCTURE_LOOKUP_PAUSE_UNTIL, resume_at)
 
+def _structure_lookups_deferred() -> bool:
+    """Return True while the shared ESI error budget forbids new lookups.
 
-def _wait_for_structure_rate_limit_window() -> None:
-    """Sleep until the recorded rate limit pause elapses, if necessary."""
+    Lookups are skipped rather than slept through; callers fall back to a
+    placeholder that a later refresh replaces.
+    """
 
-    remaining = _STRUCTURE_LOOKUP_PAUSE_UNTIL - time.monotonic()
-    if remaining > 0:
-        logger.info(
-            "Throttling structure lookups for %.1fs to respect ESI rate limit",
-            remaining,
-        )
-        time.sleep(remaining)
+    wait, remaining = shared_client.governor.wait_seconds()
+    if wait <= 0:
+        return False
+    logger.info(
+        "Deferring structure lookups for %.1fs to respect ESI rate limit (remaining=%s)",
+        wait,
+        remaining,
+    )
+    return True
 
 
 def _rate_limited_public_get(
@@ -92,11 +97,16 @@ def _rate_limited_public_get(
     timeout: int = 15,
     max_attempts: int = 3,
 ) -> requests.Response | None:
-    """Perform a GET request honouring the shared rate limit pause."""
+    """Perform a GET request honouring the shared ESI error budget.
+
+    Gives up without a request (returning the last response, if any) while
+    the budget is spent.
+    """
 
     response: requests.Response | None = None
     for attempt in range(1, max_attempts + 1):
-        _wait_for_structure_rate_limit_window()
+        if _structure_lookups_deferred():
+            return response
 
         try:
             response = requests.get(url, params=params, timeout=timeout)
@@ -121,6 +131,7 @@ def _rate_limited_public_get(
             time.sleep(sleep_for)
             continue
 
+        shared_client.governor.record_headers(response.headers)
         if response.status_code == 420:
             sleep_for, remaining = rate_limit_wait_seconds(
                 response, shared_client.backoff_factor * (2 ** (attempt - 1))
@@ -188,8 +199,9 @@ def get_type_name(type_id: int | None) -> str:
     if not type_id:
         return ""
 
-    if type_id in _TYPE_NAME_CACHE:
-        return _TYPE_NAME_CACHE[type_id]
+    cached = _TYPE_NAME_CACHE.get(type_id)
+    if cached is not None:
+        return cached
 
     if EveType is None:
         value = str(type_id)
@@ -202,7 +214,7 @@ def get_type_name(type_id: int | None) -> str:
             )
             value = str(type_id)
 
-    _TYPE_NAME_CACHE[type_id] = value
+    _TYPE_NAME_CACHE.set(type_id, value)
     return value
 
 
@@ -218,8 +230,9 @@ def get_corporation_name(corporation_id: int | None) -> str:
         logger.debug("Unable to coerce corporation id %s", corporation_id)
         return str(corporation_id)
 
-    if corp_id in _CORP_NAME_CACHE:
-        return _CORP_NAME_CACHE[corp_id]
+    cached = _CORP_NAME_CACHE.get(corp_id)
+    if cached is not None:
+        return cached
 
     try:
         corp = EveCorporationInfo.objects.only("corporation_name").get(
@@ -245,7 +258,7 @@ def get_corporation_name(corporation_id: int | None) -> str:
             )
             name = str(corp_id)
 
-    _CORP_NAME_CACHE[corp_id] = name
+    _CORP_NAME_CACHE.set(corp_id, name)
     return name
 
 
@@ -263,8 +276,9 @@ def get_corporation_ticker(corporation_id: int | None) -> str:
         )
         return ""
 
-    if corp_id in _CORP_TICKER_CACHE:
-        return _CORP_TICKER_CACHE[corp_id]
+    cached = _CORP_TICKER_CACHE.get(corp_id)
+    if cached is not None:
+        return cached
 
     ticker = ""
 
@@ -287,7 +301,7 @@ def get_corporation_ticker(corporation_id: int | None) -> str:
         if record:
             ticker = record.get("corporation_ticker", "") or ""
 
-    _CORP_TICKER_CACHE[corp_id] = ticker
+    _CORP_TICKER_CACHE.set(corp_id, ticker)
     return ticker
 
 
@@ -296,8 +310,9 @@ def get_character_name(character_id: int | None) -> str:
     if not character_id:
         return ""
 
-    if character_id in _CHAR_NAME_CACHE:
-        return _CHAR_NAME_CACHE[character_id]
+    cached = _CHAR_NAME_CACHE.get(character_id)
+    if cached is not None:
+        return cached
 
     try:
         value = (
@@ -312,31 +327,143 @@ def get_character_name(character_id: int | None) -> str:
         )
         value = str(character_id)
 
-    _CHAR_NAME_CACHE[character_id] = value
+    _CHAR_NAME_CACHE.set(character_id, value)
     return value
 
 
 def batch_cache_type_names(type_ids: Iterable[int]) -> Mapping[int, str]:
     """Fetch and cache type names in batch, returning the mapping."""
-    ids = {int(pk) for pk in type_ids if pk}
-    if not ids:
-        return {}
+    return resolve_names_bulk(type_ids=type_ids, use_esi=False)["types"]
+
+
+def _normalize_name_ids(ids: Iterable | None) -> set[int]:
+    normalized: set[int] = set()
+    for raw in ids or ():
+        try:
+            value = int(raw)
+        except (TypeError, ValueError):
+            continue
+        if value > 0:
+            normalized.add(value)
+    return normalized
+
+
+def _chunked_ids(ids: Iterable[int], size: int = _NAME_LOOKUP_CHUNK_SIZE):
+    ids = sorted(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
 
+def _load_type_names(type_ids: set[int]) -> dict[int, str]:
     if EveType is None:
-        return {pk: str(pk) for pk in ids}
+        return {}
+    found: dict[int, str] = {}
+    for batch in _chunked_ids(type_ids):
+        found.update(EveType.objects.filter(id__in=batch).values_list("id", "name"))
+    return found
+
+
+def _load_character_names(character_ids: set[int]) -> dict[int, str]:
+    found: dict[int, str] = {}
+    for batch in _chunked_ids(character_ids):
+        found.update(
+            EveCharacter.objects.filter(character_id__in=batch).values_list(
+                "character_id", "character_name"
+            )
+        )
+    return found
+
+
+def _load_corporation_names(corporation_ids: set[int]) -> dict[int, str]:
+    found: dict[int, str] = {}
+    try:
+        for batch in _chunked_ids(corporation_ids):
+            found.update(
+                EveCorporationInfo.objects.filter(corporation_id__in=batch).values_list(
+                    "corporation_id", "corporation_name"
+                )
+            )
+        # Corporations nobody registered in Auth may still be known through
+        # one of their members.
+        leftover = corporation_ids - {pk for pk, name in found.items() if name}
+        for batch in _chunked_ids(leftover):
+            rows = (
+                EveCharacter.objects.filter(corporation_id__in=batch)
+                .exclude(corporation_name="")
+                .values_list("corporation_id", "corporation_name")
+                .order_by("corporation_name")
+            )
+            for corp_id, corp_name in rows:
+                if not found.get(corp_id):
+                    found[corp_id] = corp_name
+    except AppRegistryNotReady:
+        logger.debug("Corporation names not available (app registry not ready)")
+    return found
 
-    result: dict[int, str] = {}
-    for eve_type in EveType.objects.filter(id__in=ids).only("id", "name"):
-        _TYPE_NAME_CACHE[eve_type.id] = eve_type.name
-        result[eve_type.id] = eve_type.name
 
-    missing = ids - result.keys()
-    for pk in missing:
-        value = str(pk)
-        _TYPE_NAME_CACHE[pk] = value
-        result[pk] = value
+def resolve_names_bulk(
+    *,
+    type_ids: Iterable[int] | None = None,
+    character_ids: Iterable[int] | None = None,
+    corporation_ids: Iterable[int] | None = None,
+    use_esi: bool = True,
+) -> dict[str, dict[int, str]]:
+    """Resolve type, character and corporation names for many IDs at once.
+
+    Cache misses are loaded with one query per namespace. IDs still unknown
+    afterwards are sent to ``/universe/names/`` in a single call when
+    ``use_esi`` is set, and anything left falls back to the ID string like the
+    per-ID helpers. Every answer is written to the name caches, so
+    ``get_type_name``/``get_character_name``/``get_corporation_name`` hit the
+    cache for these IDs afterwards.
+
+    Returns ``{"types": {...}, "characters": {...}, "corporations": {...}}``.
+    """
+
+    namespaces = (
+        ("types", _TYPE_NAME_CACHE, type_ids, _load_type_names),
+        ("characters", _CHAR_NAME_CACHE, character_ids, _load_character_names),
+        (
+            "corporations",
+            _CORP_NAME_CACHE,
+            corporation_ids,
+            _load_corporation_names,
+        ),
+    )
+
+    resolved: dict[str, dict[int, str]] = {}
+    fetched: dict[str, dict[int, str]] = {}
+    missing: dict[str, set[int]] = {}
+    for key, tier, ids, loader in namespaces:
+        wanted = _normalize_name_ids(ids)
+        resolved[key] = dict(tier.get_many(wanted)) if wanted else {}
+        pending = wanted - resolved[key].keys()
+        fetched[key] = (
+            {pk: name for pk, name in loader(pending).items() if name}
+            if pending
+            else {}
+        )
+        missing[key] = pending - fetched[key].keys()
+
+    unknown = set().union(*missing.values())
+    if unknown and use_esi:
+        try:
+            esi_names = shared_client.resolve_ids_to_names(sorted(unknown))
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            logger.warning("Unable to resolve %s names via ESI: %s", len(unknown), exc)
+            esi_names = {}
+        for key, pending in missing.items():
+            for pk in pending:
+                if esi_names.get(pk):
+                    fetched[key][pk] = esi_names[pk]
+
+    for key, tier, _ids, _loader in namespaces:
+        for pk in missing[key] - fetched[key].keys():
+            fetched[key][pk] = str(pk)
+        tier.set_many(fetched[key])
+        resolved[key].update(fetched[key])
 
-    return result
+    return resolved
 
 
 def get_blueprint_product_type_id(blueprint_type_id: int | None) -> int | None:
@@ -345,8 +472,9 @@ def get_blueprint_product_type_id(blueprint_type_id: int | None) -> int | None:
         return None
 
     blueprint_type_id = int(blueprint_type_id)
-    if blueprint_type_id in _BP_PRODUCT_CACHE:
-        return _BP_PRODUCT_CACHE[blueprint_type_id]
+    cached = _BP_PRODUCT_CACHE.get_many([blueprint_type_id])
+    if blueprint_type_id in cached:
+        return cached[blueprint_type_id]
 
     product_id: int | None = None
 
@@ -366,7 +494,7 @@ def get_blueprint_product_type_id(blueprint_type_id: int | None) -> int | None:
                 exc_info=True,
             )
 
-    _BP_PRODUCT_CACHE[blueprint_type_id] = product_id
+    _BP_PRODUCT_CACHE.set(blueprint_type_id, product_id)
     return product_id
 
 
@@ -376,8 +504,9 @@ def is_reaction_blueprint(blueprint_type_id: int | None) -> bool:
         return False
 
     blueprint_type_id = int(blueprint_type_id)
-    if blueprint_type_id in _REACTION_CACHE:
-        return _REACTION_CACHE[blueprint_type_id]
+    cached = _REACTION_CACHE.get(blueprint_type_id)
+    if cached is not None:
+        return cached
 
     if EveIndustryActivityProduct is None:
         value = False
@@ -394,7 +523,7 @@ def is_reaction_blueprint(blueprint_type_id: int | None) -> bool:
             )
             value = False
 
-    _REACTION_CACHE[blueprint_type_id] = value
+    _REACTION_CACHE.set(blueprint_type_id, value)
     return value
 
 
@@ -455,47 +584,75 @@ def _invalidate_owner_structure_tokens(owner_user_id: int | None) -> None:
     _OWNER_STRUCTURE_TOKEN_CACHE.pop(owner_user_id, None)
 
 
-def _lookup_location_name_in_db(structure_id: int) -> str | None:
-    """Return a previously stored location name for the given ID when present."""
+def _location_index_model():
+    try:
+        return apps.get_model("indy_hub", "CachedStructureName")
+    except (LookupError, AppRegistryNotReady):
+        return None
 
-    model_specs = (
-        ("indy_hub", "Blueprint", "location_id", "location_name"),
-        ("indy_hub", "IndustryJob", "station_id", "location_name"),
-    )
 
-    for app_label, model_name, id_field, name_field in model_specs:
-        try:
-            model = apps.get_model(app_label, model_name)
-        except (LookupError, AppRegistryNotReady):
-            continue
+def _load_location_names(location_ids: set[int]) -> dict[int, str]:
+    """Load indexed (non-placeholder) names from ``CachedStructureName``."""
 
-        if model is None:
-            continue
+    model = _location_index_model()
+    if model is None or not location_ids:
+        return {}
+    found: dict[int, str] = {}
+    try:
+        for batch in _chunked_ids(location_ids):
+            found.update(
+                model.objects.filter(
+                    structure_id__in=batch,
+                    confidence__gt=model.Confidence.PLACEHOLDER,
+                ).values_list("structure_id", "name")
+            )
+    except Exception:  # pragma: no cover - defensive fallback
+        logger.debug(
+            "Unable to read %s indexed location names", len(location_ids), exc_info=True
+        )
+    return {pk: str(name) for pk, name in found.items() if name}
 
-        filter_kwargs = {id_field: structure_id}
 
-        try:
-            qs = (
-                model.objects.filter(**filter_kwargs)
-                .exclude(**{f"{name_field}__isnull": True})
-                .exclude(**{name_field: ""})
-                .exclude(**{f"{name_field}__startswith": PLACEHOLDER_PREFIX})
-            )
-            existing = qs.values_list(name_field, flat=True).first()
-        except Exception:  # pragma: no cover - defensive fallback
-            logger.debug(
-                "Unable to reuse stored location for %s via %s.%s",
-                structure_id,
-                app_label,
-                model_name,
-                exc_info=True,
-            )
-            existing = None
+def _store_location_name(location_id: int, name: str, *, source: str) -> None:
+    model = _location_index_model()
+    if model is None:
+        return
+    try:
+        model.objects.update_or_create(
+            structure_id=int(location_id),
+            defaults={
+                "name": name[:255],
+                "source": source,
+                "last_resolved": timezone.now(),
+            },
+        )
+    except Exception:  # pragma: no cover - defensive fallback
+        logger.debug("Unable to index location name for %s", location_id, exc_info=True)
+
 
-        if existing:
-            return str(existing)
+def _lookup_location_name_in_db(structure_id: int) -> str | None:
+    """Return the indexed name of ``structure_id`` when one is known."""
 
-    return None
+    return _load_location_names({int(structure_id)}).get(int(structure_id))
+
+
+def resolve_location_names(location_ids: Iterable[int]) -> dict[int, str]:
+    """Return the known names of many locations without calling ESI.
+
+    Location cache misses are read from ``CachedStructureName`` with one
+    query (per 900 IDs) and cached. IDs without a known name are left out, so
+    callers decide whether to spend ESI lookups on them through
+    ``resolve_location_name``.
+    """
+
+    wanted = _normalize_name_ids(location_ids)
+    if not wanted:
+        return {}
+    resolved = dict(_LOCATION_NAME_CACHE.get_many(wanted))
+    indexed = _load_location_names(wanted - resolved.keys())
+    _LOCATION_NAME_CACHE.set_many(indexed)
+    resolved.update(indexed)
+    return resolved
 
 
 def resolve_location_name(
@@ -508,6 +665,9 @@ def resolve_location_name(
 ) -> str:
     """Resolve a structure or station name using ESI lookups with caching.
 
+    The location cache and the ``CachedStructureName`` index are consulted
+    before ESI, and names found through ESI are added to the index.
+
     When ``force_refresh`` is True, cached placeholder values (``Structure <id>``)
     are ignored so that a fresh lookup can populate the real name if available.
     """
@@ -526,10 +686,11 @@ def resolve_location_name(
     if not force_refresh:
         db_name = _lookup_location_name_in_db(structure_id)
         if db_name:
-            _LOCATION_NAME_CACHE[structure_id] = db_name
+            _LOCATION_NAME_CACHE.set(structure_id, db_name)
             return db_name
 
     name: str | None = None
+    source = "esi"
     is_station = is_station_id(structure_id)
 
     attempted_characters: set[int] = set()
@@ -555,11 +716,12 @@ def resolve_location_name(
         if candidate_character_id in attempted_characters:
             return None
 
+        if _structure_lookups_deferred():
+            return None
+
         attempted_characters.add(candidate_character_id)
         remaining_attempts -= 1
 
-        _wait_for_structure_rate_limit_window()
-
         try:
             return shared_client.fetch_structure_name(
                 structure_id, candidate_character_id
@@ -662,9 +824,15 @@ def resolve_location_name(
                 except ValueError:
                     payload = {}
                 name = payload.get("name")
+                source = "station"
 
-    if not name:
+    if name:
+        _store_location_name(structure_id, name, source=source)
+    else:
+        if _structure_lookups_deferred():
+            # Lookups were skipped, not failed: let the next call retry.
+            return placeholder_value
         name = placeholder_value
 
-    _LOCATION_NAME_CACHE[structure_id] = name
+    _LOCATION_NAME_CACHE.set(structure_id, name)
     return name
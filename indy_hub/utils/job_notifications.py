@@ -605,9 +605,85 @@ def process_job_completion_notification(job: IndustryJob) -> bool:
     Returns True when the job required processing (and is now marked notified).
     """
 
-    if not job or job.job_completed_notified:
+    if not _deliver_job_completion_notification(job):
         return False
+    _mark_job_notified(job)
+    return True
+
+
+def process_job_completion_notifications(jobs) -> int:
+    """Batch variant of :func:`process_job_completion_notification`.
+
+    Used by the bulk job synchronization, which bypasses ``post_save``. Owner
+    users and their notification settings are loaded once for the batch,
+    corporation recipients once per corporation, and all processed jobs are
+    flagged as notified with a single UPDATE.
+    """
+
+    pending = [
+        job
+        for job in jobs
+        if job is not None
+        and job.pk is not None
+        and not job.job_completed_notified
+        and _job_has_ended(job)
+    ]
+    if not pending:
+        return 0
+
+    corporation_ids = {
+        int(job.corporation_id)
+        for job in pending
+        if _is_corporation_job(job) and job.corporation_id
+    }
+    corporation_settings = {
+        corporation_id: list(
+            _eligible_corporation_notification_settings(corporation_id)
+        )
+        for corporation_id in corporation_ids
+    }
+
+    user_ids = {
+        job.owner_user_id
+        for job in pending
+        if not _is_corporation_job(job) and job.owner_user_id
+    }
+    users = User.objects.in_bulk(user_ids) if user_ids else {}
+    user_settings: dict[int, CharacterSettings] = {}
+    if user_ids:
+        for settings in CharacterSettings.objects.filter(
+            user_id__in=user_ids, character_id=0
+        ).order_by("pk"):
+            user_settings.setdefault(settings.user_id, settings)
+    for job in pending:
+        if job.owner_user_id in users:
+            job.owner_user = users[job.owner_user_id]
+
+    processed = [
+        job
+        for job in pending
+        if _deliver_job_completion_notification(
+            job,
+            corporation_settings=corporation_settings,
+            user_settings=user_settings,
+        )
+    ]
+    if not processed:
+        return 0
+
+    IndustryJob.objects.filter(pk__in=[job.pk for job in processed]).update(
+        job_completed_notified=True
+    )
+    for job in processed:
+        job.job_completed_notified = True
+    return len(processed)
+
+
+def _is_corporation_job(job) -> bool:
+    return getattr(job, "owner_kind", None) == Blueprint.OwnerKind.CORPORATION
 
+
+def _job_has_ended(job) -> bool:
     end_date = getattr(job, "end_date", None)
     if isinstance(end_date, str):
         parsed = parse_datetime(end_date)
@@ -624,22 +700,40 @@ def process_job_completion_notification(job: IndustryJob) -> bool:
     if isinstance(end_date, datetime) and timezone.is_naive(end_date):
         end_date = timezone.make_aware(end_date, timezone.utc)
 
-    if not end_date or end_date > timezone.now():
+    return bool(end_date) and end_date <= timezone.now()
+
+
+def _deliver_job_completion_notification(
+    job: IndustryJob,
+    *,
+    corporation_settings: dict[int, list] | None = None,
+    user_settings: dict[int, CharacterSettings] | None = None,
+) -> bool:
+    """Notify recipients for a finished job; return True when it is now handled.
+
+    ``corporation_settings`` and ``user_settings`` hold recipients prefetched
+    by :func:`process_job_completion_notifications`; without them they are
+    queried for this job.
+    """
+
+    if not job or job.job_completed_notified:
         return False
 
-    is_corp_job = getattr(job, "owner_kind", None) == Blueprint.OwnerKind.CORPORATION
+    if not _job_has_ended(job):
+        return False
 
-    if is_corp_job:
+    if _is_corporation_job(job):
         corporation_id = getattr(job, "corporation_id", None)
         if not corporation_id:
-            _mark_job_notified(job)
             return True
 
-        eligible_settings = list(
-            _eligible_corporation_notification_settings(int(corporation_id))
-        )
+        if corporation_settings is not None:
+            eligible_settings = corporation_settings.get(int(corporation_id), [])
+        else:
+            eligible_settings = list(
+                _eligible_corporation_notification_settings(int(corporation_id))
+            )
         if not eligible_settings:
-            _mark_job_notified(job)
             return True
 
         payload = build_job_notification_payload(job)
@@ -680,17 +774,17 @@ def process_job_completion_notification(job: IndustryJob) -> bool:
                     setting=corp_setting,
                 )
 
-        _mark_job_notified(job)
         return True
 
-    user = getattr(job, "owner_user", None)
-    if not user:
-        _mark_job_notified(job)
+    if not getattr(job, "owner_user_id", None):
         return True
+    user = job.owner_user
 
-    settings = CharacterSettings.objects.filter(user=user, character_id=0).first()
+    if user_settings is not None:
+        settings = user_settings.get(user.pk)
+    else:
+        settings = CharacterSettings.objects.filter(user=user, character_id=0).first()
     if not settings:
-        _mark_job_notified(job)
         return True
 
     frequency = settings.jobs_notify_frequency or (
@@ -700,7 +794,6 @@ def process_job_completion_notification(job: IndustryJob) -> bool:
     )
 
     if frequency == CharacterSettings.NOTIFY_DISABLED:
-        _mark_job_notified(job)
         return True
 
     payload = build_job_notification_payload(job)
@@ -736,5 +829,4 @@ def process_job_completion_notification(job: IndustryJob) -> bool:
             settings=settings,
         )
 
-    _mark_job_notified(job)
     return True
@@ -0,0 +1,173 @@
+"""Bounded two-tier cache used by the EVE name/metadata lookups.
+
+The first tier is a per-process LRU with a TTL so long-lived workers do not
+grow without bound; the second tier is the Django cache, shared by every
+worker so a restart does not mean re-warming from the database.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Any
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+
+DEFAULT_MAXSIZE = int(getattr(settings, "INDY_HUB_NAME_CACHE_MAXSIZE", 20_000))
+DEFAULT_LOCAL_TTL = int(getattr(settings, "INDY_HUB_NAME_CACHE_LOCAL_TTL", 60 * 60))
+DEFAULT_SHARED_TTL = int(
+    getattr(settings, "INDY_HUB_NAME_CACHE_SHARED_TTL", 24 * 60 * 60)
+)
+
+_KEY_PREFIX = "indy_hub:names"
+_MISSING = object()
+_REGISTRY: dict[str, TwoTierCache] = {}
+
+
+class TwoTierCache:
+    """In-process LRU with TTL in front of the shared Django cache.
+
+    Values are wrapped before being stored in the shared tier so ``None`` can
+    be cached as a legitimate answer.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        maxsize: int = DEFAULT_MAXSIZE,
+        local_ttl: int = DEFAULT_LOCAL_TTL,
+        shared_ttl: int = DEFAULT_SHARED_TTL,
+    ) -> None:
+        self.namespace = namespace
+        self.maxsize = max(1, int(maxsize))
+        self.local_ttl = local_ttl
+        self.shared_ttl = shared_ttl
+        self._local: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        _REGISTRY[namespace] = self
+
+    def _shared_key(self, key: Hashable) -> str:
+        return f"{_KEY_PREFIX}:{self.namespace}:{key}"
+
+    def _get_local(self, key: Hashable) -> Any:
+        entry = self._local.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return _MISSING
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: Hashable, value: Any) -> None:
+        self._local[key] = (time.monotonic() + self.local_ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._get_local(key)
+            if value is not _MISSING:
+                self.local_hits += 1
+                return value
+
+        wrapped = cache.get(self._shared_key(key))
+        with self._lock:
+            if wrapped is None:
+                self.misses += 1
+                return default
+            self.shared_hits += 1
+            self._set_local(key, wrapped[0])
+        return wrapped[0]
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        """Return the cached values for ``keys``; missing keys are omitted."""
+
+        found: dict[Hashable, Any] = {}
+        remaining: list[Hashable] = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                value = self._get_local(key)
+                if value is _MISSING:
+                    remaining.append(key)
+                else:
+                    found[key] = value
+            self.local_hits += len(found)
+
+        if not remaining:
+            return found
+
+        shared_keys = {self._shared_key(key): key for key in remaining}
+        shared = cache.get_many(list(shared_keys))
+        with self._lock:
+            for shared_key, key in shared_keys.items():
+                wrapped = shared.get(shared_key)
+                if wrapped is None:
+                    self.misses += 1
+                    continue
+                self.shared_hits += 1
+                found[key] = wrapped[0]
+                self._set_local(key, wrapped[0])
+        return found
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._set_local(key, value)
+        cache.set(self._shared_key(key), (value,), self.shared_ttl)
+
+    def set_many(self, mapping: Mapping[Hashable, Any]) -> None:
+        if not mapping:
+            return
+        with self._lock:
+            for key, value in mapping.items():
+                self._set_local(key, value)
+        cache.set_many(
+            {self._shared_key(key): (value,) for key, value in mapping.items()},
+            self.shared_ttl,
+        )
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._local.pop(key, None)
+        cache.delete(self._shared_key(key))
+
+    def clear(self) -> None:
+        """Drop the local tier and the shared entries this process knows of."""
+
+        with self._lock:
+            keys = list(self._local)
+            self._local.clear()
+        if keys:
+            cache.delete_many([self._shared_key(key) for key in keys])
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "local_size": len(self._local),
+            "maxsize": self.maxsize,
+        }
+
+
+def name_cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit/miss counters for every registered namespace."""
+
+    return {namespace: tier.stats() for namespace, tier in _REGISTRY.items()}
@@ -8,10 +8,6 @@ These views handle API calls, external data fetching, and service integrations.
 import json
 import logging
 from decimal import Decimal
-from math import ceil
-
-# Third Party
-import requests
 
 # Django
 from django.contrib.auth.decorators import login_required
@@ -30,6 +26,8 @@ from ..models import (
     ProductionConfig,
     ProductionSimulation,
 )
+from ..services.industry_graph import get_industry_graph
+from ..services.market_prices import PriceUnavailableError, get_jita_prices
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +42,83 @@ def _to_serializable(value):
     return value
 
 
+# Upper bound on the number of run counts a single batch request may expand.
+MAX_BATCH_RUNS = 500
+
+
+def _parse_runs_list(raw: str) -> list[int]:
+    """Parse ``"1,5,10-20"`` / ``"1-100:10"`` into sorted unique run counts."""
+
+    runs: set[int] = set()
+    for part in str(raw).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            span, _, step_raw = part.partition(":")
+            start_raw, _, end_raw = span.partition("-")
+            start, end = int(start_raw), int(end_raw)
+            step = max(1, int(step_raw or 1))
+            if end < start:
+                start, end = end, start
+            if (end - start) // step + 1 > MAX_BATCH_RUNS:
+                raise ValueError("too many run counts")
+            values = list(range(start, end + 1, step))
+            if values[-1] != end:
+                values.append(end)
+            runs.update(values)
+        else:
+            runs.add(int(part))
+        if len(runs) > MAX_BATCH_RUNS:
+            raise ValueError("too many run counts")
+    return sorted(max(1, value) for value in runs)
+
+
+def _parse_config_sets(
+    raw: str,
+    me: int,
+    te: int,
+    me_te_configs: dict[int, dict[str, int]],
+    *,
+    max_sets: int = MAX_BATCH_RUNS,
+) -> list[dict[str, object]]:
+    """Parse the optional JSON list of ME/TE override sets for batch payloads.
+
+    Each entry may carry ``me``/``te`` for the root blueprint and a
+    ``blueprints`` mapping of blueprint type_id to ``{"me": .., "te": ..}``;
+    missing values fall back to the request's own parameters. More than
+    ``max_sets`` entries are rejected.
+    """
+
+    if not raw:
+        return [{"me": me, "te": te, "me_te_configs": me_te_configs}]
+
+    entries = json.loads(raw)
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("config_sets must be a non-empty list")
+    if len(entries) > max_sets:
+        raise ValueError("too many config sets")
+
+    config_sets = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError("config_sets entries must be objects")
+        merged = {bp_id: dict(values) for bp_id, values in me_te_configs.items()}
+        for bp_id, values in (entry.get("blueprints") or {}).items():
+            target = merged.setdefault(int(bp_id), {})
+            for field in ("me", "te"):
+                if field in values:
+                    target[field] = int(values[field])
+        config_sets.append(
+            {
+                "me": int(entry.get("me", me)),
+                "te": int(entry.get("te", te)),
+                "me_te_configs": merged,
+            }
+        )
+    return config_sets
+
+
 @indy_hub_access_required
 @indy_hub_permission_required("can_access_indy_hub")
 @login_required
@@ -53,6 +128,10 @@ def craft_bp_payload(request, type_id: int):
 
     This is used by the V2 UI to simulate profitability across multiple run counts
     while allowing buy/prod decisions to change with cycle rounding effects.
+
+    Passing ``runs_list`` (e.g. ``1,5,10-50:5``) switches to batch mode: every
+    run count, optionally for each entry of the ``config_sets`` JSON list, is
+    expanded in one pass and returned under ``results``.
     """
 
     debug_enabled = str(request.GET.get("indy_debug", "")).strip() in {
@@ -96,35 +175,70 @@ def craft_bp_payload(request, type_id: int):
                 continue
 
     # Final product and output qty per run.
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT product_eve_type_id, quantity
-            FROM eveuniverse_eveindustryactivityproduct
-            WHERE eve_type_id = %s AND activity_id IN (1, 11)
-            LIMIT 1
-            """,
-            [type_id],
-        )
-        product_row = cursor.fetchone()
-
-    product_type_id = product_row[0] if product_row else None
-    output_qty_per_run = product_row[1] if product_row and len(product_row) > 1 else 1
+    graph = get_industry_graph()
+    product_type_id = graph.product_of(type_id)
+    output_qty_per_run = graph.output_per_run(type_id)
     final_product_qty = (output_qty_per_run or 1) * num_runs
 
+    runs_list_raw = request.GET.get("runs_list")
+    if runs_list_raw:
+        try:
+            runs_list = _parse_runs_list(runs_list_raw)
+            # Every config set expands every run count: cap the product.
+            config_sets = _parse_config_sets(
+                request.GET.get("config_sets", ""),
+                me,
+                te,
+                me_te_configs,
+                max_sets=MAX_BATCH_RUNS // max(len(runs_list), 1),
+            )
+        except (TypeError, ValueError, AttributeError) as exc:
+            return JsonResponse(
+                {"error": f"Invalid batch parameters: {exc}"}, status=400
+            )
+        if not runs_list:
+            return JsonResponse({"error": "runs_list is empty"}, status=400)
+
+        results = []
+        for config_index, config in enumerate(config_sets):
+            recipe_map: dict[int, dict[str, object]] = {}
+            trees = graph.build_materials_trees(
+                type_id,
+                runs_list,
+                config["me"],
+                me_te_map=config["me_te_configs"],
+                recipe_map=recipe_map,
+            )
+            serialized_recipes = _to_serializable(recipe_map)
+            for runs, tree in zip(runs_list, trees):
+                results.append(
+                    {
+                        "config_index": config_index,
+                        "num_runs": runs,
+                        "me": config["me"],
+                        "te": config["te"],
+                        "final_product_qty": (output_qty_per_run or 1) * runs,
+                        "materials_tree": _to_serializable(tree),
+                        "recipe_map": serialized_recipes,
+                    }
+                )
+
+        return JsonResponse(
+            {
+                "type_id": type_id,
+                "bp_type_id": type_id,
+                "product_type_id": product_type_id,
+                "output_qty_per_run": output_qty_per_run,
+                "runs": runs_list,
+                "config_sets": _to_serializable(config_sets),
+                "results": results,
+            }
+        )
+
     debug_info: dict[str, object] = {}
     if debug_enabled:
         try:
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT COUNT(*)
-                    FROM eveuniverse_eveindustryactivitymaterial
-                    WHERE eve_type_id = %s AND activity_id IN (1, 11)
-                    """,
-                    [type_id],
-                )
-                mats_count = int(cursor.fetchone()[0])
+            mats_count = len(graph.materials_of(type_id))
             debug_info = {
                 "db_vendor": connection.vendor,
                 "requested_type_id": int(type_id),
@@ -132,7 +246,7 @@ def craft_bp_payload(request, type_id: int):
                 "me": int(me),
                 "te": int(te),
                 "me_te_configs_count": int(len(me_te_configs)),
-                "product_row_found": bool(product_row),
+                "product_row_found": int(type_id) in graph.products,
                 "product_type_id": int(product_type_id) if product_type_id else None,
                 "output_qty_per_run": int(output_qty_per_run or 1),
                 "top_level_material_rows": mats_count,
@@ -145,146 +259,9 @@ def craft_bp_payload(request, type_id: int):
     # Exact per-cycle recipes for craftable items (keyed by product type_id).
     # This avoids approximating recipes from tree occurrences in the frontend.
     recipe_map: dict[int, dict[str, object]] = {}
-    recipe_cache: dict[tuple[int, int], dict[str, object]] = {}
-
-    def get_materials_tree(
-        bp_id,
-        runs,
-        blueprint_me=0,
-        depth=0,
-        max_depth=10,
-        seen=None,
-        me_te_map=None,
-    ):
-        if seen is None:
-            seen = set()
-        if me_te_map is None:
-            me_te_map = {}
-        if depth > max_depth or bp_id in seen:
-            return []
-        seen.add(bp_id)
-
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT m.material_eve_type_id, t.name, m.quantity
-                FROM eveuniverse_eveindustryactivitymaterial m
-                JOIN eveuniverse_evetype t ON m.material_eve_type_id = t.id
-                WHERE m.eve_type_id = %s AND m.activity_id IN (1, 11)
-                """,
-                [bp_id],
-            )
-
-            mats = []
-            for row in cursor.fetchall():
-                # IMPORTANT: ME rounding must be applied per-run (per job/cycle), then multiplied.
-                # Doing ceil((base * runs) * (1 - ME)) underestimates for small base quantities.
-                per_run_qty = ceil((row[2] or 0) * (100 - blueprint_me) / 100)
-                qty = int(per_run_qty) * int(runs)
-                mat = {
-                    "type_id": row[0],
-                    "type_name": row[1],
-                    "quantity": qty,
-                    "cycles": None,
-                    "produced_per_cycle": None,
-                    "total_produced": None,
-                    "surplus": None,
-                }
-
-                # If craftable, compute cycles + recurse.
-                with connection.cursor() as sub_cursor:
-                    sub_cursor.execute(
-                        """
-                        SELECT eve_type_id
-                        FROM eveuniverse_eveindustryactivityproduct
-                        WHERE product_eve_type_id = %s AND activity_id IN (1, 11)
-                        LIMIT 1
-                        """,
-                        [mat["type_id"]],
-                    )
-                    sub_bp_row = sub_cursor.fetchone()
-
-                    if sub_bp_row:
-                        sub_bp_id = sub_bp_row[0]
-                        sub_cursor.execute(
-                            """
-                            SELECT quantity
-                            FROM eveuniverse_eveindustryactivityproduct
-                            WHERE eve_type_id = %s AND activity_id IN (1, 11)
-                            LIMIT 1
-                            """,
-                            [sub_bp_id],
-                        )
-                        prod_qty_row = sub_cursor.fetchone()
-                        output_qty = prod_qty_row[0] if prod_qty_row else 1
-                        cycles = ceil(mat["quantity"] / output_qty)
-                        total_produced = cycles * output_qty
-                        surplus = total_produced - mat["quantity"]
-                        mat["cycles"] = cycles
-                        mat["produced_per_cycle"] = output_qty
-                        mat["total_produced"] = total_produced
-                        mat["surplus"] = surplus
-
-                        sub_bp_config = (me_te_map or {}).get(sub_bp_id, {})
-                        sub_bp_me = sub_bp_config.get("me", 0)
-
-                        # Build exact per-cycle recipe for this craftable output (mat["type_id"]).
-                        # Cache by (blueprint_id, blueprint_me) because ME changes the rounded per-cycle quantities.
-                        cache_key = (int(sub_bp_id), int(sub_bp_me))
-                        if cache_key not in recipe_cache:
-                            with connection.cursor() as recipe_cursor:
-                                recipe_cursor.execute(
-                                    """
-                                    SELECT material_eve_type_id, quantity
-                                    FROM eveuniverse_eveindustryactivitymaterial
-                                    WHERE eve_type_id = %s AND activity_id IN (1, 11)
-                                    """,
-                                    [sub_bp_id],
-                                )
-                                inputs = []
-                                for (
-                                    mat_type_id,
-                                    base_qty_per_cycle,
-                                ) in recipe_cursor.fetchall():
-                                    qty_per_cycle = ceil(
-                                        (base_qty_per_cycle or 0)
-                                        * (100 - sub_bp_me)
-                                        / 100
-                                    )
-                                    if qty_per_cycle <= 0:
-                                        continue
-                                    inputs.append(
-                                        {
-                                            "type_id": int(mat_type_id),
-                                            "quantity": int(qty_per_cycle),
-                                        }
-                                    )
-                            recipe_cache[cache_key] = {
-                                "produced_per_cycle": int(output_qty or 1),
-                                "inputs_per_cycle": inputs,
-                            }
-
-                        # Key recipe map by produced item type_id (not blueprint id)
-                        produced_type_id = int(mat["type_id"])
-                        if produced_type_id not in recipe_map:
-                            recipe_map[produced_type_id] = recipe_cache[cache_key]
-
-                        mat["sub_materials"] = get_materials_tree(
-                            sub_bp_id,
-                            cycles,
-                            sub_bp_me,
-                            depth + 1,
-                            max_depth,
-                            seen.copy(),
-                            me_te_map,
-                        )
-                    else:
-                        mat["sub_materials"] = []
-
-                mats.append(mat)
-            return mats
-
-    materials_tree = get_materials_tree(type_id, num_runs, me, me_te_map=me_te_configs)
+    materials_tree = graph.build_materials_tree(
+        type_id, num_runs, me, me_te_map=me_te_configs, recipe_map=recipe_map
+    )
 
     payload = {
         "type_id": type_id,
@@ -308,10 +285,8 @@ def craft_bp_payload(request, type_id: int):
 @login_required
 def fuzzwork_price(request):
     """
-    Get item prices from Fuzzwork API.
+    Get Jita item prices from the shared Fuzzwork price cache.
 
-    This view fetches current market prices for EVE Online items
-    from the Fuzzwork Market API service.
     Supports both single type_id and comma-separated multiple type_ids.
     """
     type_id = request.GET.get("type_id")
@@ -319,53 +294,35 @@ def fuzzwork_price(request):
     if not type_id:
         return JsonResponse({"error": "type_id parameter required"}, status=400)
 
+    # Support multiple type IDs separated by commas
+    type_ids = [t.strip() for t in type_id.split(",") if t.strip()]
+    unique_type_ids = [tid for tid in dict.fromkeys(type_ids) if tid.isdigit()]
+    if not unique_type_ids:
+        return JsonResponse({"error": "Invalid type_id parameter"}, status=400)
+
     try:
-        # Support multiple type IDs separated by commas
-        type_ids = [t.strip() for t in type_id.split(",") if t.strip()]
-        if not type_ids:
-            return JsonResponse({"error": "Invalid type_id parameter"}, status=400)
-
-        # Remove duplicates and join back
-        unique_type_ids = list(set(type_ids))
-        type_ids_str = ",".join(unique_type_ids)
-
-        # Fetch price data from Fuzzwork API
-        response = requests.get(
-            f"https://market.fuzzwork.co.uk/aggregates/?station=60003760&types={type_ids_str}",
-            timeout=10,
-        )
-        response.raise_for_status()
-
-        data = response.json()
-
-        # Optional: return the full Fuzzwork payload for each requested typeId.
-        # This is used by the "Calcul" tab for deep inspection.
-        if full:
-            result = {}
-            for tid in unique_type_ids:
-                # Fuzzwork keys are strings in the aggregates response.
-                result[tid] = data.get(tid, {})
-            return JsonResponse(result)
-
-        # Return simplified price data (use sell.min for material costs, sell.min for products)
-        result = {}
-        for tid in unique_type_ids:
-            if tid in data:
-                item_data = data[tid]
-                # Use sell.min as the default price (what you'd pay to buy)
-                sell_min = float(item_data.get("sell", {}).get("min", 0))
-                result[tid] = sell_min
-            else:
-                result[tid] = 0
-
-        return JsonResponse(result)
-
-    except requests.RequestException as e:
+        prices = get_jita_prices(unique_type_ids, raise_errors=True)
+    except PriceUnavailableError as e:
         logger.error(f"Error fetching price data from Fuzzwork: {e}")
         return JsonResponse({"error": "Unable to fetch price data"}, status=503)
-    except (ValueError, KeyError) as e:
-        logger.error(f"Error parsing price data: {e}")
-        return JsonResponse({"error": "Invalid data received"}, status=500)
+
+    # Optional: return the full Fuzzwork payload for each requested typeId.
+    # This is used by the "Calcul" tab for deep inspection.
+    if full:
+        return JsonResponse(
+            {
+                tid: (prices[int(tid)].data if int(tid) in prices else {})
+                for tid in unique_type_ids
+            }
+        )
+
+    # Return simplified price data (sell.min is what you'd pay to buy)
+    return JsonResponse(
+        {
+            tid: (float(prices[int(tid)].sell) if int(tid) in prices else 0)
+            for tid in unique_type_ids
+        }
+    )
 
 
 def health_check(request):
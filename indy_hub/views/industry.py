@@ -4,6 +4,7 @@
 import json
 import logging
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from decimal import Decimal
 from math import ceil
@@ -18,7 +19,7 @@ from django.contrib.auth.models import User
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.paginator import Paginator
 from django.db import connection
-from django.db.models import Case, Count, Q, When
+from django.db.models import Case, Count, Exists, OuterRef, Q, When
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -44,8 +45,16 @@ from ..models import (
     IndustryJob,
     ProductionConfig,
     ProductionSimulation,
+    SharedBlueprintCatalogEntry,
 )
-from ..notifications import build_site_url, notify_user
+from ..notifications import (
+    build_site_url,
+    notification_batch,
+    notify_user,
+    queue_notification,
+)
+from ..services.blueprint_catalog import ensure_blueprint_catalog, viewer_scope_keys
+from ..services.industry_graph import get_industry_graph
 from ..services.simulations import summarize_simulations
 from ..tasks.industry import (
     MANUAL_REFRESH_KIND_BLUEPRINTS,
@@ -64,6 +73,7 @@ from ..utils.eve import (
     get_corporation_name,
     get_corporation_ticker,
     get_type_name,
+    resolve_names_bulk,
 )
 
 # Indy Hub
@@ -343,6 +353,31 @@ def _eligible_owner_details_for_request(
     )
 
 
+def _fulfillable_blueprints_queryset(user: User, corporation_ids: Iterable[int]):
+    """Originals ``user`` can fulfill copy requests from (own and corporate)."""
+
+    owned = Q(owner_user=user, owner_kind=Blueprint.OwnerKind.CHARACTER)
+    corporation_ids = list(corporation_ids or ())
+    if corporation_ids:
+        owned |= Q(
+            owner_kind=Blueprint.OwnerKind.CORPORATION,
+            corporation_id__in=corporation_ids,
+        )
+    return Blueprint.objects.filter(owned, bp_type=Blueprint.BPType.ORIGINAL)
+
+
+def _copy_request_match(blueprints_qs) -> Exists:
+    """EXISTS clause matching copy requests against ``blueprints_qs`` on (type, ME, TE)."""
+
+    return Exists(
+        blueprints_qs.filter(
+            type_id=OuterRef("type_id"),
+            material_efficiency=OuterRef("material_efficiency"),
+            time_efficiency=OuterRef("time_efficiency"),
+        )
+    )
+
+
 def _eligible_owner_ids_for_request(req: BlueprintCopyRequest) -> set[int]:
     """Return user IDs that can fulfil the request based on owned originals."""
 
@@ -732,25 +767,31 @@ def personnal_bp_list(request, scope="character"):
                 .values_list("corporation_id", "corporation_name")
                 .distinct()
             )
+            owner_pairs = list(owner_pairs)
+            corp_names = resolve_names_bulk(
+                corporation_ids=[corp_id for corp_id, name in owner_pairs if not name],
+                use_esi=False,
+            )["corporations"]
             owner_options = []
             for corp_id, corp_name in owner_pairs:
                 if not corp_id:
                     continue
-                display_name = (
-                    corp_name or get_corporation_name(corp_id) or str(corp_id)
-                )
+                display_name = corp_name or corp_names.get(corp_id) or str(corp_id)
                 owner_options.append((corp_id, display_name))
         else:
-            owner_ids = (
+            owner_ids = list(
                 base_blueprints_qs.exclude(character_id__isnull=True)
                 .values_list("character_id", flat=True)
                 .distinct()
             )
+            character_names = resolve_names_bulk(
+                character_ids=owner_ids, use_esi=False
+            )["characters"]
             owner_options = []
             for cid in owner_ids:
                 if not cid:
                     continue
-                display_name = get_character_name(cid) or str(cid)
+                display_name = character_names.get(cid) or str(cid)
                 owner_options.append((cid, display_name))
 
         blueprints_qs = base_blueprints_qs.filter(type_id__in=allowed_type_ids)
@@ -1265,23 +1306,31 @@ def personnal_job_list(request, scope="character"):
             .values_list("corporation_id", "corporation_name")
             .distinct()
         )
+        owner_pairs = list(owner_pairs)
+        corp_names = resolve_names_bulk(
+            corporation_ids=[corp_id for corp_id, name in owner_pairs if not name],
+            use_esi=False,
+        )["corporations"]
         owner_options = []
         for corp_id, corp_name in owner_pairs:
             if not corp_id:
                 continue
-            display_name = corp_name or get_corporation_name(corp_id) or str(corp_id)
+            display_name = corp_name or corp_names.get(corp_id) or str(corp_id)
             owner_options.append((corp_id, display_name))
     else:
-        owner_ids = (
+        owner_ids = list(
             base_jobs_qs.exclude(character_id__isnull=True)
             .values_list("character_id", flat=True)
             .distinct()
         )
+        character_names = resolve_names_bulk(character_ids=owner_ids, use_esi=False)[
+            "characters"
+        ]
         owner_options = []
         for cid in owner_ids:
             if not cid:
                 continue
-            display_name = get_character_name(cid) or str(cid)
+            display_name = character_names.get(cid) or str(cid)
             owner_options.append((cid, display_name))
 
     jobs_qs = base_jobs_qs
@@ -1752,209 +1801,31 @@ def craft_bp(request, type_id):
             bp_name = row[0] if row else str(type_id)
 
         # --- Fetch final product and quantity ---
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT product_eve_type_id, quantity
-                FROM eveuniverse_eveindustryactivityproduct
-                WHERE eve_type_id = %s AND activity_id IN (1, 11)
-                LIMIT 1
-                """,
-                [type_id],
-            )
-            product_row = cursor.fetchone()
-            product_type_id = product_row[0] if product_row else None
-            output_qty_per_run = (
-                product_row[1] if product_row and len(product_row) > 1 else 1
-            )
-            final_product_qty = output_qty_per_run * num_runs
+        graph = get_industry_graph()
+        product_type_id = graph.product_of(type_id)
+        output_qty_per_run = graph.output_per_run(type_id)
+        final_product_qty = output_qty_per_run * num_runs
 
         # --- Build materials tree ---
         logger.debug(
             f"About to build materials tree with me_te_configs: {me_te_configs}"
         )
-
-        def get_materials_tree(
-            bp_id,
-            runs,
-            blueprint_me=0,
-            depth=0,
-            max_depth=10,
-            seen=None,
-            me_te_map=None,
-        ):
-            """Recursively build the material tree for a given blueprint.
-
-            Args:
-                bp_id: Blueprint type ID
-                runs: Number of production runs
-                blueprint_me: Material efficiency for this specific blueprint
-                depth: Current recursion depth
-                max_depth: Maximum recursion depth
-                seen: Set of already processed blueprint IDs (to avoid cycles)
-                me_te_map: Dictionary mapping blueprint type_id to their ME/TE configs
-            """
-            if seen is None:
-                seen = set()
-            if me_te_map is None:
-                me_te_map = {}
-            if depth > max_depth or bp_id in seen:
-                return []
-            seen.add(bp_id)
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        """
-                        SELECT m.material_eve_type_id, t.name, m.quantity
-                        FROM eveuniverse_eveindustryactivitymaterial m
-                        JOIN eveuniverse_evetype t ON m.material_eve_type_id = t.id
-                        WHERE m.eve_type_id = %s AND m.activity_id IN (1, 11)
-                        """,
-                        [bp_id],
-                    )
-                    mats = []
-                    for row in cursor.fetchall():
-                        # IMPORTANT: Apply ME rounding per-run (per job/cycle), then multiply.
-                        # Doing ceil((base_qty * runs) * (1 - ME)) underestimates for small quantities.
-                        per_run_qty = ceil((row[2] or 0) * (100 - blueprint_me) / 100)
-                        qty = int(per_run_qty) * int(runs)
-                        mat = {
-                            "type_id": row[0],
-                            "type_name": row[1],
-                            "quantity": qty,
-                            # Default values, will be overwritten if blueprint exists
-                            "cycles": None,
-                            "produced_per_cycle": None,
-                            "total_produced": None,
-                            "surplus": None,
-                        }
-                        # Check if this material can be produced by a blueprint (i.e. is a sub-product)
-                        with connection.cursor() as sub_cursor:
-                            sub_cursor.execute(
-                                """
-                                SELECT eve_type_id
-                                FROM eveuniverse_eveindustryactivityproduct
-                                WHERE product_eve_type_id = %s AND activity_id IN (1, 11)
-                                LIMIT 1
-                                """,
-                                [mat["type_id"]],
-                            )
-                            sub_bp_row = sub_cursor.fetchone()
-                            if sub_bp_row:
-                                sub_bp_id = sub_bp_row[0]
-                                sub_cursor.execute(
-                                    """
-                                    SELECT quantity
-                                    FROM eveuniverse_eveindustryactivityproduct
-                                    WHERE eve_type_id = %s AND activity_id IN (1, 11)
-                                    LIMIT 1
-                                    """,
-                                    [sub_bp_id],
-                                )
-                                prod_qty_row = sub_cursor.fetchone()
-                                output_qty = prod_qty_row[0] if prod_qty_row else 1
-                                cycles = ceil(mat["quantity"] / output_qty)
-                                total_produced = cycles * output_qty
-                                surplus = total_produced - mat["quantity"]
-                                mat["cycles"] = cycles
-                                mat["produced_per_cycle"] = output_qty
-                                mat["total_produced"] = total_produced
-                                mat["surplus"] = surplus
-
-                                # Get ME/TE for this sub-blueprint from the config map
-                                sub_bp_config = me_te_map.get(sub_bp_id, {})
-                                sub_bp_me = sub_bp_config.get("me", 0)
-
-                                mat["sub_materials"] = get_materials_tree(
-                                    sub_bp_id,
-                                    cycles,
-                                    sub_bp_me,
-                                    depth + 1,
-                                    max_depth,
-                                    seen.copy(),
-                                    me_te_map,
-                                )
-                            else:
-                                mat["sub_materials"] = []
-                        mats.append(mat)
-                return mats
-            except Exception as tree_error:
-                logger.error(
-                    f"Error in get_materials_tree for bp_id={bp_id}: {type(tree_error).__name__}: {str(tree_error)}",
-                    exc_info=True,
-                )
-                return []
-
-        materials_tree = get_materials_tree(
-            type_id, num_runs, me, me_te_map=me_te_configs
-        )
+        try:
+            materials_tree = graph.build_materials_tree(
+                type_id, num_runs, me, me_te_map=me_te_configs
+            )
+        except Exception as tree_error:
+            logger.error(
+                f"Error building materials tree for bp_id={type_id}: {type(tree_error).__name__}: {str(tree_error)}",
+                exc_info=True,
+            )
+            materials_tree = []
         logger.warning(
             f"AFTER get_materials_tree: materials_tree has {len(materials_tree)} top-level materials, me={me}, te={te}"
         )
 
-        # --- Function to collect all blueprints that should be excluded from configs ---
-        def collect_buy_exclusions(tree, buy_set, excluded=None):
-            """
-            Collect all blueprint type_ids that need to be excluded from the blueprint configs.
-            If an item is marked for purchase, the blueprint that produces it and all descendants are excluded.
-            """
-            if excluded is None:
-                excluded = set()
-
-            for mat in tree:
-                # If this material is marked for purchase instead of production
-                if mat["type_id"] in buy_set:
-                    # Find the blueprint that produces this material and exclude it
-                    with connection.cursor() as cursor:
-                        cursor.execute(
-                            """
-                            SELECT eve_type_id
-                            FROM eveuniverse_eveindustryactivityproduct
-                            WHERE product_eve_type_id = %s AND activity_id IN (1, 11)
-                            LIMIT 1
-                            """,
-                            [mat["type_id"]],
-                        )
-                        bp_row = cursor.fetchone()
-                        if bp_row:
-                            excluded.add(
-                                bp_row[0]
-                            )  # Exclude the blueprint that produces this item
-
-                    # Recursively exclude every downstream blueprint
-                    if mat.get("sub_materials"):
-                        collect_all_descendant_blueprints(
-                            mat["sub_materials"], excluded
-                        )
-                elif mat.get("sub_materials"):
-                    # Continue scanning child materials
-                    collect_buy_exclusions(mat["sub_materials"], buy_set, excluded)
-
-            return excluded
-
-        def collect_all_descendant_blueprints(tree, excluded):
-            """Recursively collect every descendant blueprint in a tree."""
-            for mat in tree:
-                # Find the blueprint that produces this material
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        """
-                        SELECT eve_type_id
-                        FROM eveuniverse_eveindustryactivityproduct
-                        WHERE product_eve_type_id = %s AND activity_id IN (1, 11)
-                        LIMIT 1
-                        """,
-                        [mat["type_id"]],
-                    )
-                    bp_row = cursor.fetchone()
-                    if bp_row:
-                        excluded.add(bp_row[0])
-
-                if mat.get("sub_materials"):
-                    collect_all_descendant_blueprints(mat["sub_materials"], excluded)
-
         # Gather exclusions based on buy/craft decisions
-        blueprint_exclusions = collect_buy_exclusions(materials_tree, buy_decisions)
+        blueprint_exclusions = graph.buy_exclusions(materials_tree, buy_decisions)
         logger.info(f"Blueprint exclusions: {blueprint_exclusions}")  # Debug log
 
         def flatten_materials(materials, buy_as_final=None):
@@ -1994,43 +1865,7 @@ def craft_bp(request, type_id):
             ]
 
         # --- Extract every blueprint involved (root + children) ---
-        def extract_all_blueprint_type_ids(bp_id, acc=None, depth=0, max_depth=10):
-            """Recursively retrieve every blueprint type_id (root and descendants)."""
-            if acc is None:
-                acc = set()
-            if depth > max_depth or bp_id in acc:
-                return acc
-            acc.add(bp_id)
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT m.material_eve_type_id
-                    FROM eveuniverse_eveindustryactivitymaterial m
-                    WHERE m.eve_type_id = %s AND m.activity_id IN (1, 11)
-                    """,
-                    [bp_id],
-                )
-                material_type_ids = [row[0] for row in cursor.fetchall()]
-            for mat_type_id in material_type_ids:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        """
-                        SELECT eve_type_id
-                        FROM eveuniverse_eveindustryactivityproduct
-                        WHERE product_eve_type_id = %s AND activity_id IN (1, 11)
-                        LIMIT 1
-                        """,
-                        [mat_type_id],
-                    )
-                    sub_bp_row = cursor.fetchone()
-                    if sub_bp_row:
-                        sub_bp_id = sub_bp_row[0]
-                        extract_all_blueprint_type_ids(
-                            sub_bp_id, acc, depth + 1, max_depth
-                        )
-            return acc
-
-        all_bp_ids = extract_all_blueprint_type_ids(type_id)
+        all_bp_ids = graph.blueprint_closure(type_id)
 
         # --- Retrieve configurations for every collected blueprint ---
         if all_bp_ids:
@@ -2450,39 +2285,17 @@ def craft_bp(request, type_id):
         def collect_craftables(materials, craftables):
             for mat in materials:
                 # Only accumulate values when the item is craftable (produced by a blueprint)
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        """
-                        SELECT eve_type_id
-                        FROM eveuniverse_eveindustryactivityproduct
-                        WHERE product_eve_type_id = %s AND activity_id IN (1, 11)
-                        LIMIT 1
-                        """,
-                        [mat["type_id"]],
+                sub_bp_id = graph.producer_of(mat["type_id"])
+                if sub_bp_id is not None:
+                    # Accumulate the requested quantity
+                    craftables[mat["type_id"]]["type_name"] = mat["type_name"]
+                    craftables[mat["type_id"]]["total_needed"] += ceil(mat["quantity"])
+                    craftables[mat["type_id"]]["produced_per_cycle"] = (
+                        graph.output_per_run(sub_bp_id)
                     )
-                    sub_bp_row = cursor.fetchone()
-                    if sub_bp_row:
-                        # Accumulate the requested quantity
-                        craftables[mat["type_id"]]["type_name"] = mat["type_name"]
-                        craftables[mat["type_id"]]["total_needed"] += ceil(
-                            mat["quantity"]
-                        )
-                        # Retrieve the quantity produced per cycle
-                        cursor.execute(
-                            """
-                            SELECT quantity
-                            FROM eveuniverse_eveindustryactivityproduct
-                            WHERE eve_type_id = %s AND activity_id IN (1, 11)
-                            LIMIT 1
-                            """,
-                            [sub_bp_row[0]],
-                        )
-                        prod_qty_row = cursor.fetchone()
-                        output_qty = prod_qty_row[0] if prod_qty_row else 1
-                        craftables[mat["type_id"]]["produced_per_cycle"] = output_qty
-                        # Continue descending into sub-materials
-                        if "sub_materials" in mat:
-                            collect_craftables(mat["sub_materials"], craftables)
+                    # Continue descending into sub-materials
+                    if "sub_materials" in mat:
+                        collect_craftables(mat["sub_materials"], craftables)
 
         craftables = defaultdict(
             lambda: {"type_name": "", "total_needed": 0, "produced_per_cycle": 1}
@@ -2498,27 +2311,17 @@ def craft_bp(request, type_id):
 
         # --- Prepare direct materials list (only direct children of the main blueprint) ---
         direct_materials_list = []
-        with connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT m.material_eve_type_id, t.name, m.quantity "
-                "FROM eveuniverse_eveindustryactivitymaterial m "
-                "JOIN eveuniverse_evetype t ON m.material_eve_type_id = t.id "
-                "WHERE m.eve_type_id = %s AND m.activity_id IN (1, 11)",
-                [type_id],
+        for material_id, base_per_run in graph.materials_of(type_id):
+            base_qty = base_per_run * num_runs
+            # Apply ME bonus if applicable and round up to integer
+            qty = ceil(base_qty * (100 - me) / 100)
+            direct_materials_list.append(
+                {
+                    "type_id": material_id,
+                    "type_name": graph.type_name(material_id),
+                    "quantity": qty,
+                }
             )
-            for row in cursor.fetchall():
-                base_qty = row[2] * num_runs
-                # Apply ME bonus if applicable and round up to integer
-                # Standard Library
-
-                qty = ceil(base_qty * (100 - me) / 100)
-                direct_materials_list.append(
-                    {
-                        "type_id": row[0],
-                        "type_name": row[1],
-                        "quantity": qty,
-                    }
-                )
 
         # --- Prepare materials list (flattened), fallback to direct fetch if empty ---
         materials_list = flatten_materials(materials_tree, buy_decisions)
@@ -2860,15 +2663,16 @@ def bp_copy_request_create(request):
     )
     fulfill_label = _("Review copy requests")
 
-    for owner in User.objects.filter(id__in=owner_ids):
-        notify_user(
-            owner,
-            notification_title,
-            notification_body,
-            "info",
-            link=fulfill_queue_url,
-            link_label=fulfill_label,
-        )
+    with notification_batch():
+        for owner in User.objects.filter(id__in=owner_ids):
+            queue_notification(
+                owner,
+                notification_title,
+                notification_body,
+                "info",
+                link=fulfill_queue_url,
+                link_label=fulfill_label,
+            )
 
     messages.success(
         request,
@@ -2881,191 +2685,35 @@ def bp_copy_request_create(request):
 @indy_hub_permission_required("can_access_indy_hub")
 @login_required
 def bp_copy_request_page(request):
-    # Alliance Auth
-    from allianceauth.eveonline.models import EveCharacter
-
     search = request.GET.get("search", "").strip()
     min_me = request.GET.get("min_me", "")
     min_te = request.GET.get("min_te", "")
     page = request.GET.get("page", 1)
     per_page = int(request.GET.get("per_page", 24))
-    # Determine viewer affiliations (corporation / alliance)
-    viewer_corp_ids: set[int] = set()
-    viewer_alliance_ids: set[int] = set()
-    viewer_characters = EveCharacter.objects.filter(
-        character_ownership__user=request.user
-    ).values("corporation_id", "alliance_id")
-    for char in viewer_characters:
-        corp_id = char.get("corporation_id")
-        if corp_id is not None:
-            viewer_corp_ids.add(corp_id)
-        alliance_id = char.get("alliance_id")
-        if alliance_id is not None:
-            viewer_alliance_ids.add(alliance_id)
-
-    viewer_can_request_copies = request.user.has_perm("indy_hub.can_access_indy_hub")
-
-    # Fetch copy sharing configuration for character-owned and corporation-owned originals
-    character_settings = list(
-        CharacterSettings.objects.filter(
-            character_id=0,
-            allow_copy_requests=True,
-        ).exclude(copy_sharing_scope=CharacterSettings.SCOPE_NONE)
-    )
-    corporation_settings = list(
-        CorporationSharingSetting.objects.filter(allow_copy_requests=True)
-        .exclude(share_scope=CharacterSettings.SCOPE_NONE)
-        .only("user_id", "corporation_id", "share_scope")
-    )
-
-    owner_user_ids = {
-        setting.user_id for setting in character_settings + corporation_settings
-    }
-
-    owner_affiliations: dict[int, dict[str, set[int]]] = {}
-    corp_alliance_map: dict[int, set[int]] = defaultdict(set)
-
-    if owner_user_ids:
-        owner_characters = EveCharacter.objects.filter(
-            character_ownership__user_id__in=owner_user_ids
-        ).values(
-            "character_ownership__user_id",
-            "corporation_id",
-            "alliance_id",
-        )
-        for char in owner_characters:
-            user_id = char["character_ownership__user_id"]
-            corp_id = char.get("corporation_id")
-            alliance_id = char.get("alliance_id")
-
-            data = owner_affiliations.setdefault(
-                user_id, {"corp_ids": set(), "alliance_ids": set()}
-            )
-            if corp_id is not None:
-                data["corp_ids"].add(corp_id)
-                if alliance_id:
-                    corp_alliance_map[corp_id].add(alliance_id)
-            if alliance_id:
-                data["alliance_ids"].add(alliance_id)
-
-    missing_corp_ids = {
-        setting.corporation_id
-        for setting in corporation_settings
-        if setting.corporation_id and not corp_alliance_map.get(setting.corporation_id)
-    }
-    if missing_corp_ids:
-        # Alliance Auth
-        from allianceauth.eveonline.models import EveCorporationInfo
-
-        corp_records = EveCorporationInfo.objects.filter(
-            corporation_id__in=missing_corp_ids
-        ).values("corporation_id", "alliance_id")
-        for record in corp_records:
-            corp_id = record.get("corporation_id")
-            alliance_id = record.get("alliance_id")
-            if corp_id and alliance_id:
-                corp_alliance_map[corp_id].add(alliance_id)
-
-    allowed_character_user_ids: set[int] = set()
-    for setting in character_settings:
-        affiliations = owner_affiliations.get(
-            setting.user_id, {"corp_ids": set(), "alliance_ids": set()}
-        )
-        corp_ids = affiliations["corp_ids"]
-        alliance_ids = affiliations["alliance_ids"]
-
-        if setting.copy_sharing_scope == CharacterSettings.SCOPE_CORPORATION:
-            if viewer_corp_ids & corp_ids:
-                allowed_character_user_ids.add(setting.user_id)
-        elif setting.copy_sharing_scope == CharacterSettings.SCOPE_ALLIANCE:
-            if (viewer_corp_ids & corp_ids) or (viewer_alliance_ids & alliance_ids):
-                allowed_character_user_ids.add(setting.user_id)
-        elif setting.copy_sharing_scope == CharacterSettings.SCOPE_EVERYONE:
-            if viewer_can_request_copies:
-                allowed_character_user_ids.add(setting.user_id)
-
-    allowed_corporate_pairs: set[tuple[int, int]] = set()
-    for setting in corporation_settings:
-        corp_id = setting.corporation_id
-        if not corp_id:
-            continue
 
-        allowed = False
-        if setting.share_scope == CharacterSettings.SCOPE_CORPORATION:
-            allowed = corp_id in viewer_corp_ids
-        elif setting.share_scope == CharacterSettings.SCOPE_ALLIANCE:
-            alliance_ids = corp_alliance_map.get(corp_id, set())
-            allowed = (corp_id in viewer_corp_ids) or bool(
-                viewer_alliance_ids & alliance_ids
-            )
-        elif setting.share_scope == CharacterSettings.SCOPE_EVERYONE:
-            allowed = viewer_can_request_copies
-
-        if allowed:
-            allowed_corporate_pairs.add((setting.user_id, corp_id))
-
-    blueprint_filters: list[Q] = []
-    if allowed_character_user_ids:
-        blueprint_filters.append(
-            Q(
-                owner_user_id__in=allowed_character_user_ids,
-                owner_kind=Blueprint.OwnerKind.CHARACTER,
-            )
-        )
-
-    for user_id, corp_id in allowed_corporate_pairs:
-        blueprint_filters.append(
-            Q(
-                owner_user_id=user_id,
-                owner_kind=Blueprint.OwnerKind.CORPORATION,
-                corporation_id=corp_id,
-            )
-        )
-
-    combined_blueprint_filter: Q | None = None
-    for condition in blueprint_filters:
-        combined_blueprint_filter = (
-            condition
-            if combined_blueprint_filter is None
-            else combined_blueprint_filter | condition
-        )
-
-    if combined_blueprint_filter is None:
-        qs = Blueprint.objects.none()
-    else:
-        qs = (
-            Blueprint.objects.filter(combined_blueprint_filter)
-            .filter(bp_type=Blueprint.BPType.ORIGINAL)
-            .order_by("type_name", "material_efficiency", "time_efficiency")
-        )
-    seen = set()
-    bp_list = []
-    for bp in qs:
-        key = (bp.type_id, bp.material_efficiency, bp.time_efficiency)
-        if key in seen:
-            continue
-        seen.add(key)
-        bp_list.append(
-            {
-                "type_id": bp.type_id,
-                "type_name": bp.type_name or str(bp.type_id),
-                "icon_url": f"https://images.evetech.net/types/{bp.type_id}/bp?size=32",
-                "material_efficiency": bp.material_efficiency,
-                "time_efficiency": bp.time_efficiency,
-            }
-        )
+    # Shared originals are read from the precomputed catalog: one row per
+    # visibility scope, deduplicated on (type, ME, TE) and paginated in SQL.
+    ensure_blueprint_catalog()
+    catalog_qs = SharedBlueprintCatalogEntry.objects.filter(
+        scope_key__in=viewer_scope_keys(request.user)
+    )
     if search:
-        bp_list = [bp for bp in bp_list if search.lower() in bp["type_name"].lower()]
+        catalog_qs = catalog_qs.filter(type_name__icontains=search)
     if min_me.isdigit():
-        min_me_val = int(min_me)
-        bp_list = [bp for bp in bp_list if bp["material_efficiency"] >= min_me_val]
+        catalog_qs = catalog_qs.filter(material_efficiency__gte=int(min_me))
     if min_te.isdigit():
-        min_te_val = int(min_te)
-        bp_list = [bp for bp in bp_list if bp["time_efficiency"] >= min_te_val]
+        catalog_qs = catalog_qs.filter(time_efficiency__gte=int(min_te))
+    catalog_qs = (
+        catalog_qs.values(
+            "type_id", "type_name", "material_efficiency", "time_efficiency"
+        )
+        .order_by("type_name", "material_efficiency", "time_efficiency", "type_id")
+        .distinct()
+    )
     per_page_options = [12, 24, 48, 96]
     me_options = list(range(0, 11))
     te_options = list(range(0, 21, 2))  # 0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20
-    paginator = Paginator(bp_list, per_page)
+    paginator = Paginator(catalog_qs, per_page)
     page_obj = paginator.get_page(page)
     page_range = paginator.get_elided_page_range(
         number=page_obj.number, on_each_side=5, on_ends=1
@@ -3144,59 +2792,62 @@ def bp_copy_request_page(request):
             fulfill_label = _("Review copy requests")
 
             provider_users = User.objects.filter(id__in=eligible_owner_ids)
-            for owner in provider_users:
-                provider_body = notification_body
-                if corporate_source_line:
-                    provider_body = f"{provider_body}\n\n{corporate_source_line}"
-                quick_actions = []
-                link_cta = _("Click here")
-
-                accept_link = build_action_link(
-                    action="accept",
-                    request_id=new_request.id,
-                    user_id=owner.id,
-                )
-                if accept_link:
-                    quick_actions.append(
-                        _("Accept: %(link)s") % {"link": f"[{link_cta}]({accept_link})"}
+            # Queued so request latency does not scale with provider count.
+            with notification_batch():
+                for owner in provider_users:
+                    provider_body = notification_body
+                    if corporate_source_line:
+                        provider_body = f"{provider_body}\n\n{corporate_source_line}"
+                    quick_actions = []
+                    link_cta = _("Click here")
+
+                    accept_link = build_action_link(
+                        action="accept",
+                        request_id=new_request.id,
+                        user_id=owner.id,
                     )
+                    if accept_link:
+                        quick_actions.append(
+                            _("Accept: %(link)s")
+                            % {"link": f"[{link_cta}]({accept_link})"}
+                        )
 
-                conditional_link = build_action_link(
-                    action="conditional",
-                    request_id=new_request.id,
-                    user_id=owner.id,
-                )
-                if conditional_link:
-                    quick_actions.append(
-                        _("Send conditions: %(link)s")
-                        % {"link": f"[{link_cta}]({conditional_link})"}
+                    conditional_link = build_action_link(
+                        action="conditional",
+                        request_id=new_request.id,
+                        user_id=owner.id,
                     )
+                    if conditional_link:
+                        quick_actions.append(
+                            _("Send conditions: %(link)s")
+                            % {"link": f"[{link_cta}]({conditional_link})"}
+                        )
 
-                reject_link = build_action_link(
-                    action="reject",
-                    request_id=new_request.id,
-                    user_id=owner.id,
-                )
-                if reject_link:
-                    quick_actions.append(
-                        _("Decline: %(link)s")
-                        % {"link": f"[{link_cta}]({reject_link})"}
+                    reject_link = build_action_link(
+                        action="reject",
+                        request_id=new_request.id,
+                        user_id=owner.id,
                     )
+                    if reject_link:
+                        quick_actions.append(
+                            _("Decline: %(link)s")
+                            % {"link": f"[{link_cta}]({reject_link})"}
+                        )
 
-                if quick_actions:
-                    provider_body = (
-                        f"{provider_body}\n\n"
-                        f"{_('Quick actions:')}\n" + "\n".join(quick_actions)
-                    )
+                    if quick_actions:
+                        provider_body = (
+                            f"{provider_body}\n\n"
+                            f"{_('Quick actions:')}\n" + "\n".join(quick_actions)
+                        )
 
-                notify_user(
-                    owner,
-                    notification_title,
-                    provider_body,
-                    "info",
-                    link=fulfill_queue_url,
-                    link_label=fulfill_label,
-                )
+                    queue_notification(
+                        owner,
+                        notification_title,
+                        provider_body,
+                        "info",
+                        link=fulfill_queue_url,
+                        link_label=fulfill_label,
+                    )
 
         flash_level(request, flash_message)
         return redirect("indy_hub:bp_copy_request_page")
@@ -3307,20 +2958,10 @@ def bp_copy_fulfill_requests(request):
             request, "indy_hub/blueprint_sharing/bp_copy_fulfill_requests.html", context
         )
 
-    my_bps_qs = Blueprint.objects.filter(
-        owner_user=request.user,
-        owner_kind=Blueprint.OwnerKind.CHARACTER,
-        bp_type=Blueprint.BPType.ORIGINAL,
+    accessible_bps_qs = _fulfillable_blueprints_queryset(
+        request.user, accessible_corporation_ids
     )
-    accessible_blueprints = list(my_bps_qs)
-
-    if accessible_corporation_ids:
-        corp_bp_qs = Blueprint.objects.filter(
-            owner_kind=Blueprint.OwnerKind.CORPORATION,
-            bp_type=Blueprint.BPType.ORIGINAL,
-            corporation_id__in=accessible_corporation_ids,
-        )
-        accessible_blueprints.extend(list(corp_bp_qs))
+    accessible_blueprints = list(accessible_bps_qs)
 
     bp_index = defaultdict(list)
     bp_item_map = {}
@@ -3394,15 +3035,10 @@ def bp_copy_fulfill_requests(request):
             request, "indy_hub/blueprint_sharing/bp_copy_fulfill_requests.html", context
         )
 
-    q = Q()
-    has_filters = False
-    for bp in accessible_blueprints:
-        has_filters = True
-        q |= Q(
-            type_id=bp.type_id,
-            material_efficiency=bp.material_efficiency,
-            time_efficiency=bp.time_efficiency,
-        )
+    # Match requests to accessible originals with a single EXISTS semi-join
+    # instead of one OR-ed clause per blueprint.
+    q = Q(_copy_request_match(accessible_bps_qs))
+    has_filters = bool(accessible_blueprints)
 
     if not has_filters and not include_self_requests:
         context = {
@@ -4508,15 +4144,16 @@ def bp_update_copy_request(request, request_id):
     )
     fulfill_label = _("Review copy requests")
 
-    for owner in User.objects.filter(id__in=owner_ids):
-        notify_user(
-            owner,
-            notification_title,
-            notification_body,
-            "info",
-            link=fulfill_queue_url,
-            link_label=fulfill_label,
-        )
+    with notification_batch():
+        for owner in User.objects.filter(id__in=owner_ids):
+            queue_notification(
+                owner,
+                notification_title,
+                notification_body,
+                "info",
+                link=fulfill_queue_url,
+                link_label=fulfill_label,
+            )
 
     messages.success(request, _("Request updated."))
     return redirect("indy_hub:bp_copy_my_requests")
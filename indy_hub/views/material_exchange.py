@@ -33,7 +33,12 @@ from ..models import (
     MaterialExchangeTransaction,
 )
 from ..notifications import notify_multi
-from ..services.asset_cache import get_corp_divisions_cached, get_user_assets_cached
+from ..services.asset_cache import (
+    get_character_assets_last_refreshed,
+    get_corp_divisions_cached,
+    get_user_assets_cached,
+)
+from ..services.market_prices import get_jita_prices
 from ..tasks.material_exchange import (
     ME_STOCK_SYNC_CACHE_VERSION,
     ME_USER_ASSETS_CACHE_VERSION,
@@ -423,35 +428,15 @@ def _get_group_map(type_ids: list[int]) -> dict[int, str]:
 
 
 def _fetch_fuzzwork_prices(type_ids: list[int]) -> dict[int, dict[str, Decimal]]:
-    """Batch fetch Jita buy/sell prices from Fuzzwork for given type IDs."""
+    """Jita buy/sell prices for given type IDs from the shared price cache."""
 
     if not type_ids:
         return {}
 
-    try:
-        # Third Party
-        import requests
-
-        jita_station_id = 60003760  # Jita 4-4
-        unique_ids = list({int(t) for t in type_ids if t})
-        type_ids_str = ",".join(map(str, unique_ids))
-        url = f"https://market.fuzzwork.co.uk/aggregates/?station={jita_station_id}&types={type_ids_str}"
-
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning(f"material_exchange: failed to fetch fuzzwork prices: {exc}")
-        return {}
-
-    prices: dict[int, dict[str, Decimal]] = {}
-    for tid in unique_ids:
-        info = data.get(str(tid), {})
-        buy_price = Decimal(str(info.get("buy", {}).get("max", 0) or 0))
-        sell_price = Decimal(str(info.get("sell", {}).get("min", 0) or 0))
-        prices[tid] = {"buy": buy_price, "sell": sell_price}
-
-    return prices
+    prices = get_jita_prices(type_ids)
+    return {
+        tid: {"buy": price.buy, "sell": price.sell} for tid, price in prices.items()
+    }
 
 
 @login_required
@@ -675,12 +660,7 @@ def material_exchange_sell(request):
     materials_with_qty: list[dict] = []
     assets_refreshing = False
 
-    sell_last_update = (
-        CachedCharacterAsset.objects.filter(user=request.user)
-        .order_by("-synced_at")
-        .values_list("synced_at", flat=True)
-        .first()
-    )
+    sell_last_update = get_character_assets_last_refreshed(request.user.id)
 
     user_assets_version_refresh = False
     try:
@@ -877,7 +857,7 @@ def material_exchange_sell(request):
                 "Starting stock sync for sell page (last_sync=%s)",
                 config.last_stock_sync,
             )
-            sync_material_exchange_stock()
+            sync_material_exchange_stock(config.pk)
             config.refresh_from_db()
             logger.info(
                 "Stock sync completed successfully (last_sync=%s)",
@@ -1226,7 +1206,7 @@ def material_exchange_buy(request):
         and not base_stock_qs.filter(jita_buy_price__gt=0).exists()
     ):
         try:
-            sync_material_exchange_prices()
+            sync_material_exchange_prices(config_id=config.pk)
             config.refresh_from_db()
         except Exception as exc:  # pragma: no cover - defensive
             messages.warning(request, f"Price sync failed automatically: {exc}")
@@ -46,6 +46,7 @@ from ..models import (
     BlueprintCopyChat,
     BlueprintCopyOffer,
     BlueprintCopyRequest,
+    ESISyncSchedule,
     IndustryJob,
     JobNotificationDigestEntry,
     ProductionConfig,
@@ -658,6 +659,20 @@ def build_corporation_sharing_context(user) -> dict[str, Any] | None:
             }
         )
 
+    # Unchanged rows are not rewritten by syncs, so the schedule holds the
+    # actual time of the last successful sync.
+    sync_times = ESISyncSchedule.objects.filter(
+        owner_kind=Blueprint.OwnerKind.CORPORATION,
+        owner_id__in=list(summary),
+        last_synced_at__isnull=False,
+    ).values_list("kind", "owner_id", "last_synced_at")
+    for kind, corp_id, last_synced_at in sync_times:
+        section = summary[corp_id].get(kind)
+        if section is not None:
+            section["last_sync"] = max(
+                filter(None, (section.get("last_sync"), last_synced_at))
+            )
+
     corporations = sorted(
         summary.values(),
         key=lambda item: (item.get("name") or str(item.get("corporation_id"))).lower(),